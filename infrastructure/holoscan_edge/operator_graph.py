@@ -0,0 +1,384 @@
+"""
+Streaming operator graph runtime for the Holoscan edge pipelines.
+
+A lightweight CPU stand-in for a Holoscan application graph: operators are
+chained with bounded queues and each runs on its own worker thread, so frame
+N+1 is converted while frame N is in inference and frame N-1 is overlaid.
+Steady-state throughput is set by the slowest operator rather than by the
+sum of all of them.
+
+Backpressure is configurable at runtime. With "block" a full queue stalls
+its producer. With "drop_oldest" the oldest non-critical frame waiting in
+the queue is evicted to make room, so the graph always works on the
+freshest data. Critical frames are never evicted: if a queue holds only
+critical frames, the producer waits instead.
+
+Every submitted frame is accounted for once drained: frames_in equals
+frames_out plus frames_dropped, where drops are frames evicted by
+backpressure, frames whose operator raised, and frames an operator
+filtered out.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+
+_END = object()  # end-of-stream marker, forwarded through every stage
+
+
+@dataclass
+class Frame:
+    """A unit of work flowing through the graph."""
+    stream_id: str
+    timestamp: float
+    data: Any
+    critical: bool = False
+    sequence: int = 0
+    metadata: Dict = field(default_factory=dict)
+
+
+class BoundedQueue:
+    """
+    Bounded FIFO between two operators with a runtime-adjustable policy.
+
+    Args:
+        capacity: Maximum queued frames
+        policy: "block" or "drop_oldest"
+        on_drop: Called with each evicted frame
+    """
+
+    def __init__(
+        self,
+        capacity: int = 4,
+        policy: str = BLOCK,
+        on_drop: Optional[Callable[[Frame], None]] = None
+    ):
+        self._items = deque()
+        self._cond = threading.Condition()
+        self.capacity = max(1, int(capacity))
+        self.policy = policy
+        self.on_drop = on_drop
+        self.dropped = 0
+
+    def configure(self, capacity: int, policy: str):
+        """Change capacity and policy; excess frames are evicted under drop_oldest."""
+        with self._cond:
+            self.capacity = max(1, int(capacity))
+            self.policy = policy
+            if policy == DROP_OLDEST:
+                while len(self._items) > self.capacity and self._evict_oldest():
+                    pass
+            self._cond.notify_all()
+
+    def put(self, item: Any):
+        """Enqueue, applying the backpressure policy when full."""
+        with self._cond:
+            while len(self._items) >= self.capacity and item is not _END:
+                if self.policy == DROP_OLDEST and self._evict_oldest():
+                    break
+                self._cond.wait()
+            self._items.append(item)
+            self._cond.notify_all()
+
+    def get(self) -> Any:
+        """Dequeue, waiting until an item is available."""
+        with self._cond:
+            while not self._items:
+                self._cond.wait()
+            item = self._items.popleft()
+            self._cond.notify_all()
+            return item
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _evict_oldest(self) -> bool:
+        """Drop the oldest non-critical frame; False if there is none."""
+        for i, queued in enumerate(self._items):
+            if queued is not _END and not queued.critical:
+                del self._items[i]
+                self.dropped += 1
+                if self.on_drop is not None:
+                    self.on_drop(queued)
+                return True
+        return False
+
+
+class OperatorStats:
+    """Per-operator counters and a fixed window of recent latencies."""
+
+    def __init__(self, window: int = 2048):
+        self.latencies_ms = np.zeros(window)
+        self.count = 0
+        self.errors = 0
+        self.filtered = 0
+        self.busy_s = 0.0
+
+    def record(self, seconds: float):
+        self.latencies_ms[self.count % len(self.latencies_ms)] = seconds * 1000.0
+        self.count += 1
+        self.busy_s += seconds
+
+    def summary(self) -> Dict[str, float]:
+        recent = self.latencies_ms[:min(self.count, len(self.latencies_ms))]
+        if not len(recent):
+            return {"count": 0, "errors": self.errors, "filtered": self.filtered,
+                    "mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        p50, p95 = np.percentile(recent, [50, 95])
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "filtered": self.filtered,
+            "mean_ms": self.busy_s * 1000.0 / self.count,
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "max_ms": float(recent.max())
+        }
+
+
+class OperatorGraph:
+    """
+    Linear graph of operators, one worker thread per operator.
+
+    Each operator is a callable taking the frame payload and returning the
+    new payload, or None to filter the frame out. Frames that leave the last
+    operator are handed to `sink`; a frame the sink raises on is counted as
+    failed and dropped, and the last worker carries on.
+
+    Args:
+        queue_capacity: Frames buffered in front of each operator
+        policy: Backpressure policy ("block" or "drop_oldest")
+        sink: Called with each finished Frame
+        on_drop: Called with each dropped frame (evicted by backpressure,
+            failed in an operator or the sink, or filtered out)
+    """
+
+    def __init__(
+        self,
+        queue_capacity: int = 4,
+        policy: str = BLOCK,
+        sink: Optional[Callable[[Frame], None]] = None,
+        on_drop: Optional[Callable[[Frame], None]] = None
+    ):
+        self.queue_capacity = queue_capacity
+        self.policy = policy
+        self.sink = sink
+        self.on_drop = on_drop
+        self.operators: List[Tuple[str, Callable[[Any], Any]]] = []
+        self.queues: List[BoundedQueue] = []
+        self.stats: Dict[str, OperatorStats] = {}
+        self._threads: List[threading.Thread] = []
+        self._sequence = itertools.count()
+        self.frames_in = 0
+        self.frames_out = 0
+        self.sink_errors = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def add_operator(self, name: str, fn: Callable[[Any], Any]) -> 'OperatorGraph':
+        """Append an operator; returns self for chaining."""
+        if self._threads:
+            raise RuntimeError("Cannot add operators to a running graph")
+        if name in self.stats:
+            raise ValueError(f"Duplicate operator name: {name}")
+        self.operators.append((name, fn))
+        self.stats[name] = OperatorStats()
+        return self
+
+    @property
+    def running(self) -> bool:
+        return any(t.is_alive() for t in self._threads)
+
+    def start(self):
+        """Create the queues and start one worker per operator."""
+        if not self.operators:
+            raise ValueError("Operator graph has no operators")
+        if self.running:
+            return
+        self.queues = [
+            BoundedQueue(self.queue_capacity, self.policy, self._dropped)
+            for _ in self.operators
+        ]
+        self._threads = [
+            threading.Thread(target=self._worker, args=(i,), name=f"op-{name}", daemon=True)
+            for i, (name, _) in enumerate(self.operators)
+        ]
+        self.started_at = time.perf_counter()
+        self.finished_at = None
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Operator graph started: {' -> '.join(n for n, _ in self.operators)}")
+
+    def set_backpressure(self, capacity: int, policy: str):
+        """Reconfigure every queue (e.g. on a flow mode change)."""
+        self.queue_capacity = capacity
+        self.policy = policy
+        for queue in self.queues:
+            queue.configure(capacity, policy)
+
+    def submit(
+        self,
+        data: Any,
+        stream_id: str = "",
+        timestamp: Optional[float] = None,
+        critical: bool = False,
+        metadata: Optional[Dict] = None
+    ) -> Frame:
+        """Feed one frame into the first operator's queue."""
+        if not self.queues:
+            raise RuntimeError("Operator graph is not started")
+        frame = Frame(
+            stream_id=stream_id,
+            timestamp=time.time() if timestamp is None else timestamp,
+            data=data,
+            critical=critical,
+            sequence=next(self._sequence),
+            metadata=metadata or {}
+        )
+        self.frames_in += 1
+        self.queues[0].put(frame)
+        return frame
+
+    def stop(self, timeout: Optional[float] = None):
+        """Signal end of stream and wait for queued frames to drain."""
+        if not self.queues:
+            return
+        self.queues[0].put(_END)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def run(self, source: Iterator, critical: bool = False) -> Dict:
+        """Start, feed every (stream_id, timestamp, data) from `source`, drain, return metrics."""
+        self.start()
+        for stream_id, timestamp, data in source:
+            self.submit(data, stream_id=stream_id, timestamp=timestamp, critical=critical)
+        self.stop()
+        return self.metrics()
+
+    def metrics(self) -> Dict:
+        """Throughput, drops (evicted + failed + filtered), and latency per operator."""
+        end = self.finished_at or time.perf_counter()
+        elapsed = end - self.started_at if self.started_at else 0.0
+        operators = {}
+        for i, (name, _) in enumerate(self.operators):
+            summary = self.stats[name].summary()
+            if self.queues:
+                summary["queue_depth"] = len(self.queues[i])
+                summary["evicted"] = self.queues[i].dropped
+                summary["dropped"] = summary["evicted"] + summary["errors"] + summary["filtered"]
+            operators[name] = summary
+        evicted = sum(q.dropped for q in self.queues)
+        failed = sum(stats.errors for stats in self.stats.values()) + self.sink_errors
+        filtered = sum(stats.filtered for stats in self.stats.values())
+        return {
+            "frames_in": self.frames_in,
+            "frames_out": self.frames_out,
+            "frames_dropped": evicted + failed + filtered,
+            "frames_evicted": evicted,
+            "frames_failed": failed,
+            "sink_errors": self.sink_errors,
+            "frames_filtered": filtered,
+            "elapsed_s": elapsed,
+            "throughput_fps": self.frames_out / elapsed if elapsed > 0 else 0.0,
+            "policy": self.policy,
+            "queue_capacity": self.queue_capacity,
+            "operators": operators
+        }
+
+    def _dropped(self, frame: Frame):
+        if self.on_drop is not None:
+            try:
+                self.on_drop(frame)
+            except Exception as e:
+                logger.error(f"Drop callback failed on frame {frame.sequence}: {e}")
+
+    def _worker(self, index: int):
+        name, fn = self.operators[index]
+        stats = self.stats[name]
+        inbox = self.queues[index]
+        outbox = self.queues[index + 1] if index + 1 < len(self.queues) else None
+
+        while True:
+            frame = inbox.get()
+            if frame is _END:
+                if outbox is not None:
+                    outbox.put(_END)
+                else:
+                    self.finished_at = time.perf_counter()
+                return
+
+            start = time.perf_counter()
+            try:
+                frame.data = fn(frame.data)
+            except Exception as e:
+                stats.errors += 1
+                logger.error(f"Operator {name} failed on frame {frame.sequence}: {e}")
+                self._dropped(frame)
+                continue
+            stats.record(time.perf_counter() - start)
+            if frame.data is None:
+                stats.filtered += 1
+                self._dropped(frame)
+                continue
+
+            if outbox is not None:
+                outbox.put(frame)
+                continue
+            if self.sink is not None:
+                try:
+                    self.sink(frame)
+                except Exception as e:
+                    self.sink_errors += 1
+                    logger.error(f"Sink failed on frame {frame.sequence}: {e}")
+                    self._dropped(frame)
+                    continue
+            self.frames_out += 1
+
+
+class SyntheticFrameSource:
+    """
+    Generates (stream_id, timestamp, frame) tuples for testing graphs.
+
+    Args:
+        stream_id: Stream identifier attached to each frame
+        shape: Frame shape
+        count: Number of frames
+        fps: Pace frames at this rate (None = as fast as possible)
+        seed: Random seed for frame content
+    """
+
+    def __init__(
+        self,
+        stream_id: str = "synthetic_01",
+        shape: Tuple[int, ...] = (480, 640, 3),
+        count: int = 100,
+        fps: Optional[float] = None,
+        seed: int = 0
+    ):
+        self.stream_id = stream_id
+        self.count = count
+        self.fps = fps
+        rng = np.random.default_rng(seed)
+        # A few distinct frames, reused, keep generation out of the timings
+        self._frames = rng.integers(0, 256, size=(4,) + tuple(shape), dtype=np.uint8)
+
+    def __iter__(self) -> Iterator[Tuple[str, float, np.ndarray]]:
+        start = time.perf_counter()
+        for i in range(self.count):
+            if self.fps:
+                delay = start + i / self.fps - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            yield self.stream_id, time.time(), self._frames[i % len(self._frames)]
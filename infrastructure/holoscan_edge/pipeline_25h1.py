@@ -7,9 +7,12 @@ bandwidth-constrained Ghost-Mode mesh networks.
 """
 
 import logging
-from typing import Dict, List, Optional
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from enum import Enum
 
+from operator_graph import BLOCK, DROP_OLDEST, Frame, OperatorGraph
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +24,45 @@ class FlowMode(Enum):
     EMERGENCY_ONLY = "emergency_only"
 
 
+# Per-mode stream settings. Queue depth and backpressure apply to the
+# streaming operator graph: lossless under optimal conditions, freshest-frame
+# (drop oldest non-critical) once the link or the device is constrained.
+FLOW_MODE_SETTINGS = {
+    FlowMode.ULTRA_LOW_LATENCY: {
+        "compression": "none",
+        "frame_rate": 60,
+        "resolution": "1080p",
+        "priority_streams": ["ultrasound", "ecg", "vital_signs", "environmental"],
+        "queue_depth": 4,
+        "backpressure": BLOCK
+    },
+    FlowMode.ADAPTIVE_COMPRESSION: {
+        "compression": "h264",
+        "frame_rate": 30,
+        "resolution": "720p",
+        "priority_streams": ["ultrasound", "ecg", "vital_signs"],
+        "queue_depth": 4,
+        "backpressure": DROP_OLDEST
+    },
+    FlowMode.BANDWIDTH_SAVER: {
+        "compression": "h265",
+        "frame_rate": 15,
+        "resolution": "480p",
+        "priority_streams": ["ecg", "vital_signs"],
+        "queue_depth": 2,
+        "backpressure": DROP_OLDEST
+    },
+    FlowMode.EMERGENCY_ONLY: {
+        "compression": "aggressive",
+        "frame_rate": 5,
+        "resolution": "360p",
+        "priority_streams": ["vital_signs"],
+        "queue_depth": 1,
+        "backpressure": DROP_OLDEST
+    }
+}
+
+
 class HoloscanProductionPipeline:
     """
     NVIDIA Holoscan SDK (PB 25h1) with Dynamic Flow Control.
@@ -47,6 +89,10 @@ class HoloscanProductionPipeline:
         self.bandwidth_threshold = bandwidth_threshold
         self.current_mode = FlowMode.ULTRA_LOW_LATENCY
         self.active_streams = {}
+        self.frame_ring = None
+        self.frame_field = "raw"
+        self.graph: Optional[OperatorGraph] = None
+        self._stats_lock = threading.Lock()
         
         logger.info(f"Initializing Holoscan Pipeline on {device}")
         logger.info(f"Thermal limit: {thermal_limit}°C, Bandwidth threshold: {bandwidth_threshold} Mbps")
@@ -100,38 +146,15 @@ class HoloscanProductionPipeline:
     
     def _apply_mode_settings(self, mode: FlowMode):
         """Apply flow control settings for the given mode."""
-        settings = {
-            FlowMode.ULTRA_LOW_LATENCY: {
-                "compression": "none",
-                "frame_rate": 60,
-                "resolution": "1080p",
-                "priority_streams": ["ultrasound", "ecg", "vital_signs", "environmental"]
-            },
-            FlowMode.ADAPTIVE_COMPRESSION: {
-                "compression": "h264",
-                "frame_rate": 30,
-                "resolution": "720p",
-                "priority_streams": ["ultrasound", "ecg", "vital_signs"]
-            },
-            FlowMode.BANDWIDTH_SAVER: {
-                "compression": "h265",
-                "frame_rate": 15,
-                "resolution": "480p",
-                "priority_streams": ["ecg", "vital_signs"]
-            },
-            FlowMode.EMERGENCY_ONLY: {
-                "compression": "aggressive",
-                "frame_rate": 5,
-                "resolution": "360p",
-                "priority_streams": ["vital_signs"]
-            }
-        }
-        
-        current_settings = settings[mode]
+        current_settings = FLOW_MODE_SETTINGS[mode]
         logger.info(f"Applying settings: {current_settings}")
         
         # Update active streams
         self._update_stream_priorities(current_settings["priority_streams"])
+        
+        # Backpressure for the streaming graph follows the mode
+        if self.graph is not None:
+            self.graph.set_backpressure(current_settings["queue_depth"], current_settings["backpressure"])
     
     def _update_stream_priorities(self, priority_streams: List[str]):
         """Update stream priorities based on current mode."""
@@ -182,10 +205,26 @@ class HoloscanProductionPipeline:
         logger.info(f"Registered stream: {stream_id} ({stream_type})")
         return True
     
+    def attach_frame_ring(self, ring: Any, field: str = "raw"):
+        """
+        Read frames from a shared-memory frame ring.
+        
+        Once attached, `process_frame` also accepts a slot index and works on
+        the slot's buffer in place instead of a `bytes` copy of the frame.
+        
+        Args:
+            ring: `kinetic_sensory.frame_ring.FrameRing` (or anything with
+                a `view(slot, field)` method)
+            field: Slot field holding the raw frame
+        """
+        self.frame_ring = ring
+        self.frame_field = field
+        logger.info(f"Attached frame ring ({field})")
+    
     def process_frame(
         self,
         stream_id: str,
-        frame_data: bytes,
+        frame_data: Union[bytes, memoryview, int],
         timestamp: float
     ) -> Optional[Dict]:
         """
@@ -193,7 +232,8 @@ class HoloscanProductionPipeline:
         
         Args:
             stream_id: Stream identifier
-            frame_data: Raw frame data
+            frame_data: Raw frame data (any buffer, not copied), or a slot
+                index into the attached frame ring
             timestamp: Frame timestamp
         
         Returns:
@@ -210,6 +250,14 @@ class HoloscanProductionPipeline:
             stream["frames_dropped"] += 1
             return None
         
+        slot = None
+        if isinstance(frame_data, int):
+            if self.frame_ring is None:
+                logger.error(f"Slot {frame_data} for {stream_id} but no frame ring attached")
+                return None
+            slot = frame_data
+            frame_data = self.frame_ring.view(slot, self.frame_field)
+        
         # Process frame based on current mode
         processed = self._process_with_mode(frame_data, stream)
         
@@ -217,6 +265,7 @@ class HoloscanProductionPipeline:
         
         return {
             "stream_id": stream_id,
+            "slot": slot,
             "timestamp": timestamp,
             "processed_data": processed,
             "mode": self.current_mode.value,
@@ -225,20 +274,128 @@ class HoloscanProductionPipeline:
     
     def _process_with_mode(
         self,
-        frame_data: bytes,
+        frame_data: Union[bytes, memoryview],
         stream: Dict
-    ) -> bytes:
+    ) -> Union[bytes, memoryview]:
         """Process frame data according to current flow mode."""
         # Placeholder for actual processing
         # In production, this applies compression, downscaling, etc.
         return frame_data
     
+    def start_streaming(
+        self,
+        operators: List[Tuple[str, Callable[[Any], Any]]],
+        sink: Optional[Callable[[Dict], None]] = None
+    ) -> OperatorGraph:
+        """
+        Run frames through a pipelined operator graph instead of inline.
+        
+        Each operator (e.g. format conversion, inference, overlay) gets its
+        own worker thread and bounded input queue; a final flow-control
+        operator applies `_process_with_mode`. Queue depth and backpressure
+        follow the current flow mode and are updated by `adjust_flow`.
+        
+        Args:
+            operators: (name, fn) pairs; fn maps a frame payload to the next
+                payload, or None to filter the frame out
+            sink: Called with processed frame metadata (as from `process_frame`)
+        
+        Returns:
+            The running operator graph
+        """
+        if self.graph is not None:
+            self.stop_streaming()
+        
+        settings = FLOW_MODE_SETTINGS[self.current_mode]
+        graph = OperatorGraph(
+            queue_capacity=settings["queue_depth"],
+            policy=settings["backpressure"],
+            sink=lambda frame: self._emit_frame(frame, sink),
+            on_drop=self._count_drop
+        )
+        for name, fn in operators:
+            graph.add_operator(name, fn)
+        graph.add_operator("flow_control", lambda data: self._process_with_mode(data, None))
+        graph.start()
+        
+        self.graph = graph
+        return graph
+    
+    def submit_frame(
+        self,
+        stream_id: str,
+        frame_data: Any,
+        timestamp: float
+    ) -> bool:
+        """
+        Queue a frame on the streaming graph (non-blocking unless backpressure
+        is "block" or the frame is critical and every queued frame is too).
+        
+        Frames from streams registered with metadata {"critical": True} are
+        never evicted by drop-oldest backpressure.
+        
+        Returns:
+            True if the frame was queued, False if rejected
+        """
+        if self.graph is None:
+            raise RuntimeError("Streaming not started; call start_streaming first")
+        if stream_id not in self.active_streams:
+            logger.error(f"Unknown stream: {stream_id}")
+            return False
+        
+        stream = self.active_streams[stream_id]
+        if not stream["enabled"]:
+            self._count_drop(stream_id)
+            return False
+        
+        self.graph.submit(
+            frame_data,
+            stream_id=stream_id,
+            timestamp=timestamp,
+            critical=bool(stream["metadata"].get("critical", False))
+        )
+        return True
+    
+    def stop_streaming(self) -> Dict:
+        """Drain the streaming graph and return its metrics."""
+        if self.graph is None:
+            return {}
+        self.graph.stop()
+        metrics = self.graph.metrics()
+        self.graph = None
+        return metrics
+    
+    def _emit_frame(self, frame: Frame, sink: Optional[Callable[[Dict], None]]):
+        """Account a frame leaving the graph and pass it on."""
+        stream = self.active_streams.get(frame.stream_id)
+        if stream is None:
+            return
+        with self._stats_lock:
+            stream["frames_processed"] += 1
+            frame_number = stream["frames_processed"]
+        if sink is not None:
+            sink({
+                "stream_id": frame.stream_id,
+                "timestamp": frame.timestamp,
+                "processed_data": frame.data,
+                "mode": self.current_mode.value,
+                "frame_number": frame_number
+            })
+    
+    def _count_drop(self, frame: Union[Frame, str]):
+        """Count a frame dropped by flow control, backpressure or a failing operator."""
+        stream_id = frame.stream_id if isinstance(frame, Frame) else frame
+        stream = self.active_streams.get(stream_id)
+        if stream is not None:
+            with self._stats_lock:
+                stream["frames_dropped"] += 1
+    
     def get_statistics(self) -> Dict:
         """Get pipeline statistics."""
         total_processed = sum(s["frames_processed"] for s in self.active_streams.values())
         total_dropped = sum(s["frames_dropped"] for s in self.active_streams.values())
         
-        return {
+        stats = {
             "current_mode": self.current_mode.value,
             "active_streams": len([s for s in self.active_streams.values() if s["enabled"]]),
             "total_streams": len(self.active_streams),
@@ -246,6 +403,9 @@ class HoloscanProductionPipeline:
             "frames_dropped": total_dropped,
             "drop_rate": total_dropped / (total_processed + total_dropped) if (total_processed + total_dropped) > 0 else 0
         }
+        if self.graph is not None:
+            stats["operators"] = self.graph.metrics()["operators"]
+        return stats
     
     def configure_medical_instrument(
         self,
@@ -12,6 +12,8 @@ Compliance:
 """
 
 import json
+import os
+import sys
 import logging
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -19,6 +21,15 @@ from enum import Enum
 import numpy as np
 from dataclasses import dataclass
 
+try:
+    from civilization_os.placement import KM_PER_DEGREE, PopulationRaster, select_facilities
+    from civilization_os.spatial_index import SpatialIndex, create_spatial_index
+except ImportError:
+    # Fallback for standalone execution: import from the repository root
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from civilization_os.placement import KM_PER_DEGREE, PopulationRaster, select_facilities
+    from civilization_os.spatial_index import SpatialIndex, create_spatial_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +53,21 @@ class SimulationMode(Enum):
     CLIMATE_ADAPTATION = "climate_adaptation"
 
 
+# Service radius per infrastructure type (Sphere / WHO access standards where defined)
+SERVICE_RADIUS_KM = {
+    "health_facility": 5.0,       # WHO: within 5 km / one hour's walk
+    "water_system": 0.5,          # Sphere: water point within 500 m
+    "power_grid": 2.0,
+    "transport": 1.0,
+    "education": 3.0,
+    "sanitation": 0.05,           # Sphere: toilet within 50 m
+    "emergency_response": 10.0
+}
+
+# Cost of one new facility (USD)
+FACILITY_COST = 1000000
+
+
 @dataclass
 class UrbanEntity:
     """Represents an entity in the digital twin"""
@@ -82,7 +108,8 @@ class OmniverseTwin:
         city_name: str,
         population: int,
         geographic_bounds: Dict[str, Tuple[float, float]],
-        enable_omniverse: bool = False
+        enable_omniverse: bool = False,
+        spatial_backend: str = "grid"
     ):
         self.city_name = city_name
         self.population = population
@@ -92,6 +119,17 @@ class OmniverseTwin:
         # Urban entities registry
         self.entities: Dict[str, UrbanEntity] = {}
         
+        # One spatial index per entity type over (lat, lng)
+        self.spatial_backend = spatial_backend
+        self.spatial_indexes: Dict[InfrastructureType, SpatialIndex] = {}
+        
+        # Population density raster for coverage (uniform until real data is loaded)
+        self.population_raster = PopulationRaster.uniform(
+            population,
+            geographic_bounds.get("lat", (0, 1)),
+            geographic_bounds.get("lng", (0, 1))
+        )
+        
         # Simulation history
         self.simulation_history: List[SimulationResult] = []
         
@@ -128,11 +166,61 @@ class OmniverseTwin:
             metadata=metadata or {}
         )
         
+        previous = self.entities.get(entity_id)
+        if previous is not None and previous.entity_type != entity_type:
+            self.spatial_indexes[previous.entity_type].remove(entity_id)
+        
         self.entities[entity_id] = entity
+        self._spatial_index(entity_type).insert(entity_id, location[0], location[1])
         
         logger.info(f"✅ Registered entity: {entity_id} ({entity_type.value})")
         return entity
     
+    def set_population_density(self, density: np.ndarray):
+        """
+        Load a population density raster spanning the twin's geographic bounds.
+        
+        Args:
+            density: People per cell, rows along latitude, columns along longitude
+        """
+        self.population_raster = PopulationRaster(
+            np.asarray(density, dtype=float),
+            self.geographic_bounds.get("lat", (0, 1)),
+            self.geographic_bounds.get("lng", (0, 1))
+        )
+        logger.info(f"🗺️ Population raster loaded - {self.population_raster.shape}, {density.sum():,.0f} people")
+    
+    def move_entity(self, entity_id: str, location: Tuple[float, float, float]) -> UrbanEntity:
+        """
+        Update an entity's location (e.g. a relocated mobile clinic).
+        
+        Args:
+            entity_id: Registered entity
+            location: New coordinates (lat, lng, elevation)
+        
+        Returns:
+            Updated UrbanEntity
+        """
+        entity = self.entities[entity_id]
+        entity.location = location
+        self.spatial_indexes[entity.entity_type].move(entity_id, location[0], location[1])
+        return entity
+    
+    def remove_entity(self, entity_id: str) -> UrbanEntity:
+        """
+        Remove an entity from the digital twin.
+        
+        Args:
+            entity_id: Registered entity
+        
+        Returns:
+            The removed UrbanEntity
+        """
+        entity = self.entities.pop(entity_id)
+        self.spatial_indexes[entity.entity_type].remove(entity_id)
+        logger.info(f"🗑️ Removed entity: {entity_id}")
+        return entity
+    
     def simulate_outbreak_response(
         self,
         outbreak_location: Tuple[float, float],
@@ -224,43 +312,75 @@ class OmniverseTwin:
         self,
         entity_type: InfrastructureType,
         target_coverage: float = 0.95,
-        budget_constraint: Optional[float] = None
+        budget_constraint: Optional[float] = None,
+        candidate_sites: Optional[List[Tuple[float, float]]] = None,
+        service_radius_km: Optional[float] = None,
+        max_facilities: int = 50
     ) -> Dict:
         """
         Optimize placement of new infrastructure to maximize population coverage.
         
+        Every candidate is scored against the population raster at once, then
+        sites are chosen by lazy-greedy maximum coverage until the target
+        coverage, the budget or `max_facilities` is reached.
+        
         Args:
             entity_type: Type of infrastructure to optimize
             target_coverage: Target population coverage (0-1)
             budget_constraint: Maximum budget (optional)
+            candidate_sites: Candidate (lat, lng) sites (default: populated raster cells)
+            service_radius_km: Coverage radius (default: SERVICE_RADIUS_KM for the type)
+            max_facilities: Maximum new facilities
         
         Returns:
             Optimization results with recommended placements
         """
         # Get existing entities of this type
         existing = [e for e in self.entities.values() if e.entity_type == entity_type]
+        radius_km = service_radius_km or SERVICE_RADIUS_KM.get(entity_type.value, 5.0)
         
-        # Calculate current coverage
-        current_coverage = self._calculate_coverage(existing)
+        sites = (
+            np.asarray(candidate_sites, dtype=float).reshape(-1, 2)
+            if candidate_sites is not None
+            else self.population_raster.cell_centers()
+        )
         
-        # Generate optimal placement candidates
-        candidates = self._generate_placement_candidates(
-            entity_type=entity_type,
+        selection = select_facilities(
+            raster=self.population_raster,
+            sites=sites,
+            radius_km=radius_km,
+            costs=np.full(len(sites), FACILITY_COST, dtype=float),
+            budget=budget_constraint,
+            max_facilities=max_facilities,
             target_coverage=target_coverage,
-            existing=existing
+            existing=np.array([e.location[:2] for e in existing], dtype=float).reshape(-1, 2)
         )
         
-        # Apply budget constraint if provided
-        if budget_constraint:
-            candidates = self._apply_budget_constraint(candidates, budget_constraint)
+        total_population = float(self.population_raster.density.sum()) or 1.0
+        placements = [
+            {
+                "location": (float(sites[i, 0]), float(sites[i, 1]), 0.0),
+                "capacity": int(self.population * 0.002),
+                "cost": FACILITY_COST,
+                "coverage_improvement": gain / total_population
+            }
+            for i, gain in zip(selection["selected"], selection["marginal_gains"])
+        ]
+        
+        logger.info(
+            f"📍 Placement optimized - {len(sites):,} candidates, "
+            f"{len(placements)} selected, {selection['evaluations']:,} coverage evaluations"
+        )
         
         return {
             "entity_type": entity_type.value,
-            "current_coverage": current_coverage,
+            "current_coverage": selection["baseline_coverage"],
             "target_coverage": target_coverage,
-            "recommended_placements": candidates,
-            "estimated_cost": sum(c["cost"] for c in candidates),
-            "projected_coverage": self._calculate_projected_coverage(existing, candidates)
+            "service_radius_km": radius_km,
+            "candidates_evaluated": len(sites),
+            "recommended_placements": placements,
+            "estimated_cost": sum(c["cost"] for c in placements),
+            "projected_coverage": selection["projected_coverage"]
         }
     
     def simulate_disaster_preparedness(
@@ -376,6 +496,19 @@ class OmniverseTwin:
         logger.info(f"📦 Exported to Omniverse: {output_path}")
         return True
     
+    def _spatial_index(self, entity_type: InfrastructureType) -> SpatialIndex:
+        """Spatial index for one entity type (created on first use)"""
+        index = self.spatial_indexes.get(entity_type)
+        if index is None:
+            index = self.spatial_indexes[entity_type] = create_spatial_index(self.spatial_backend)
+        return index
+    
+    def _indexes_for(self, entity_type: Optional[InfrastructureType]) -> List[SpatialIndex]:
+        if entity_type:
+            index = self.spatial_indexes.get(entity_type)
+            return [index] if index is not None else []
+        return list(self.spatial_indexes.values())
+    
     def _find_entities_in_radius(
         self,
         center: Tuple[float, float],
@@ -383,37 +516,41 @@ class OmniverseTwin:
         entity_type: Optional[InfrastructureType] = None
     ) -> List[UrbanEntity]:
         """Find entities within radius of center point"""
-        entities = []
-        
-        for entity in self.entities.values():
-            if entity_type and entity.entity_type != entity_type:
-                continue
-            
-            # Calculate distance (simplified haversine)
-            distance = self._calculate_distance(center, entity.location[:2])
-            
-            if distance <= radius_km:
-                entities.append(entity)
-        
-        return entities
+        radius = radius_km / KM_PER_DEGREE
+        return [
+            self.entities[entity_id]
+            for index in self._indexes_for(entity_type)
+            for entity_id in index.query_radius(center[0], center[1], radius)
+        ]
     
     def _find_entities_in_bounds(
         self,
         bounds: Dict[str, Tuple[float, float]]
     ) -> List[UrbanEntity]:
         """Find entities within geographic bounds"""
-        entities = []
-        
         lat_min, lat_max = bounds.get("lat", (-90, 90))
         lng_min, lng_max = bounds.get("lng", (-180, 180))
         
-        for entity in self.entities.values():
-            lat, lng, _ = entity.location
-            
-            if lat_min <= lat <= lat_max and lng_min <= lng <= lng_max:
-                entities.append(entity)
-        
-        return entities
+        return [
+            self.entities[entity_id]
+            for index in self._indexes_for(None)
+            for entity_id in index.query_bbox(lat_min, lng_min, lat_max, lng_max)
+        ]
+    
+    def _find_nearest_entities(
+        self,
+        center: Tuple[float, float],
+        k: int = 1,
+        entity_type: Optional[InfrastructureType] = None
+    ) -> List[Tuple[UrbanEntity, float]]:
+        """Find the k entities closest to center as (entity, distance_km), closest first"""
+        found = [
+            (distance, entity_id)
+            for index in self._indexes_for(entity_type)
+            for entity_id, distance in index.nearest(center[0], center[1], k)
+        ]
+        found.sort(key=lambda item: item[0])
+        return [(self.entities[entity_id], distance * KM_PER_DEGREE) for distance, entity_id in found[:k]]
     
     def _calculate_distance(
         self,
@@ -428,7 +565,7 @@ class OmniverseTwin:
         dlat = abs(lat2 - lat1)
         dlng = abs(lng2 - lng1)
         
-        return np.sqrt(dlat**2 + dlng**2) * 111  # Rough km conversion
+        return np.sqrt(dlat**2 + dlng**2) * KM_PER_DEGREE  # Rough km conversion
     
     def _optimize_resource_allocation(
         self,
@@ -457,92 +594,6 @@ class OmniverseTwin:
         
         return allocation
     
-    def _calculate_coverage(self, entities: List[UrbanEntity]) -> float:
-        """Calculate population coverage by entities"""
-        if not entities:
-            return 0.0
-        
-        # Simplified coverage calculation
-        total_capacity = sum(e.capacity for e in entities)
-        return min(1.0, total_capacity / (self.population * 0.02))  # 2% coverage target
-    
-    def _generate_placement_candidates(
-        self,
-        entity_type: InfrastructureType,
-        target_coverage: float,
-        existing: List[UrbanEntity]
-    ) -> List[Dict]:
-        """Generate optimal placement candidates"""
-        # Simplified candidate generation
-        current_coverage = self._calculate_coverage(existing)
-        gap = target_coverage - current_coverage
-        
-        if gap <= 0:
-            return []
-        
-        # Generate candidates
-        candidates = []
-        num_needed = max(1, int(gap * 10))
-        
-        for i in range(num_needed):
-            candidates.append({
-                "location": self._generate_optimal_location(existing),
-                "capacity": int(self.population * 0.002),
-                "cost": 1000000,  # $1M per facility
-                "coverage_improvement": gap / num_needed
-            })
-        
-        return candidates
-    
-    def _generate_optimal_location(
-        self,
-        existing: List[UrbanEntity]
-    ) -> Tuple[float, float, float]:
-        """Generate optimal location for new entity"""
-        # Simplified: Random location within bounds
-        lat_min, lat_max = self.geographic_bounds.get("lat", (0, 1))
-        lng_min, lng_max = self.geographic_bounds.get("lng", (0, 1))
-        
-        return (
-            np.random.uniform(lat_min, lat_max),
-            np.random.uniform(lng_min, lng_max),
-            0.0
-        )
-    
-    def _apply_budget_constraint(
-        self,
-        candidates: List[Dict],
-        budget: float
-    ) -> List[Dict]:
-        """Apply budget constraint to candidates"""
-        # Sort by coverage improvement per cost
-        sorted_candidates = sorted(
-            candidates,
-            key=lambda c: c["coverage_improvement"] / c["cost"],
-            reverse=True
-        )
-        
-        # Select candidates within budget
-        selected = []
-        remaining_budget = budget
-        
-        for candidate in sorted_candidates:
-            if candidate["cost"] <= remaining_budget:
-                selected.append(candidate)
-                remaining_budget -= candidate["cost"]
-        
-        return selected
-    
-    def _calculate_projected_coverage(
-        self,
-        existing: List[UrbanEntity],
-        candidates: List[Dict]
-    ) -> float:
-        """Calculate projected coverage with new placements"""
-        current = self._calculate_coverage(existing)
-        improvement = sum(c["coverage_improvement"] for c in candidates)
-        return min(1.0, current + improvement)
-    
     def _calculate_damage_probability(
         self,
         entity_type: InfrastructureType,
@@ -0,0 +1,220 @@
+"""
+Infrastructure Placement - Coverage scoring and facility selection
+Part of iLuminara Civilization OS
+
+Scores candidate sites against a population density raster and selects
+facilities for maximum population coverage:
+- A site covers every raster cell whose centre lies within its service
+  radius. On a regular raster that footprint is, row by row, one contiguous
+  run of columns, so coverage is stored as (first, last) column per row
+  instead of a cell list.
+- The population a site would newly cover is a difference of row prefix sums
+  over those runs, so all candidates are scored in one (sites x rows) gather.
+- Coverage is submodular, so multi-facility selection uses lazy greedy
+  (CELF): a candidate's stale gain is an upper bound on its current gain and
+  only the heap top is re-scored each round.
+"""
+
+import heapq
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Rough km per degree (planar lat/lng distance, as used by the twin)
+KM_PER_DEGREE = 111
+
+
+@dataclass
+class PopulationRaster:
+    """People per cell on a regular lat/lng grid (rows = lat, columns = lng)"""
+    density: np.ndarray                 # (rows, cols)
+    lat_bounds: Tuple[float, float]
+    lng_bounds: Tuple[float, float]
+
+    @classmethod
+    def uniform(
+        cls,
+        population: int,
+        lat_bounds: Tuple[float, float],
+        lng_bounds: Tuple[float, float],
+        shape: Tuple[int, int] = (64, 64)
+    ) -> 'PopulationRaster':
+        """Population spread evenly over the bounds"""
+        return cls(np.full(shape, population / (shape[0] * shape[1])), tuple(lat_bounds), tuple(lng_bounds))
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.density.shape
+
+    @property
+    def cell_size(self) -> Tuple[float, float]:
+        """(lat, lng) size of one cell in degrees"""
+        rows, cols = self.shape
+        return ((self.lat_bounds[1] - self.lat_bounds[0]) / rows,
+                (self.lng_bounds[1] - self.lng_bounds[0]) / cols)
+
+    @property
+    def lat_centers(self) -> np.ndarray:
+        return self.lat_bounds[0] + (np.arange(self.shape[0]) + 0.5) * self.cell_size[0]
+
+    @property
+    def lng_centers(self) -> np.ndarray:
+        return self.lng_bounds[0] + (np.arange(self.shape[1]) + 0.5) * self.cell_size[1]
+
+    def cell_centers(self, populated_only: bool = True) -> np.ndarray:
+        """(n, 2) lat/lng centres of (populated) cells"""
+        rows, cols = np.nonzero(self.density > 0) if populated_only else np.indices(self.shape).reshape(2, -1)
+        return np.column_stack([self.lat_centers[rows], self.lng_centers[cols]])
+
+    def coverage_runs(self, sites: np.ndarray, radius_km: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Covered column run per (site, row).
+
+        Returns:
+            first, last: (sites, rows) column indices, empty where last < first
+        """
+        sites = np.asarray(sites, dtype=float).reshape(-1, 2)
+        radius = radius_km / KM_PER_DEGREE
+        cols = self.shape[1]
+        lng0 = self.lng_centers[0]
+        step = self.cell_size[1]
+
+        dlat = self.lat_centers[None, :] - sites[:, :1]
+        half = np.sqrt(np.maximum(radius * radius - dlat * dlat, 0.0))
+        half[np.abs(dlat) > radius] = -1.0  # row out of reach
+
+        first = np.ceil((sites[:, 1:] - half - lng0) / step - 1e-9)
+        last = np.floor((sites[:, 1:] + half - lng0) / step + 1e-9)
+        first = np.clip(first, 0, cols).astype(np.int64)
+        last = np.clip(last, -1, cols - 1).astype(np.int64)
+        last[half < 0] = -1
+        return first, last
+
+
+def run_sums(prefix: np.ndarray, first: np.ndarray, last: np.ndarray) -> np.ndarray:
+    """Sum of a raster over coverage runs, from row prefix sums (rows, cols + 1)"""
+    rows = np.arange(prefix.shape[0])
+    totals = prefix[rows, np.maximum(last + 1, first)] - prefix[rows, first]
+    return totals.sum(axis=-1)
+
+
+def row_prefix(values: np.ndarray) -> np.ndarray:
+    """Row-wise prefix sums with a leading zero column"""
+    prefix = np.zeros((values.shape[0], values.shape[1] + 1))
+    np.cumsum(values, axis=1, out=prefix[:, 1:])
+    return prefix
+
+
+def mark_covered(uncovered: np.ndarray, first: np.ndarray, last: np.ndarray):
+    """Zero the cells covered by one site's runs"""
+    for row in np.nonzero(last >= first)[0]:
+        uncovered[row, first[row]:last[row] + 1] = 0.0
+
+
+def select_facilities(
+    raster: PopulationRaster,
+    sites: np.ndarray,
+    radius_km: float,
+    costs: Optional[Sequence[float]] = None,
+    budget: Optional[float] = None,
+    max_facilities: Optional[int] = None,
+    target_coverage: Optional[float] = None,
+    existing: Optional[np.ndarray] = None,
+    lazy_batch: int = 32
+) -> Dict:
+    """
+    Lazy-greedy maximum-coverage facility selection.
+
+    Each round picks the site with the best newly covered population per unit
+    cost that still fits the budget. Stops at the target coverage, the
+    facility limit, the budget, or when no site adds coverage.
+
+    Args:
+        raster: Population density
+        sites: (n, 2) candidate lat/lng
+        radius_km: Service radius
+        costs: Per-site cost, positive (default 1 each)
+        budget: Total budget (default unlimited); 0 selects nothing
+        max_facilities: Maximum sites to select
+        target_coverage: Stop once this population share is covered
+        existing: (m, 2) lat/lng of facilities already in place
+        lazy_batch: Stale candidates re-scored together per heap refresh
+
+    Returns:
+        Dict with selected site indices, marginal gains (people), and
+        coverage before/after as population shares
+    """
+    sites = np.asarray(sites, dtype=float).reshape(-1, 2)
+    costs = np.ones(len(sites)) if costs is None else np.asarray(costs, dtype=float)
+    budget = math.inf if budget is None else float(budget)
+    max_facilities = len(sites) if max_facilities is None else max_facilities
+
+    uncovered = raster.density.astype(float).copy()
+    total = float(uncovered.sum())
+    if existing is not None and len(existing):
+        ex_first, ex_last = raster.coverage_runs(existing, radius_km)
+        for i in range(len(ex_first)):
+            mark_covered(uncovered, ex_first[i], ex_last[i])
+    baseline = 1.0 - float(uncovered.sum()) / total if total > 0 else 0.0
+
+    first, last = raster.coverage_runs(sites, radius_km)
+    prefix = row_prefix(uncovered)
+    gains = run_sums(prefix, first, last)
+
+    # Max-heap on gain per cost; round stamps mark which gains are current
+    heap = [(-gains[i] / costs[i], i, 0) for i in np.nonzero(gains > 0)[0]]
+    heapq.heapify(heap)
+
+    selected, marginal = [], []
+    spent, covered, round_no = 0.0, total - float(uncovered.sum()), 0
+    evaluations = len(sites)
+    while heap and len(selected) < max_facilities:
+        if target_coverage is not None and total > 0 and covered / total >= target_coverage:
+            break
+        _, i, stamp = heapq.heappop(heap)
+        if spent + costs[i] > budget:
+            continue  # never affordable again: budgets only shrink
+        if stamp != round_no:
+            # Re-score a few stale heap tops in one vectorized gather
+            stale = [i]
+            while heap and len(stale) < lazy_batch and heap[0][2] != round_no:
+                stale.append(heapq.heappop(heap)[1])
+            stale = np.array(stale)
+            fresh = run_sums(prefix, first[stale], last[stale])
+            evaluations += len(stale)
+            for j, gain in zip(stale, fresh):
+                if gain > 0:
+                    heapq.heappush(heap, (-gain / costs[j], int(j), round_no))
+            continue
+
+        gain = float(run_sums(prefix, first[i], last[i]))
+        selected.append(int(i))
+        marginal.append(gain)
+        spent += costs[i]
+        covered += gain
+        mark_covered(uncovered, first[i], last[i])
+        prefix = row_prefix(uncovered)
+        round_no += 1
+
+    return {
+        "selected": selected,
+        "marginal_gains": marginal,
+        "total_cost": spent,
+        "baseline_coverage": baseline,
+        "projected_coverage": covered / total if total > 0 else 0.0,
+        "evaluations": evaluations
+    }
+
+
+def coverage_fraction(raster: PopulationRaster, sites: np.ndarray, radius_km: float) -> float:
+    """Population share within `radius_km` of any site"""
+    total = float(raster.density.sum())
+    if total <= 0 or len(sites) == 0:
+        return 0.0
+    uncovered = raster.density.astype(float).copy()
+    first, last = raster.coverage_runs(sites, radius_km)
+    for i in range(len(first)):
+        mark_covered(uncovered, first[i], last[i])
+    return 1.0 - float(uncovered.sum()) / total
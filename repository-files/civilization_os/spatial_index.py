@@ -0,0 +1,383 @@
+"""
+Spatial Index - Point indexes for Digital Twin entity queries
+Part of iLuminara Civilization OS
+
+Pluggable 2-D point indexes behind one interface (`SpatialIndex`):
+- `UniformGridIndex`: points bucketed into square cells, stored as one
+  cell-sorted array (CSR layout), so a box query is one contiguous slice per
+  grid column
+- `STRTreeIndex`: R-tree bulk-loaded with Sort-Tile-Recursive packing, queried
+  level by level with vectorized bounding-box tests
+
+Both keep coordinates in growable numpy arrays addressed by slot. The packed
+structure is static: inserts and moves append a new slot to a small pending
+buffer (the old slot is tombstoned), removals only tombstone, and queries scan
+the pending buffer alongside the packed structure. Once the pending buffer
+outgrows `rebuild_fraction` of the index it is repacked, so maintenance is
+amortized O(log n) per update while queries stay output-sensitive.
+
+Supported queries: radius, bounding box and k-nearest neighbours.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+class SpatialIndex(ABC):
+    """Dynamic 2-D point index keyed by entity id"""
+
+    def __init__(self, rebuild_fraction: float = 0.05, min_rebuild: int = 1024):
+        """
+        Args:
+            rebuild_fraction: Repack once pending updates exceed this share of live points
+            min_rebuild: Pending updates always tolerated before repacking
+        """
+        self.rebuild_fraction = rebuild_fraction
+        self.min_rebuild = min_rebuild
+
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._alive = np.zeros(0, dtype=bool)
+        self._keys: List[Optional[Hashable]] = []
+        self._slots: Dict[Hashable, int] = {}
+        self._pending: List[int] = []
+        self._packed_count = 0
+        self._packed_area = 0.0
+
+    # --- MAINTENANCE ---
+
+    def bulk_load(self, keys: Iterable[Hashable], x: Iterable[float], y: Iterable[float]):
+        """Replace the index contents and pack it in one pass"""
+        keys = list(keys)
+        self._x = np.asarray(x, dtype=float).copy()
+        self._y = np.asarray(y, dtype=float).copy()
+        if not len(keys) == len(self._x) == len(self._y):
+            raise ValueError("keys, x and y must have the same length")
+
+        self._keys = keys
+        self._slots = dict(zip(keys, range(len(keys))))
+        if len(self._slots) != len(keys):
+            raise ValueError("duplicate keys in bulk load")
+        self._alive = np.ones(len(keys), dtype=bool)
+        self._pending = []
+        self._pack()
+
+    def insert(self, key: Hashable, x: float, y: float):
+        """Add a point (an existing key is moved)"""
+        if key in self._slots:
+            self._alive[self._slots[key]] = False
+
+        slot = len(self._keys)
+        if slot == len(self._x):
+            self._grow(max(16, 2 * slot))
+        self._x[slot] = x
+        self._y[slot] = y
+        self._alive[slot] = True
+        self._keys.append(key)
+        self._slots[key] = slot
+        self._pending.append(slot)
+        self._maybe_repack()
+
+    def move(self, key: Hashable, x: float, y: float):
+        """Update a point's coordinates"""
+        if key not in self._slots:
+            raise KeyError(key)
+        self.insert(key, x, y)
+
+    def remove(self, key: Hashable):
+        """Delete a point"""
+        slot = self._slots.pop(key)
+        self._alive[slot] = False
+        self._keys[slot] = None
+        self._maybe_repack()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._slots
+
+    def location(self, key: Hashable) -> Tuple[float, float]:
+        slot = self._slots[key]
+        return float(self._x[slot]), float(self._y[slot])
+
+    # --- QUERIES ---
+
+    def query_bbox(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[Hashable]:
+        """Keys of points with min <= coordinate <= max on both axes"""
+        return self._to_keys(self._bbox_slots(min_x, min_y, max_x, max_y))
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[Hashable]:
+        """Keys of points within `radius` (inclusive) of (x, y)"""
+        slots, _ = self._radius_slots(x, y, radius)
+        return self._to_keys(slots)
+
+    def nearest(self, x: float, y: float, k: int = 1) -> List[Tuple[Hashable, float]]:
+        """
+        The k nearest points as (key, distance), closest first.
+
+        Searches a radius sized from the index density and doubles it until
+        it holds k points; every point inside the final radius has been seen,
+        so the k closest of them are exact.
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return []
+
+        radius = self._initial_knn_radius(k)
+        while True:
+            slots, dist = self._radius_slots(x, y, radius)
+            if len(slots) >= k or len(slots) == len(self):
+                break
+            radius *= 2.0
+
+        best = np.argpartition(dist, k - 1)[:k] if len(dist) > k else np.arange(len(dist))
+        best = best[np.lexsort((slots[best], dist[best]))]
+        return [(self._keys[s], float(d)) for s, d in zip(slots[best], dist[best])]
+
+    # --- INTERNALS ---
+
+    @abstractmethod
+    def _build(self, slots: np.ndarray):
+        """Pack the given live slots into the static structure"""
+
+    @abstractmethod
+    def _packed_bbox(self, min_x: float, min_y: float, max_x: float, max_y: float) -> np.ndarray:
+        """Candidate slots from the static structure (may include dead slots)"""
+
+    def _pack(self):
+        """Compact slots (if any are dead) and rebuild the static structure"""
+        n = len(self._keys)
+        if len(self._slots) != n or len(self._x) != n:
+            live = np.nonzero(self._alive[:n])[0]
+            self._x = self._x[live].copy()
+            self._y = self._y[live].copy()
+            self._keys = [self._keys[s] for s in live]
+            self._slots = dict(zip(self._keys, range(len(self._keys))))
+            self._alive = np.ones(len(live), dtype=bool)
+        self._pending = []
+        self._packed_count = len(self._keys)
+        self._packed_area = float(np.ptp(self._x) * np.ptp(self._y)) if self._keys else 0.0
+        self._build(np.arange(len(self._keys)))
+
+    def _maybe_repack(self):
+        dead = len(self._keys) - len(self._slots)
+        if len(self._pending) + dead > max(self.min_rebuild, self.rebuild_fraction * self._packed_count):
+            self._pack()
+
+    def _grow(self, capacity: int):
+        for name in ("_x", "_y"):
+            grown = np.empty(capacity)
+            grown[:len(getattr(self, name))] = getattr(self, name)
+            setattr(self, name, grown)
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:len(self._alive)] = self._alive
+        self._alive = alive
+
+    def _bbox_slots(self, min_x: float, min_y: float, max_x: float, max_y: float) -> np.ndarray:
+        candidates = self._packed_bbox(min_x, min_y, max_x, max_y)
+        if self._pending:
+            candidates = np.concatenate([candidates, np.asarray(self._pending, dtype=np.int64)])
+        x, y = self._x[candidates], self._y[candidates]
+        keep = (self._alive[candidates]
+                & (x >= min_x) & (x <= max_x) & (y >= min_y) & (y <= max_y))
+        return np.sort(candidates[keep])
+
+    def _radius_slots(self, x: float, y: float, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+        slots = self._bbox_slots(x - radius, y - radius, x + radius, y + radius)
+        dist = np.hypot(self._x[slots] - x, self._y[slots] - y)
+        inside = dist <= radius
+        return slots[inside], dist[inside]
+
+    def _initial_knn_radius(self, k: int) -> float:
+        """Radius expected to hold k points at the packed density"""
+        if self._packed_count < 2 or self._packed_area <= 0:
+            return 1.0
+        return max(math.sqrt(self._packed_area * k / (math.pi * self._packed_count)), 1e-9)
+
+    def _to_keys(self, slots: np.ndarray) -> List[Hashable]:
+        keys = self._keys
+        return [keys[s] for s in slots]
+
+
+def _csr_ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Concatenate integer ranges [starts[i], ends[i]) without a Python loop"""
+    lens = np.maximum(ends - starts, 0)
+    total = int(lens.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.arange(total) - np.repeat(np.cumsum(lens) - lens, lens)
+    return np.repeat(starts, lens) + offsets
+
+
+class UniformGridIndex(SpatialIndex):
+    """
+    Uniform grid over the packed points' extent.
+
+    Cells are numbered column-major (cx * ny + cy) and points are stored
+    sorted by cell, so the cells of one grid column inside a query box form a
+    single contiguous range. Points outside the packed extent are clamped to
+    the border cells, which keeps queries exact for any coordinate.
+    """
+
+    def __init__(self, cell_size: Optional[float] = None, points_per_cell: int = 16, **kwargs):
+        """
+        Args:
+            cell_size: Cell side length (default: sized from the data for
+                `points_per_cell` points per cell on average)
+            points_per_cell: Target occupancy when `cell_size` is not given
+        """
+        super().__init__(**kwargs)
+        self.cell_size = cell_size
+        self.points_per_cell = points_per_cell
+        self._origin = (0.0, 0.0)
+        self._size = 1.0
+        self._shape = (1, 1)
+        self._order = np.zeros(0, dtype=np.int64)
+        self._cell_start = np.zeros(2, dtype=np.int64)
+
+    def _build(self, slots: np.ndarray):
+        x, y = self._x[slots], self._y[slots]
+        if len(slots):
+            min_x, min_y = float(x.min()), float(y.min())
+            width, height = float(x.max()) - min_x, float(y.max()) - min_y
+        else:
+            min_x = min_y = width = height = 0.0
+
+        size = self.cell_size
+        if size is None:
+            area = max(width * height, 1e-12)
+            size = math.sqrt(area * self.points_per_cell / max(len(slots), 1))
+        size = max(size, 1e-12)
+        max_cells = 4 * len(slots) + 16
+        while (int(width / size) + 1) * (int(height / size) + 1) > max_cells:
+            size *= 2.0
+        nx, ny = int(width / size) + 1, int(height / size) + 1
+
+        self._origin = (min_x, min_y)
+        self._size = size
+        self._shape = (nx, ny)
+
+        cells = self._cell_x(x) * ny + self._cell_y(y)
+        order = np.argsort(cells, kind="stable")
+        self._order = slots[order]
+        counts = np.bincount(cells, minlength=nx * ny)
+        self._cell_start = np.concatenate([[0], np.cumsum(counts)])
+
+    def _cell_x(self, x) -> np.ndarray:
+        return np.clip(np.floor((np.asarray(x) - self._origin[0]) / self._size), 0, self._shape[0] - 1).astype(np.int64)
+
+    def _cell_y(self, y) -> np.ndarray:
+        return np.clip(np.floor((np.asarray(y) - self._origin[1]) / self._size), 0, self._shape[1] - 1).astype(np.int64)
+
+    def _packed_bbox(self, min_x: float, min_y: float, max_x: float, max_y: float) -> np.ndarray:
+        if len(self._order) == 0 or min_x > max_x or min_y > max_y:
+            return np.zeros(0, dtype=np.int64)
+        cx0, cx1 = int(self._cell_x(min_x)), int(self._cell_x(max_x))
+        cy0, cy1 = int(self._cell_y(min_y)), int(self._cell_y(max_y))
+        ny = self._shape[1]
+        columns = np.arange(cx0, cx1 + 1) * ny
+        positions = _csr_ranges(self._cell_start[columns + cy0], self._cell_start[columns + cy1 + 1])
+        return self._order[positions]
+
+
+class STRTreeIndex(SpatialIndex):
+    """
+    Static R-tree packed with Sort-Tile-Recursive.
+
+    Each level is a set of flat arrays (bounding boxes plus the contiguous
+    child range of every node). A query walks the levels top-down, testing
+    all live nodes of a level against the box in one vectorized step.
+    """
+
+    def __init__(self, leaf_size: int = 32, fanout: int = 16, **kwargs):
+        """
+        Args:
+            leaf_size: Points per leaf
+            fanout: Children per internal node
+        """
+        super().__init__(**kwargs)
+        self.leaf_size = leaf_size
+        self.fanout = fanout
+        self._order = np.zeros(0, dtype=np.int64)
+        self._levels: List[Dict[str, np.ndarray]] = []
+
+    @staticmethod
+    def _str_order(cx: np.ndarray, cy: np.ndarray, group: int) -> np.ndarray:
+        """Permutation putting items into STR tiles of `group` consecutive entries"""
+        n = len(cx)
+        pages = math.ceil(n / group)
+        slices = max(1, math.ceil(math.sqrt(pages)))
+        by_x = np.argsort(cx, kind="stable")
+        slice_id = np.empty(n, dtype=np.int64)
+        slice_id[by_x] = np.arange(n) // (slices * group)
+        return np.lexsort((cy, slice_id))
+
+    @staticmethod
+    def _pack_level(min_x, min_y, max_x, max_y, group: int) -> Dict[str, np.ndarray]:
+        """Bounding boxes of consecutive runs of `group` entries"""
+        starts = np.arange(0, len(min_x), group)
+        return {
+            "min_x": np.minimum.reduceat(min_x, starts),
+            "min_y": np.minimum.reduceat(min_y, starts),
+            "max_x": np.maximum.reduceat(max_x, starts),
+            "max_y": np.maximum.reduceat(max_y, starts),
+            "start": starts,
+            "end": np.minimum(starts + group, len(min_x))
+        }
+
+    def _build(self, slots: np.ndarray):
+        self._levels = []
+        if len(slots) == 0:
+            self._order = slots
+            return
+
+        x, y = self._x[slots], self._y[slots]
+        order = self._str_order(x, y, self.leaf_size)
+        self._order = slots[order]
+        x, y = x[order], y[order]
+        level = self._pack_level(x, y, x, y, self.leaf_size)
+        levels = [level]
+
+        while len(level["start"]) > 1:
+            cx = (level["min_x"] + level["max_x"]) / 2
+            cy = (level["min_y"] + level["max_y"]) / 2
+            order = self._str_order(cx, cy, self.fanout)
+            # Reorder the child level so every parent's children are contiguous
+            level = {name: values[order] for name, values in level.items()}
+            levels[-1] = level
+            level = self._pack_level(level["min_x"], level["min_y"], level["max_x"], level["max_y"], self.fanout)
+            levels.append(level)
+
+        self._levels = levels[::-1]  # root first
+
+    def _packed_bbox(self, min_x: float, min_y: float, max_x: float, max_y: float) -> np.ndarray:
+        if not self._levels:
+            return np.zeros(0, dtype=np.int64)
+
+        nodes = np.arange(len(self._levels[0]["start"]))
+        for depth, level in enumerate(self._levels):
+            hit = ((level["min_x"][nodes] <= max_x) & (level["max_x"][nodes] >= min_x)
+                   & (level["min_y"][nodes] <= max_y) & (level["max_y"][nodes] >= min_y))
+            nodes = nodes[hit]
+            if len(nodes) == 0:
+                return np.zeros(0, dtype=np.int64)
+            nodes = _csr_ranges(level["start"][nodes], level["end"][nodes])
+        return self._order[nodes]
+
+
+SPATIAL_BACKENDS = {
+    "grid": UniformGridIndex,
+    "strtree": STRTreeIndex,
+}
+
+
+def create_spatial_index(backend: str = "grid", **kwargs) -> SpatialIndex:
+    """Instantiate a spatial index backend by name ("grid" or "strtree")"""
+    try:
+        return SPATIAL_BACKENDS[backend](**kwargs)
+    except KeyError:
+        raise ValueError(f"Unknown spatial index backend: {backend}") from None
@@ -0,0 +1,170 @@
+"""
+Agent Execution Pools
+Thread and process execution for MultiAgentCoordinator agents
+
+CPU-bound agents must not run on the event loop: they hold it for their
+whole run and serialize the ensemble. Agents therefore declare an
+execution class:
+- ASYNC: coroutine, awaited on the event loop (I/O-bound agents)
+- THREAD: plain callable run in a thread pool (blocking I/O, or native
+  code that releases the GIL). A thread cannot be stopped: on timeout its
+  result is discarded, but it runs to completion
+- PROCESS: plain picklable (module-level) callable run in a worker process.
+  Timeouts and cancellation are enforced by terminating the worker; the
+  pool starts a replacement on demand
+
+Workers are persistent, so interpreter start-up is paid once per worker,
+not once per call.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionClass(Enum):
+    """Where an agent runs"""
+    ASYNC = "async"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class AgentProcessError(RuntimeError):
+    """An agent raised inside a worker process, or the worker died"""
+
+
+def _worker_main(conn):
+    """Worker process loop: run (fn, args, kwargs) jobs until told to stop"""
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if job is None:
+            return
+        fn, args, kwargs = job
+        try:
+            conn.send((True, fn(*args, **kwargs)))
+        except BaseException as e:
+            conn.send((False, f"{type(e).__name__}: {e}"))
+
+
+class _Worker:
+    __slots__ = ("process", "conn")
+
+    def __init__(self, context):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def kill(self):
+        # The pipe is left to the thread still reading it: terminating the
+        # child makes that read fail with EOFError, then the pipe is collected
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join(timeout=5)
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+
+
+class ProcessAgentPool:
+    """
+    Persistent worker processes with per-call timeout enforcement.
+
+    Each call holds one worker exclusively. If the call times out or the
+    awaiting task is cancelled, the worker is terminated (the agent's work
+    really stops) and replaced lazily.
+    """
+
+    def __init__(self, max_workers: int, mp_context: Optional[str] = "spawn"):
+        """
+        Args:
+            max_workers: Worker processes (concurrent process agents)
+            mp_context: multiprocessing start method ("spawn" avoids forking
+                a process that is already running threads)
+        """
+        self.max_workers = max_workers
+        self.terminated = 0
+        self._context = multiprocessing.get_context(mp_context)
+        self._idle: List[_Worker] = []
+        self._started = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop = None
+        # Threads blocking on worker pipes, so the event loop does not
+        self._waiters = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agent-process-wait")
+
+    def start(self):
+        """Start every worker now instead of on first use"""
+        while self._started < self.max_workers:
+            self._idle.append(_Worker(self._context))
+            self._started += 1
+
+    def _checkout(self) -> _Worker:
+        while self._idle:
+            worker = self._idle.pop()
+            if worker.process.is_alive():
+                return worker
+            worker.kill()
+            self._started -= 1
+        self._started += 1
+        return _Worker(self._context)
+
+    async def run(self, fn: Callable, args: Tuple = (), kwargs: Optional[dict] = None, timeout: Optional[float] = None) -> Any:
+        """
+        Run `fn(*args, **kwargs)` in a worker process.
+
+        Raises:
+            asyncio.TimeoutError: The call exceeded `timeout` (worker terminated)
+            AgentProcessError: The agent raised, or the worker died
+        """
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._slots_loop = loop
+
+        async with self._slots:
+            worker = self._checkout()
+            healthy = False
+            try:
+                worker.conn.send((fn, args, kwargs or {}))
+                ok, value = await asyncio.wait_for(
+                    loop.run_in_executor(self._waiters, worker.conn.recv),
+                    timeout=timeout
+                )
+                healthy = True
+            except (EOFError, ConnectionError) as e:
+                raise AgentProcessError(f"Agent worker exited: {e}") from None
+            finally:
+                if healthy:
+                    self._idle.append(worker)
+                else:
+                    # Timeout, cancellation or a dead worker: stop the work for real
+                    worker.kill()
+                    self._started -= 1
+                    self.terminated += 1
+
+        if not ok:
+            raise AgentProcessError(value)
+        return value
+
+    def shutdown(self):
+        for worker in self._idle:
+            worker.stop()
+        self._idle = []
+        self._started = 0
+        self._waiters.shutdown(wait=False)
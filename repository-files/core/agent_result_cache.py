@@ -0,0 +1,158 @@
+"""
+Agent Result Reuse
+Request coalescing and result caching for MultiAgentCoordinator
+
+During alert storms many callers submit the same query at once:
+- Queries are keyed by a canonical digest (SHA-256 of sorted-key compact
+  JSON, dict keys tagged with their type). Values or keys without an exact
+  JSON form make the query uncacheable rather than risk two different
+  inputs sharing a key
+- SingleFlight: identical in-flight agent runs are shared, so N concurrent
+  callers cost one execution. The run is cancelled only once every waiter
+  has gone away
+- TTLResultCache: completed results are reused for `ttl_seconds`, bounded
+  to `max_entries` (least recently used are evicted)
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class UncacheableQuery(TypeError):
+    """The query contains values without a canonical JSON form"""
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if hasattr(value, "tolist"):
+        return value.tolist()  # numpy arrays and scalars, exactly
+    if isinstance(value, Enum):
+        return value.value
+    raise UncacheableQuery(f"No canonical form for {type(value).__name__}")
+
+
+_KEY_TYPES = (str, bool, int, float, type(None))
+
+
+def _typed_keys(value: Any) -> Any:
+    """
+    Dict keys tagged with their type, so {1: x} and {"1": x} differ and
+    mixed key types still sort
+    """
+    if isinstance(value, dict):
+        tagged = {}
+        for key, item in value.items():
+            if not isinstance(key, _KEY_TYPES):
+                raise UncacheableQuery(f"No canonical form for {type(key).__name__} dict key")
+            tagged[f"{type(key).__name__}:{key!r}"] = _typed_keys(item)
+        return tagged
+    if isinstance(value, (list, tuple)):
+        return [_typed_keys(item) if isinstance(item, (dict, list, tuple)) else item for item in value]
+    return value
+
+
+def canonical_digest(query: Dict[str, Any]) -> str:
+    """
+    SHA-256 of the query as sorted-key compact JSON, keys tagged with their type.
+
+    Raises:
+        UncacheableQuery: A value or dict key has no exact JSON form
+    """
+    encoded = json.dumps(_typed_keys(query), sort_keys=True, separators=(",", ":"), default=_canonical)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class TTLResultCache:
+    """Results valid for `ttl_seconds`, at most `max_entries`"""
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            ttl_seconds: How long a result is reused (0 disables the cache)
+            max_entries: Results kept
+            clock: Time source (monotonic seconds)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if self.clock() >= expires:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        if self.ttl_seconds <= 0:
+            return
+        self._entries[key] = (self.clock() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share one in-flight coroutine between callers with the same key"""
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Await the run for `key`, starting `factory()` if none is in flight.
+
+        Returns:
+            (result, shared) where shared is True if another caller started the run
+        """
+        flight = self._flights.get(key)
+        shared = flight is not None and flight.task.get_loop() is asyncio.get_running_loop()
+        if not shared:
+            flight = _Flight(asyncio.ensure_future(factory()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _, key=key, flight=flight: self._finish(key, flight))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task), shared
+        except asyncio.CancelledError:
+            if flight.waiters == 1:
+                flight.task.cancel()  # last waiter gone: stop the run
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def _finish(self, key: Hashable, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def __len__(self) -> int:
+        return len(self._flights)
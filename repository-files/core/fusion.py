@@ -10,14 +10,61 @@ Compliance:
 
 import hashlib
 import json
+import math
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass, asdict
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+EARTH_RADIUS_KM = 6371.0
+
+# Row block size for the pairwise haversine matrix (bounds memory at ~block * n floats)
+SPATIAL_BLOCK_SIZE = 1024
+
+
+def max_pairwise_haversine_km(latitudes: np.ndarray, longitudes: np.ndarray) -> float:
+    """
+    Maximum great-circle distance over all pairs of points.
+    
+    Evaluates the haversine formula as a broadcasted (block, n) matrix, one
+    row block at a time, so small inputs take a single vectorized pass and
+    large inputs never materialize the full n x n matrix.
+    
+    Args:
+        latitudes: Latitudes in degrees
+        longitudes: Longitudes in degrees
+    
+    Returns:
+        Maximum pairwise distance in km (0.0 for fewer than two points)
+    """
+    n = len(latitudes)
+    if n < 2:
+        return 0.0
+    
+    lat = np.radians(np.asarray(latitudes, dtype=float))
+    lon = np.radians(np.asarray(longitudes, dtype=float))
+    cos_lat = np.cos(lat)
+    
+    max_a = 0.0
+    for start in range(0, n - 1, SPATIAL_BLOCK_SIZE):
+        stop = min(start + SPATIAL_BLOCK_SIZE, n - 1)
+        # Compare each row only against later points (upper triangle)
+        rows = slice(start, stop)
+        cols = slice(start + 1, n)
+        dlat = lat[cols][None, :] - lat[rows][:, None]
+        dlon = lon[cols][None, :] - lon[rows][:, None]
+        a = np.sin(dlat / 2) ** 2 + cos_lat[rows][:, None] * cos_lat[cols][None, :] * np.sin(dlon / 2) ** 2
+        max_a = max(max_a, float(a.max()))
+    
+    # Distance is monotonic in `a`, so only the maximum needs the arctangent
+    max_a = min(max_a, 1.0)
+    return EARTH_RADIUS_KM * 2 * math.atan2(math.sqrt(max_a), math.sqrt(1 - max_a))
+
 
 class DataSource(Enum):
     """Data source types for fusion"""
@@ -106,6 +153,13 @@ class GoldenThreadFusion:
         # Fusion history
         self.fusion_history: List[FusedRecord] = []
         
+        # Running verification statistics, updated per fusion
+        self._stats_total = 0
+        self._stats_status_counts: Dict[str, int] = {}
+        self._stats_score_sum = 0.0
+        self._stats_spatial_sum = 0.0
+        self._stats_temporal_sum = 0.0
+        
         logger.info(f"🧬 Golden Thread initialized - Spatial: {spatial_threshold_km}km, Temporal: {temporal_threshold_hours}h")
     
     def fuse_signals(
@@ -173,6 +227,7 @@ class GoldenThreadFusion:
         
         # Store in history
         self.fusion_history.append(fused_record)
+        self._update_statistics(fused_record)
         
         logger.info(
             f"✅ Fusion complete - Record: {record_id}, "
@@ -186,17 +241,16 @@ class GoldenThreadFusion:
         if len(signals) < 2:
             return 0.0
         
-        max_delta = 0.0
-        for i, signal1 in enumerate(signals):
-            for signal2 in signals[i+1:]:
-                if signal1.latitude and signal1.longitude and signal2.latitude and signal2.longitude:
-                    delta = self._haversine_distance(
-                        signal1.latitude, signal1.longitude,
-                        signal2.latitude, signal2.longitude
-                    )
-                    max_delta = max(max_delta, delta)
-        
-        return max_delta
+        located = [s for s in signals if s.latitude and s.longitude]
+        if len(located) == 2:
+            # Common two-source case: skip array setup
+            a, b = located
+            return self._haversine_distance(a.latitude, a.longitude, b.latitude, b.longitude)
+        
+        return max_pairwise_haversine_km(
+            np.fromiter((s.latitude for s in located), dtype=float, count=len(located)),
+            np.fromiter((s.longitude for s in located), dtype=float, count=len(located))
+        )
     
     def _calculate_temporal_delta(self, signals: List[DataSignal]) -> float:
         """Calculate maximum temporal distance between signals"""
@@ -338,47 +392,46 @@ class GoldenThreadFusion:
         lat2: float, lon2: float
     ) -> float:
         """Calculate distance between two points using Haversine formula"""
-        from math import radians, sin, cos, sqrt, atan2
-        
-        R = 6371.0  # Earth radius in km
-        
-        lat1_rad = radians(lat1)
-        lon1_rad = radians(lon1)
-        lat2_rad = radians(lat2)
-        lon2_rad = radians(lon2)
+        lat1_rad = math.radians(lat1)
+        lon1_rad = math.radians(lon1)
+        lat2_rad = math.radians(lat2)
+        lon2_rad = math.radians(lon2)
         
         dlat = lat2_rad - lat1_rad
         dlon = lon2_rad - lon1_rad
         
-        a = sin(dlat/2)**2 + cos(lat1_rad) * cos(lat2_rad) * sin(dlon/2)**2
-        c = 2 * atan2(sqrt(a), sqrt(1-a))
+        a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
+        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
         
-        return R * c
+        return EARTH_RADIUS_KM * c
     
     def get_fusion_history(self, limit: int = 100) -> List[FusedRecord]:
         """Get recent fusion history"""
         return self.fusion_history[-limit:]
     
+    def _update_statistics(self, record: FusedRecord):
+        """Fold one fused record into the running statistics"""
+        status = record.verification_status.name
+        self._stats_total += 1
+        self._stats_status_counts[status] = self._stats_status_counts.get(status, 0) + 1
+        self._stats_score_sum += record.verification_score
+        self._stats_spatial_sum += record.spatial_delta_km
+        self._stats_temporal_sum += record.temporal_delta_hours
+    
     def get_verification_statistics(self) -> Dict:
-        """Get verification statistics"""
-        if not self.fusion_history:
+        """Get verification statistics (O(1), from running counters)"""
+        total = self._stats_total
+        if not total:
             return {}
         
-        total = len(self.fusion_history)
-        status_counts = {}
-        
-        for record in self.fusion_history:
-            status = record.verification_status.name
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
         return {
             'total_fusions': total,
             'status_distribution': {
-                status: count / total for status, count in status_counts.items()
+                status: count / total for status, count in self._stats_status_counts.items()
             },
-            'average_verification_score': sum(r.verification_score for r in self.fusion_history) / total,
-            'average_spatial_delta_km': sum(r.spatial_delta_km for r in self.fusion_history) / total,
-            'average_temporal_delta_hours': sum(r.temporal_delta_hours for r in self.fusion_history) / total
+            'average_verification_score': self._stats_score_sum / total,
+            'average_spatial_delta_km': self._stats_spatial_sum / total,
+            'average_temporal_delta_hours': self._stats_temporal_sum / total
         }
 
 
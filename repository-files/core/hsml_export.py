@@ -0,0 +1,236 @@
+"""
+HSML HDX Export
+Streaming export of HSML events to UN OCHA HDX
+
+Events are read one at a time from a sink's stored segments and never
+collected into a single structure, so memory stays constant however long
+the node has been logging:
+- "json": the HDX dataset document, with the stored event bytes copied
+  straight into its data array (no re-parsing)
+- "csv" / "jsonl" / "arrow": columnar export. Events are buffered into
+  row groups of `row_group_size` and each row group is appended to one file
+  per column group (identity, action, payload). Every file leads with
+  `event_id` so the groups can be joined. Arrow IPC needs pyarrow.
+  A manifest with the HDX dataset metadata lists the files.
+
+Compliance:
+- GDPR Art. 30 (Records of Processing)
+- UN OCHA HDX Data Standards
+"""
+
+import csv
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+HDX_DATASET = {
+    "name": "iluminara-health-events",
+    "title": "iLuminara Health Surveillance Events",
+    "organization": "iluminara",
+    "maintainer": "iluminara-core",
+    "license_id": "cc-by-sa",
+    "methodology": "HSML Selective Logging",
+    "caveats": "78% storage reduction applied"
+}
+
+COLUMN_GROUPS = {
+    "identity": ("event_id", "event_type", "priority", "timestamp", "hash"),
+    "action": ("event_id", "actor", "resource", "action", "outcome"),
+    "payload": ("event_id", "context", "reasoning_chain")
+}
+
+COLUMNAR_FORMATS = ("csv", "jsonl", "arrow")
+MANIFEST_NAME = "hdx_manifest.json"
+
+
+def _rate(events: int, seconds: float) -> float:
+    return events / seconds if seconds > 0 else 0.0
+
+
+def export_hdx_json(payloads: Iterable[bytes], output_path: str) -> Dict[str, Any]:
+    """
+    Write the HDX dataset document, one stored event at a time.
+
+    Args:
+        payloads: Serialized events (compact JSON bytes), oldest first
+        output_path: Destination JSON file
+
+    Returns:
+        Export statistics (events, seconds, events_per_second)
+    """
+    start = time.perf_counter()
+    resource = {
+        "name": "health_events",
+        "format": "JSON",
+        "description": "Health surveillance events with selective logging"
+    }
+    head = json.dumps({"dataset": HDX_DATASET, "resources": [resource]}, indent=2)
+    # Reopen the resource object so the data array can be streamed into it
+    head = head[:head.rindex("}", 0, head.rindex("]"))].rstrip() + ',\n      "data": ['
+
+    events = 0
+    with open(output_path, "wb") as f:
+        f.write(head.encode())
+        for payload in payloads:
+            f.write(b"\n        " if events == 0 else b",\n        ")
+            f.write(payload)
+            events += 1
+        f.write(b"\n      ]\n    }\n  ]\n}\n")
+
+    seconds = time.perf_counter() - start
+    return {"format": "json", "events": events, "seconds": seconds,
+            "events_per_second": _rate(events, seconds), "files": [output_path]}
+
+
+def _cell(value: Any) -> Any:
+    """Scalar columns as-is; nested context / reasoning chain as compact JSON"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, separators=(",", ":"), default=str)
+    return value
+
+
+class _CSVGroupWriter:
+    extension = "csv"
+
+    def __init__(self, path: str, columns: Sequence[str]):
+        self._file = open(path, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(columns)
+
+    def write_rows(self, rows: List[list]):
+        self._writer.writerows([[_cell(v) for v in row] for row in rows])
+
+    def close(self):
+        self._file.close()
+
+
+class _JSONLGroupWriter:
+    extension = "jsonl"
+
+    def __init__(self, path: str, columns: Sequence[str]):
+        self._file = open(path, "w")
+        self._columns = columns
+
+    def write_rows(self, rows: List[list]):
+        self._file.write("".join(
+            json.dumps(dict(zip(self._columns, row)), separators=(",", ":"), default=str) + "\n"
+            for row in rows
+        ))
+
+    def close(self):
+        self._file.close()
+
+
+class _ArrowGroupWriter:
+    """One Arrow IPC file per column group, one record batch per row group"""
+
+    extension = "arrow"
+
+    def __init__(self, path: str, columns: Sequence[str]):
+        import pyarrow as pa
+
+        self._pa = pa
+        self._columns = columns
+        self._schema = pa.schema([(name, pa.string()) for name in columns])
+        self._sink = pa.OSFile(path, "wb")
+        self._writer = pa.ipc.new_file(self._sink, self._schema)
+
+    def write_rows(self, rows: List[list]):
+        arrays = [
+            self._pa.array([None if row[i] is None else str(_cell(row[i])) for row in rows], type=self._pa.string())
+            for i in range(len(self._columns))
+        ]
+        self._writer.write_batch(self._pa.RecordBatch.from_arrays(arrays, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+        self._sink.close()
+
+
+_GROUP_WRITERS = {"csv": _CSVGroupWriter, "jsonl": _JSONLGroupWriter, "arrow": _ArrowGroupWriter}
+
+
+def export_hdx_columnar(
+    payloads: Iterable[bytes],
+    output_dir: str,
+    fmt: str = "csv",
+    row_group_size: int = 4096,
+    column_groups: Dict[str, Sequence[str]] = COLUMN_GROUPS
+) -> Dict[str, Any]:
+    """
+    Stream events into one columnar file per column group.
+
+    Args:
+        payloads: Serialized events (compact JSON bytes), oldest first
+        output_dir: Directory for the group files and the HDX manifest
+        fmt: "csv", "jsonl" or "arrow"
+        row_group_size: Events buffered before each write
+        column_groups: Group name -> event fields written to that group's file
+
+    Returns:
+        Export statistics (events, row_groups, seconds, events_per_second, files)
+    """
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported HDX export format: {fmt}")
+
+    start = time.perf_counter()
+    os.makedirs(output_dir, exist_ok=True)
+    writer_cls = _GROUP_WRITERS[fmt]
+    paths = {group: os.path.join(output_dir, f"{group}.{writer_cls.extension}") for group in column_groups}
+
+    try:
+        writers = {group: writer_cls(paths[group], columns) for group, columns in column_groups.items()}
+    except ImportError:
+        logger.error("❌ pyarrow not installed: pip install pyarrow")
+        return {"error": "pyarrow not available"}
+
+    events = 0
+    row_groups = 0
+    buffer: List[Dict[str, Any]] = []
+
+    def write_row_group():
+        for group, columns in column_groups.items():
+            writers[group].write_rows([[record.get(c) for c in columns] for record in buffer])
+        buffer.clear()
+
+    try:
+        for payload in payloads:
+            buffer.append(json.loads(payload))
+            if len(buffer) >= row_group_size:
+                events += len(buffer)
+                row_groups += 1
+                write_row_group()
+        if buffer:
+            events += len(buffer)
+            row_groups += 1
+            write_row_group()
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    manifest = {
+        "dataset": HDX_DATASET,
+        "resources": [
+            {
+                "name": f"health_events_{group}",
+                "format": fmt.upper(),
+                "description": f"Health surveillance events ({group} columns), joined on event_id",
+                "path": os.path.basename(paths[group]),
+                "columns": list(columns)
+            }
+            for group, columns in column_groups.items()
+        ],
+        "rows": events,
+        "row_group_size": row_group_size
+    }
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    seconds = time.perf_counter() - start
+    return {"format": fmt, "events": events, "row_groups": row_groups, "seconds": seconds,
+            "events_per_second": _rate(events, seconds), "files": [manifest_path] + list(paths.values())}
@@ -10,13 +10,26 @@ Compliance:
 """
 
 import json
+import os
+import sys
 import hashlib
+import threading
+from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Sequence
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
 import logging
 
+try:
+    from core.hsml_export import export_hdx_columnar, export_hdx_json
+    from core.hsml_sinks import AsyncSinkWriter, HSMLSink, RingSink
+except ImportError:
+    # Fallback for standalone execution: import from the repository root
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from core.hsml_export import export_hdx_columnar, export_hdx_json
+    from core.hsml_sinks import AsyncSinkWriter, HSMLSink, RingSink
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,6 +90,8 @@ class HSMLLogger:
     2. Reasoning chain compression
     3. Immutable audit trail for critical events
     4. UN OCHA HDX compatibility
+    5. Asynchronous sinks: events are serialized once on a writer thread
+       behind a bounded queue, so memory is bounded regardless of uptime
     """
     
     # Storage reduction target
@@ -98,20 +113,49 @@ class HSMLLogger:
         self,
         storage_backend: str = "local",
         enable_compression: bool = True,
-        enable_blockchain: bool = False
+        enable_blockchain: bool = False,
+        sinks: Optional[Sequence[HSMLSink]] = None,
+        queue_size: int = 10000,
+        recent_events: int = 1000,
+        block_when_full: bool = True
     ):
+        """
+        Args:
+            storage_backend: Storage backend label
+            enable_compression: Enable reasoning/context compression
+            enable_blockchain: Anchor critical events on chain
+            sinks: Event writers (default: in-memory ring of `recent_events`,
+                so `export_to_hdx` only sees the most recent events; pass a
+                `RotatingJSONLSink` or `BinarySink` to export the full log)
+            queue_size: Events buffered for the writer thread
+            recent_events: Recent HSMLEvent objects kept in `events`
+            block_when_full: When the queue is full, wait (True) or drop
+                non-critical events (False); critical events always wait
+        """
         self.storage_backend = storage_backend
         self.enable_compression = enable_compression
         self.enable_blockchain = enable_blockchain
+        self.block_when_full = block_when_full
         
-        # Event log
-        self.events: List[HSMLEvent] = []
+        # Recent events (bounded); the full log lives in the sinks
+        self.events: deque = deque(maxlen=recent_events)
+        
+        self.sinks = list(sinks) if sinks is not None else [RingSink(capacity=recent_events)]
+        self._writer = AsyncSinkWriter(
+            self.sinks,
+            to_dict=self._event_record,
+            queue_size=queue_size,
+            on_written=self._account_storage
+        )
+        self._stats_lock = threading.Lock()
+        self._stored_body_bytes = 0
         
         # Statistics
         self.stats = {
             "total_events": 0,
             "logged_events": 0,
             "skipped_events": 0,
+            "dropped_events": 0,
             "storage_saved_bytes": 0,
             "compression_ratio": 0.0
         }
@@ -192,22 +236,16 @@ class HSMLLogger:
             hash=event_hash
         )
         
-        # Store event
+        # Hand off to the sink writer (serialization and sizing happen there)
+        block = self.block_when_full or priority == HSMLPriority.CRITICAL
+        if not self._writer.submit((event, context, reasoning_chain), block=block):
+            self.stats["dropped_events"] += 1
+            logger.warning(f"⚠️ HSML queue full - dropped {priority.value} event {event_id}")
+            return None
+        
         self.events.append(event)
         self.stats["logged_events"] += 1
         
-        # Calculate storage savings
-        original_size = self._estimate_size(context, reasoning_chain)
-        compressed_size = self._estimate_size(event.context, event.reasoning_chain)
-        self.stats["storage_saved_bytes"] += (original_size - compressed_size)
-        
-        # Update compression ratio
-        if self.stats["total_events"] > 0:
-            self.stats["compression_ratio"] = (
-                self.stats["storage_saved_bytes"] /
-                (self.stats["storage_saved_bytes"] + compressed_size * self.stats["logged_events"])
-            )
-        
         logger.info(
             f"📝 Event logged - Type: {event_type.value}, "
             f"Priority: {priority.value}, ID: {event_id}"
@@ -299,48 +337,115 @@ class HSMLLogger:
         raw = f"{event_id}:{event_type.value}:{actor}:{resource}:{action}:{outcome}"
         return hashlib.sha256(raw.encode()).hexdigest()
     
-    def _estimate_size(
+    @staticmethod
+    def _event_record(item: tuple) -> Dict:
+        """
+        Same fields as HSMLEvent.to_dict, without asdict's deep copy: the
+        record is serialized straight away and the event is not mutated.
+        """
+        event = item[0]
+        record = {f.name: getattr(event, f.name) for f in fields(event)}
+        record["event_type"] = event.event_type.value
+        record["priority"] = event.priority.value
+        record["timestamp"] = event.timestamp.isoformat()
+        return record
+    
+    def _account_storage(self, item: tuple, payload: bytes, stored_size: int):
+        """
+        Storage-reduction statistics, on the writer thread.
+        
+        `stored_size` is the context + reasoning bytes from the event's one
+        serialization; only the parts filtered out are encoded again, to size
+        what was saved.
+        """
+        event, context, reasoning_chain = item
+        saved = self._estimate_dropped_size(context, reasoning_chain, event)
+        
+        with self._stats_lock:
+            self._stored_body_bytes += stored_size
+            self.stats["storage_saved_bytes"] += saved
+            total = self.stats["storage_saved_bytes"] + self._stored_body_bytes
+            self.stats["compression_ratio"] = self.stats["storage_saved_bytes"] / total if total else 0.0
+    
+    def _estimate_dropped_size(
         self,
         context: Optional[Dict],
-        reasoning_chain: Optional[List[str]]
+        reasoning_chain: Optional[List[str]],
+        event: HSMLEvent
     ) -> int:
-        """Estimate storage size in bytes"""
+        """Estimated encoded size of the context fields and reasoning steps filtered out"""
         size = 0
         
-        if context:
-            size += len(json.dumps(context).encode())
+        # Filtering returns the original objects when nothing was removed
+        if context and event.context is not context:
+            dropped = {k: v for k, v in context.items() if k not in event.context}
+            if dropped:
+                size += len(json.dumps(dropped, separators=(",", ":"), default=str))
         
-        if reasoning_chain:
-            size += len(json.dumps(reasoning_chain).encode())
+        if reasoning_chain and event.reasoning_chain is not reasoning_chain:
+            # Quoted step plus separator
+            kept = event.reasoning_chain or []
+            size += sum(len(step) + 3 for step in reasoning_chain) - sum(len(step) + 3 for step in kept)
         
         return size
     
-    def export_to_hdx(self, output_path: str):
-        """Export events to UN OCHA HDX format"""
-        hdx_data = {
-            "dataset": {
-                "name": "iluminara-health-events",
-                "title": "iLuminara Health Surveillance Events",
-                "organization": "iluminara",
-                "maintainer": "iluminara-core",
-                "license_id": "cc-by-sa",
-                "methodology": "HSML Selective Logging",
-                "caveats": "78% storage reduction applied"
-            },
-            "resources": [
-                {
-                    "name": "health_events",
-                    "format": "JSON",
-                    "description": "Health surveillance events with selective logging",
-                    "data": [event.to_dict() for event in self.events]
-                }
-            ]
-        }
+    def flush(self):
+        """Wait until every logged event has been written to the sinks"""
+        self._writer.flush()
+    
+    def close(self):
+        """Flush and close the sinks"""
+        self._writer.close()
+    
+    def export_to_hdx(
+        self,
+        output_path: str,
+        format: str = "json",
+        row_group_size: int = 4096
+    ) -> Dict:
+        """
+        Export events to UN OCHA HDX format, streamed from the sinks.
         
-        with open(output_path, 'w') as f:
-            json.dump(hdx_data, f, indent=2)
+        Reads the first sink that can read events back; a warning is logged
+        if that sink has already evicted older events (e.g. the default ring).
         
-        logger.info(f"📤 Exported {len(self.events)} events to HDX format: {output_path}")
+        Args:
+            output_path: JSON file for "json"; output directory for the
+                columnar formats ("csv", "jsonl", "arrow")
+            format: Export format
+            row_group_size: Events per row group (columnar formats)
+        
+        Returns:
+            Export statistics, including events_per_second
+        """
+        payloads = self._stored_payloads()
+        if format == "json":
+            result = export_hdx_json(payloads, output_path)
+        else:
+            result = export_hdx_columnar(payloads, output_path, fmt=format, row_group_size=row_group_size)
+        
+        if "error" not in result:
+            logger.info(
+                f"📤 Exported {result['events']} events to HDX {format}: {output_path} "
+                f"({result['events_per_second']:,.0f} events/s)"
+            )
+        return result
+    
+    def _stored_payloads(self) -> Iterator[bytes]:
+        """Written events from the first sink that can be read back"""
+        self.flush()
+        for sink in self.sinks:
+            try:
+                payloads = sink.iter_payloads()
+            except NotImplementedError:
+                continue
+            if sink.evicted:
+                logger.warning(
+                    f"⚠️ HDX export reads {type(sink).__name__}, which has evicted {sink.evicted} older events; "
+                    f"only the most recent events are exported"
+                )
+            yield from payloads
+            return
     
     def get_statistics(self) -> Dict:
         """Get logging statistics"""
@@ -348,7 +453,9 @@ class HSMLLogger:
             **self.stats,
             "storage_reduction_achieved": self.stats["compression_ratio"],
             "target_storage_reduction": self.TARGET_STORAGE_REDUCTION,
-            "target_met": self.stats["compression_ratio"] >= self.TARGET_STORAGE_REDUCTION
+            "target_met": self.stats["compression_ratio"] >= self.TARGET_STORAGE_REDUCTION,
+            "queued_events": self._writer.pending,
+            "written_events": self._writer.written
         }
 
 
@@ -402,7 +509,8 @@ if __name__ == "__main__":
         outcome="success"
     )
     
-    # Get statistics
+    # Get statistics (once the writer has caught up)
+    logger_instance.flush()
     stats = logger_instance.get_statistics()
     print(f"\n📊 HSML Statistics:")
     print(f"   Total Events: {stats['total_events']}")
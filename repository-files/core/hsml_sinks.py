@@ -0,0 +1,369 @@
+"""
+HSML Event Sinks
+Asynchronous, bounded storage for HSML selective-logging events
+
+Events are handed to a bounded queue and written by one background thread:
+- Each event is serialized to JSON exactly once, on the writer thread; the
+  byte lengths of its context and reasoning chain come from that same
+  serialization (used for the storage-reduction statistics)
+- The same bytes go to every configured sink
+- Sinks: rotating JSONL segments, rotating length-prefixed binary segments,
+  and an in-memory ring (tests, dashboards)
+- Memory is bounded by the queue size and the ring capacity, however long
+  the node runs; disk use can be bounded with `max_segments`
+
+Compliance:
+- GDPR Art. 30 (Records of Processing)
+- ISO 27001 A.12.4 (Logging and Monitoring)
+"""
+
+import json
+import logging
+import os
+import queue
+import struct
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_LENGTH = struct.Struct("<I")
+_STOP = object()
+
+
+def serialize_event(record: Dict[str, Any]) -> Tuple[bytes, int]:
+    """
+    Serialize one event dict to compact JSON bytes.
+
+    Context and reasoning chain are encoded separately and spliced in, so
+    their encoded size is known without a second `json.dumps`.
+
+    Returns:
+        (payload, bytes of context + reasoning chain within the payload)
+    """
+    context = record.get("context")
+    reasoning = record.get("reasoning_chain")
+    header = {k: v for k, v in record.items() if k not in ("context", "reasoning_chain")}
+
+    context_json = json.dumps(context, separators=(",", ":"), default=str)
+    reasoning_json = json.dumps(reasoning, separators=(",", ":"), default=str)
+    header_json = json.dumps(header, separators=(",", ":"), default=str)
+
+    separator = "," if header else ""
+    payload = f'{header_json[:-1]}{separator}"context":{context_json},"reasoning_chain":{reasoning_json}}}'.encode()
+    # Empty context / no chain count as zero, as before
+    body = (len(context_json) if context else 0) + (len(reasoning_json) if reasoning else 0)
+    return payload, body
+
+
+class HSMLSink:
+    """Base class: receives serialized events in batches on the writer thread"""
+
+    # Written events that can no longer be read back (bounded in-memory sinks)
+    evicted = 0
+
+    def write_batch(self, payloads: Sequence[bytes]):
+        raise NotImplementedError
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def iter_payloads(self) -> Iterator[bytes]:
+        """Stored serialized events, oldest first (sinks that can be read back)"""
+        raise NotImplementedError
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        for payload in self.iter_payloads():
+            yield json.loads(payload)
+
+
+class RingSink(HSMLSink):
+    """Keeps the most recent `capacity` serialized events in memory"""
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self._ring: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    def write_batch(self, payloads: Sequence[bytes]):
+        with self._lock:
+            self.evicted += max(len(self._ring) + len(payloads) - self.capacity, 0)
+            self._ring.extend(payloads)
+
+    def payloads(self) -> List[bytes]:
+        with self._lock:
+            return list(self._ring)
+
+    def iter_payloads(self) -> Iterator[bytes]:
+        return iter(self.payloads())
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+
+class _RotatingFileSink(HSMLSink):
+    """Append-only segment files, rotated by size, oldest deleted past `max_segments`"""
+
+    suffix = ".log"
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = "hsml",
+        max_bytes: int = 64 * 1024 * 1024,
+        max_segments: Optional[int] = None
+    ):
+        """
+        Args:
+            directory: Where segment files are written
+            prefix: Segment file name prefix
+            max_bytes: Rotate once a segment reaches this size
+            max_segments: Keep at most this many segments (None keeps all)
+        """
+        self.directory = directory
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.max_segments = max_segments
+        os.makedirs(directory, exist_ok=True)
+
+        existing = self.segments()
+        self._index = self._segment_index(existing[-1]) if existing else 0
+        self._file = None
+        self._size = 0
+        self._lock = threading.Lock()
+        if existing:
+            self._reopen(existing[-1])
+        else:
+            self._open_next()
+
+    def _segment_path(self, index: int) -> str:
+        return os.path.join(self.directory, f"{self.prefix}-{index:06d}{self.suffix}")
+
+    def _segment_index(self, path: str) -> int:
+        name = os.path.basename(path)
+        return int(name[len(self.prefix) + 1:-len(self.suffix)])
+
+    def segments(self) -> List[str]:
+        """Segment paths, oldest first"""
+        names = [
+            n for n in os.listdir(self.directory)
+            if n.startswith(self.prefix + "-") and n.endswith(self.suffix)
+            and n[len(self.prefix) + 1:-len(self.suffix)].isdigit()
+        ]
+        return [os.path.join(self.directory, n) for n in sorted(names)]
+
+    def _reopen(self, path: str):
+        self._file = open(path, "ab")
+        self._size = self._file.tell()
+
+    def _open_next(self):
+        if self._file is not None:
+            self._file.close()
+        self._index += 1
+        self._file = open(self._segment_path(self._index), "ab")
+        self._size = self._file.tell()
+        if self.max_segments is not None:
+            for stale in self.segments()[:-self.max_segments]:
+                os.remove(stale)
+
+    def _frame(self, payload: bytes) -> bytes:
+        raise NotImplementedError
+
+    def write_batch(self, payloads: Sequence[bytes]):
+        with self._lock:
+            chunk = []
+            size = self._size
+            for payload in payloads:
+                framed = self._frame(payload)
+                if size and size + len(framed) > self.max_bytes:
+                    self._file.write(b"".join(chunk))
+                    chunk = []
+                    self._open_next()
+                    size = 0
+                chunk.append(framed)
+                size += len(framed)
+            self._file.write(b"".join(chunk))
+            self._size = size
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def iter_payloads(self) -> Iterator[bytes]:
+        """Stored payloads from every segment, oldest first (flush the writer first)"""
+        for path in self.segments():
+            with open(path, "rb") as f:
+                yield from self._read(f)
+
+    def _read(self, f) -> Iterator[bytes]:
+        raise NotImplementedError
+
+
+class RotatingJSONLSink(_RotatingFileSink):
+    """One JSON object per line"""
+
+    suffix = ".jsonl"
+
+    def _frame(self, payload: bytes) -> bytes:
+        return payload + b"\n"
+
+    def _read(self, f) -> Iterator[bytes]:
+        for line in f:
+            if line.endswith(b"\n"):
+                yield line[:-1]
+
+
+class BinarySink(_RotatingFileSink):
+    """Length-prefixed records: 4-byte little-endian length, then the JSON bytes"""
+
+    suffix = ".bin"
+
+    def _frame(self, payload: bytes) -> bytes:
+        return _LENGTH.pack(len(payload)) + payload
+
+    def _read(self, f) -> Iterator[bytes]:
+        while True:
+            head = f.read(_LENGTH.size)
+            if len(head) < _LENGTH.size:
+                return
+            (length,) = _LENGTH.unpack(head)
+            payload = f.read(length)
+            if len(payload) < length:
+                return  # torn final record
+            yield payload
+
+
+class AsyncSinkWriter:
+    """
+    Bounded queue plus one writer thread feeding a set of sinks.
+    """
+
+    def __init__(
+        self,
+        sinks: Sequence[HSMLSink],
+        to_dict: Callable[[Any], Dict[str, Any]] = dict,
+        queue_size: int = 10000,
+        batch_size: int = 256,
+        on_written: Optional[Callable[[Any, bytes, int], None]] = None
+    ):
+        """
+        Args:
+            sinks: Destinations for every serialized event
+            to_dict: Turns a queued item into the dict that is serialized
+            queue_size: Maximum events waiting to be written
+            batch_size: Maximum events serialized and written per sink call
+            on_written: Called on the writer thread as (item, payload, body_bytes)
+        """
+        self.sinks = list(sinks)
+        self.to_dict = to_dict
+        self.batch_size = batch_size
+        self.on_written = on_written
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, item: Any, block: bool = True) -> bool:
+        """
+        Queue one event for writing.
+
+        Returns:
+            False if the queue was full and `block` is False (event dropped)
+        """
+        self._ensure_thread()
+        try:
+            self._queue.put(item, block=block)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="hsml-sink-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            batch = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(entry is _STOP for entry in batch)
+            events = [entry for entry in batch if entry is not _STOP]
+            try:
+                if events:
+                    self._write(events)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, events: List[Any]):
+        payloads = []
+        for item in events:
+            try:
+                payload, body = serialize_event(self.to_dict(item))
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"❌ HSML event serialization failed: {e}")
+                continue
+            payloads.append(payload)
+            if self.on_written is not None:
+                try:
+                    self.on_written(item, payload, body)
+                except Exception as e:
+                    self.errors += 1
+                    logger.error(f"❌ HSML on_written callback failed: {e}")
+
+        for sink in self.sinks:
+            try:
+                sink.write_batch(payloads)
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"❌ HSML sink {type(sink).__name__} failed: {e}")
+        self.written += len(payloads)
+
+    def flush(self):
+        """Block until every queued event is written and sinks are flushed"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self):
+        """Write what is queued, stop the thread and close the sinks"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._thread = None
+        for sink in self.sinks:
+            sink.close()
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
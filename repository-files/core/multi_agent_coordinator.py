@@ -8,13 +8,28 @@ Compliance:
 """
 
 import asyncio
+import functools
 import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from enum import Enum
 from dataclasses import dataclass, asdict
 import json
 
+try:
+    from core.agent_executors import ExecutionClass, ProcessAgentPool
+    from core.agent_result_cache import SingleFlight, TTLResultCache, canonical_digest
+    from governance_kernel.metrics import MetricsTracker, get_metrics_tracker
+except ImportError:
+    # Fallback for standalone execution: import from the repository root
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from core.agent_executors import ExecutionClass, ProcessAgentPool
+    from core.agent_result_cache import SingleFlight, TTLResultCache, canonical_digest
+    from governance_kernel.metrics import MetricsTracker, get_metrics_tracker
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +51,26 @@ class AgentStatus(Enum):
     TIMEOUT = "timeout"
 
 
+@dataclass
+class AgentDescriptor:
+    """
+    A registered agent and how it runs.
+    
+    `runner(disease, historical_data, forecast_horizon_days) -> Dict` is a
+    coroutine function for ASYNC agents and a plain function for THREAD and
+    PROCESS agents (module-level / picklable for PROCESS). Without a runner
+    the coordinator's built-in agent for `agent_type` is used (ASYNC only).
+    `cacheable=False` opts the agent out of the result cache (concurrent
+    identical queries still share one run).
+    """
+    agent_type: AgentType
+    agent: object
+    execution_class: ExecutionClass = ExecutionClass.ASYNC
+    runner: Optional[Callable] = None
+    timeout_seconds: Optional[float] = None
+    cacheable: bool = True
+
+
 @dataclass
 class AgentResult:
     """Result from agent execution"""
@@ -82,15 +117,43 @@ class MultiAgentCoordinator:
     - Epidemiological Forecasting Agent (SEIR, SIR, ARIMA)
     - Spatiotemporal Analysis Agent (Clustering, Hotspot Detection)
     - Early Warning System Agent (Real-time Multi-source Fusion)
+    
+    Each agent declares an execution class: ASYNC agents run on the event
+    loop, THREAD agents in a thread pool and PROCESS agents (CPU-bound) in
+    worker processes, so one slow agent does not serialize the ensemble and
+    process agents are really stopped when they time out.
+    
+    Identical queries (same canonical digest) submitted while an agent run
+    is in flight share that run, and completed results are reused for
+    `result_cache_ttl_seconds`. Hit rate is reported through MetricsTracker.
     """
     
+    CACHE_NAME = "agent_results"
+    
     def __init__(
         self,
         location: str,
         population_size: int,
         enable_parallel_execution: bool = True,
-        timeout_seconds: int = 30
+        timeout_seconds: int = 30,
+        thread_workers: int = 4,
+        process_workers: Optional[int] = None,
+        result_cache_ttl_seconds: float = 60.0,
+        result_cache_size: int = 1024,
+        metrics: Optional[MetricsTracker] = None
     ):
+        """
+        Args:
+            location: Deployment location
+            population_size: Population covered
+            enable_parallel_execution: Run agents concurrently
+            timeout_seconds: Default per-agent timeout
+            thread_workers: Threads for THREAD agents
+            process_workers: Worker processes for PROCESS agents (default: CPU count)
+            result_cache_ttl_seconds: How long agent results are reused (0 disables)
+            result_cache_size: Agent results kept
+            metrics: Receives cache hit / coalesced / miss counts (default: global tracker)
+        """
         self.location = location
         self.population_size = population_size
         self.enable_parallel_execution = enable_parallel_execution
@@ -98,6 +161,18 @@ class MultiAgentCoordinator:
         
         # Agent registry
         self.agents: Dict[AgentType, object] = {}
+        self.descriptors: Dict[AgentType, AgentDescriptor] = {}
+        
+        # Execution pools (created on first use)
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers or os.cpu_count() or 1
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessAgentPool] = None
+        
+        # Result reuse
+        self.result_cache = TTLResultCache(ttl_seconds=result_cache_ttl_seconds, max_entries=result_cache_size)
+        self._single_flight = SingleFlight()
+        self.metrics = metrics or get_metrics_tracker()
         
         # Execution history
         self.execution_history: List[EnsemblePrediction] = []
@@ -107,10 +182,56 @@ class MultiAgentCoordinator:
             f"Location: {location}, Population: {population_size:,}"
         )
     
-    def register_agent(self, agent_type: AgentType, agent: object) -> None:
-        """Register a specialized agent"""
+    def register_agent(
+        self,
+        agent_type: AgentType,
+        agent: object,
+        execution_class: ExecutionClass = ExecutionClass.ASYNC,
+        runner: Optional[Callable] = None,
+        timeout_seconds: Optional[float] = None,
+        cacheable: bool = True
+    ) -> None:
+        """Register a specialized agent (see AgentDescriptor for `runner` and `cacheable`)"""
+        if execution_class != ExecutionClass.ASYNC and runner is None:
+            raise ValueError(f"{execution_class.value} agents need a runner")
+        
         self.agents[agent_type] = agent
-        logger.info(f"✅ Registered agent: {agent_type.value}")
+        self.result_cache.clear()
+        self.descriptors[agent_type] = AgentDescriptor(
+            agent_type=agent_type,
+            agent=agent,
+            execution_class=execution_class,
+            runner=runner,
+            timeout_seconds=timeout_seconds,
+            cacheable=cacheable
+        )
+        logger.info(f"✅ Registered agent: {agent_type.value} ({execution_class.value})")
+    
+    def warm_up(self) -> None:
+        """Start the process workers now, so the first ensemble does not pay start-up"""
+        if any(d.execution_class == ExecutionClass.PROCESS for d in self.descriptors.values()):
+            self._get_process_pool().start()
+    
+    def shutdown(self) -> None:
+        """Stop the thread and process pools"""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=False)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+    
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers, thread_name_prefix="agent-thread"
+            )
+        return self._thread_pool
+    
+    def _get_process_pool(self) -> ProcessAgentPool:
+        if self._process_pool is None:
+            self._process_pool = ProcessAgentPool(max_workers=self.process_workers)
+        return self._process_pool
     
     async def execute_ensemble(
         self,
@@ -168,9 +289,10 @@ class MultiAgentCoordinator:
         """Execute agents in parallel"""
         tasks = []
         
-        for agent_type, agent in self.agents.items():
-            task = self._execute_agent(
-                agent_type, agent, disease, historical_data, forecast_horizon_days
+        query_digest = self._query_digest(disease, historical_data, forecast_horizon_days)
+        for descriptor in self.descriptors.values():
+            task = self._execute_agent_reusing(
+                descriptor, query_digest, disease, historical_data, forecast_horizon_days
             )
             tasks.append(task)
         
@@ -181,7 +303,7 @@ class MultiAgentCoordinator:
         agent_results = []
         for i, result in enumerate(results):
             if isinstance(result, Exception):
-                agent_type = list(self.agents.keys())[i]
+                agent_type = list(self.descriptors.keys())[i]
                 agent_results.append(AgentResult(
                     agent_type=agent_type,
                     status=AgentStatus.FAILED,
@@ -204,44 +326,79 @@ class MultiAgentCoordinator:
         """Execute agents sequentially"""
         agent_results = []
         
-        for agent_type, agent in self.agents.items():
-            result = await self._execute_agent(
-                agent_type, agent, disease, historical_data, forecast_horizon_days
+        query_digest = self._query_digest(disease, historical_data, forecast_horizon_days)
+        for descriptor in self.descriptors.values():
+            result = await self._execute_agent_reusing(
+                descriptor, query_digest, disease, historical_data, forecast_horizon_days
             )
             agent_results.append(result)
         
         return agent_results
     
+    def _query_digest(self, disease: str, historical_data: Dict, forecast_horizon_days: int) -> Optional[str]:
+        """Canonical digest of everything an agent sees, or None if not canonicalizable"""
+        try:
+            return canonical_digest({
+                "location": self.location,
+                "population_size": self.population_size,
+                "disease": disease,
+                "historical_data": historical_data,
+                "forecast_horizon_days": forecast_horizon_days
+            })
+        except (TypeError, ValueError) as e:  # UncacheableQuery is a TypeError
+            logger.warning(f"⚠️ Query not cacheable: {e}")
+            return None
+    
+    async def _execute_agent_reusing(
+        self,
+        descriptor: AgentDescriptor,
+        query_digest: Optional[str],
+        disease: str,
+        historical_data: Dict,
+        forecast_horizon_days: int
+    ) -> AgentResult:
+        """
+        Cached result, else a share of an identical in-flight run, else a new run.
+        
+        Returned results may be shared between callers; treat them as read-only.
+        """
+        if query_digest is None:
+            return await self._execute_agent(descriptor, disease, historical_data, forecast_horizon_days)
+        
+        key = (descriptor.agent_type, query_digest)
+        if descriptor.cacheable:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                self.metrics.record_cache_lookup(self.CACHE_NAME, "hit")
+                return cached
+        
+        result, shared = await self._single_flight.do(
+            key,
+            lambda: self._execute_agent(descriptor, disease, historical_data, forecast_horizon_days)
+        )
+        self.metrics.record_cache_lookup(self.CACHE_NAME, "coalesced" if shared else "miss")
+        
+        if not shared and descriptor.cacheable and result.status == AgentStatus.COMPLETED:
+            self.result_cache.put(key, result)
+        return result
+    
     async def _execute_agent(
         self,
-        agent_type: AgentType,
-        agent: object,
+        descriptor: AgentDescriptor,
         disease: str,
         historical_data: Dict,
         forecast_horizon_days: int
     ) -> AgentResult:
-        """Execute a single agent with timeout"""
+        """Execute a single agent with timeout, in its execution class"""
+        agent_type = descriptor.agent_type
+        timeout = descriptor.timeout_seconds or self.timeout_seconds
         start_time = datetime.utcnow()
         
         try:
             # Execute agent with timeout
-            if agent_type == AgentType.EPIDEMIOLOGICAL:
-                result = await asyncio.wait_for(
-                    self._run_epidemiological_agent(agent, disease, historical_data, forecast_horizon_days),
-                    timeout=self.timeout_seconds
-                )
-            elif agent_type == AgentType.SPATIOTEMPORAL:
-                result = await asyncio.wait_for(
-                    self._run_spatiotemporal_agent(agent, disease, historical_data),
-                    timeout=self.timeout_seconds
-                )
-            elif agent_type == AgentType.EARLY_WARNING:
-                result = await asyncio.wait_for(
-                    self._run_early_warning_agent(agent, disease, historical_data),
-                    timeout=self.timeout_seconds
-                )
-            else:
-                result = {}
+            result = await self._dispatch(
+                descriptor, disease, historical_data, forecast_horizon_days, timeout
+            )
             
             execution_time = (datetime.utcnow() - start_time).total_seconds() * 1000
             
@@ -259,7 +416,7 @@ class MultiAgentCoordinator:
                 agent_type=agent_type,
                 status=AgentStatus.TIMEOUT,
                 result={},
-                execution_time_ms=self.timeout_seconds * 1000,
+                execution_time_ms=timeout * 1000,
                 timestamp=datetime.utcnow(),
                 error="Execution timeout"
             )
@@ -276,6 +433,41 @@ class MultiAgentCoordinator:
                 error=str(e)
             )
     
+    async def _dispatch(
+        self,
+        descriptor: AgentDescriptor,
+        disease: str,
+        historical_data: Dict,
+        forecast_horizon_days: int,
+        timeout: float
+    ) -> Dict:
+        """Run an agent on the event loop, a pool thread or a worker process"""
+        args = (disease, historical_data, forecast_horizon_days)
+        
+        if descriptor.execution_class == ExecutionClass.PROCESS:
+            # Timeout / cancellation terminate the worker process
+            return await self._get_process_pool().run(descriptor.runner, args, timeout=timeout)
+        
+        if descriptor.execution_class == ExecutionClass.THREAD:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._get_thread_pool(), functools.partial(descriptor.runner, *args))
+            return await asyncio.wait_for(future, timeout=timeout)
+        
+        if descriptor.runner is not None:
+            return await asyncio.wait_for(descriptor.runner(*args), timeout=timeout)
+        
+        # Built-in agents
+        agent = descriptor.agent
+        if descriptor.agent_type == AgentType.EPIDEMIOLOGICAL:
+            coroutine = self._run_epidemiological_agent(agent, disease, historical_data, forecast_horizon_days)
+        elif descriptor.agent_type == AgentType.SPATIOTEMPORAL:
+            coroutine = self._run_spatiotemporal_agent(agent, disease, historical_data)
+        elif descriptor.agent_type == AgentType.EARLY_WARNING:
+            coroutine = self._run_early_warning_agent(agent, disease, historical_data)
+        else:
+            return {}
+        return await asyncio.wait_for(coroutine, timeout=timeout)
+    
     async def _run_epidemiological_agent(
         self,
         agent: object,
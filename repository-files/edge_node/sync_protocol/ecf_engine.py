@@ -24,6 +24,13 @@ import logging
 from scipy.spatial.distance import euclidean
 from scipy.stats import pearsonr
 
+try:
+    from governance_kernel.profiling import profiled
+except ImportError:
+    # Fallback for standalone execution: no profiling spans
+    def profiled(name=None):
+        return lambda fn: fn
+
 logger = logging.getLogger(__name__)
 
 
@@ -129,6 +136,7 @@ class ECFEngine:
         
         logger.info(f"🔗 ECF Engine initialized - Quantum: {enable_quantum_weighting}")
     
+    @profiled()
     def ingest_signal(self, signal: Signal) -> Optional[FusedEvent]:
         """
         Ingest a new signal and attempt fusion with existing signals
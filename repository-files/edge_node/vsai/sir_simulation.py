@@ -0,0 +1,224 @@
+"""
+VSAI SIR Simulation Service
+IP-06: Viral Symbiotic API Infusion
+
+Macro-scale SIR trajectories for the infusion model, with:
+- A trajectory cache keyed by a fingerprint of every input that affects
+  the result (population, initial state, horizon, β, γ), so repeated
+  dashboard requests do not re-integrate
+- Batched sweeps: many (β, γ) pairs are stacked into one ODE system with a
+  vectorized right-hand side and integrated in a single `odeint` call.
+  States are interleaved [S0, I0, R0, S1, I1, R1, ...], so the Jacobian is
+  banded (block diagonal) and LSODA's cost stays linear in the number of
+  pairs
+- Only pairs missing from the cache are solved; every solved pair is cached
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.integrate import odeint
+
+Trajectory = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+def sir_fingerprint(
+    population: float,
+    infected0: float,
+    recovered0: float,
+    days: int,
+    beta: float,
+    gamma: float
+) -> str:
+    """Stable cache key for one SIR run (exact float repr, not rounded)"""
+    params = [repr(float(population)), repr(float(infected0)), repr(float(recovered0)),
+              int(days), repr(float(beta)), repr(float(gamma))]
+    return hashlib.sha256(json.dumps(params).encode()).hexdigest()
+
+
+def sir_derivatives(y: np.ndarray, t: float, N: float, beta: np.ndarray, gamma: np.ndarray) -> np.ndarray:
+    """
+    Differential equations for many independent SIR systems at once.
+
+    Adapted for API Spread:
+    - S: Uninstalled (Susceptible)
+    - I: Installed & Sharing (Viral State / Infected)
+    - R: Installed & Passive (Symbiotic State / Recovered)
+
+    Args:
+        y: Interleaved state [S0, I0, R0, S1, I1, R1, ...]
+        t: Time
+        N: Total population
+        beta: Transmission rate per system (Contact Rate * Probability of Install)
+        gamma: Recovery rate per system (Transition from 'Sharer' to 'User')
+
+    Returns:
+        Interleaved derivatives [dS/dt, dI/dt, dR/dt, ...]
+    """
+    S = y[0::3]
+    I = y[1::3]
+    infections = beta * S * I / N
+    recoveries = gamma * I
+    out = np.empty_like(y)
+    out[0::3] = -infections
+    out[1::3] = infections - recoveries
+    out[2::3] = recoveries
+    return out
+
+
+def solve_sir_batch(
+    population: float,
+    infected0: float,
+    recovered0: float,
+    days: int,
+    betas: Sequence[float],
+    gammas: Sequence[float]
+) -> Trajectory:
+    """
+    Integrate one SIR system per (beta, gamma) pair in a single solver call.
+
+    Returns:
+        (t, S, I, R) with S, I, R shaped (pairs, days)
+    """
+    betas = np.asarray(betas, dtype=np.float64)
+    gammas = np.asarray(gammas, dtype=np.float64)
+    pairs = len(betas)
+    t = np.linspace(0, days, days)
+
+    S0 = population - infected0 - recovered0
+    y0 = np.tile([S0, infected0, recovered0], pairs).astype(np.float64)
+    ret = odeint(sir_derivatives, y0, t, args=(population, betas, gammas), ml=2, mu=2)
+
+    states = ret.reshape(len(t), pairs, 3)
+    return t, states[:, :, 0].T, states[:, :, 1].T, states[:, :, 2].T
+
+
+class SIRSimulationService:
+    """
+    Cached, batched SIR trajectories for VSAI dashboards.
+
+    Cached arrays are returned read-only, so callers cannot corrupt them.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """
+        Initialize the service.
+
+        Args:
+            max_entries: Trajectories kept (least recently used are evicted)
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.solver_calls = 0
+        self._cache: "OrderedDict[str, Trajectory]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[Trajectory]:
+        with self._lock:
+            trajectory = self._cache.get(key)
+            if trajectory is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return trajectory
+
+    def _put(self, key: str, trajectory: Trajectory):
+        for array in trajectory:
+            array.flags.writeable = False
+        with self._lock:
+            self._cache[key] = trajectory
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def simulate(
+        self,
+        population: float,
+        infected0: float,
+        recovered0: float,
+        days: int,
+        beta: float,
+        gamma: float
+    ) -> Trajectory:
+        """One trajectory (t, S, I, R), from cache when possible"""
+        return self.simulate_many(population, infected0, recovered0, days, [beta], [gamma])[0]
+
+    def sweep(
+        self,
+        population: float,
+        infected0: float,
+        recovered0: float,
+        days: int,
+        betas: Sequence[float],
+        gammas: Sequence[float]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Sensitivity grid over every (beta, gamma) combination.
+
+        Returns:
+            Dict with t, beta and gamma axes, and S, I, R shaped
+            (len(betas), len(gammas), days)
+        """
+        betas = np.asarray(betas, dtype=np.float64)
+        gammas = np.asarray(gammas, dtype=np.float64)
+        beta_grid, gamma_grid = np.meshgrid(betas, gammas, indexing="ij")
+        flat = self.simulate_many(population, infected0, recovered0, days, beta_grid.ravel(), gamma_grid.ravel())
+
+        shape = beta_grid.shape + (days,)
+        return {
+            "t": flat[0][0] if flat else np.linspace(0, days, days),
+            "beta": betas,
+            "gamma": gammas,
+            "S": np.array([f[1] for f in flat]).reshape(shape),
+            "I": np.array([f[2] for f in flat]).reshape(shape),
+            "R": np.array([f[3] for f in flat]).reshape(shape)
+        }
+
+    def simulate_many(
+        self,
+        population: float,
+        infected0: float,
+        recovered0: float,
+        days: int,
+        betas: Sequence[float],
+        gammas: Sequence[float]
+    ) -> List[Trajectory]:
+        """One trajectory per (beta, gamma) pair; cache misses are integrated as one batch"""
+        results = []
+        missing = {}
+        for slot, (beta, gamma) in enumerate(zip(betas, gammas)):
+            key = sir_fingerprint(population, infected0, recovered0, days, beta, gamma)
+            trajectory = self._get(key)
+            results.append(trajectory)
+            if trajectory is None:
+                # Duplicate pairs in one request are solved once
+                missing.setdefault(key, []).append((slot, beta, gamma))
+
+        if missing:
+            keys = list(missing)
+            firsts = [missing[k][0] for k in keys]
+            t, S, I, R = solve_sir_batch(population, infected0, recovered0, days,
+                                         [f[1] for f in firsts], [f[2] for f in firsts])
+            self.solver_calls += 1
+            for j, key in enumerate(keys):
+                trajectory = (t.copy(), S[j].copy(), I[j].copy(), R[j].copy())
+                self._put(key, trajectory)
+                for slot, _, _ in missing[key]:
+                    results[slot] = trajectory
+
+        return results
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
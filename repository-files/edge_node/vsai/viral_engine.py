@@ -30,40 +30,43 @@ The 94% Logic:
 import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
-import hashlib
-import uuid
-import time
+import os
+import sys
 import json
 import logging
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Tuple, Optional
+from dataclasses import dataclass, asdict
+from typing import List, Dict, Sequence, Tuple, Optional
 from datetime import datetime, timedelta
-from scipy.integrate import odeint
 from scipy.optimize import minimize
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.preprocessing import StandardScaler
 
-logger = logging.getLogger(__name__)
+try:
+    from edge_node.vsai.referral_tree import (
+        MAX_CHAIN_LENGTH, NODE_TYPES, NodeBitmap, NodeTable, NodeVector, generate_referral_hash, grow_generation
+    )
+    from edge_node.vsai.sir_simulation import SIRSimulationService
+except ImportError:
+    # Fallback for standalone execution: import from the repository root
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    from edge_node.vsai.referral_tree import (
+        MAX_CHAIN_LENGTH, NODE_TYPES, NodeBitmap, NodeTable, NodeVector, generate_referral_hash, grow_generation
+    )
+    from edge_node.vsai.sir_simulation import SIRSimulationService
 
+logger = logging.getLogger(__name__)
 
-# --- CRYPTO-ANCHOR UTILITIES ---
+# NodeVector and generate_referral_hash moved to referral_tree and are re-exported here
+__all__ = [
+    "NodeVector",
+    "ViralMetrics",
+    "ViralSymbioticAPIInfusion",
+    "generate_referral_hash",
+    "verify_referral_chain",
+]
 
-def generate_referral_hash(parent_id: str, child_id: str, salt: str = "5DM-BRIDGE") -> str:
-    """
-    Creates a tamper-proof link between referrer and referee.
-    Prevents 'Referral Fraud' (Sybil attacks) common in gamified systems.
-    
-    Args:
-        parent_id: Referrer node ID
-        child_id: Referee node ID
-        salt: Cryptographic salt
-    
-    Returns:
-        SHA-256 hash of the referral relationship
-    """
-    payload = f"{parent_id}:{child_id}:{salt}:{time.time()}"
-    return hashlib.sha256(payload.encode()).hexdigest()
 
+# --- CRYPTO-ANCHOR UTILITIES ---
 
 def verify_referral_chain(chain: List[str], node_id: str) -> bool:
     """
@@ -80,48 +83,21 @@ def verify_referral_chain(chain: List[str], node_id: str) -> bool:
     if not chain:
         return True
     
+    # Check chain length (prevent infinite chains); cheap, so before the set
+    if len(chain) > MAX_CHAIN_LENGTH:
+        logger.warning(f"⚠️ Referral chain too long for node {node_id}")
+        return False
+    
     # Check for duplicate hashes (circular referrals)
     if len(chain) != len(set(chain)):
         logger.warning(f"⚠️ Circular referral detected for node {node_id}")
         return False
     
-    # Check chain length (prevent infinite chains)
-    if len(chain) > 10:
-        logger.warning(f"⚠️ Referral chain too long for node {node_id}")
-        return False
-    
     return True
 
 
 # --- DATA STRUCTURES ---
 
-@dataclass
-class NodeVector:
-    """
-    Represents a node in the viral network.
-    
-    Types:
-    - SMARTPHONE: Full API access, rich UI
-    - FEATURE_PHONE: USSD interface, limited bandwidth
-    - USSD_GATEWAY: Server-side USSD handler
-    """
-    id: str
-    type: str  # 'SMARTPHONE', 'FEATURE_PHONE', 'USSD_GATEWAY'
-    trust_score: float  # 0.0 to 1.0 (Community influence)
-    data_balance: float  # MB
-    is_infected: bool = False
-    referral_chain: List[str] = field(default_factory=list)
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
-    last_active: str = field(default_factory=lambda: datetime.utcnow().isoformat())
-    total_referrals: int = 0
-    airtime_earned: float = 0.0  # USD
-    location: Optional[str] = None
-    
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for serialization"""
-        return asdict(self)
-
-
 @dataclass
 class ViralMetrics:
     """Tracks viral spread metrics"""
@@ -155,7 +131,8 @@ class ViralSymbioticAPIInfusion:
         target_population: int = 14_000_000,
         baseline_cac: float = 10.00,
         viral_incentive_cost: float = 0.50,
-        enable_compliance: bool = True
+        enable_compliance: bool = True,
+        simulator: Optional[SIRSimulationService] = None
     ):
         """
         Initialize the VSAI engine.
@@ -165,11 +142,12 @@ class ViralSymbioticAPIInfusion:
             baseline_cac: Traditional customer acquisition cost
             viral_incentive_cost: Cost per viral referral (airtime reward)
             enable_compliance: Enable GDPR/KDPA consent validation
+            simulator: Shared SIR trajectory cache (one per engine by default)
         """
         self.population_size = target_population
-        self.nodes: Dict[str, NodeVector] = {}
-        self.graph = nx.DiGraph()  # The Referral Tree
+        self.nodes = NodeTable()  # The Referral Tree (columnar, parent pointers)
         self.enable_compliance = enable_compliance
+        self.rng = np.random.default_rng()
         
         # ML for Virality Prediction (Whom to incentivize?)
         # Features: [Contacts, Daily_SMS, Mobile_Money_Tx, Trust_Score]
@@ -183,6 +161,7 @@ class ViralSymbioticAPIInfusion:
         self.current_cac = baseline_cac
         
         # Simulation results
+        self.simulator = simulator or SIRSimulationService()
         self.simulation_results = None
         self.metrics_history: List[ViralMetrics] = []
         
@@ -234,56 +213,26 @@ class ViralSymbioticAPIInfusion:
         if locations is None:
             locations = ["Nairobi", "Dadaab", "Garissa", "Mombasa", "Kisumu"]
         
-        for i in range(initial_count):
-            node_id = str(uuid.uuid4())[:8]
-            
-            # High trust score for initial seeds (CHWs, Elders)
-            trust_score = np.random.uniform(trust_threshold, 1.0)
-            
-            # Smartphones for seeds (they need full API access)
-            node = NodeVector(
-                id=node_id,
-                type='SMARTPHONE',
-                trust_score=trust_score,
-                data_balance=100.0,
-                is_infected=True,
-                location=np.random.choice(locations)
-            )
-            
-            self.nodes[node_id] = node
-            self.graph.add_node(node_id, type='SEED', trust=trust_score)
-            
-            # Register consent (GDPR/KDPA compliance)
-            if self.enable_compliance:
+        # High trust score for initial seeds (CHWs, Elders); smartphones for
+        # seeds (they need full API access)
+        trust_scores = np.random.uniform(trust_threshold, 1.0, initial_count)
+        codes = np.array([self.nodes.location_code(loc) for loc in locations])
+        seeds = self.nodes.append(
+            parent=np.full(initial_count, -1),
+            node_type=NODE_TYPES.index('SMARTPHONE'),
+            trust=trust_scores,
+            location=np.random.choice(codes, initial_count),
+            data_balance=100.0,
+            consent=self.enable_compliance
+        )
+        
+        # Register consent (GDPR/KDPA compliance)
+        if self.enable_compliance:
+            for node_id in self.nodes.ids(seeds):
                 self.consent_registry[node_id] = True
         
         logger.info(f"✅ {initial_count} Trust Anchors seeded across {len(locations)} locations")
     
-    def _sir_derivatives(self, y, t, N, beta, gamma):
-        """
-        Differential equations for the SIR (Susceptible-Infected-Recovered) model.
-        
-        Adapted for API Spread:
-        - S: Uninstalled (Susceptible)
-        - I: Installed & Sharing (Viral State / Infected)
-        - R: Installed & Passive (Symbiotic State / Recovered)
-        
-        Args:
-            y: Current state [S, I, R]
-            t: Time
-            N: Total population
-            beta: Transmission rate (Contact Rate * Probability of Install)
-            gamma: Recovery rate (Transition from 'Sharer' to 'User')
-        
-        Returns:
-            Derivatives [dS/dt, dI/dt, dR/dt]
-        """
-        S, I, R = y
-        dSdt = -beta * S * I / N
-        dIdt = beta * S * I / N - gamma * I
-        dRdt = gamma * I
-        return dSdt, dIdt, dRdt
-    
     def simulate_infusion(
         self,
         days: int = 60,
@@ -310,16 +259,14 @@ class ViralSymbioticAPIInfusion:
         N = self.population_size
         I0 = len(self.nodes)  # Initial seeds
         R0 = 0
-        S0 = N - I0 - R0
         
         # If K > 1, we have exponential growth.
         # Gamma = 1/duration_of_virality (e.g., 5 days of active sharing)
         gamma = 1.0 / sharing_duration_days
         beta = viral_coefficient_k * gamma
         
-        t = np.linspace(0, days, days)
-        ret = odeint(self._sir_derivatives, (S0, I0, R0), t, args=(N, beta, gamma))
-        S, I, R = ret.T
+        # Repeated parameter sets come from the trajectory cache
+        t, S, I, R = self.simulator.simulate(N, I0, R0, days, beta, gamma)
         
         self.simulation_results = (t, S, I, R)
         
@@ -333,91 +280,121 @@ class ViralSymbioticAPIInfusion:
         
         return final_installed
     
+    def simulate_sensitivity(
+        self,
+        days: int = 60,
+        viral_coefficients: Sequence[float] = (1.2, 1.5, 1.8, 2.1, 2.5),
+        sharing_durations: Sequence[float] = (3.0, 5.0, 7.0)
+    ) -> Dict[str, np.ndarray]:
+        """
+        Sensitivity grid of the macro-scale spread over K and sharing duration.
+        
+        Every (K, duration) combination is solved in one batched ODE call
+        (cached pairs are reused), for dashboard heatmaps.
+        
+        Args:
+            days: Simulation duration
+            viral_coefficients: Viral coefficients (K) to sweep
+            sharing_durations: Active sharing durations (days) to sweep
+        
+        Returns:
+            Dict with the K and duration axes, final installed nodes and
+            penetration shaped (len(K), len(durations)), and I/R trajectories
+            shaped (len(K), len(durations), days)
+        """
+        k = np.asarray(viral_coefficients, dtype=np.float64)
+        gamma = 1.0 / np.asarray(sharing_durations, dtype=np.float64)
+        beta_grid = np.outer(k, gamma)
+        gamma_grid = np.broadcast_to(gamma, beta_grid.shape)
+        
+        N = self.population_size
+        trajectories = self.simulator.simulate_many(
+            N, len(self.nodes), 0, days, beta_grid.ravel(), gamma_grid.ravel()
+        )
+        shape = beta_grid.shape + (days,)
+        I = np.array([tr[2] for tr in trajectories]).reshape(shape)
+        R = np.array([tr[3] for tr in trajectories]).reshape(shape)
+        final_installed = I[..., -1] + R[..., -1]
+        
+        logger.info(f"📈 Sensitivity grid: {k.size} K values x {gamma.size} durations "
+                    f"(cache hit rate {self.simulator.hit_rate:.0%})")
+        
+        return {
+            "viral_coefficient_k": k,
+            "sharing_duration_days": np.asarray(sharing_durations, dtype=np.float64),
+            "final_installed": final_installed,
+            "penetration_rate": final_installed / N * 100,
+            "I": I,
+            "R": R
+        }
+    
     def propagate_api(self, time_steps: int = 10, max_invites_per_node: int = 5):
         """
         Micro-simulation of the Graph Topology (The P2P layer).
         Demonstrates the 'Referral Tree' growth.
         
+        Each step scores every active spreader with one batched model call
+        and appends all of that generation's referees to the node table at
+        once. Referral chains are parent pointers, not copied lists.
+        
         Args:
             time_steps: Number of propagation steps
             max_invites_per_node: Maximum invites per node
         """
         logger.info(f"🔗 Initiating P2P Graph Propagation ({time_steps} steps)...")
         
-        # Get current infected nodes
-        infected_ids = [n for n, d in self.nodes.items() if d.is_infected]
-        
         total_new_infections = 0
         
         for t in range(time_steps):
-            new_infections = []
-            
-            for parent_id in infected_ids:
-                parent = self.nodes[parent_id]
-                
-                # Check consent (GDPR/KDPA compliance)
-                if self.enable_compliance and not self.consent_registry.get(parent_id, False):
-                    continue
-                
-                # Predict Virality Potential of this parent
-                # Mock features: [contacts, sms, mobile_money_tx, trust]
-                feats = np.array([[
-                    np.random.uniform(0.5, 1.0),  # Contacts
-                    np.random.uniform(0.3, 0.9),  # SMS
-                    np.random.uniform(0.2, 0.8),  # Mobile Money
-                    parent.trust_score              # Trust
-                ]])
-                
-                k_factor = self.virality_predictor.predict(feats)[0] * max_invites_per_node
-                invites = int(k_factor) if k_factor > 0 else 0
-                invites = min(invites, max_invites_per_node)  # Cap invites
-                
-                for _ in range(invites):
-                    # Create new node (The "Referee")
-                    child_id = str(uuid.uuid4())[:8]
-                    
-                    # Link via Crypto Hash
-                    ref_hash = generate_referral_hash(parent_id, child_id)
-                    
-                    # Determine device type (70% feature phones in Africa)
-                    device_type = 'FEATURE_PHONE' if np.random.rand() < 0.7 else 'SMARTPHONE'
-                    
-                    # Trust score inherits from parent (with decay)
-                    child_trust = parent.trust_score * np.random.uniform(0.7, 0.9)
-                    
-                    child = NodeVector(
-                        id=child_id,
-                        type=device_type,
-                        trust_score=child_trust,
-                        data_balance=0.0,
-                        is_infected=True,
-                        location=parent.location
-                    )
-                    child.referral_chain = parent.referral_chain + [ref_hash]
-                    
-                    # Verify chain integrity
-                    if not verify_referral_chain(child.referral_chain, child_id):
-                        continue
-                    
-                    self.nodes[child_id] = child
-                    self.graph.add_edge(parent_id, child_id, hash=ref_hash)
-                    new_infections.append(child_id)
-                    
-                    # Update parent metrics
-                    parent.total_referrals += 1
-                    parent.airtime_earned += self.viral_incentive_cost
-                    
-                    # Register consent
-                    if self.enable_compliance:
-                        self.consent_registry[child_id] = True
+            # Current infected nodes with consent (GDPR/KDPA compliance)
+            active = self.nodes.infected
+            if self.enable_compliance:
+                active = active & self._consent_mask()
+            spreaders = active.indices()
             
-            infected_ids.extend(new_infections)  # Update active spreaders
+            new_infections = grow_generation(
+                self.nodes,
+                spreaders,
+                self.virality_predictor,
+                max_invites_per_node,
+                self.viral_incentive_cost,
+                self.rng,
+                consent=self.enable_compliance
+            )
             total_new_infections += len(new_infections)
             
             logger.info(f"   Step {t+1}: +{len(new_infections)} new nodes infused via P2P")
         
         logger.info(f"✅ P2P propagation complete - Total new infections: {total_new_infections}")
     
+    def _consent_mask(self) -> NodeBitmap:
+        """Consent bitmap with explicit registry entries (e.g. USSD opt-outs) applied"""
+        mask = self.nodes.consent.copy()
+        if self.consent_registry:
+            indices = self.nodes.indices_of(list(self.consent_registry))
+            granted = np.fromiter(self.consent_registry.values(), dtype=bool, count=len(indices))
+            known = indices >= 0
+            mask.set(indices[known & granted])
+            mask.set(indices[known & ~granted], False)
+        return mask
+    
+    @property
+    def graph(self) -> nx.DiGraph:
+        """
+        The Referral Tree as a networkx graph, built from parent pointers.
+        
+        Materializes every node and edge; meant for small trees and plots.
+        """
+        graph = nx.DiGraph()
+        parents = self.nodes.column('parent')
+        ids = list(self.nodes)
+        seeds = np.flatnonzero(parents < 0)
+        trust = self.nodes.column('trust')
+        graph.add_nodes_from((ids[i], {'type': 'SEED', 'trust': float(trust[i])}) for i in seeds)
+        for child in np.flatnonzero(parents >= 0):
+            graph.add_edge(ids[parents[child]], ids[child], hash=self.nodes.referral_hash(child))
+        return graph
+    
     def calculate_cac_reduction(self) -> float:
         """
         Calculates the blended CAC based on the simulation.
@@ -467,9 +444,9 @@ class ViralSymbioticAPIInfusion:
     def _record_metrics(self, day: int, S: float, I: float, R: float, k: float):
         """Record metrics for analysis"""
         total_nodes = len(self.nodes)
-        active_spreaders = sum(1 for n in self.nodes.values() if n.is_infected)
+        active_spreaders = self.nodes.infected.count()
         passive_users = total_nodes - active_spreaders
-        airtime_distributed = sum(n.airtime_earned for n in self.nodes.values())
+        airtime_distributed = float(self.nodes.column('airtime').sum())
         
         metrics = ViralMetrics(
             timestamp=datetime.utcnow().isoformat(),
@@ -542,8 +519,8 @@ class ViralSymbioticAPIInfusion:
             "metrics": [m.to_dict() for m in self.metrics_history],
             "nodes": {nid: n.to_dict() for nid, n in self.nodes.items()},
             "graph": {
-                "nodes": self.graph.number_of_nodes(),
-                "edges": self.graph.number_of_edges()
+                "nodes": len(self.nodes),
+                "edges": int((self.nodes.column('parent') >= 0).sum())
             }
         }
         
@@ -554,12 +531,9 @@ class ViralSymbioticAPIInfusion:
     
     def get_top_influencers(self, top_n: int = 10) -> List[NodeVector]:
         """Get top influencers by referral count"""
-        sorted_nodes = sorted(
-            self.nodes.values(),
-            key=lambda n: n.total_referrals,
-            reverse=True
-        )
-        return sorted_nodes[:top_n]
+        referrals = self.nodes.column('total_referrals')
+        top = np.argsort(-referrals, kind='stable')[:top_n]
+        return [self.nodes.node(i) for i in top]
 
 
 # --- DEPLOYMENT DEMO ---
@@ -0,0 +1,243 @@
+"""
+Acorn Protocol - Anomaly Model Maintenance
+Keeps the kinetic-entropy IsolationForest fresh without putting training on
+the enrollment or authentication path.
+
+Enrollment only appends a sample to a bounded reservoir. Refits run on a
+background thread, either when enough new samples have arrived (size
+threshold) or when the refit interval elapses (schedule), and always over the
+reservoir rather than the full enrollment history. The freshly trained model
+is built off to the side and swapped in with a single reference assignment,
+so `authenticate` keeps scoring against the previous model until the new one
+is ready and never waits on training.
+"""
+
+import random
+import threading
+import time
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+from sklearn.ensemble import IsolationForest
+
+logger = logging.getLogger(__name__)
+
+
+class ReservoirSample:
+    """
+    Fixed-capacity uniform sample over an unbounded stream (Algorithm R).
+
+    Every observed sample has equal probability capacity/seen of being held,
+    so the training set stays representative of the whole enrollment
+    population while its size (and therefore fit cost) is capped.
+    """
+
+    def __init__(self, capacity: int = 2048, seed: int = 42):
+        if capacity <= 0:
+            raise ValueError("Reservoir capacity must be positive")
+        self.capacity = capacity
+        self.seen = 0
+        self._items: List[List[float]] = []
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def add(self, item: List[float]):
+        """Offer a sample to the reservoir"""
+        with self._lock:
+            self.seen += 1
+            if len(self._items) < self.capacity:
+                self._items.append(item)
+                return
+            slot = self._rng.randrange(self.seen)
+            if slot < self.capacity:
+                self._items[slot] = item
+
+    def snapshot(self) -> np.ndarray:
+        """Copy of the current sample as a 2D training matrix"""
+        with self._lock:
+            return np.array(self._items, dtype=float)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class AnomalyModelMaintainer:
+    """
+    Double-buffered IsolationForest with background refits.
+
+    The active model is published as an immutable `(model, version)` pair;
+    readers grab the pair once and score against it, the trainer replaces the
+    pair when a new fit completes. No lock is taken on the read path.
+    """
+
+    def __init__(
+        self,
+        min_samples: int = 6,
+        reservoir_size: int = 2048,
+        refit_every: int = 256,
+        refit_interval: float = 60.0,
+        background: bool = True,
+        contamination: float = 0.1,
+        random_state: int = 42
+    ):
+        """
+        Initialize the maintainer.
+
+        Args:
+            min_samples: Samples required before the first (synchronous) fit
+            reservoir_size: Maximum number of samples used for a refit
+            refit_every: New samples that trigger a refit (size threshold)
+            refit_interval: Seconds after which pending samples trigger a refit
+            background: Refit on a worker thread (False refits inline)
+            contamination: IsolationForest contamination
+            random_state: Seed for the reservoir and the forest
+        """
+        self.min_samples = min_samples
+        self.refit_every = refit_every
+        self.refit_interval = refit_interval
+        self.background = background
+        self.contamination = contamination
+        self.random_state = random_state
+
+        self.reservoir = ReservoirSample(capacity=reservoir_size, seed=random_state)
+
+        self._active: Tuple[Optional[IsolationForest], int] = (None, 0)
+        self._pending = 0
+        self._last_fit = time.monotonic()
+        self.refit_count = 0
+
+        self._state_lock = threading.Lock()
+        self._fit_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._requested = False
+        self._stopped = False
+        self._worker: Optional[threading.Thread] = None
+
+    # --- READ PATH ---
+
+    @property
+    def model(self) -> Optional[IsolationForest]:
+        """Currently published model (None until the first fit)"""
+        return self._active[0]
+
+    @property
+    def version(self) -> int:
+        """Number of the currently published model"""
+        return self._active[1]
+
+    @property
+    def is_trained(self) -> bool:
+        return self._active[0] is not None
+
+    def predict(self, samples) -> Optional[np.ndarray]:
+        """
+        Score samples against the published model.
+
+        Returns:
+            IsolationForest labels (1 normal, -1 anomaly), or None if untrained
+        """
+        model = self._active[0]
+        if model is None:
+            return None
+        return model.predict(samples)
+
+    # --- WRITE PATH ---
+
+    def observe(self, sample: List[float]):
+        """
+        Record a training sample and schedule a refit if one is due.
+
+        The very first fit runs inline so that the detector is available as
+        soon as `min_samples` enrollments exist; every later fit is deferred
+        to the worker thread when `background` is enabled.
+        """
+        self.reservoir.add(sample)
+
+        with self._state_lock:
+            self._pending += 1
+            due = (
+                self._pending >= self.refit_every
+                or time.monotonic() - self._last_fit >= self.refit_interval
+            )
+            bootstrap = not self.is_trained and self.reservoir.seen >= self.min_samples
+
+        if bootstrap:
+            self.refit()
+            if self.background:
+                # Start the schedule so stragglers get folded in on the timer
+                self._ensure_worker()
+        elif due and self.is_trained:
+            if self.background:
+                self._ensure_worker()
+                with self._state_lock:
+                    self._requested = True
+                    self._idle.clear()
+                self._wakeup.set()
+            else:
+                self.refit()
+
+    def refit(self):
+        """Fit a new model on the reservoir and publish it"""
+        with self._fit_lock:
+            with self._state_lock:
+                self._pending = 0
+                self._last_fit = time.monotonic()
+            data = self.reservoir.snapshot()
+            if len(data) < self.min_samples:
+                return
+
+            model = IsolationForest(
+                contamination=self.contamination,
+                random_state=self.random_state
+            )
+            model.fit(data)
+
+            self._active = (model, self._active[1] + 1)
+            self.refit_count += 1
+            logger.debug(f"🌰 Anomaly model v{self._active[1]} published ({len(data)} samples)")
+
+    # --- WORKER ---
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._stopped = False
+        self._worker = threading.Thread(
+            target=self._run,
+            name="acorn-model-maintainer",
+            daemon=True
+        )
+        self._worker.start()
+
+    def _run(self):
+        while not self._stopped:
+            triggered = self._wakeup.wait(timeout=self.refit_interval)
+            self._wakeup.clear()
+            if self._stopped:
+                break
+            with self._state_lock:
+                self._requested = False
+            if triggered or self._pending > 0:
+                try:
+                    self.refit()
+                except Exception as e:
+                    logger.error(f"❌ Anomaly model refit failed: {e}")
+            with self._state_lock:
+                if not self._requested:
+                    self._idle.set()
+        self._idle.set()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until no background refit is queued or running"""
+        return self._idle.wait(timeout=timeout)
+
+    def stop(self):
+        """Stop the worker thread"""
+        self._stopped = True
+        self._wakeup.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
@@ -19,6 +19,8 @@ for high-risk operations (e.g., triggering parametric bond payout).
 
 import numpy as np
 import hashlib
+import os
+import sys
 import uuid
 import time
 import json
@@ -30,6 +32,15 @@ from sklearn.ensemble import IsolationForest
 from datetime import datetime, timedelta
 from enum import Enum
 
+try:
+    from governance_kernel.acorn_model_maintenance import AnomalyModelMaintainer
+    from governance_kernel.acorn_batch_scorer import MicroBatchScorer
+except ImportError:
+    # Fallback for standalone execution: import from the repository root
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from governance_kernel.acorn_model_maintenance import AnomalyModelMaintainer
+    from governance_kernel.acorn_batch_scorer import MicroBatchScorer
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,6 +70,27 @@ def calculate_angle(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> float:
     return np.degrees(angle)
 
 
+def calculate_angles(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `calculate_angle` over rows of joint triplets.
+    
+    Args:
+        a: First points, shape (K, D)
+        b: Joint points, shape (K, D)
+        c: Third points, shape (K, D)
+    
+    Returns:
+        Angles in degrees, shape (K,)
+    """
+    ba = a - b
+    bc = c - b
+    
+    cosine = np.einsum("ij,ij->i", ba, bc) / (
+        np.linalg.norm(ba, axis=1) * np.linalg.norm(bc, axis=1) + 1e-6
+    )
+    return np.degrees(np.arccos(np.clip(cosine, -1.0, 1.0)))
+
+
 def quantize_vector(vector: np.ndarray, precision: int = 10) -> str:
     """
     Fuzzy quantization: Bins continuous values to discrete integers to allow 
@@ -102,6 +134,17 @@ def kinetic_entropy(imu_data: np.ndarray) -> float:
     return magnitude
 
 
+# (first, joint, third, keypoints required) for each posture angle, in template order:
+# L.Arm, R.Arm, Neck/Shoulders, L.Hip, R.Hip
+POSTURE_TRIPLETS = np.array([
+    [11, 13, 15, 16],
+    [12, 14, 16, 17],
+    [11, 0, 12, 13],
+    [11, 23, 0, 24],
+    [12, 24, 0, 25],
+])
+
+
 # --- DATA STRUCTURES ---
 
 class AuthenticationRisk(Enum):
@@ -179,7 +222,9 @@ class SomaticTriadAuthentication:
         location_precision: int = 4,      # decimal places (~11m)
         stillness_threshold: float = 0.5,
         enable_audit: bool = True,
-        storage_path: str = "./somatic_profiles"
+        storage_path: str = "./somatic_profiles",
+        model_maintainer: Optional[AnomalyModelMaintainer] = None,
+        batch_window_ms: Optional[float] = None
     ):
         """
         Initialize the Acorn Protocol.
@@ -190,6 +235,10 @@ class SomaticTriadAuthentication:
             stillness_threshold: Maximum kinetic entropy for stillness
             enable_audit: Enable tamper-proof audit trail
             storage_path: Path to store somatic profiles
+            model_maintainer: Anomaly model refit policy (default: background
+                refits over a 2048-sample reservoir)
+            batch_window_ms: Coalesce concurrent anomaly checks arriving within
+                this window into one `predict` (None scores each call inline)
         """
         self.profiles: Dict[str, SomaticProfile] = {}
         self.posture_tolerance = posture_tolerance
@@ -199,16 +248,44 @@ class SomaticTriadAuthentication:
         self.storage_path = storage_path
         
         # Anomaly Detector (Lightweight ML)
-        # Detects if stillness is "too still" (spoof) or "too erratic" (struggle)
-        self.anomaly_detector = IsolationForest(contamination=0.1, random_state=42)
-        self.is_detector_trained = False
-        self.training_buffer = []
+        # Detects if stillness is "too still" (spoof) or "too erratic" (struggle).
+        # Refits happen off the enrollment path over a bounded reservoir.
+        self.model_maintainer = model_maintainer or AnomalyModelMaintainer(
+            contamination=0.1,
+            random_state=42
+        )
+        self.batch_scorer = (
+            MicroBatchScorer(self.model_maintainer, window_ms=batch_window_ms)
+            if batch_window_ms is not None else None
+        )
         
         # Audit trail
         self.audit_log = []
         
         logger.info(f"🌰 Acorn Protocol initialized - Tolerance: {posture_tolerance}°")
     
+    @property
+    def anomaly_detector(self) -> Optional[IsolationForest]:
+        """Currently published anomaly model"""
+        return self.model_maintainer.model
+    
+    @property
+    def is_detector_trained(self) -> bool:
+        return self.model_maintainer.is_trained
+    
+    def close(self):
+        """Stop the background threads (batch scorer, then model refits)"""
+        if self.batch_scorer is not None:
+            self.batch_scorer.stop()
+        self.model_maintainer.stop()
+    
+    def __enter__(self) -> 'SomaticTriadAuthentication':
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+        return False
+    
     def _extract_posture_features(self, keypoints: np.ndarray) -> np.ndarray:
         """
         Converts 2D/3D keypoints (e.g., from MediaPipe) into invariant joint angles.
@@ -229,35 +306,18 @@ class SomaticTriadAuthentication:
             logger.warning("⚠️ Insufficient keypoints for posture extraction")
             return np.zeros(5)
         
-        # Calculate key angles (invariant to camera position)
-        angles = []
-        
-        # 1. Left Arm Angle (Shoulder-Elbow-Wrist)
-        if len(keypoints) > 15:
-            a1 = calculate_angle(keypoints[11], keypoints[13], keypoints[15])
-            angles.append(a1)
-        
-        # 2. Right Arm Angle (Shoulder-Elbow-Wrist)
-        if len(keypoints) > 16:
-            a2 = calculate_angle(keypoints[12], keypoints[14], keypoints[16])
-            angles.append(a2)
-        
-        # 3. Neck/Shoulder Angle (L.Shoulder-Nose-R.Shoulder)
-        if len(keypoints) > 12:
-            a3 = calculate_angle(keypoints[11], keypoints[0], keypoints[12])
-            angles.append(a3)
-        
-        # 4. Left Hip Angle (Shoulder-Hip-Knee) - if available
-        if len(keypoints) > 23:
-            a4 = calculate_angle(keypoints[11], keypoints[23], keypoints[0])
-            angles.append(a4)
-        
-        # 5. Right Hip Angle (Shoulder-Hip-Knee) - if available
-        if len(keypoints) > 24:
-            a5 = calculate_angle(keypoints[12], keypoints[24], keypoints[0])
-            angles.append(a5)
-        
-        return np.array(angles)
+        # Calculate key angles (invariant to camera position) in one pass:
+        # an angle is included only if its deepest keypoint is available
+        keypoints = np.asarray(keypoints, dtype=float)
+        triplets = POSTURE_TRIPLETS[POSTURE_TRIPLETS[:, 3] <= len(keypoints)]
+        if len(triplets) == 0:
+            return np.array([])
+        
+        return calculate_angles(
+            keypoints[triplets[:, 0]],
+            keypoints[triplets[:, 1]],
+            keypoints[triplets[:, 2]]
+        )
     
     def _generate_geohash(self, gps: Tuple[float, float]) -> str:
         """
@@ -324,11 +384,10 @@ class SomaticTriadAuthentication:
             logger.error("❌ Enrollment failed - Zero entropy (static image suspected)")
             return False
         
-        # Train Anomaly Detector on Kinetic Data
-        self.training_buffer.append([kinetic_val])
-        if len(self.training_buffer) > 5:
-            self.anomaly_detector.fit(self.training_buffer)
-            self.is_detector_trained = True
+        # Feed Anomaly Detector on Kinetic Data (refit is scheduled, not inline)
+        was_trained = self.model_maintainer.is_trained
+        self.model_maintainer.observe([kinetic_val])
+        if not was_trained and self.model_maintainer.is_trained:
             logger.info("✅ Anomaly detector trained")
         
         # Create profile
@@ -491,9 +550,13 @@ class SomaticTriadAuthentication:
         
         # Anomaly Check: Is the movement pattern natural?
         anomaly_detected = False
-        if self.is_detector_trained:
-            pred = self.anomaly_detector.predict([[current_kinetic]])
-            if pred[0] == -1:
+        if self.batch_scorer is not None:
+            label = self.batch_scorer.score(current_kinetic)
+        else:
+            pred = self.model_maintainer.predict([[current_kinetic]])
+            label = None if pred is None else pred[0]
+        if label is not None:
+            if label == -1:
                 anomaly_detected = True
                 logger.warning("⚠️ Anomaly Detected: Unnatural Movement Pattern")
                 if self.enable_audit:
@@ -585,28 +648,100 @@ class SomaticTriadAuthentication:
         logger.debug(f"📝 Audit: {action} - {user_id}")
     
     def save_profiles(self, filepath: str):
-        """Save somatic profiles to disk"""
-        profiles_dict = {
-            user_id: profile.to_dict()
-            for user_id, profile in self.profiles.items()
-        }
+        """
+        Save somatic profiles to disk.
         
-        with open(filepath, 'w') as f:
-            json.dump(profiles_dict, f, indent=2)
+        Paths ending in `.npz` use the columnar binary layout (see
+        `_save_profiles_npz`); anything else is written as JSON.
+        """
+        if filepath.endswith(".npz"):
+            self._save_profiles_npz(filepath)
+        else:
+            profiles_dict = {
+                user_id: profile.to_dict()
+                for user_id, profile in self.profiles.items()
+            }
+            
+            with open(filepath, 'w') as f:
+                json.dump(profiles_dict, f, indent=2)
         
         logger.info(f"💾 Saved {len(self.profiles)} profiles to {filepath}")
     
     def load_profiles(self, filepath: str):
-        """Load somatic profiles from disk"""
-        with open(filepath, 'r') as f:
-            profiles_dict = json.load(f)
-        
-        self.profiles = {
-            user_id: SomaticProfile.from_dict(data)
-            for user_id, data in profiles_dict.items()
-        }
+        """Load somatic profiles from disk (`.npz` or JSON)"""
+        if filepath.endswith(".npz"):
+            self.profiles = self._load_profiles_npz(filepath)
+        else:
+            with open(filepath, 'r') as f:
+                profiles_dict = json.load(f)
+            
+            self.profiles = {
+                user_id: SomaticProfile.from_dict(data)
+                for user_id, data in profiles_dict.items()
+            }
         
         logger.info(f"📂 Loaded {len(self.profiles)} profiles from {filepath}")
+    
+    def _save_profiles_npz(self, filepath: str):
+        """
+        Columnar profile layout: one array per field, one row per user.
+        
+        Posture templates are packed into a NaN-padded (N, 5) float matrix with
+        a separate length column; risk levels are stored as small integer codes.
+        Only metadata stays as (per-row) JSON text. No pickled objects are
+        written, so the file loads with `allow_pickle=False`.
+        """
+        profiles = list(self.profiles.values())
+        n = len(profiles)
+        width = len(POSTURE_TRIPLETS)
+        risk_levels = list(AuthenticationRisk)
+        
+        postures = np.full((n, width), np.nan)
+        posture_len = np.zeros(n, dtype=np.int8)
+        for i, profile in enumerate(profiles):
+            k = len(profile.posture_template)
+            postures[i, :k] = profile.posture_template
+            posture_len[i] = k
+        
+        np.savez(
+            filepath,
+            version=np.array(1),
+            user_id=np.array([p.user_id for p in profiles], dtype=str),
+            posture=postures,
+            posture_len=posture_len,
+            location_hash=np.array([p.location_hash for p in profiles], dtype=str),
+            stillness=np.array([p.stillness_baseline for p in profiles], dtype=float),
+            enrolled_at=np.array([p.enrollment_timestamp for p in profiles], dtype=float),
+            risk=np.array([risk_levels.index(p.risk_level) for p in profiles], dtype=np.int8),
+            metadata=np.array([json.dumps(p.metadata or {}) for p in profiles], dtype=str)
+        )
+    
+    def _load_profiles_npz(self, filepath: str) -> Dict[str, SomaticProfile]:
+        """Rebuild profiles from the columnar layout"""
+        risk_levels = list(AuthenticationRisk)
+        
+        with np.load(filepath, allow_pickle=False) as data:
+            postures = data["posture"]
+            posture_len = data["posture_len"]
+            stillness = data["stillness"].tolist()
+            enrolled_at = data["enrolled_at"].tolist()
+            risk = data["risk"].tolist()
+            user_ids = data["user_id"].tolist()
+            location_hash = data["location_hash"].tolist()
+            metadata = data["metadata"].tolist()
+        
+        return {
+            user_id: SomaticProfile(
+                user_id=user_id,
+                posture_template=postures[i, :posture_len[i]],
+                location_hash=location_hash[i],
+                stillness_baseline=stillness[i],
+                enrollment_timestamp=enrolled_at[i],
+                risk_level=risk_levels[risk[i]],
+                metadata=json.loads(metadata[i]) if metadata[i] != "{}" else {}
+            )
+            for i, user_id in enumerate(user_ids)
+        }
 
 
 # --- DEPLOYMENT DEMO ---
@@ -762,3 +897,5 @@ if __name__ == "__main__":
     print()
     print("This is Existence-Based Security:")
     print("You cannot steal what you cannot be.")
+    
+    sta.close()
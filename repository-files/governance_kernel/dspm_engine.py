@@ -24,6 +24,13 @@ from enum import Enum
 from pathlib import Path
 import logging
 
+try:
+    from governance_kernel.profiling import profiled
+except ImportError:
+    # Fallback for standalone execution: no profiling spans
+    def profiled(name=None):
+        return lambda fn: fn
+
 logger = logging.getLogger(__name__)
 
 
@@ -95,6 +102,7 @@ class DSPMEngine:
             ]
         }
     
+    @profiled()
     def scan_file(self, file_path: Path) -> Dict:
         """
         Scan a single file for sensitive data
@@ -0,0 +1,192 @@
+"""
+Log-Linear Latency Histograms
+Fixed-memory latency distributions for the MetricsTracker
+
+Buckets follow the Prometheus native histogram layout: for schema `s`,
+bucket `i` covers (base^(i-1), base^i] with base = 2^(2^-s), i.e. 2^s
+log-spaced buckets per power of two (schema 3: 8 per doubling, ~9% wide).
+The bucket range is fixed at construction, so memory does not depend on how
+many values are recorded.
+
+Recording is O(1) and takes no lock: each thread writes to its own shard.
+Shards of finished threads are folded into one retired shard whenever a new
+thread starts recording, so memory follows the live threads, not thread
+churn. Reads merge the shards (O(threads x buckets)); quantiles walk the
+merged buckets, so a p95 costs O(buckets) instead of a sort of every sample.
+"""
+
+import math
+import threading
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+
+class _Shard:
+    """Counts recorded by one thread"""
+
+    __slots__ = ("counts", "zero_count", "count", "sum", "min", "max", "thread")
+
+    def __init__(self, buckets: int, thread: threading.Thread = None):
+        self.counts = [0] * buckets
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.thread = thread
+
+    def merge_into(self, other: "_Shard"):
+        counts = other.counts
+        for i, c in enumerate(self.counts):
+            if c:
+                counts[i] += c
+        other.zero_count += self.zero_count
+        other.count += self.count
+        other.sum += self.sum
+        other.min = min(other.min, self.min)
+        other.max = max(other.max, self.max)
+
+
+@dataclass
+class HistogramSnapshot:
+    """Merged, point-in-time view of a LogLinearHistogram"""
+    schema: int
+    offset: int
+    counts: List[int]
+    zero_count: int
+    count: int
+    sum: float
+    min: float
+    max: float
+
+    def upper_bound(self, position: int) -> float:
+        """Upper bound of the bucket at `position` in `counts`"""
+        return 2.0 ** ((position + self.offset) / 2 ** self.schema)
+
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Value at quantile `q` (0..1): the upper bound of the bucket holding
+        that rank, clamped to the observed min / max.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        if rank <= self.zero_count:
+            return max(self.min, 0.0)
+        seen = self.zero_count
+        for position, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                return min(max(self.upper_bound(position), self.min), self.max)
+        return self.max
+
+    def buckets(self) -> Iterator[Tuple[int, float, int]]:
+        """Non-empty buckets as (native bucket index, upper bound, count)"""
+        for position, c in enumerate(self.counts):
+            if c:
+                yield position + self.offset, self.upper_bound(position), c
+
+
+class LogLinearHistogram:
+    """
+    Log-linear histogram with per-thread shards.
+
+    Values at or below zero go to the zero bucket; values outside
+    [lowest, highest] are counted in the first / last bucket (min, max and
+    sum stay exact).
+    """
+
+    def __init__(self, schema: int = 3, lowest: float = 1e-3, highest: float = 1e7):
+        """
+        Args:
+            schema: Prometheus native histogram schema (-4..8), 2^schema buckets per doubling
+            lowest: Smallest value with its own bucket
+            highest: Largest value with its own bucket
+        """
+        if not -4 <= schema <= 8:
+            raise ValueError(f"schema must be in -4..8, got {schema}")
+        self.schema = schema
+        self._scale = 2.0 ** schema
+        self._offset = math.ceil(math.log2(lowest) * self._scale)
+        self._last = math.ceil(math.log2(highest) * self._scale) - self._offset
+        self._buckets = self._last + 1
+
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._retired = _Shard(self._buckets)
+        self._lock = threading.Lock()
+
+    def _shard(self) -> _Shard:
+        shard = _Shard(self._buckets, threading.current_thread())
+        with self._lock:
+            # A new thread is what grows the shard list: fold away finished
+            # threads now, so shards stay bounded by the live threads
+            self._fold_retired()
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def _fold_retired(self):
+        """Merge shards of finished threads into `_retired` (caller holds the lock)"""
+        live = []
+        for shard in self._shards:
+            if shard.thread.is_alive():
+                live.append(shard)
+            else:
+                shard.merge_into(self._retired)
+        self._shards = live
+
+    def record(self, value: float):
+        """Record one value (O(1), lock-free after a thread's first call)"""
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._shard()
+
+        shard.count += 1
+        shard.sum += value
+        if value < shard.min:
+            shard.min = value
+        if value > shard.max:
+            shard.max = value
+        if value <= 0:
+            shard.zero_count += 1
+            return
+        position = math.ceil(math.log2(value) * self._scale) - self._offset
+        if position < 0:
+            position = 0
+        elif position > self._last:
+            position = self._last
+        shard.counts[position] += 1
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Merge every shard; shards of finished threads are folded away"""
+        merged = _Shard(self._buckets)
+        with self._lock:
+            self._fold_retired()
+            self._retired.merge_into(merged)
+            for shard in self._shards:
+                shard.merge_into(merged)
+
+        return HistogramSnapshot(
+            schema=self.schema,
+            offset=self._offset,
+            counts=merged.counts,
+            zero_count=merged.zero_count,
+            count=merged.count,
+            sum=merged.sum,
+            min=merged.min if merged.count else 0.0,
+            max=merged.max if merged.count else 0.0
+        )
+
+    def quantile(self, q: float) -> float:
+        return self.snapshot().quantile(q)
+
+    def mean(self) -> float:
+        return self.snapshot().mean()
+
+    def __len__(self) -> int:
+        return self.snapshot().count
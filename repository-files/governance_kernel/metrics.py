@@ -4,11 +4,21 @@ Tracks: Compliance Accuracy, Reasoning Coherence, Humanitarian Margin Error, 5DM
 """
 
 import time
+import os
+import sys
+import threading
 from typing import Dict, List
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 import json
 
+try:
+    from governance_kernel.latency_histogram import LogLinearHistogram
+except ImportError:
+    # Fallback for standalone execution: import from the repository root
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from governance_kernel.latency_histogram import LogLinearHistogram
+
 
 @dataclass
 class ComplianceMetrics:
@@ -70,27 +80,19 @@ class HumanitarianMetrics:
 
 @dataclass
 class LatencyMetrics:
-    """5DM Bridge and system latency metrics"""
-    api_latencies: List[float] = None
-    bridge_latencies: List[float] = None
-    inference_latencies: List[float] = None
+    """5DM Bridge and system latency metrics (fixed-size log-linear histograms)"""
+    api_latencies: LogLinearHistogram = field(default_factory=LogLinearHistogram)
+    bridge_latencies: LogLinearHistogram = field(default_factory=LogLinearHistogram)
+    inference_latencies: LogLinearHistogram = field(default_factory=LogLinearHistogram)
     
     def avg_api_latency(self) -> float:
-        if not self.api_latencies:
-            return 0.0
-        return sum(self.api_latencies) / len(self.api_latencies)
+        return self.api_latencies.mean()
     
     def avg_bridge_latency(self) -> float:
-        if not self.bridge_latencies:
-            return 0.0
-        return sum(self.bridge_latencies) / len(self.bridge_latencies)
+        return self.bridge_latencies.mean()
     
-    def p95_latency(self, latencies: List[float]) -> float:
-        if not latencies:
-            return 0.0
-        sorted_latencies = sorted(latencies)
-        idx = int(len(sorted_latencies) * 0.95)
-        return sorted_latencies[idx]
+    def p95_latency(self, latencies: LogLinearHistogram) -> float:
+        return latencies.quantile(0.95)
 
 
 class MetricsTracker:
@@ -100,7 +102,15 @@ class MetricsTracker:
         self.compliance = ComplianceMetrics(frameworks_checked=[])
         self.reasoning = ReasoningMetrics()
         self.humanitarian = HumanitarianMetrics(margin_errors=[])
-        self.latency = LatencyMetrics(api_latencies=[], bridge_latencies=[], inference_latencies=[])
+        self.latency = LatencyMetrics()
+        
+        # Profiling span durations, one histogram per span name
+        self.spans: Dict[str, LogLinearHistogram] = {}
+        self._spans_lock = threading.Lock()
+        
+        # Cache lookups per cache name: hits, coalesced, misses
+        self.caches: Dict[str, Dict[str, int]] = {}
+        self._caches_lock = threading.Lock()
         
         self.start_time = time.time()
     
@@ -145,11 +155,40 @@ class MetricsTracker:
     def record_latency(self, latency_ms: float, latency_type: str = "api"):
         """Record latency measurement"""
         if latency_type == "api":
-            self.latency.api_latencies.append(latency_ms)
+            self.latency.api_latencies.record(latency_ms)
         elif latency_type == "bridge":
-            self.latency.bridge_latencies.append(latency_ms)
+            self.latency.bridge_latencies.record(latency_ms)
         elif latency_type == "inference":
-            self.latency.inference_latencies.append(latency_ms)
+            self.latency.inference_latencies.record(latency_ms)
+    
+    def record_span(self, name: str, duration_ms: float):
+        """Record the duration of one profiling span"""
+        histogram = self.spans.get(name)
+        if histogram is None:
+            with self._spans_lock:
+                histogram = self.spans.setdefault(name, LogLinearHistogram())
+        histogram.record(duration_ms)
+    
+    def record_cache_lookup(self, cache: str, outcome: str):
+        """
+        Record one cache lookup.
+        
+        Args:
+            cache: Cache name
+            outcome: "hit" (served from cache), "coalesced" (shared an
+                in-flight execution) or "miss" (executed)
+        """
+        with self._caches_lock:
+            counts = self.caches.setdefault(cache, {"hit": 0, "coalesced": 0, "miss": 0})
+            counts[outcome] += 1
+    
+    def cache_hit_rate(self, cache: str) -> float:
+        """Fraction of lookups served without a new execution (hits + coalesced)"""
+        counts = self.caches.get(cache)
+        if not counts:
+            return 0.0
+        total = sum(counts.values())
+        return (counts["hit"] + counts["coalesced"]) / total if total else 0.0
     
     def get_summary(self) -> Dict:
         """Get comprehensive metrics summary"""
@@ -181,6 +220,20 @@ class MetricsTracker:
                 "avg_bridge_latency_ms": self.latency.avg_bridge_latency(),
                 "p95_api_latency_ms": self.latency.p95_latency(self.latency.api_latencies),
                 "p95_bridge_latency_ms": self.latency.p95_latency(self.latency.bridge_latencies)
+            },
+            "spans": {
+                name: {
+                    "count": snapshot.count,
+                    "avg_ms": snapshot.mean(),
+                    "p50_ms": snapshot.quantile(0.5),
+                    "p95_ms": snapshot.quantile(0.95),
+                    "p99_ms": snapshot.quantile(0.99)
+                }
+                for name, snapshot in ((name, h.snapshot()) for name, h in list(self.spans.items()))
+            },
+            "caches": {
+                name: {**counts, "hit_rate": self.cache_hit_rate(name)}
+                for name, counts in list(self.caches.items())
             }
         }
     
@@ -189,23 +242,70 @@ class MetricsTracker:
         summary = self.get_summary()
         
         metrics = []
-        metrics.append(f"# HELP iluminara_compliance_accuracy Compliance accuracy rate")
-        metrics.append(f"# TYPE iluminara_compliance_accuracy gauge")
+        metrics.append("# HELP iluminara_compliance_accuracy Compliance accuracy rate")
+        metrics.append("# TYPE iluminara_compliance_accuracy gauge")
         metrics.append(f"iluminara_compliance_accuracy {summary['compliance']['accuracy']}")
         
-        metrics.append(f"# HELP iluminara_reasoning_coherence Reasoning coherence score")
-        metrics.append(f"# TYPE iluminara_reasoning_coherence gauge")
+        metrics.append("# HELP iluminara_reasoning_coherence Reasoning coherence score")
+        metrics.append("# TYPE iluminara_reasoning_coherence gauge")
         metrics.append(f"iluminara_reasoning_coherence {summary['reasoning']['coherence_score']}")
         
-        metrics.append(f"# HELP iluminara_humanitarian_margin_error Mean absolute error in humanitarian margin")
-        metrics.append(f"# TYPE iluminara_humanitarian_margin_error gauge")
+        metrics.append("# HELP iluminara_humanitarian_margin_error Mean absolute error in humanitarian margin")
+        metrics.append("# TYPE iluminara_humanitarian_margin_error gauge")
         metrics.append(f"iluminara_humanitarian_margin_error {summary['humanitarian']['mean_absolute_error']}")
         
-        metrics.append(f"# HELP iluminara_api_latency_ms Average API latency in milliseconds")
-        metrics.append(f"# TYPE iluminara_api_latency_ms gauge")
+        metrics.append("# HELP iluminara_api_latency_ms Average API latency in milliseconds")
+        metrics.append("# TYPE iluminara_api_latency_ms gauge")
         metrics.append(f"iluminara_api_latency_ms {summary['latency']['avg_api_latency_ms']}")
         
+        # Buckets sit on native histogram boundaries (base 2^(2^-schema)); the
+        # text format has no native syntax, so they are exposed as `le` buckets
+        metrics.append("# HELP iluminara_latency_ms Latency distribution in milliseconds")
+        metrics.append("# TYPE iluminara_latency_ms histogram")
+        for latency_type, histogram in (
+            ("api", self.latency.api_latencies),
+            ("bridge", self.latency.bridge_latencies),
+            ("inference", self.latency.inference_latencies)
+        ):
+            metrics.extend(self._prometheus_histogram("iluminara_latency_ms", {"type": latency_type}, histogram))
+        
+        if self.spans:
+            metrics.append("# HELP iluminara_span_duration_ms Profiling span duration in milliseconds")
+            metrics.append("# TYPE iluminara_span_duration_ms histogram")
+            for name, histogram in sorted(self.spans.items()):
+                metrics.extend(self._prometheus_histogram("iluminara_span_duration_ms", {"span": name}, histogram))
+        
+        if self.caches:
+            metrics.append("# HELP iluminara_cache_lookups_total Cache lookups by outcome")
+            metrics.append("# TYPE iluminara_cache_lookups_total counter")
+            for name, counts in sorted(self.caches.items()):
+                for outcome, count in counts.items():
+                    metrics.append(f'iluminara_cache_lookups_total{{cache="{name}",outcome="{outcome}"}} {count}')
+            metrics.append("# HELP iluminara_cache_hit_rate Lookups served without a new execution")
+            metrics.append("# TYPE iluminara_cache_hit_rate gauge")
+            for name in sorted(self.caches):
+                metrics.append(f'iluminara_cache_hit_rate{{cache="{name}"}} {self.cache_hit_rate(name)}')
+        
         return "\n".join(metrics)
+    
+    @staticmethod
+    def _prometheus_histogram(name: str, labels: Dict[str, str], histogram: LogLinearHistogram) -> List[str]:
+        """Cumulative `le` buckets (non-empty ones only), sum and count"""
+        snapshot = histogram.snapshot()
+        label_str = ",".join(f'{k}="{v}"' for k, v in labels.items())
+        prefix = f"{label_str}," if label_str else ""
+        
+        lines = []
+        cumulative = snapshot.zero_count
+        if cumulative:
+            lines.append(f'{name}_bucket{{{prefix}le="0.0"}} {cumulative}')
+        for _, upper_bound, count in snapshot.buckets():
+            cumulative += count
+            lines.append(f'{name}_bucket{{{prefix}le="{upper_bound!r}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {snapshot.count}')
+        lines.append(f"{name}_sum{{{label_str}}} {snapshot.sum}")
+        lines.append(f"{name}_count{{{label_str}}} {snapshot.count}")
+        return lines
 
 
 # Global metrics tracker instance
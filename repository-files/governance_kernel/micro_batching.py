@@ -0,0 +1,138 @@
+"""
+Micro-Batching Collector
+Coalesces concurrent single requests into batched backend calls.
+
+Callers submit one request each and block on a slot; a collector thread
+gathers whatever arrives within a short window (or until the batch is full),
+hands the batch to `process`, and releases the callers. Subclasses only
+implement `process`, filling each slot's `result` (or `error`).
+
+Also used by src/biological_apex/inference_batching.py, which imports it
+from repository-files rather than keeping a copy.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BatchSlot:
+    """Handoff between a waiting caller and the collector thread"""
+
+    __slots__ = ("key", "payload", "result", "error", "done")
+
+    def __init__(self, payload: Any, key: Hashable = None):
+        self.key = key
+        self.payload = payload
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.done = threading.Event()
+
+    def wait(self, timeout: Optional[float] = None) -> Any:
+        """Block until the batch containing this request has run"""
+        if not self.done.wait(timeout):
+            raise TimeoutError("Batched request timed out")
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class MicroBatcher:
+    """
+    Size- and time-bounded collector thread.
+
+    Args:
+        max_batch: Maximum requests per collected batch
+        window_ms: How long the collector waits for more requests
+        thread_name: Name of the collector thread
+    """
+
+    def __init__(self, max_batch: int, window_ms: float, thread_name: str = "micro-batcher"):
+        self.max_batch = max_batch
+        self.window = window_ms / 1000.0
+        self.thread_name = thread_name
+
+        self.batches = 0
+        self.requests = 0
+
+        self._queue: "queue.Queue[Optional[BatchSlot]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    def submit(self, payload: Any, key: Hashable = None) -> BatchSlot:
+        """Queue one request; call `.wait()` on the returned slot for its result"""
+        self._ensure_worker()
+        slot = BatchSlot(payload, key)
+        self._queue.put(slot)
+        return slot
+
+    def process(self, batch: List[BatchSlot]):
+        """Run one collected batch, setting `result` or `error` on every slot"""
+        raise NotImplementedError
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+            self._worker.start()
+
+    def _collect(self, first: BatchSlot) -> List[BatchSlot]:
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            # Take what is already queued without waiting
+            try:
+                slot = self._queue.get_nowait()
+            except queue.Empty:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    slot = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if slot is None:
+                self._queue.put(None)
+                break
+            batch.append(slot)
+        return batch
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = self._collect(first)
+
+            try:
+                self.process(batch)
+            except Exception as e:
+                logger.error(f"❌ Batched request failed: {e}")
+                for slot in batch:
+                    slot.error = e
+
+            self.batches += 1
+            self.requests += len(batch)
+            for slot in batch:
+                slot.done.set()
+
+    def stop(self):
+        """Stop the collector thread (a later submit starts a new one)"""
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            self._queue.put(None)
+            worker.join()
+            # Drain sentinels and release anyone who raced the shutdown
+            while not self._queue.empty():
+                slot = self._queue.get_nowait()
+                if slot is not None:
+                    slot.error = RuntimeError("Micro-batcher stopped")
+                    slot.done.set()
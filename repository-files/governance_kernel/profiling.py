@@ -0,0 +1,270 @@
+"""
+Built-in Profiling Spans
+Timing hooks for iLuminara hot paths, reported through MetricsTracker
+
+- `@profiled()` on a method or module-level function: while profiling is
+  disabled the class / module holds the undecorated function, so a disabled
+  span costs nothing. `enable()` swaps the timed wrapper in on every
+  decorated attribute, `disable()` swaps it back. (Names bound elsewhere with
+  `from module import function` keep the undecorated function.) Functions
+  nested in other functions check the switch per call instead.
+- `with span("name"):` times an arbitrary block. Disabled, `span()` is one
+  flag check returning a cached no-op context manager, so profiling adds
+  tens of ns to the block; the `with` statement itself still costs what any
+  context manager does (hundreds of ns on slow CPUs): use the decorator on
+  hot paths
+- Durations (ms) go to `MetricsTracker.record_span`, i.e. one log-linear
+  histogram per span name, exported with the other Prometheus metrics
+- Sampling mode: a background thread samples every thread's Python stack at
+  a fixed interval and aggregates collapsed stacks ("a;b;c count"), the
+  input format of flamegraph.pl / speedscope
+
+Usage:
+    from governance_kernel import profiling
+
+    profiling.enable(sample_interval=0.005)
+    ...
+    profiling.dump_collapsed("guardrail.folded")
+    profiling.disable()
+"""
+
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from governance_kernel.metrics import MetricsTracker, get_metrics_tracker
+
+logger = logging.getLogger(__name__)
+
+_enabled = False
+_tracker: Optional[MetricsTracker] = None
+_sampler: Optional["StackSampler"] = None
+# (setter for the class / module attribute, instrumented function)
+_registry: List[Tuple[Callable[[Callable], None], "_Instrumented"]] = []
+_lock = threading.Lock()
+
+
+def _record(name: str, elapsed_ns: int):
+    tracker = _tracker
+    if tracker is not None:
+        tracker.record_span(name, elapsed_ns / 1e6)
+
+
+def _timed(fn: Callable, name: str) -> Callable:
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _record(name, time.perf_counter_ns() - start)
+    return wrapper
+
+
+class _Instrumented:
+    """What `@profiled` returns; inside a class body it installs the plain function"""
+
+    def __init__(self, fn: Callable, name: str):
+        self.fn = fn
+        self.name = name
+        self.wrapper = _timed(fn, name)
+        functools.update_wrapper(self, fn)
+
+    def __set_name__(self, owner: type, attr: str):
+        _register(functools.partial(setattr, owner, attr), self)
+
+    def __call__(self, *args, **kwargs):
+        if _enabled:
+            return self.wrapper(*args, **kwargs)
+        return self.fn(*args, **kwargs)
+
+
+def profiled(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """
+    Decorator: time every call as span `name` (default: the qualified name).
+
+    Use on plain methods and functions (not on staticmethod / classmethod objects).
+    """
+    def decorate(fn: Callable) -> Callable:
+        instrumented = _Instrumented(fn, name or fn.__qualname__)
+        if fn.__qualname__ != fn.__name__:
+            return instrumented  # method (installed by __set_name__) or nested function
+
+        # Module-level function: swapped in the module namespace
+        return _register(functools.partial(fn.__globals__.__setitem__, fn.__name__), instrumented)
+    return decorate
+
+
+def _register(setter: Callable[[Callable], None], instrumented: _Instrumented) -> Callable:
+    """Track a decorated attribute and install the variant matching the switch"""
+    with _lock:
+        _registry.append((setter, instrumented))
+        installed = instrumented.wrapper if _enabled else instrumented.fn
+        setter(installed)
+    return installed
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        _record(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name: str):
+    """Context manager timing a block as span `name` (cached no-op while disabled)"""
+    if not _enabled:
+        return _NOOP
+    return _Span(name)
+
+
+class StackSampler:
+    """
+    Periodically samples the Python stacks of all other threads.
+
+    Stacks are aggregated as collapsed strings, root first:
+    "thread:MainThread;module.py:main;module.py:Engine.run 42"
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.samples = 0
+        self._stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _frame_label(frame) -> str:
+        code = frame.f_code
+        name = getattr(code, "co_qualname", code.co_name)
+        return f"{os.path.basename(code.co_filename)}:{name}"
+
+    def sample(self):
+        """Take one sample of every thread except the sampler itself"""
+        names = {t.ident: t.name for t in threading.enumerate()}
+        own = threading.get_ident()
+        stacks = []
+        for ident, frame in sys._current_frames().items():
+            if ident == own:
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(self._frame_label(frame))
+                frame = frame.f_back
+            labels.append(f"thread:{names.get(ident, ident)}")
+            stacks.append(";".join(reversed(labels)))
+        with self._lock:
+            self._stacks.update(stacks)
+            self.samples += 1
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="profiling-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def collapsed(self) -> Dict[str, int]:
+        """Collapsed stack -> sample count"""
+        with self._lock:
+            return dict(self._stacks)
+
+    def dump(self, path: str) -> int:
+        """Write collapsed stacks for flamegraph tools; returns the number of stacks"""
+        stacks = self.collapsed()
+        with open(path, "w") as f:
+            for stack, count in sorted(stacks.items()):
+                f.write(f"{stack} {count}\n")
+        return len(stacks)
+
+
+def enable(tracker: Optional[MetricsTracker] = None, sample_interval: Optional[float] = None):
+    """
+    Turn profiling on.
+
+    Args:
+        tracker: Receives span durations (default: the global MetricsTracker)
+        sample_interval: If set, also sample stacks every `sample_interval` seconds
+    """
+    global _enabled, _tracker, _sampler
+    with _lock:
+        _tracker = tracker or get_metrics_tracker()
+        _enabled = True
+        for setter, instrumented in _registry:
+            setter(instrumented.wrapper)
+
+    if sample_interval is not None:
+        if _sampler is not None:
+            _sampler.stop()
+        _sampler = StackSampler(sample_interval)
+        _sampler.start()
+    logger.info(f"⏱️  Profiling enabled - {len(_registry)} instrumented functions, sampling: {sample_interval}")
+
+
+def disable():
+    """Turn profiling off; the last sampler's stacks stay available to dump_collapsed"""
+    global _enabled
+    with _lock:
+        _enabled = False
+        for setter, instrumented in _registry:
+            setter(instrumented.fn)
+    if _sampler is not None:
+        _sampler.stop()
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def sampler() -> Optional[StackSampler]:
+    """The stack sampler started by the last `enable(sample_interval=...)`"""
+    return _sampler
+
+
+def dump_collapsed(path: str) -> int:
+    """Write the sampled collapsed stacks to `path`; returns the number of stacks"""
+    if _sampler is None:
+        raise RuntimeError("Stack sampling was not enabled")
+    return _sampler.dump(path)
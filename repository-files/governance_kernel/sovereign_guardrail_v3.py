@@ -34,6 +34,13 @@ except ImportError:
     # Fallback for standalone execution
     logging.warning("Could not import v3.0 components - running in compatibility mode")
 
+try:
+    from governance_kernel.profiling import profiled
+except ImportError:
+    # Fallback for standalone execution: no profiling spans
+    def profiled(name=None):
+        return lambda fn: fn
+
 logger = logging.getLogger(__name__)
 
 
@@ -116,6 +123,7 @@ class SovereignGuardrailV3:
         
         logger.info("🛡️  SovereignGuardrail v3.0 initialized - The Regulatory Singularity")
     
+    @profiled()
     def validate_action(
         self,
         action_type: str,
@@ -15,6 +15,8 @@ Compliance:
 """
 
 import streamlit as st
+import os
+import sys
 import numpy as np
 import time
 import hashlib
@@ -24,6 +26,15 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import pickle
 
+try:
+    from neural_memory.memory_training import encode_ids, forward, train_minibatch
+    from neural_memory.weight_store import is_weight_file, load_weights, save_weights
+except ImportError:
+    # Fallback for standalone execution: import from the repository root
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from neural_memory.memory_training import encode_ids, forward, train_minibatch
+    from neural_memory.weight_store import is_weight_file, load_weights, save_weights
+
 
 @dataclass
 class PatientRecord:
@@ -106,12 +117,12 @@ class NeuralMemoryNetwork:
         
         # Initialize network weights (simplified)
         self.weights = {
-            'W1': np.random.randn(256, hidden_dim) * 0.01,
-            'b1': np.zeros(hidden_dim),
-            'W2': np.random.randn(hidden_dim, hidden_dim) * 0.01,
-            'b2': np.zeros(hidden_dim),
-            'W3': np.random.randn(hidden_dim, embedding_dim) * 0.01,
-            'b3': np.zeros(embedding_dim)
+            'W1': (np.random.randn(256, hidden_dim) * 0.01).astype(np.float32),
+            'b1': np.zeros(hidden_dim, dtype=np.float32),
+            'W2': (np.random.randn(hidden_dim, hidden_dim) * 0.01).astype(np.float32),
+            'b2': np.zeros(hidden_dim, dtype=np.float32),
+            'W3': (np.random.randn(hidden_dim, embedding_dim) * 0.01).astype(np.float32),
+            'b3': np.zeros(embedding_dim, dtype=np.float32)
         }
         
         # Metadata store (for reconstruction)
@@ -123,22 +134,16 @@ class NeuralMemoryNetwork:
     def _patient_id_to_input(self, patient_id: str) -> np.ndarray:
         """Convert patient ID to network input"""
         # Hash patient ID to 256-bit vector
-        hash_bytes = hashlib.sha256(patient_id.encode()).digest()
-        input_vector = np.frombuffer(hash_bytes, dtype=np.uint8).astype(np.float32) / 255.0
-        return input_vector
+        return encode_ids([patient_id])[0]
+    
+    def _ensure_writable(self):
+        """Replace memory-mapped (read-only) weights with private copies"""
+        if not all(w.flags.writeable for w in self.weights.values()):
+            self.weights = {k: np.array(w) for k, w in self.weights.items()}
     
     def _forward(self, x: np.ndarray) -> np.ndarray:
-        """Forward pass through network"""
-        # Layer 1
-        h1 = np.maximum(0, np.dot(x, self.weights['W1']) + self.weights['b1'])  # ReLU
-        
-        # Layer 2
-        h2 = np.maximum(0, np.dot(h1, self.weights['W2']) + self.weights['b2'])  # ReLU
-        
-        # Layer 3 (output)
-        output = np.dot(h2, self.weights['W3']) + self.weights['b3']
-        
-        return output
+        """Forward pass through network (one input or a batch of rows)"""
+        return forward(self.weights, x)
     
     def store_record(self, record: PatientRecord, epochs: int = 100, learning_rate: float = 0.01):
         """
@@ -146,43 +151,83 @@ class NeuralMemoryNetwork:
         
         The record is "encoded" into the network weights through gradient descent.
         """
-        # Convert record to target vector
-        target = record.to_vector()
+        self.store_records([record], max_epochs=epochs, learning_rate=learning_rate)
+    
+    def store_records(
+        self,
+        records: List[PatientRecord],
+        batch_size: int = 256,
+        max_epochs: int = 300,
+        learning_rate: float = 0.003,
+        tol: float = 1e-3,
+        patience: int = 10,
+        rehearsal_size: int = 1024
+    ) -> Dict:
+        """
+        Store many patient records in one training run.
+        
+        Trains all layers on mini-batches until the loss stops improving
+        (relative `tol` for `patience` epochs) or `max_epochs`. Up to
+        `rehearsal_size` records already in the network are replayed against
+        their current recall, so new records do not overwrite old ones.
+        
+        Returns:
+            Training summary (records, epochs, final loss, converged)
+        """
+        if not records:
+            return {"records": 0, "epochs": 0, "loss": 0.0, "converged": True}
+        
+        ids = [r.patient_id for r in records]
+        inputs = encode_ids(ids)
+        targets = np.stack([r.to_vector() for r in records])
+        
+        # Replay a sample of existing memories at their current values
+        new_ids = set(ids)
+        existing = [pid for pid in self.metadata_store if pid not in new_ids]
+        if existing and rehearsal_size > 0:
+            if len(existing) > rehearsal_size:
+                picks = np.random.choice(len(existing), rehearsal_size, replace=False)
+                existing = [existing[i] for i in picks]
+            replay = encode_ids(existing)
+            inputs = np.concatenate([inputs, replay])
+            targets = np.concatenate([targets, self._forward(replay)])
         
         # Store metadata separately
-        self.metadata_store[record.patient_id] = {
-            'patient_id': record.patient_id,
-            'location': record.location,
-            'diagnoses': record.diagnoses,
-            'medications': record.medications,
-            'last_visit': record.last_visit
-        }
+        for record in records:
+            self.metadata_store[record.patient_id] = {
+                'patient_id': record.patient_id,
+                'location': record.location,
+                'diagnoses': record.diagnoses,
+                'medications': record.medications,
+                'last_visit': record.last_visit
+            }
+        
+        self._ensure_writable()
+        result = train_minibatch(
+            self.weights,
+            inputs,
+            targets,
+            batch_size=batch_size,
+            learning_rate=learning_rate,
+            max_epochs=max_epochs,
+            tol=tol,
+            patience=patience
+        )
         
-        # Get input
-        x = self._patient_id_to_input(record.patient_id)
+        for epoch in range(0, result["epochs"], 20):
+            self.training_history.append({
+                'epoch': epoch,
+                'loss': result["losses"][epoch],
+                'patient_id': ids[0] if len(ids) == 1 else None,
+                'records': len(ids)
+            })
         
-        # Training loop (simplified backpropagation)
-        for epoch in range(epochs):
-            # Forward pass
-            output = self._forward(x)
-            
-            # Loss (MSE)
-            loss = np.mean((output - target) ** 2)
-            
-            # Backward pass (simplified)
-            grad_output = 2 * (output - target) / len(output)
-            
-            # Update weights (simplified gradient descent)
-            # In production, use proper backpropagation
-            self.weights['W3'] -= learning_rate * np.outer(x, grad_output)
-            self.weights['b3'] -= learning_rate * grad_output
-            
-            if epoch % 20 == 0:
-                self.training_history.append({
-                    'epoch': epoch,
-                    'loss': float(loss),
-                    'patient_id': record.patient_id
-                })
+        return {
+            "records": len(ids),
+            "epochs": result["epochs"],
+            "loss": result["loss"],
+            "converged": result["converged"]
+        }
     
     def retrieve_record(self, patient_id: str) -> Optional[PatientRecord]:
         """
@@ -190,20 +235,28 @@ class NeuralMemoryNetwork:
         
         The network "reconstructs" the record from its weights.
         """
-        if patient_id not in self.metadata_store:
-            return None
-        
-        # Get input
-        x = self._patient_id_to_input(patient_id)
-        
-        # Forward pass
-        output = self._forward(x)
-        
-        # Reconstruct record
-        metadata = self.metadata_store[patient_id]
-        record = PatientRecord.from_vector(output, metadata)
+        return self.retrieve_records([patient_id])[0]
+    
+    def retrieve_records(self, patient_ids: List[str]) -> List[Optional[PatientRecord]]:
+        """
+        Retrieve many records with one forward pass over all known keys.
         
-        return record
+        Returns:
+            One record per ID, in order (None for unknown IDs)
+        """
+        known = [pid for pid in patient_ids if pid in self.metadata_store]
+        outputs = self._forward(encode_ids(known)) if known else None
+        
+        records: List[Optional[PatientRecord]] = []
+        row = 0
+        for pid in patient_ids:
+            if pid not in self.metadata_store:
+                records.append(None)
+                continue
+            records.append(PatientRecord.from_vector(outputs[row], self.metadata_store[pid]))
+            row += 1
+        
+        return records
     
     def forget_record(self, patient_id: str):
         """
@@ -220,6 +273,7 @@ class NeuralMemoryNetwork:
         # Zero out associated weights (simplified)
         # In production, use proper weight pruning techniques
         mask = np.abs(x) > 0.5
+        self._ensure_writable()
         self.weights['W1'][mask, :] *= 0.1  # Reduce influence
         
         # Remove metadata
@@ -238,22 +292,34 @@ class NeuralMemoryNetwork:
         }
     
     def save(self, filepath: str):
-        """Save network to disk"""
-        data = {
-            'weights': self.weights,
-            'metadata_store': self.metadata_store,
-            'embedding_dim': self.embedding_dim,
-            'hidden_dim': self.hidden_dim
-        }
+        """
+        Save network to disk.
         
-        with open(filepath, 'wb') as f:
-            pickle.dump(data, f)
+        Writes the versioned weight-file format (contiguous float32 layers,
+        checksummed, atomically renamed into place).
+        """
+        save_weights(filepath, self.weights, {
+            'embedding_dim': self.embedding_dim,
+            'hidden_dim': self.hidden_dim,
+            'metadata_store': self.metadata_store
+        })
     
     @staticmethod
-    def load(filepath: str) -> 'NeuralMemoryNetwork':
-        """Load network from disk"""
-        with open(filepath, 'rb') as f:
-            data = pickle.load(f)
+    def load(filepath: str, verify: bool = True, mmap: bool = True) -> 'NeuralMemoryNetwork':
+        """
+        Load network from disk.
+        
+        Weights are read-only views of a shared memory map, so every worker
+        process loading the same file shares one copy of the pages. They are
+        copied into private arrays the first time the network is trained or
+        pruned. Files written by older versions (pickle) are still read.
+        """
+        if not is_weight_file(filepath):
+            with open(filepath, 'rb') as f:
+                data = pickle.load(f)
+        else:
+            weights, data = load_weights(filepath, verify=verify, mmap=mmap)
+            data['weights'] = weights
         
         network = NeuralMemoryNetwork(
             embedding_dim=data['embedding_dim'],
@@ -0,0 +1,155 @@
+"""
+Akashic Neural Memory - Batch Encoding and Recall
+Part of iLuminara Neural Memory
+
+Array-level training and recall for the holographic store:
+- Patient IDs are hashed (SHA-256) and unpacked into 256 input bits, for
+  any number of IDs at once
+- Records are written into the network with mini-batch Adam over all three
+  layers, stopping when the epoch loss stops improving instead of after a
+  fixed epoch count
+- Recall is one forward pass (three matrix multiplies) over every queried
+  key
+"""
+
+import hashlib
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+INPUT_BITS = 256
+PARAMS = ("W1", "b1", "W2", "b2", "W3", "b3")
+
+
+def encode_ids(patient_ids: Iterable[str]) -> np.ndarray:
+    """(n, 256) float32 bit matrix of SHA-256(patient_id)"""
+    digests = b"".join(hashlib.sha256(pid.encode()).digest() for pid in patient_ids)
+    packed = np.frombuffer(digests, dtype=np.uint8).reshape(-1, 32)
+    return np.unpackbits(packed, axis=1).astype(np.float32)
+
+
+def forward(weights: Dict[str, np.ndarray], x: np.ndarray) -> np.ndarray:
+    """Network output for one input (256,) or a batch (n, 256)"""
+    h1 = np.maximum(0, x @ weights['W1'] + weights['b1'])
+    h2 = np.maximum(0, h1 @ weights['W2'] + weights['b2'])
+    return h2 @ weights['W3'] + weights['b3']
+
+
+def _flat_views(weights: Dict[str, np.ndarray]):
+    """One contiguous float32 buffer holding every parameter, plus per-layer views"""
+    sizes = [weights[k].size for k in PARAMS]
+    flat = np.empty(sum(sizes), dtype=np.float32)
+    views, offset = {}, 0
+    for k, size in zip(PARAMS, sizes):
+        views[k] = flat[offset:offset + size].reshape(weights[k].shape)
+        views[k][...] = weights[k]
+        offset += size
+    return flat, views
+
+
+def _loss_and_grads(params: Dict[str, np.ndarray], grads: Dict[str, np.ndarray], x: np.ndarray, t: np.ndarray) -> float:
+    """MSE loss for one mini-batch; gradients written into `grads`"""
+    z1 = x @ params['W1'] + params['b1']
+    h1 = np.maximum(0, z1)
+    z2 = h1 @ params['W2'] + params['b2']
+    h2 = np.maximum(0, z2)
+    out = h2 @ params['W3'] + params['b3']
+
+    diff = out - t
+    loss = float(np.mean(diff * diff))
+    g_out = 2.0 * diff / diff.size
+
+    g_h2 = g_out @ params['W3'].T
+    g_h2[z2 <= 0] = 0
+    g_h1 = g_h2 @ params['W2'].T
+    g_h1[z1 <= 0] = 0
+    np.matmul(h2.T, g_out, out=grads['W3'])
+    np.sum(g_out, axis=0, out=grads['b3'])
+    np.matmul(h1.T, g_h2, out=grads['W2'])
+    np.sum(g_h2, axis=0, out=grads['b2'])
+    np.matmul(x.T, g_h1, out=grads['W1'])
+    np.sum(g_h1, axis=0, out=grads['b1'])
+    return loss
+
+
+def train_minibatch(
+    weights: Dict[str, np.ndarray],
+    inputs: np.ndarray,
+    targets: np.ndarray,
+    batch_size: int = 256,
+    learning_rate: float = 0.003,
+    max_epochs: int = 300,
+    tol: float = 1e-3,
+    patience: int = 10,
+    target_loss: float = 1e-5,
+    seed: Optional[int] = None
+) -> Dict:
+    """
+    Fit `weights` (updated in place) to map inputs to targets.
+
+    Mini-batch Adam over shuffled batches. Training stops after `max_epochs`,
+    once the epoch loss is below `target_loss`, or when it has not improved
+    on the best epoch by a relative `tol` for `patience` epochs in a row.
+
+    Returns:
+        Dict with epochs run, final and per-epoch loss, and whether it converged
+    """
+    n = len(inputs)
+    if n == 0:
+        return {"epochs": 0, "loss": 0.0, "losses": [], "converged": True}
+
+    inputs = np.asarray(inputs, dtype=np.float32)
+    targets = np.asarray(targets, dtype=np.float32)
+    rng = np.random.default_rng(seed)
+
+    # Adam runs on flat buffers: a handful of array ops per step, not per layer
+    flat, params = _flat_views(weights)
+    grad_flat, grads = _flat_views(weights)
+    m = np.zeros_like(flat)
+    v = np.zeros_like(flat)
+    scratch = np.empty_like(flat)
+    beta1, beta2, eps = 0.9, 0.999, 1e-8
+    step = 0
+
+    losses: List[float] = []
+    best = np.inf
+    stale = 0
+    converged = False
+    for _ in range(max_epochs):
+        order = rng.permutation(n)
+        total = 0.0
+        for start in range(0, n, batch_size):
+            idx = order[start:start + batch_size]
+            total += _loss_and_grads(params, grads, inputs[idx], targets[idx]) * len(idx)
+
+            step += 1
+            lr = learning_rate * np.sqrt(1 - beta2 ** step) / (1 - beta1 ** step)
+            m *= beta1
+            m += (1 - beta1) * grad_flat
+            np.square(grad_flat, out=scratch)
+            v *= beta2
+            v += (1 - beta2) * scratch
+            np.sqrt(v, out=scratch)
+            scratch += eps
+            np.divide(m, scratch, out=scratch)
+            scratch *= lr
+            flat -= scratch
+
+        epoch_loss = total / n
+        losses.append(epoch_loss)
+        if epoch_loss <= target_loss:
+            converged = True
+            break
+        if epoch_loss < best * (1 - tol):
+            best = epoch_loss
+            stale = 0
+        else:
+            stale += 1
+            if stale >= patience:
+                converged = True
+                break
+
+    for k in PARAMS:
+        weights[k][...] = params[k]
+
+    return {"epochs": len(losses), "loss": losses[-1], "losses": losses, "converged": converged}
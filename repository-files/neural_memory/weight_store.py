@@ -0,0 +1,151 @@
+"""
+Akashic Neural Memory - Memory-Mapped Weight Files
+Part of iLuminara Neural Memory
+
+Versioned on-disk format for network weights:
+- Fixed preamble: magic, format version, header length, SHA-256 checksum
+- JSON header: layer names, shapes, dtypes and offsets, network dimensions
+  and the metadata store
+- Layer data: contiguous little-endian float32 arrays, each 64-byte aligned
+
+Loading maps the data region with `np.memmap`. Every process that loads the
+same file shares the same read-only page-cache pages instead of keeping a
+private unpickled copy. Saves go to a temporary file in the same directory,
+are fsynced, and are renamed over the target, so readers never see a
+partial file. The checksum covers the header and data.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+MAGIC = b"AKASHWT\x00"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+DTYPE = np.dtype("<f4")
+
+# magic, version, header length, sha256(header + data)
+_PREAMBLE = struct.Struct("<8sII32s")
+
+
+class WeightFileError(ValueError):
+    """Raised for files that are not valid weight files or fail verification"""
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def is_weight_file(filepath: str) -> bool:
+    """True if the file starts with the weight-file magic"""
+    with open(filepath, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def save_weights(filepath: str, weights: Dict[str, np.ndarray], info: Optional[Dict[str, Any]] = None):
+    """
+    Atomically write weights (and JSON-serializable `info`) to `filepath`.
+
+    Args:
+        filepath: Destination path
+        weights: Layer name -> array, stored as float32 in insertion order
+        info: Extra header fields (dimensions, metadata store)
+    """
+    arrays = {name: np.ascontiguousarray(w, dtype=DTYPE) for name, w in weights.items()}
+
+    # Offsets are relative to the start of the data region
+    layers = []
+    offset = 0
+    for name, array in arrays.items():
+        offset = _align(offset)
+        layers.append({"name": name, "shape": list(array.shape), "dtype": DTYPE.str, "offset": offset})
+        offset += array.nbytes
+    data_size = offset
+
+    header = json.dumps({"layers": layers, "data_size": data_size, "info": info or {}}).encode()
+    data_start = _align(_PREAMBLE.size + len(header))
+    header = header.ljust(data_start - _PREAMBLE.size, b" ")
+
+    digest = hashlib.sha256(header)
+    position = 0
+    for layer, array in zip(layers, arrays.values()):
+        digest.update(b"\x00" * (layer["offset"] - position))
+        digest.update(memoryview(array).cast("B"))
+        position = layer["offset"] + array.nbytes
+
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp_path = tempfile.mkstemp(prefix=".weights-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header), digest.digest()))
+            f.write(header)
+            for layer, array in zip(layers, arrays.values()):
+                f.seek(data_start + layer["offset"])
+                f.write(memoryview(array).cast("B"))
+            f.truncate(data_start + data_size)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def load_weights(filepath: str, verify: bool = True, mmap: bool = True) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    Open a weight file.
+
+    Args:
+        filepath: Path written by `save_weights`
+        verify: Check the SHA-256 checksum (reads every page once)
+        mmap: Return read-only views of a shared mapping; otherwise private copies
+
+    Returns:
+        (weights, info)
+    """
+    with open(filepath, "rb") as f:
+        preamble = f.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise WeightFileError(f"{filepath}: truncated preamble")
+        magic, version, header_len, checksum = _PREAMBLE.unpack(preamble)
+        if magic != MAGIC:
+            raise WeightFileError(f"{filepath}: not a weight file")
+        if version != FORMAT_VERSION:
+            raise WeightFileError(f"{filepath}: unsupported format version {version}")
+        header_bytes = f.read(header_len)
+
+    try:
+        header = json.loads(header_bytes)
+    except ValueError as e:
+        raise WeightFileError(f"{filepath}: corrupt header ({e})")
+
+    data_start = _PREAMBLE.size + header_len
+    data_size = header["data_size"]
+    if os.path.getsize(filepath) != data_start + data_size:
+        raise WeightFileError(f"{filepath}: expected {data_start + data_size} bytes")
+
+    if data_size:
+        data = np.memmap(filepath, dtype=np.uint8, mode="r", offset=data_start, shape=(data_size,))
+    else:
+        data = np.zeros(0, dtype=np.uint8)
+
+    if verify:
+        digest = hashlib.sha256(header_bytes)
+        digest.update(data)
+        if digest.digest() != checksum:
+            raise WeightFileError(f"{filepath}: checksum mismatch")
+
+    weights = {}
+    for layer in header["layers"]:
+        dtype = np.dtype(layer["dtype"])
+        count = int(np.prod(layer["shape"]))
+        array = np.frombuffer(data, dtype=dtype, count=count, offset=layer["offset"]).reshape(layer["shape"])
+        weights[layer["name"]] = array if mmap else array.copy()
+
+    return weights, header["info"]
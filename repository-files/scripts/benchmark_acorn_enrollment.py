@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Acorn Protocol Enrollment Benchmark
+Measures sequential enrollment throughput with the reservoir/background-refit
+anomaly model against the legacy refit-on-every-enrollment behaviour.
+
+Usage:
+    python scripts/benchmark_acorn_enrollment.py --enrollments 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from sklearn.ensemble import IsolationForest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from governance_kernel.acorn_protocol import SomaticTriadAuthentication
+
+
+def _synthetic_pose(rng: np.random.Generator) -> np.ndarray:
+    return rng.normal(0, 1, (25, 3))
+
+
+def run_maintained(n: int, seed: int) -> float:
+    """Enroll n users with the default model maintainer"""
+    rng = np.random.default_rng(seed)
+    sta = SomaticTriadAuthentication(enable_audit=False)
+
+    start = time.perf_counter()
+    for i in range(n):
+        sta.enroll(
+            f"user_{i}",
+            _synthetic_pose(rng),
+            (-1.2921, 36.8219),
+            rng.normal(0, 0.02, (100, 3))
+        )
+    elapsed = time.perf_counter() - start
+
+    sta.model_maintainer.wait_idle()
+    sta.close()
+    print(f"  refits: {sta.model_maintainer.refit_count}, "
+          f"reservoir: {len(sta.model_maintainer.reservoir)}")
+    return elapsed
+
+
+def run_legacy(n: int, seed: int) -> float:
+    """Enroll n users, refitting on the full history every time (pre-maintainer behaviour)"""
+    rng = np.random.default_rng(seed)
+    sta = SomaticTriadAuthentication(enable_audit=False)
+    buffer = []
+    detector = IsolationForest(contamination=0.1, random_state=42)
+
+    start = time.perf_counter()
+    for i in range(n):
+        imu = rng.normal(0, 0.02, (100, 3))
+        sta.enroll(f"user_{i}", _synthetic_pose(rng), (-1.2921, 36.8219), imu)
+        buffer.append([float(np.linalg.norm(np.var(imu, axis=0)))])
+        if len(buffer) > 5:
+            detector.fit(buffer)
+    elapsed = time.perf_counter() - start
+
+    sta.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Acorn enrollment benchmark")
+    parser.add_argument("--enrollments", type=int, default=10000)
+    parser.add_argument("--legacy-enrollments", type=int, default=300,
+                        help="Legacy path is quadratic; measured on a smaller run")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"Maintained model: {args.enrollments} sequential enrollments")
+    t = run_maintained(args.enrollments, args.seed)
+    print(f"  total: {t:.2f}s  ({args.enrollments / t:,.0f} enrollments/s, "
+          f"{t / args.enrollments * 1e3:.3f} ms/enrollment)")
+
+    if args.legacy_enrollments > 0:
+        print(f"Legacy refit-per-enrollment: {args.legacy_enrollments} sequential enrollments")
+        t_legacy = run_legacy(args.legacy_enrollments, args.seed)
+        print(f"  total: {t_legacy:.2f}s  ({args.legacy_enrollments / t_legacy:,.0f} enrollments/s, "
+              f"{t_legacy / args.legacy_enrollments * 1e3:.3f} ms/enrollment)")
+
+
+if __name__ == "__main__":
+    main()
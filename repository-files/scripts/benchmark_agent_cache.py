@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Agent Result Reuse Benchmark
+Alert storm: many callers submit the same ensemble query at once, then
+again while the results are still fresh. Compares agent executions and wall
+time when every call runs the agents (the previous behaviour) against
+single-flight coalescing plus the TTL result cache.
+
+Usage:
+    python scripts/benchmark_agent_cache.py --callers 200 --waves 3
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.agent_executors import ExecutionClass
+from core.multi_agent_coordinator import AgentType, MultiAgentCoordinator
+from governance_kernel.metrics import MetricsTracker
+
+AGENT_TYPES = (AgentType.EPIDEMIOLOGICAL, AgentType.SPATIOTEMPORAL, AgentType.EARLY_WARNING)
+
+
+class CountingAgent:
+    """Blocking agent (thread pool) counting its executions"""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.calls = 0
+
+    def __call__(self, disease, historical_data, horizon):
+        self.calls += 1
+        time.sleep(self.seconds)
+        return {"risk_score": 0.8, "confidence": 0.85}
+
+
+def run_storm(coordinator, agents, callers, waves, distinct):
+    """`waves` bursts of `callers` concurrent queries; distinct=True defeats reuse"""
+    async def wave(n):
+        await asyncio.gather(*[
+            coordinator.execute_ensemble(
+                "cholera",
+                {"cases": [10, 15, 25, 40], "caller": f"{n}-{i}" if distinct else "alert"}
+            )
+            for i in range(callers)
+        ])
+
+    start = time.perf_counter()
+    for n in range(waves):
+        asyncio.run(wave(n))
+    seconds = time.perf_counter() - start
+    return sum(a.calls for a in agents), seconds
+
+
+def build(metrics, agent_seconds):
+    coordinator = MultiAgentCoordinator("Dadaab", 200000, thread_workers=4, metrics=metrics)
+    agents = []
+    for agent_type in AGENT_TYPES:
+        agent = CountingAgent(agent_seconds)
+        coordinator.register_agent(agent_type, object(), ExecutionClass.THREAD, agent)
+        agents.append(agent)
+    return coordinator, agents
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Agent result reuse benchmark")
+    parser.add_argument("--callers", type=int, default=200)
+    parser.add_argument("--waves", type=int, default=3)
+    parser.add_argument("--agent-seconds", type=float, default=0.05)
+    args = parser.parse_args()
+
+    print(f"{args.waves} waves x {args.callers} concurrent callers, "
+          f"{len(AGENT_TYPES)} agents of {args.agent_seconds * 1000:.0f}ms")
+
+    baseline, agents = build(MetricsTracker(), args.agent_seconds)
+    executions, seconds = run_storm(baseline, agents, args.callers, args.waves, distinct=True)
+    print(f"{'every call executes':>24s}: {executions:6d} agent runs, {seconds:6.2f}s")
+    baseline.shutdown()
+
+    metrics = MetricsTracker()
+    reusing, agents = build(metrics, args.agent_seconds)
+    executions, seconds = run_storm(reusing, agents, args.callers, args.waves, distinct=False)
+    print(f"{'coalesced + cached':>24s}: {executions:6d} agent runs, {seconds:6.2f}s")
+    print(f"{'lookups':>24s}: {metrics.caches[MultiAgentCoordinator.CACHE_NAME]}")
+    print(f"{'hit rate':>24s}: {metrics.cache_hit_rate(MultiAgentCoordinator.CACHE_NAME):.1%}")
+    reusing.shutdown()
+
+
+if __name__ == "__main__":
+    main()
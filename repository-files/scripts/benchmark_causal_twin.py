@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Causal-Twin Engine Benchmark
+Measures per-step wall time of the struct-of-arrays engine at several
+population sizes.
+
+Usage:
+    python scripts/benchmark_causal_twin.py --populations 10000 100000 1000000 --days 30
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulation_engine.vectorized_engine import CellListEngine, STATES
+
+
+def run(population: int, days: int, initial_infected: int, seed: int):
+    build_start = time.perf_counter()
+    engine = CellListEngine(population=population, initial_infected=initial_infected, seed=seed)
+    build = time.perf_counter() - build_start
+
+    step_times = []
+    for _ in range(days):
+        start = time.perf_counter()
+        counts = engine.step(lockdown_strength=0.3, vaccination_rate=0.005, testing_rate=0.2)
+        step_times.append(time.perf_counter() - start)
+
+    step_times.sort()
+    mean = sum(step_times) / len(step_times)
+    print(f"{population:>10,} agents | init {build * 1e3:8.1f} ms | "
+          f"step mean {mean * 1e3:8.2f} ms  p50 {step_times[len(step_times) // 2] * 1e3:8.2f} ms  "
+          f"max {step_times[-1] * 1e3:8.2f} ms | "
+          f"{population * days / sum(step_times) / 1e6:6.2f} M agent-days/s | "
+          + " ".join(f"{s.value}={c}" for s, c in zip(STATES, counts)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Causal-Twin engine benchmark")
+    parser.add_argument("--populations", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--infected-fraction", type=float, default=0.001)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    for population in args.populations:
+        run(population, args.days, max(1, int(population * args.infected_fraction)), args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+HSML HDX Export Benchmark
+Throughput and peak memory of exporting N logged events from on-disk JSONL
+segments: the previous export (every event loaded into one dict, then
+json.dump) against the streaming HDX JSON and row-group columnar exports.
+
+Usage:
+    python scripts/benchmark_hsml_export.py --events 200000 --row-group-size 4096
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.hsml_export import HDX_DATASET, export_hdx_columnar, export_hdx_json
+from core.hsml_sinks import RotatingJSONLSink, serialize_event
+
+
+def materialized(sink, output_path):
+    """The previous export_to_hdx: the whole dataset in memory, then one dump"""
+    start = time.perf_counter()
+    data = list(sink.iter_records())
+    hdx_data = {"dataset": HDX_DATASET,
+                "resources": [{"name": "health_events", "format": "JSON", "data": data}]}
+    with open(output_path, "w") as f:
+        json.dump(hdx_data, f, indent=2)
+    seconds = time.perf_counter() - start
+    return {"events": len(data), "events_per_second": len(data) / seconds}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HSML HDX export benchmark")
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--row-group-size", type=int, default=4096)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sink = RotatingJSONLSink(os.path.join(tmp, "segments"), max_bytes=16 * 1024 * 1024)
+        batch = []
+        for i in range(args.events):
+            batch.append(serialize_event({
+                "event_id": f"evt{i:08d}", "event_type": "outbreak_detection", "priority": "high",
+                "timestamp": "2025-01-01T00:00:00", "actor": "ecf_engine", "resource": f"zone_{i % 500}",
+                "action": "detect_outbreak", "context": {"patient_id": str(i), "location": "Dadaab"},
+                "reasoning_chain": ["Threshold exceeded", "Cluster confirmed"], "outcome": "alert",
+                "hash": f"{i:064x}"
+            })[0])
+            if len(batch) == 4096:
+                sink.write_batch(batch)
+                batch = []
+        sink.write_batch(batch)
+        sink.flush()
+        print(f"{args.events:,} events in {len(sink.segments())} segments")
+
+        runs = [
+            ("materialized json", lambda: materialized(sink, os.path.join(tmp, "old.json"))),
+            ("streamed json", lambda: export_hdx_json(sink.iter_payloads(), os.path.join(tmp, "new.json"))),
+        ] + [
+            (f"columnar {fmt}", lambda fmt=fmt: export_hdx_columnar(
+                sink.iter_payloads(), os.path.join(tmp, fmt), fmt=fmt, row_group_size=args.row_group_size))
+            for fmt in ("csv", "jsonl", "arrow")
+        ]
+        for name, run in runs:
+            result = run()
+            if "error" in result:
+                print(f"{name:>18s}: skipped ({result['error']})")
+                continue
+            tracemalloc.start()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{name:>18s}: {result['events_per_second']:>9,.0f} events/s, peak {peak / 1e6:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+HSML Logging Benchmark
+Cost and peak memory of getting N events onto disk: the previous path
+(every event kept in a list, four `json.dumps` per event for the size
+estimate, then one HDX export of the whole list) against the bounded
+async sink writer. "caller" is the rate log_event returns at.
+
+Usage:
+    python scripts/benchmark_hsml_logging.py --events 50000
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.hsml_logging import HSMLEventType, HSMLLogger
+from core.hsml_sinks import BinarySink, RotatingJSONLSink
+
+
+def event_args(i):
+    return dict(
+        event_type=HSMLEventType.CONSENT_VALIDATION,
+        actor="consent_manager",
+        resource=f"patient_{i}",
+        action="validate_consent",
+        context={"patient_id": str(i), "consent_token": "VALID_TOKEN", "scope": "diagnosis",
+                 "location": "Dadaab", "facility": "clinic_7"},
+        reasoning_chain=["Check consent token", "Validate scope", "Check expiration", "Consent valid"]
+    )
+
+
+def list_path(events, directory):
+    """The previous log_event storage: unbounded list, size estimates, export"""
+    hsml = HSMLLogger()
+    hsml._writer.submit = lambda item, block=True: True
+    hsml.events = []
+    for i in range(events):
+        args = event_args(i)
+        event = hsml.log_event(**args)
+        # original and filtered sizes, as _estimate_size computed them
+        len(json.dumps(args["context"]).encode())
+        len(json.dumps(args["reasoning_chain"]).encode())
+        len(json.dumps(event.context).encode())
+        len(json.dumps(event.reasoning_chain).encode())
+    with open(os.path.join(directory, "hdx.json"), "w") as f:
+        json.dump([e.to_dict() for e in hsml.events], f, indent=2, default=str)
+    return hsml
+
+
+def measure(fn):
+    """Wall time of one run, then traced peak memory of a second run"""
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HSML logging benchmark")
+    parser.add_argument("--events", type=int, default=50000)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    n = args.events
+    with tempfile.TemporaryDirectory() as tmp:
+        elapsed, peak, _ = measure(lambda: list_path(n, tmp))
+    print(f"{'list + export':>22s}: {n / elapsed:>9,.0f} events/s, peak {peak / 1e6:7.1f} MB")
+
+    for name, sink_cls in (("ring (default)", None), ("async JSONL", RotatingJSONLSink),
+                           ("async binary", BinarySink)):
+        with tempfile.TemporaryDirectory() as tmp:
+            def run():
+                sinks = [sink_cls(tmp, max_bytes=4 * 1024 * 1024)] if sink_cls else None
+                hsml = HSMLLogger(sinks=sinks)
+                start = time.perf_counter()
+                for i in range(n):
+                    hsml.log_event(**event_args(i))
+                submitted = time.perf_counter() - start
+                hsml.flush()
+                hsml.close()
+                return submitted, hsml
+            elapsed, peak, (submitted, hsml) = measure(run)
+            stats = hsml.get_statistics()
+            print(f"{name:>22s}: {n / elapsed:>9,.0f} events/s "
+                  f"(caller {n / submitted:,.0f}/s), peak {peak / 1e6:7.1f} MB, "
+                  f"written {stats['written_events']}, reduction {stats['compression_ratio']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
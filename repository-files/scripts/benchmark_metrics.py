@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+MetricsTracker Latency Benchmark
+Cost of recording latencies and of a p95 read as the sample count grows:
+the previous unbounded list (sorted on every p95) against the log-linear
+histogram, single-threaded and from several recording threads.
+
+Usage:
+    python scripts/benchmark_metrics.py --threads 4
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from governance_kernel.latency_histogram import LogLinearHistogram
+
+
+def timed(fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def traced_peak(fn):
+    tracemalloc.start()
+    kept = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return peak
+
+
+def filled(values):
+    hist = LogLinearHistogram()
+    for v in values:
+        hist.record(v)
+    return hist
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MetricsTracker latency benchmark")
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'samples':>10s} {'list rec/s':>12s} {'hist rec/s':>12s} {'list p95':>10s} {'hist p95':>10s} "
+          f"{'p95 err':>8s} {'list MB':>8s} {'hist KB':>8s}")
+    for n in (10_000, 100_000, 1_000_000):
+        values = [rng.lognormvariate(3, 1) for _ in range(n)]
+
+        samples = []
+        list_record, _ = timed(lambda: [samples.append(v) for v in values])
+        hist = LogLinearHistogram()
+        hist_record, _ = timed(lambda: [hist.record(v) for v in values])
+
+        list_p95, exact = timed(lambda: sorted(samples)[int(len(samples) * 0.95)], repeat=3)
+        hist_p95, approx = timed(lambda: hist.quantile(0.95), repeat=100)
+
+        list_mem = traced_peak(lambda: [v * 1.0 for v in values])
+        hist_mem = traced_peak(lambda: filled(values))
+
+        print(f"{n:>10,d} {n / list_record:>12,.0f} {n / hist_record:>12,.0f} "
+              f"{list_p95 * 1e3:>8.2f}ms {hist_p95 * 1e3:>8.3f}ms {abs(approx / exact - 1):>8.1%} "
+              f"{list_mem / 1e6:>8.1f} {hist_mem / 1e3:>8.1f}")
+
+    per_thread = 250_000
+    hist = LogLinearHistogram()
+
+    def work():
+        for i in range(per_thread):
+            hist.record(1.0 + i % 500)
+
+    threads = [threading.Thread(target=work) for _ in range(args.threads)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    print(f"\n{args.threads} threads: {args.threads * per_thread / elapsed:,.0f} records/s, "
+          f"count {len(hist):,} (expected {args.threads * per_thread:,})")
+
+
+if __name__ == "__main__":
+    main()
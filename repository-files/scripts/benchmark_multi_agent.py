@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Multi-Agent Ensemble Benchmark
+Ensemble wall time when every agent runs on the event loop (the previous
+behaviour: blocking and CPU-bound agents serialize the ensemble) against
+agents dispatched by execution class (async / thread pool / worker
+processes). The target is a wall time close to the slowest agent.
+
+Usage:
+    python scripts/benchmark_multi_agent.py --cpu-seconds 0.6
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.agent_executors import ExecutionClass
+from core.multi_agent_coordinator import AgentType, MultiAgentCoordinator
+
+AGENT_TYPES = (AgentType.EPIDEMIOLOGICAL, AgentType.SPATIOTEMPORAL, AgentType.EARLY_WARNING)
+
+
+def cpu_agent(disease, historical_data, horizon, iterations):
+    """CPU-bound model fit (fixed amount of work)"""
+    total = 0
+    for i in range(iterations):
+        total += i * i % 7
+    return {"risk_score": 0.8, "confidence": 0.85, "work": total}
+
+
+def blocking_agent(disease, historical_data, horizon, seconds):
+    """Blocking I/O (e.g. a synchronous database client)"""
+    time.sleep(seconds)
+    return {"risk_score": 0.7, "confidence": 0.8}
+
+
+async def io_agent(disease, historical_data, horizon, seconds):
+    await asyncio.sleep(seconds)
+    return {"alert_level": "HIGH", "confidence": 0.9}
+
+
+class _Partial:
+    """Picklable `fn(*args, **extra)` for process agents"""
+
+    def __init__(self, fn, **extra):
+        self.fn = fn
+        self.extra = extra
+
+    def __call__(self, *args):
+        return self.fn(*args, **self.extra)
+
+
+def on_loop(fn, **extra):
+    """Previous behaviour: a synchronous agent called from a coroutine"""
+    async def run(*args):
+        return fn(*args, **extra)
+    return run
+
+
+def calibrate(seconds):
+    iterations = 200_000
+    start = time.perf_counter()
+    cpu_agent(None, None, None, iterations)
+    return int(iterations * seconds / (time.perf_counter() - start))
+
+
+def timed_ensemble(coordinator, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        asyncio.run(coordinator.execute_ensemble("cholera", {"cases": [10, 15, 25, 40]}))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-agent ensemble benchmark")
+    parser.add_argument("--cpu-seconds", type=float, default=0.6)
+    parser.add_argument("--blocking-seconds", type=float, default=0.4)
+    parser.add_argument("--io-seconds", type=float, default=0.3)
+    args = parser.parse_args()
+
+    iterations = calibrate(args.cpu_seconds)
+    slowest = max(args.cpu_seconds, args.blocking_seconds, args.io_seconds)
+    total = args.cpu_seconds + args.blocking_seconds + args.io_seconds
+    print(f"CPUs: {os.cpu_count()}, agents: cpu {args.cpu_seconds}s, blocking {args.blocking_seconds}s, "
+          f"io {args.io_seconds}s (slowest {slowest:.2f}s, sum {total:.2f}s)")
+
+    loop_only = MultiAgentCoordinator("Dadaab", 200000)
+    loop_only.register_agent(AgentType.EPIDEMIOLOGICAL, object(), runner=on_loop(cpu_agent, iterations=iterations))
+    loop_only.register_agent(AgentType.SPATIOTEMPORAL, object(), runner=on_loop(blocking_agent, seconds=args.blocking_seconds))
+    loop_only.register_agent(AgentType.EARLY_WARNING, object(), runner=_Partial(io_agent, seconds=args.io_seconds))
+    print(f"{'mixed, event loop':>28s}: {timed_ensemble(loop_only):.2f}s")
+
+    dispatched = MultiAgentCoordinator("Dadaab", 200000)
+    dispatched.register_agent(AgentType.EPIDEMIOLOGICAL, object(), ExecutionClass.PROCESS,
+                              _Partial(cpu_agent, iterations=iterations))
+    dispatched.register_agent(AgentType.SPATIOTEMPORAL, object(), ExecutionClass.THREAD,
+                              _Partial(blocking_agent, seconds=args.blocking_seconds))
+    dispatched.register_agent(AgentType.EARLY_WARNING, object(), ExecutionClass.ASYNC,
+                              _Partial(io_agent, seconds=args.io_seconds))
+    dispatched.warm_up()
+    print(f"{'mixed, execution classes':>28s}: {timed_ensemble(dispatched):.2f}s")
+    dispatched.shutdown()
+
+    # Three CPU-bound agents: parallel only with at least three CPUs
+    cpu_loop = MultiAgentCoordinator("Dadaab", 200000)
+    cpu_procs = MultiAgentCoordinator("Dadaab", 200000, process_workers=3)
+    for agent_type in AGENT_TYPES:
+        cpu_loop.register_agent(agent_type, object(), runner=on_loop(cpu_agent, iterations=iterations))
+        cpu_procs.register_agent(agent_type, object(), ExecutionClass.PROCESS, _Partial(cpu_agent, iterations=iterations))
+    cpu_procs.warm_up()
+    print(f"{'3 x cpu, event loop':>28s}: {timed_ensemble(cpu_loop):.2f}s")
+    print(f"{'3 x cpu, worker processes':>28s}: {timed_ensemble(cpu_procs):.2f}s")
+    cpu_procs.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Neural Memory Benchmark
+Measures records/s for writing patient records into the Akashic network one
+at a time (the previous fixed 100-epoch loop per record) against a single
+mini-batch training run, and recall with one batched forward pass against
+one pass per key.
+
+Usage:
+    python scripts/benchmark_neural_memory.py --records 10000 --hidden-dim 64
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from neural_memory.memory_training import INPUT_BITS, encode_ids, forward, train_minibatch
+
+
+def init_weights(rng, hidden_dim: int, embedding_dim: int = 8):
+    return {
+        'W1': (rng.normal(size=(INPUT_BITS, hidden_dim)) * 0.01).astype(np.float32),
+        'b1': np.zeros(hidden_dim, dtype=np.float32),
+        'W2': (rng.normal(size=(hidden_dim, hidden_dim)) * 0.01).astype(np.float32),
+        'b2': np.zeros(hidden_dim, dtype=np.float32),
+        'W3': (rng.normal(size=(hidden_dim, embedding_dim)) * 0.01).astype(np.float32),
+        'b3': np.zeros(embedding_dim, dtype=np.float32)
+    }
+
+
+def synthetic_records(rng, n: int) -> np.ndarray:
+    """Target vectors shaped like PatientRecord.to_vector()"""
+    return np.column_stack([
+        rng.integers(0, 8, n),
+        rng.uniform(0, 0.9, n),
+        rng.uniform(0, 1, n),
+        rng.integers(0, 5, n) / 10,
+        rng.integers(0, 5, n) / 10,
+        rng.normal(37, 0.5, n) / 50,
+        rng.normal(75, 10, n) / 200,
+        rng.normal(120, 12, n) / 200
+    ]).astype(np.float32)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Neural memory benchmark")
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--hidden-dim", type=int, default=64)
+    parser.add_argument("--per-record-sample", type=int, default=200,
+                        help="per-record loop is timed on this many and extrapolated")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    ids = [f"PAT_{i:07d}" for i in range(args.records)]
+    targets = synthetic_records(rng, args.records)
+    variance = float(np.var(targets, axis=0).mean())
+    print(f"{args.records} records, hidden dim {args.hidden_dim}, target variance {variance:.4f}")
+
+    # Previous path: 100 epochs per record, one record at a time
+    weights = init_weights(rng, args.hidden_dim)
+    sample = args.per_record_sample
+    start = time.perf_counter()
+    for i in range(sample):
+        train_minibatch(weights, encode_ids([ids[i]]), targets[i:i + 1],
+                        batch_size=1, max_epochs=100, patience=100, target_loss=0.0)
+    per_record = (time.perf_counter() - start) / sample
+    inputs = encode_ids(ids)
+    loss = float(np.mean((forward(weights, inputs[:sample]) - targets[:sample]) ** 2))
+    print(f"Per-record loop:  {1 / per_record:9.0f} records/s "
+          f"({per_record * args.records:.1f} s extrapolated, loss on stored {loss:.4f})")
+
+    # Mini-batch: encode every ID once, one training run
+    weights = init_weights(rng, args.hidden_dim)
+    start = time.perf_counter()
+    inputs = encode_ids(ids)
+    result = train_minibatch(weights, inputs, targets, seed=args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"Mini-batch:       {args.records / elapsed:9.0f} records/s "
+          f"({elapsed:.1f} s, {result['epochs']} epochs, loss {result['loss']:.4f})")
+
+    # Recall
+    start = time.perf_counter()
+    for i in range(args.records):
+        forward(weights, encode_ids([ids[i]])[0])
+    single = time.perf_counter() - start
+    start = time.perf_counter()
+    forward(weights, encode_ids(ids))
+    batched = time.perf_counter() - start
+    print(f"\nRecall per key:   {args.records / single:9.0f} records/s")
+    print(f"Recall batched:   {args.records / batched:9.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Causal-Twin Scenario Sweep Benchmark
+Runs the same seeded parameter grid with increasing worker counts and reports
+jobs/second, to check that sweep throughput scales with cores.
+
+Usage:
+    python scripts/benchmark_scenario_sweep.py --workers 1 2 4 8 --replicates 8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulation_engine.scenario_sweep import ScenarioSweep, build_jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scenario sweep scaling benchmark")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--replicates", type=int, default=8)
+    parser.add_argument("--population", type=int, default=20000)
+    parser.add_argument("--days", type=int, default=60)
+    args = parser.parse_args()
+
+    jobs = build_jobs(
+        {
+            "population": [args.population],
+            "r0": [1.5, 2.5, 3.5],
+            "lockdown_strength": [0.0, 0.5],
+        },
+        replicates=args.replicates,
+        days=args.days
+    )
+
+    baseline = None
+    print(f"{len(jobs)} jobs x {args.days} days x {args.population:,} agents")
+    for workers in sorted(set(args.workers)):
+        with tempfile.TemporaryDirectory() as tmp:
+            summary = ScenarioSweep(tmp).run(jobs, workers=workers)
+        rate = summary["jobs_per_second"]
+        baseline = baseline or rate
+        print(f"  workers={workers:<3} {summary['wall_seconds']:7.2f}s  "
+              f"{rate:7.2f} jobs/s  speedup x{rate / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+VSAI Propagation Benchmark
+Grows the P2P referral tree with ViralSymbioticAPIInfusion.propagate_api
+(one batched model call per generation, columnar nodes with parent
+pointers) and with the previous per-parent loop (one predict call, uuid,
+SHA-256, copied chain list, NodeVector and networkx edge per child).
+Reports nodes/s and traced memory per node, the cost of tracking infected
+nodes (bitmap vs list of IDs) and referral-chain verification throughput
+(memoized over parent pointers vs checking each copied chain list).
+
+Usage:
+    python scripts/benchmark_vsai_propagation.py --seeds 5000 --steps 3
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+
+import matplotlib
+matplotlib.use("Agg")
+import networkx as nx
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from edge_node.vsai.viral_engine import (
+    NodeVector, ViralSymbioticAPIInfusion, generate_referral_hash, verify_referral_chain
+)
+
+
+def legacy_propagate(engine: ViralSymbioticAPIInfusion, seeds: int, steps: int, max_invites: int = 5):
+    """Previous propagate_api: per-parent predict and per-child objects"""
+    nodes = {}
+    graph = nx.DiGraph()
+    for _ in range(seeds):
+        node_id = str(uuid.uuid4())[:8]
+        nodes[node_id] = NodeVector(id=node_id, type='SMARTPHONE', trust_score=np.random.uniform(0.8, 1.0),
+                                    data_balance=100.0, is_infected=True, location="Dadaab")
+        graph.add_node(node_id, type='SEED')
+    infected_ids = list(nodes)
+    for _ in range(steps):
+        new_infections = []
+        for parent_id in infected_ids:
+            parent = nodes[parent_id]
+            feats = np.array([[np.random.uniform(0.5, 1.0), np.random.uniform(0.3, 0.9),
+                               np.random.uniform(0.2, 0.8), parent.trust_score]])
+            k_factor = engine.virality_predictor.predict(feats)[0] * max_invites
+            invites = min(int(k_factor) if k_factor > 0 else 0, max_invites)
+            for _ in range(invites):
+                child_id = str(uuid.uuid4())[:8]
+                ref_hash = generate_referral_hash(parent_id, child_id)
+                child = NodeVector(id=child_id, type='FEATURE_PHONE' if np.random.rand() < 0.7 else 'SMARTPHONE',
+                                   trust_score=parent.trust_score * np.random.uniform(0.7, 0.9),
+                                   data_balance=0.0, is_infected=True, location=parent.location)
+                child.referral_chain = parent.referral_chain + [ref_hash]
+                if not verify_referral_chain(child.referral_chain, child_id):
+                    continue
+                nodes[child_id] = child
+                graph.add_edge(parent_id, child_id, hash=ref_hash)
+                new_infections.append(child_id)
+                parent.total_referrals += 1
+        infected_ids.extend(new_infections)
+    return nodes, graph
+
+
+def measure(fn):
+    """Wall time of an untraced run, then memory still held after a traced run"""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    result = fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VSAI propagation benchmark")
+    parser.add_argument("--seeds", type=int, default=5000)
+    parser.add_argument("--steps", type=int, default=3)
+    parser.add_argument("--legacy-seeds", type=int, default=50,
+                        help="legacy loop is run from this many seeds")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    np.random.seed(3)
+
+    def batched():
+        engine = ViralSymbioticAPIInfusion()
+        engine.seed_nodes(args.seeds)
+        engine.propagate_api(time_steps=args.steps)
+        return engine
+
+    engine, elapsed, memory = measure(batched)
+    count = len(engine.nodes)
+    print(f"Batched: {count:>9,d} nodes in {elapsed:6.2f} s ({count / elapsed:>9,.0f} nodes/s), "
+          f"{memory / count:5.0f} B/node ({engine.nodes.nbytes / count:.0f} B/node in columns)")
+
+    (nodes, _), elapsed, memory = measure(lambda: legacy_propagate(engine, args.legacy_seeds, args.steps))
+    count = len(nodes)
+    print(f"Legacy:  {count:>9,d} nodes in {elapsed:6.2f} s ({count / elapsed:>9,.0f} nodes/s), "
+          f"{memory / count:5.0f} B/node")
+
+    # Infected-node tracking
+    ids = list(nodes)
+    list_bytes = sys.getsizeof(ids) + sum(sys.getsizeof(i) for i in ids)
+    print(f"\nInfected tracking: ID list {list_bytes / len(ids):.1f} B/node, "
+          f"bitmap {engine.nodes.infected.nbytes * 8 / len(engine.nodes):.2f} bits/node "
+          f"({engine.nodes.infected.nbytes / 2**20:.2f} MB for {len(engine.nodes):,d} nodes)")
+
+    # Chain verification
+    table = engine.nodes
+    table.reset_verification()
+    start = time.perf_counter()
+    valid = table.verify_chains()
+    cold = time.perf_counter() - start
+    newest = np.flatnonzero(table.column('depth') == table.column('depth').max())
+    start = time.perf_counter()
+    table.verify_chains(newest)
+    warm = time.perf_counter() - start
+    chains = [n.referral_chain for n in nodes.values()]
+    start = time.perf_counter()
+    for node_id, chain in zip(ids, chains):
+        verify_referral_chain(chain, node_id)
+    legacy = time.perf_counter() - start
+    print(f"Chain verification: memoized {len(table) / cold:>12,.0f} chains/s cold ({valid.mean():.0%} valid), "
+          f"{len(newest) / warm:>12,.0f} chains/s re-checking {len(newest):,d} memoized")
+    print(f"                    per-list {len(ids) / legacy:>12,.0f} chains/s (copied chains, set per node)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+VSAI SIR Sweep Benchmark
+Time to produce (β, γ) sensitivity grids with one `odeint` call per pair
+(the previous simulate_infusion path), with one batched call over the
+stacked systems, and from the trajectory cache.
+
+Usage:
+    python scripts/benchmark_vsai_sir.py --days 60 --population 14000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from scipy.integrate import odeint
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from edge_node.vsai.sir_simulation import SIRSimulationService
+
+
+def per_pair(population, infected0, days, betas, gammas):
+    def derivatives(y, t, N, beta, gamma):
+        S, I, R = y
+        return -beta * S * I / N, beta * S * I / N - gamma * I, gamma * I
+
+    t = np.linspace(0, days, days)
+    return [odeint(derivatives, (population - infected0, infected0, 0), t, args=(population, b, g)).T
+            for b in betas for g in gammas]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VSAI SIR sweep benchmark")
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--population", type=float, default=14_000_000)
+    parser.add_argument("--seeds", type=float, default=5000)
+    args = parser.parse_args()
+
+    print(f"{args.days} days, N={args.population:,.0f}")
+    print(f"{'grid':>9s} {'per-pair odeint':>16s} {'batched':>10s} {'cached':>10s} {'max |dI|':>9s}")
+    for side in (5, 10, 20, 40, 70):
+        gammas = 1.0 / np.linspace(2, 10, side)
+        betas = np.linspace(0.1, 1.5, side)
+
+        start = time.perf_counter()
+        reference = per_pair(args.population, args.seeds, args.days, betas, gammas)
+        loop = time.perf_counter() - start
+
+        service = SIRSimulationService(max_entries=side * side)
+        start = time.perf_counter()
+        grid = service.sweep(args.population, args.seeds, 0, args.days, betas, gammas)
+        batched = time.perf_counter() - start
+
+        start = time.perf_counter()
+        service.sweep(args.population, args.seeds, 0, args.days, betas, gammas)
+        cached = time.perf_counter() - start
+
+        error = np.abs(grid["I"].reshape(side * side, -1) - np.array([r[1] for r in reference])).max()
+        print(f"{side:>4d}x{side:<4d} {loop * 1000:13.1f} ms {batched * 1000:7.1f} ms {cached * 1000:7.1f} ms {error:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Weight Store Benchmark
+Load time and per-worker memory for Akashic network weights saved as a
+pickle (previous NeuralMemoryNetwork.save) and as a memory-mapped weight
+file. Several worker processes load the same file at once, run a recall
+pass that touches every layer, and report RSS and PSS (shared pages split
+between the processes mapping them) from /proc/self/smaps_rollup.
+
+Usage:
+    python scripts/benchmark_weight_store.py --hidden-dim 4096 --workers 4
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from neural_memory.memory_training import INPUT_BITS, encode_ids, forward
+from neural_memory.weight_store import load_weights, save_weights
+
+
+def memory_kb() -> dict:
+    """Rss and Pss of this process in kB"""
+    values = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("Rss", "Pss"):
+                values[key] = int(rest.split()[0])
+    return values
+
+
+def worker(fmt: str, path: str, verify: bool, barrier, results):
+    before = memory_kb()
+    start = time.perf_counter()
+    if fmt == "pickle":
+        with open(path, "rb") as f:
+            weights = pickle.load(f)["weights"]
+    else:
+        weights, _ = load_weights(path, verify=verify)
+    load_ms = (time.perf_counter() - start) * 1000
+    forward(weights, encode_ids([f"PAT_{i}" for i in range(64)]))
+
+    # Measure while every worker still holds its weights
+    barrier.wait()
+    after = memory_kb()
+    barrier.wait()
+    results.put((load_ms, (after["Rss"] - before["Rss"]) / 1024, (after["Pss"] - before["Pss"]) / 1024))
+
+
+def run(fmt: str, path: str, workers: int, verify: bool = True):
+    ctx = mp.get_context("spawn")
+    barrier = ctx.Barrier(workers)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(fmt, path, verify, barrier, results)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    rows = [results.get() for _ in procs]
+    for p in procs:
+        p.join()
+    return np.array(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Weight store benchmark")
+    parser.add_argument("--hidden-dim", type=int, default=4096)
+    parser.add_argument("--embedding-dim", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    h = args.hidden_dim
+    weights = {
+        'W1': rng.normal(size=(INPUT_BITS, h)).astype(np.float32) * 0.01,
+        'b1': np.zeros(h, dtype=np.float32),
+        'W2': rng.normal(size=(h, h)).astype(np.float32) * 0.01,
+        'b2': np.zeros(h, dtype=np.float32),
+        'W3': rng.normal(size=(h, args.embedding_dim)).astype(np.float32) * 0.01,
+        'b3': np.zeros(args.embedding_dim, dtype=np.float32)
+    }
+    metadata = {f"PAT_{i}": {"location": "Dadaab", "diagnoses": ["malaria"]} for i in range(10000)}
+    size_mb = sum(w.nbytes for w in weights.values()) / 2**20
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pickle_path = os.path.join(tmp, "network.pkl")
+        mapped_path = os.path.join(tmp, "network.akw")
+
+        start = time.perf_counter()
+        with open(pickle_path, "wb") as f:
+            pickle.dump({'weights': weights, 'metadata_store': metadata,
+                         'embedding_dim': args.embedding_dim, 'hidden_dim': h}, f)
+        pickle_save = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        save_weights(mapped_path, weights, {'embedding_dim': args.embedding_dim, 'hidden_dim': h,
+                                            'metadata_store': metadata})
+        mapped_save = (time.perf_counter() - start) * 1000
+
+        print(f"{size_mb:.1f} MB of float32 weights, {len(metadata)} metadata entries, {args.workers} workers")
+        print(f"Save: pickle {pickle_save:.0f} ms, weight file {mapped_save:.0f} ms (fsync + rename)")
+        print(f"{'format':>22s} {'load ms':>9s} {'RSS MB':>8s} {'PSS MB':>8s}")
+        for label, fmt, path, verify in (
+            ("pickle", "pickle", pickle_path, True),
+            ("memmap + checksum", "mapped", mapped_path, True),
+            ("memmap, no checksum", "mapped", mapped_path, False),
+        ):
+            rows = run(fmt, path, args.workers, verify).mean(axis=0)
+            print(f"{label:>22s} {rows[0]:9.1f} {rows[1]:8.1f} {rows[2]:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
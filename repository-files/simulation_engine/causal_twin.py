@@ -15,47 +15,29 @@ Compliance:
 """
 
 import streamlit as st
-import numpy as np
+import os
+import sys
 import pandas as pd
 import time
 import plotly.graph_objects as go
-from dataclasses import dataclass
-from enum import Enum
-from typing import List, Tuple
-import random
+from typing import Optional
 
-
-class AgentState(Enum):
-    """Health states for virtual agents"""
-    SUSCEPTIBLE = "S"
-    EXPOSED = "E"
-    INFECTED = "I"
-    RECOVERED = "R"
-    DECEASED = "D"
-    VACCINATED = "V"
-
-
-@dataclass
-class VirtualAgent:
-    """A virtual citizen in the simulation"""
-    id: int
-    x: float
-    y: float
-    state: AgentState
-    age: int
-    mobility: float
-    compliance: float  # Willingness to follow interventions
-    days_infected: int = 0
-    
-    def move(self, lockdown_strength: float):
-        """Move agent based on mobility and lockdown"""
-        effective_mobility = self.mobility * (1 - lockdown_strength * self.compliance)
-        self.x += np.random.normal(0, effective_mobility)
-        self.y += np.random.normal(0, effective_mobility)
-        
-        # Keep within bounds
-        self.x = np.clip(self.x, 0, 100)
-        self.y = np.clip(self.y, 0, 100)
+try:
+    from simulation_engine.vectorized_engine import (
+        AgentListView,
+        AgentState,
+        CellListEngine,
+        STATE_CODE,
+    )
+except ImportError:
+    # Fallback for standalone execution: import from the repository root
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from simulation_engine.vectorized_engine import (
+        AgentListView,
+        AgentState,
+        CellListEngine,
+        STATE_CODE,
+    )
 
 
 class CausalTwinSimulation:
@@ -67,6 +49,9 @@ class CausalTwinSimulation:
     - Vaccination (move S -> V)
     - Testing & Isolation (detect I early)
     - Contact Tracing (quarantine E)
+    
+    Population state lives in a struct-of-arrays `CellListEngine`;
+    `agents` is a list-like view exposing each row as an agent object.
     """
     
     def __init__(
@@ -76,7 +61,8 @@ class CausalTwinSimulation:
         r0: float = 2.5,
         infection_radius: float = 2.0,
         recovery_days: int = 14,
-        mortality_rate: float = 0.02
+        mortality_rate: float = 0.02,
+        seed: Optional[int] = None
     ):
         self.population = population
         self.r0 = r0
@@ -85,31 +71,27 @@ class CausalTwinSimulation:
         self.mortality_rate = mortality_rate
         
         # Initialize agents
-        self.agents = self._initialize_agents(initial_infected)
+        self.engine = CellListEngine(
+            population=population,
+            initial_infected=initial_infected,
+            r0=r0,
+            infection_radius=infection_radius,
+            recovery_days=recovery_days,
+            mortality_rate=mortality_rate,
+            seed=seed
+        )
         
         # Simulation state
-        self.day = 0
         self.history = []
-        
-    def _initialize_agents(self, initial_infected: int) -> List[VirtualAgent]:
-        """Create virtual population"""
-        agents = []
-        
-        for i in range(self.population):
-            state = AgentState.INFECTED if i < initial_infected else AgentState.SUSCEPTIBLE
-            
-            agent = VirtualAgent(
-                id=i,
-                x=np.random.uniform(0, 100),
-                y=np.random.uniform(0, 100),
-                state=state,
-                age=int(np.random.gamma(40, 1)),  # Age distribution
-                mobility=np.random.uniform(0.5, 2.0),
-                compliance=np.random.beta(5, 2)  # Most people are compliant
-            )
-            agents.append(agent)
-        
-        return agents
+    
+    @property
+    def agents(self) -> AgentListView:
+        """Object view over the agent arrays"""
+        return AgentListView(self.engine.agents)
+    
+    @property
+    def day(self) -> int:
+        return self.engine.day
     
     def step(
         self,
@@ -118,86 +100,27 @@ class CausalTwinSimulation:
         testing_rate: float = 0.0
     ):
         """Simulate one day"""
-        self.day += 1
-        
-        # Phase 1: Movement
-        for agent in self.agents:
-            if agent.state != AgentState.DECEASED:
-                agent.move(lockdown_strength)
-        
-        # Phase 2: Vaccination
-        susceptible = [a for a in self.agents if a.state == AgentState.SUSCEPTIBLE]
-        n_vaccinate = int(len(susceptible) * vaccination_rate)
-        for agent in random.sample(susceptible, min(n_vaccinate, len(susceptible))):
-            agent.state = AgentState.VACCINATED
-        
-        # Phase 3: Transmission
-        infected = [a for a in self.agents if a.state == AgentState.INFECTED]
-        susceptible = [a for a in self.agents if a.state == AgentState.SUSCEPTIBLE]
-        
-        for infected_agent in infected:
-            # Find nearby susceptible agents
-            for susceptible_agent in susceptible:
-                distance = np.sqrt(
-                    (infected_agent.x - susceptible_agent.x)**2 +
-                    (infected_agent.y - susceptible_agent.y)**2
-                )
-                
-                if distance < self.infection_radius:
-                    # Transmission probability
-                    transmission_prob = self.r0 / (self.recovery_days * 10)
-                    
-                    if np.random.random() < transmission_prob:
-                        susceptible_agent.state = AgentState.EXPOSED
-        
-        # Phase 4: Disease progression
-        for agent in self.agents:
-            if agent.state == AgentState.EXPOSED:
-                # Exposed -> Infected after incubation
-                if np.random.random() < 0.2:  # 5-day incubation
-                    agent.state = AgentState.INFECTED
-                    agent.days_infected = 0
-            
-            elif agent.state == AgentState.INFECTED:
-                agent.days_infected += 1
-                
-                # Recovery or death
-                if agent.days_infected >= self.recovery_days:
-                    # Age-adjusted mortality
-                    age_factor = 1 + (agent.age / 100)
-                    death_prob = self.mortality_rate * age_factor
-                    
-                    if np.random.random() < death_prob:
-                        agent.state = AgentState.DECEASED
-                    else:
-                        agent.state = AgentState.RECOVERED
-        
-        # Phase 5: Testing & Isolation
-        if testing_rate > 0:
-            infected = [a for a in self.agents if a.state == AgentState.INFECTED]
-            n_test = int(len(infected) * testing_rate)
-            for agent in random.sample(infected, min(n_test, len(infected))):
-                # Isolated agents don't move
-                agent.mobility = 0.0
+        self.engine.step(
+            lockdown_strength=lockdown_strength,
+            vaccination_rate=vaccination_rate,
+            testing_rate=testing_rate
+        )
         
         # Record state
         self._record_state()
     
     def _record_state(self):
         """Record current state for analysis"""
-        counts = {state: 0 for state in AgentState}
-        
-        for agent in self.agents:
-            counts[agent.state] += 1
+        counts = self.engine.counts()
         
         self.history.append({
             'day': self.day,
-            'susceptible': counts[AgentState.SUSCEPTIBLE],
-            'exposed': counts[AgentState.EXPOSED],
-            'infected': counts[AgentState.INFECTED],
-            'recovered': counts[AgentState.RECOVERED],
-            'deceased': counts[AgentState.DECEASED],
-            'vaccinated': counts[AgentState.VACCINATED]
+            'susceptible': int(counts[STATE_CODE[AgentState.SUSCEPTIBLE]]),
+            'exposed': int(counts[STATE_CODE[AgentState.EXPOSED]]),
+            'infected': int(counts[STATE_CODE[AgentState.INFECTED]]),
+            'recovered': int(counts[STATE_CODE[AgentState.RECOVERED]]),
+            'deceased': int(counts[STATE_CODE[AgentState.DECEASED]]),
+            'vaccinated': int(counts[STATE_CODE[AgentState.VACCINATED]])
         })
     
     def get_metrics(self) -> dict:
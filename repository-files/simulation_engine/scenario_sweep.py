@@ -0,0 +1,286 @@
+"""
+Causal-Twin Scenario Sweeps
+Runs hundreds of seeded Causal-Twin simulations across parameter grids.
+
+Each (parameters, replicate) pair becomes a `SweepJob` whose seed is derived
+from the base seed, the replicate number and a digest of the canonical
+parameters, so a job produces the same trajectory no matter which worker runs
+it or in which order. Jobs are fanned out over a process pool and each
+finished trajectory is appended to a `ColumnarResultStore`: one flat binary
+file per metric column plus a JSONL job index. The index line is written only
+after the job's rows are flushed, so an interrupted sweep resumes by reading
+the index, trimming any partially written rows and skipping completed jobs.
+
+Usage:
+    sweep = ScenarioSweep("./sweeps/lockdown_grid")
+    jobs = build_jobs({"r0": [1.5, 2.5], "lockdown_strength": [0.0, 0.5]}, replicates=20)
+    sweep.run(jobs, workers=8)
+    columns = sweep.store.load()
+"""
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from simulation_engine.vectorized_engine import CellListEngine, STATES
+
+logger = logging.getLogger(__name__)
+
+
+# Engine constructor arguments vs per-day intervention arguments
+ENGINE_PARAMS = ("population", "initial_infected", "r0", "infection_radius", "recovery_days", "mortality_rate")
+INTERVENTION_PARAMS = ("lockdown_strength", "vaccination_rate", "testing_rate")
+
+# One row per simulated day
+METRIC_COLUMNS = ["job_id", "day"] + [state.name.lower() for state in STATES]
+
+
+def canonical_params(params: Dict) -> str:
+    """Order-independent JSON encoding of a parameter set"""
+    return json.dumps(params, sort_keys=True, separators=(",", ":"))
+
+
+def derive_seed(params: Dict, replicate: int, base_seed: int = 0) -> int:
+    """Deterministic 32-bit seed for a (parameters, replicate) pair"""
+    digest = hashlib.sha256(canonical_params(params).encode()).digest()
+    sequence = np.random.SeedSequence([base_seed, replicate, *np.frombuffer(digest[:16], dtype=np.uint32)])
+    return int(sequence.generate_state(1)[0])
+
+
+@dataclass
+class SweepJob:
+    """One seeded simulation run"""
+    job_id: int
+    params: Dict
+    replicate: int
+    seed: int
+    days: int = 90
+
+
+def build_jobs(
+    grid: Dict[str, List],
+    replicates: int = 1,
+    days: int = 90,
+    base_seed: int = 0
+) -> List[SweepJob]:
+    """
+    Expand a parameter grid into seeded jobs.
+
+    Args:
+        grid: Parameter name -> values (engine or intervention parameters)
+        replicates: Seeded repeats per grid point
+        days: Simulated days per job
+        base_seed: Sweep-wide seed
+
+    Returns:
+        Jobs in deterministic order with stable job ids
+    """
+    unknown = set(grid) - set(ENGINE_PARAMS) - set(INTERVENTION_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+
+    names = sorted(grid)
+    jobs = []
+    for values in itertools.product(*(grid[name] for name in names)):
+        params = dict(zip(names, values))
+        for replicate in range(replicates):
+            jobs.append(SweepJob(
+                job_id=len(jobs),
+                params=params,
+                replicate=replicate,
+                seed=derive_seed(params, replicate, base_seed),
+                days=days
+            ))
+    return jobs
+
+
+def run_job(job: SweepJob) -> np.ndarray:
+    """
+    Simulate one job (executed in a worker process).
+
+    Returns:
+        int64 matrix of shape (days, len(METRIC_COLUMNS))
+    """
+    engine = CellListEngine(
+        seed=job.seed,
+        **{k: v for k, v in job.params.items() if k in ENGINE_PARAMS}
+    )
+    interventions = {k: v for k, v in job.params.items() if k in INTERVENTION_PARAMS}
+
+    rows = np.empty((job.days, len(METRIC_COLUMNS)), dtype=np.int64)
+    rows[:, 0] = job.job_id
+    for day in range(job.days):
+        rows[day, 1] = day + 1
+        rows[day, 2:] = engine.step(**interventions)
+    return rows
+
+
+class ColumnarResultStore:
+    """
+    Append-only columnar store for sweep trajectories.
+
+    Layout of `directory`:
+        <column>.i64   raw little-endian int64 values, one file per column
+        jobs.jsonl     one line per committed job: id, params, seed, row range
+    """
+
+    INDEX = "jobs.jsonl"
+
+    def __init__(self, directory: str, columns: List[str] = METRIC_COLUMNS):
+        self.directory = directory
+        self.columns = columns
+        os.makedirs(directory, exist_ok=True)
+
+        self.jobs: Dict[int, Dict] = {}
+        self.rows = 0
+        self._recover()
+
+    def _column_path(self, column: str) -> str:
+        return os.path.join(self.directory, f"{column}.i64")
+
+    def _recover(self):
+        """
+        Load the job index and truncate everything after the last committed
+        job: a torn index line and any rows written after its row range
+        """
+        index_path = os.path.join(self.directory, self.INDEX)
+        if os.path.exists(index_path):
+            committed = 0
+            with open(index_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # torn final line from an interrupted write
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    self.jobs[record["job_id"]] = record
+                    self.rows = max(self.rows, record["row_end"])
+                    committed += len(line)
+            if os.path.getsize(index_path) != committed:
+                logger.warning(f"⚠️ Truncating torn job index at byte {committed}")
+                with open(index_path, "r+b") as f:
+                    f.truncate(committed)
+
+        for column in self.columns:
+            path = self._column_path(column)
+            if not os.path.exists(path):
+                open(path, "wb").close()
+            elif os.path.getsize(path) != self.rows * 8:
+                with open(path, "r+b") as f:
+                    f.truncate(self.rows * 8)
+
+    def is_complete(self, job: SweepJob) -> bool:
+        """
+        Whether `job` is committed.
+
+        Raises:
+            ValueError: The store holds a different job under the same id
+                (the directory was written by another grid)
+        """
+        record = self.jobs.get(job.job_id)
+        if record is None:
+            return False
+        if record["seed"] != job.seed or canonical_params(record["params"]) != canonical_params(job.params):
+            raise ValueError(
+                f"Job {job.job_id} in {self.directory} was run with params {record['params']} "
+                f"seed {record['seed']}, not {job.params} seed {job.seed}"
+            )
+        return True
+
+    def append(self, job: SweepJob, rows: np.ndarray):
+        """Append one job's rows, then commit it to the index"""
+        rows = np.ascontiguousarray(rows, dtype="<i8")
+        for i, column in enumerate(self.columns):
+            with open(self._column_path(column), "ab") as f:
+                f.write(rows[:, i].tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+        record = {
+            "job_id": job.job_id,
+            "params": job.params,
+            "replicate": job.replicate,
+            "seed": job.seed,
+            "row_start": self.rows,
+            "row_end": self.rows + len(rows)
+        }
+        with open(os.path.join(self.directory, self.INDEX), "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.jobs[job.job_id] = record
+        self.rows += len(rows)
+
+    def load(self, columns: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        """Memory-map committed columns (read-only)"""
+        result = {}
+        for column in columns or self.columns:
+            if self.rows == 0:
+                result[column] = np.empty(0, dtype="<i8")
+            else:
+                result[column] = np.memmap(self._column_path(column), dtype="<i8", mode="r", shape=(self.rows,))
+        return result
+
+    def job_rows(self, job_id: int) -> Dict[str, np.ndarray]:
+        """Columns restricted to one job's trajectory"""
+        record = self.jobs[job_id]
+        return {
+            column: values[record["row_start"]:record["row_end"]]
+            for column, values in self.load().items()
+        }
+
+
+class ScenarioSweep:
+    """Distributes sweep jobs over a process pool into a columnar store"""
+
+    def __init__(self, directory: str):
+        self.store = ColumnarResultStore(directory)
+
+    def run(self, jobs: List[SweepJob], workers: Optional[int] = None) -> Dict:
+        """
+        Run every job not already committed to the store.
+
+        Args:
+            jobs: Jobs from `build_jobs`
+            workers: Process count (default: CPU count); 0 runs inline
+
+        Returns:
+            Sweep summary (jobs run, skipped, wall time, throughput)
+
+        Raises:
+            ValueError: The store already holds different jobs under these ids
+        """
+        pending = [job for job in jobs if not self.store.is_complete(job)]
+        skipped = len(jobs) - len(pending)
+        if skipped:
+            logger.info(f"⏭️ Resuming sweep - {skipped} jobs already complete")
+
+        start = time.perf_counter()
+        if workers == 0:
+            for job in pending:
+                self.store.append(job, run_job(job))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(run_job, job): job for job in pending}
+                for future in as_completed(futures):
+                    self.store.append(futures[future], future.result())
+        elapsed = time.perf_counter() - start
+
+        summary = {
+            "jobs_run": len(pending),
+            "jobs_skipped": skipped,
+            "wall_seconds": elapsed,
+            "jobs_per_second": len(pending) / elapsed if elapsed > 0 else 0.0
+        }
+        logger.info(f"✅ Sweep complete - {summary}")
+        return summary
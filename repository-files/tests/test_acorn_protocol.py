@@ -0,0 +1,230 @@
+"""
+Acorn Protocol Testing Suite
+Tests somatic enrollment, anomaly model maintenance and authentication
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from governance_kernel.acorn_model_maintenance import AnomalyModelMaintainer, ReservoirSample
+from governance_kernel.acorn_batch_scorer import MicroBatchScorer
+from governance_kernel.acorn_protocol import (
+    SomaticTriadAuthentication,
+    AuthenticationRisk,
+    calculate_angle
+)
+
+
+def make_pose() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.normal(0, 1, (25, 3))
+
+
+class TestReservoirSample(unittest.TestCase):
+    """Test bounded training sample"""
+
+    def test_capacity_is_bounded(self):
+        reservoir = ReservoirSample(capacity=32, seed=1)
+        for i in range(1000):
+            reservoir.add([float(i)])
+
+        self.assertEqual(len(reservoir), 32)
+        self.assertEqual(reservoir.seen, 1000)
+        self.assertEqual(reservoir.snapshot().shape, (32, 1))
+
+    def test_sample_spans_stream(self):
+        """Late samples must be able to displace early ones"""
+        reservoir = ReservoirSample(capacity=50, seed=3)
+        for i in range(5000):
+            reservoir.add([float(i)])
+
+        self.assertGreater(reservoir.snapshot().max(), 50)
+
+
+class TestAnomalyModelMaintainer(unittest.TestCase):
+    """Test scheduled refits and model swaps"""
+
+    def test_bootstrap_fit_is_synchronous(self):
+        maintainer = AnomalyModelMaintainer(min_samples=6, background=False)
+        for i in range(5):
+            maintainer.observe([0.01 + i * 1e-3])
+            self.assertFalse(maintainer.is_trained)
+
+        maintainer.observe([0.02])
+        self.assertTrue(maintainer.is_trained)
+        self.assertEqual(maintainer.version, 1)
+
+    def test_refit_on_size_threshold(self):
+        maintainer = AnomalyModelMaintainer(
+            min_samples=6, refit_every=10, refit_interval=3600, background=False
+        )
+        for i in range(6 + 25):
+            maintainer.observe([0.01 + (i % 7) * 1e-3])
+
+        # Bootstrap + one refit per 10 new samples
+        self.assertEqual(maintainer.refit_count, 3)
+
+    def test_background_refit_swaps_model(self):
+        maintainer = AnomalyModelMaintainer(
+            min_samples=6, refit_every=20, refit_interval=3600, background=True
+        )
+        for i in range(6):
+            maintainer.observe([0.01 + i * 1e-3])
+        first = maintainer.model
+
+        for i in range(20):
+            maintainer.observe([0.015 + (i % 5) * 1e-3])
+        self.assertTrue(maintainer.wait_idle(timeout=10))
+        maintainer.stop()
+
+        self.assertIsNot(maintainer.model, first)
+        self.assertGreaterEqual(maintainer.version, 2)
+
+
+class TestMicroBatchScorer(unittest.TestCase):
+    """Test coalesced anomaly scoring"""
+
+    def setUp(self):
+        self.maintainer = AnomalyModelMaintainer(background=False)
+        rng = np.random.default_rng(1)
+        for value in rng.normal(0.03, 0.005, 64):
+            self.maintainer.observe([value])
+
+    def test_concurrent_calls_share_batches(self):
+        scorer = MicroBatchScorer(self.maintainer, window_ms=20.0)
+        values = np.linspace(0.0, 0.1, 32)
+        labels = [None] * len(values)
+
+        def worker(i):
+            labels[i] = scorer.score(values[i])
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(values))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        scorer.stop()
+
+        expected = self.maintainer.predict(values.reshape(-1, 1)).tolist()
+        self.assertEqual(labels, expected)
+        self.assertEqual(scorer.scored, len(values))
+        self.assertLess(scorer.batches, len(values))
+
+    def test_untrained_detector_returns_none(self):
+        scorer = MicroBatchScorer(AnomalyModelMaintainer(background=False))
+        self.assertIsNone(scorer.score(0.02))
+
+
+class TestSomaticTriadAuthentication(unittest.TestCase):
+    """Test end-to-end enrollment and authentication"""
+
+    def setUp(self):
+        self.sta = SomaticTriadAuthentication(
+            enable_audit=False,
+            model_maintainer=AnomalyModelMaintainer(background=False)
+        )
+        self.pose = make_pose()
+        self.gps = (-1.2921, 36.8219)
+        rng = np.random.default_rng(42)
+        for i in range(10):
+            self.sta.enroll(
+                f"user_{i}", self.pose, self.gps, rng.normal(0, 0.02, (100, 3)),
+                risk_level=AuthenticationRisk.HIGH
+            )
+
+    def test_detector_trained_after_enrollments(self):
+        self.assertTrue(self.sta.is_detector_trained)
+        self.assertIsNotNone(self.sta.anomaly_detector)
+
+    def test_static_image_rejected(self):
+        result = self.sta.authenticate("user_0", self.pose, self.gps, np.zeros((100, 3)))
+        self.assertFalse(result.success)
+        self.assertEqual(result.failure_reason, "SPOOF_DETECTED_ZERO_ENTROPY")
+
+    def test_posture_features_match_scalar_angles(self):
+        features = self.sta._extract_posture_features(self.pose)
+        expected = [
+            calculate_angle(self.pose[11], self.pose[13], self.pose[15]),
+            calculate_angle(self.pose[12], self.pose[14], self.pose[16]),
+            calculate_angle(self.pose[11], self.pose[0], self.pose[12]),
+            calculate_angle(self.pose[11], self.pose[23], self.pose[0]),
+            calculate_angle(self.pose[12], self.pose[24], self.pose[0]),
+        ]
+        np.testing.assert_allclose(features, expected)
+
+    def test_npz_profiles_round_trip(self):
+        self.sta.profiles["user_0"].metadata = {"role": "coordinator"}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "profiles.npz")
+            self.sta.save_profiles(path)
+
+            restored = SomaticTriadAuthentication(enable_audit=False)
+            restored.load_profiles(path)
+
+        self.assertEqual(set(restored.profiles), set(self.sta.profiles))
+        for user_id, profile in self.sta.profiles.items():
+            loaded = restored.profiles[user_id]
+            np.testing.assert_allclose(loaded.posture_template, profile.posture_template)
+            self.assertEqual(loaded.location_hash, profile.location_hash)
+            self.assertEqual(loaded.stillness_baseline, profile.stillness_baseline)
+            self.assertEqual(loaded.risk_level, profile.risk_level)
+            self.assertEqual(loaded.metadata, profile.metadata)
+
+    def test_wrong_location_rejected(self):
+        imu = np.random.default_rng(5).normal(0, 0.02, (100, 3))
+        result = self.sta.authenticate("user_0", self.pose, (40.7128, -74.0060), imu)
+        self.assertFalse(result.success)
+        self.assertEqual(result.failure_reason, "LOCATION_MISMATCH")
+
+
+
+class TestSomaticTriadLifetime(unittest.TestCase):
+    """Test that closing the protocol stops its background threads"""
+
+    def enroll_users(self, sta, count=10):
+        pose = make_pose()
+        rng = np.random.default_rng(3)
+        for i in range(count):
+            sta.enroll(f"user_{i}", pose, (-1.2921, 36.8219), rng.normal(0, 0.02, (100, 3)))
+
+    def test_close_stops_model_maintainer(self):
+        with SomaticTriadAuthentication(enable_audit=False) as sta:
+            self.enroll_users(sta)
+            worker = sta.model_maintainer._worker
+            self.assertTrue(worker.is_alive())
+
+        self.assertFalse(worker.is_alive())
+        self.assertIsNone(sta.model_maintainer._worker)
+
+    def test_close_stops_batch_scorer(self):
+        sta = SomaticTriadAuthentication(
+            enable_audit=False,
+            model_maintainer=AnomalyModelMaintainer(background=False),
+            batch_window_ms=1.0
+        )
+        self.enroll_users(sta)
+        imu = np.random.default_rng(9).normal(0, 0.02, (100, 3))
+        sta.authenticate("user_0", make_pose(), (-1.2921, 36.8219), imu)
+        worker = sta.batch_scorer._worker
+        self.assertTrue(worker.is_alive())
+
+        sta.close()
+        self.assertFalse(worker.is_alive())
+        self.assertGreaterEqual(sta.batch_scorer.scored, 1)
+
+    def test_close_is_idempotent(self):
+        sta = SomaticTriadAuthentication(enable_audit=False, batch_window_ms=1.0)
+        sta.close()
+        sta.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
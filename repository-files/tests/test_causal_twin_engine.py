@@ -0,0 +1,171 @@
+"""
+Causal-Twin Engine Testing Suite
+Tests the struct-of-arrays epidemic engine and its cell-list contact search
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulation_engine.vectorized_engine import (
+    AgentListView,
+    AgentState,
+    CellListEngine,
+    count_neighbors_within,
+    DECEASED,
+    STATES,
+)
+from simulation_engine.scenario_sweep import (
+    ColumnarResultStore,
+    ScenarioSweep,
+    build_jobs,
+    derive_seed,
+)
+
+
+class TestCellList(unittest.TestCase):
+    """Test neighbour counting against brute force"""
+
+    def test_matches_pairwise_distances(self):
+        rng = np.random.default_rng(11)
+        qx, qy = rng.uniform(0, 100, 800), rng.uniform(0, 100, 800)
+        tx, ty = rng.uniform(0, 100, 300), rng.uniform(0, 100, 300)
+
+        d = np.hypot(qx[:, None] - tx[None, :], qy[:, None] - ty[None, :])
+        expected = (d < 3.5).sum(axis=1)
+
+        counts = count_neighbors_within(qx, qy, tx, ty, 3.5, chunk_size=97)
+        np.testing.assert_array_equal(counts, expected)
+
+    def test_points_on_world_edge(self):
+        qx = np.array([100.0, 0.0])
+        qy = np.array([100.0, 0.0])
+        tx = np.array([99.0, 100.0, 1.0])
+        ty = np.array([100.0, 99.5, 0.0])
+
+        counts = count_neighbors_within(qx, qy, tx, ty, 2.0)
+        np.testing.assert_array_equal(counts, [2, 1])
+
+
+class TestCellListEngine(unittest.TestCase):
+    """Test day-step dynamics"""
+
+    def test_population_is_conserved(self):
+        engine = CellListEngine(population=5000, initial_infected=50, seed=3)
+        for _ in range(30):
+            counts = engine.step(lockdown_strength=0.2, vaccination_rate=0.01, testing_rate=0.3)
+            self.assertEqual(counts.sum(), 5000)
+
+        self.assertGreater(counts[STATES.index(AgentState.RECOVERED)], 0)
+
+    def test_seed_is_deterministic(self):
+        a = CellListEngine(population=2000, initial_infected=20, seed=9)
+        b = CellListEngine(population=2000, initial_infected=20, seed=9)
+        for _ in range(10):
+            np.testing.assert_array_equal(a.step(), b.step())
+
+    def test_deceased_agents_do_not_move(self):
+        engine = CellListEngine(population=100, initial_infected=0, seed=1)
+        engine.agents.state[:10] = DECEASED
+        before = engine.agents.x[:10].copy()
+        engine.step()
+        np.testing.assert_array_equal(engine.agents.x[:10], before)
+
+    def test_agent_view_writes_through(self):
+        engine = CellListEngine(population=10, initial_infected=0, seed=1)
+        agents = AgentListView(engine.agents)
+
+        agents[3].state = AgentState.VACCINATED
+        agents[-1].mobility = 0.0
+
+        self.assertEqual(STATES[engine.agents.state[3]], AgentState.VACCINATED)
+        self.assertEqual(engine.agents.mobility[9], 0.0)
+        self.assertEqual(len(agents), 10)
+        self.assertEqual([a.id for a in agents[2:5]], [2, 3, 4])
+
+
+class TestScenarioSweep(unittest.TestCase):
+    """Test seeded sweeps and resumable columnar results"""
+
+    def setUp(self):
+        self.jobs = build_jobs(
+            {"population": [500], "r0": [1.5, 3.0], "lockdown_strength": [0.0, 0.4]},
+            replicates=2,
+            days=15
+        )
+
+    def test_seed_ignores_parameter_order(self):
+        self.assertEqual(
+            derive_seed({"r0": 2.0, "population": 10}, 3),
+            derive_seed({"population": 10, "r0": 2.0}, 3)
+        )
+        self.assertNotEqual(derive_seed({"r0": 2.0}, 0), derive_seed({"r0": 2.0}, 1))
+
+    def test_pool_matches_inline_run(self):
+        with tempfile.TemporaryDirectory() as inline_dir, tempfile.TemporaryDirectory() as pool_dir:
+            ScenarioSweep(inline_dir).run(self.jobs, workers=0)
+            ScenarioSweep(pool_dir).run(self.jobs, workers=2)
+
+            inline, pooled = ColumnarResultStore(inline_dir), ColumnarResultStore(pool_dir)
+            for job in self.jobs:
+                a, b = inline.job_rows(job.job_id), pooled.job_rows(job.job_id)
+                for column in a:
+                    np.testing.assert_array_equal(a[column], b[column])
+
+    def test_resume_skips_committed_jobs_and_trims_partial_rows(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            ScenarioSweep(tmp).run(self.jobs[:3], workers=0)
+
+            # Simulate a crash after column rows were written but before the index commit
+            with open(os.path.join(tmp, "day.i64"), "ab") as f:
+                f.write(np.arange(5, dtype="<i8").tobytes())
+
+            summary = ScenarioSweep(tmp).run(self.jobs, workers=0)
+            self.assertEqual(summary["jobs_skipped"], 3)
+            self.assertEqual(summary["jobs_run"], len(self.jobs) - 3)
+
+            store = ColumnarResultStore(tmp)
+            columns = store.load()
+            self.assertEqual(len(columns["day"]), len(self.jobs) * 15)
+            self.assertEqual(len(columns["susceptible"]), len(self.jobs) * 15)
+            with open(os.path.join(tmp, "jobs.jsonl")) as f:
+                self.assertEqual(len([json.loads(line) for line in f]), len(self.jobs))
+            np.testing.assert_array_equal(store.job_rows(5)["day"], np.arange(1, 16))
+
+    def test_resume_after_torn_index_line(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            ScenarioSweep(tmp).run(self.jobs[:2], workers=0)
+
+            # Crash mid-way through the index commit of the third job
+            with open(os.path.join(tmp, "day.i64"), "ab") as f:
+                f.write(np.arange(15, dtype="<i8").tobytes())
+            with open(os.path.join(tmp, "jobs.jsonl"), "a") as f:
+                f.write('{"job_id": 2, "par')
+
+            self.assertEqual(ScenarioSweep(tmp).run(self.jobs[:5], workers=0)["jobs_run"], 3)
+            summary = ScenarioSweep(tmp).run(self.jobs, workers=0)
+            self.assertEqual(summary["jobs_skipped"], 5)
+            self.assertEqual(ScenarioSweep(tmp).run(self.jobs, workers=0)["jobs_run"], 0)
+
+            store = ColumnarResultStore(tmp)
+            self.assertEqual(sorted(store.jobs), [job.job_id for job in self.jobs])
+            self.assertEqual(store.rows, len(self.jobs) * 15)
+            np.testing.assert_array_equal(store.job_rows(2)["job_id"], np.full(15, 2))
+
+    def test_resume_rejects_a_different_grid(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            ScenarioSweep(tmp).run(self.jobs[:2], workers=0)
+            other = build_jobs({"population": [500], "r0": [2.0]}, replicates=2, days=15)
+            with self.assertRaises(ValueError):
+                ScenarioSweep(tmp).run(other, workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
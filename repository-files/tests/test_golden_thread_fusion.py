@@ -0,0 +1,127 @@
+"""
+Golden Thread Fusion Testing Suite
+Tests the vectorized spatial delta and the running verification statistics
+against the original pairwise and full-history computations
+"""
+
+import unittest
+import sys
+import os
+from datetime import datetime, timedelta
+from unittest import mock
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import core.fusion as fusion_module
+from core.fusion import DataSignal, DataSource, GoldenThreadFusion, max_pairwise_haversine_km
+
+
+def pairwise_max_km(fusion, points):
+    """The original O(n^2) loop over located signal pairs"""
+    max_delta = 0.0
+    for i, (lat1, lon1) in enumerate(points):
+        for lat2, lon2 in points[i + 1:]:
+            if lat1 and lon1 and lat2 and lon2:
+                max_delta = max(max_delta, fusion._haversine_distance(lat1, lon1, lat2, lon2))
+    return max_delta
+
+
+class TestSpatialDelta(unittest.TestCase):
+    """The vectorized maximum must match the pairwise loop"""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(30)
+        self.fusion = GoldenThreadFusion()
+
+    def random_points(self, n, spread):
+        lat = self.rng.uniform(-spread, spread, n)
+        lon = self.rng.uniform(-2 * spread, 2 * spread, n)
+        return lat, lon
+
+    def test_matches_pairwise_loop(self):
+        """Local clusters up to antipodal spreads, small and large n"""
+        for n in (2, 3, 5, 17, 120):
+            for spread in (0.01, 1.0, 45.0, 90.0):
+                lat, lon = self.random_points(n, spread)
+                expected = pairwise_max_km(self.fusion, list(zip(lat, lon)))
+                self.assertAlmostEqual(max_pairwise_haversine_km(lat, lon), expected, delta=1e-6 * max(expected, 1.0))
+
+    def test_matches_pairwise_loop_across_blocks(self):
+        """Row blocks that do not divide n still cover every pair"""
+        lat, lon = self.random_points(53, 60.0)
+        expected = pairwise_max_km(self.fusion, list(zip(lat, lon)))
+        for block in (1, 7, 52, 53, 1024):
+            with mock.patch.object(fusion_module, "SPATIAL_BLOCK_SIZE", block):
+                self.assertAlmostEqual(max_pairwise_haversine_km(lat, lon), expected, delta=1e-6 * expected)
+
+    def test_fewer_than_two_points(self):
+        self.assertEqual(max_pairwise_haversine_km(np.array([1.0]), np.array([2.0])), 0.0)
+        self.assertEqual(max_pairwise_haversine_km(np.array([]), np.array([])), 0.0)
+
+    def test_signals_without_coordinates_are_skipped(self):
+        """Fused spatial delta ignores unlocated signals, like the pairwise loop"""
+        lat, lon = self.random_points(12, 5.0)
+        points = [(la, lo) for la, lo in zip(lat, lon)]
+        points[3] = (None, None)
+        points[7] = (lat[7], None)
+        signals = [
+            DataSignal(
+                source=DataSource.CBS, location="Dadaab", symptom="fever", diagnosis=None,
+                timestamp=datetime(2025, 1, 15) + timedelta(minutes=i),
+                latitude=la, longitude=lo, severity=5, metadata={}
+            )
+            for i, (la, lo) in enumerate(points)
+        ]
+        expected = pairwise_max_km(self.fusion, points)
+        self.assertAlmostEqual(self.fusion._calculate_spatial_delta(signals), expected, delta=1e-6 * expected)
+
+
+class TestVerificationStatistics(unittest.TestCase):
+    """Running counters must match statistics recomputed from history"""
+
+    def test_running_stats_match_history(self):
+        rng = np.random.default_rng(7)
+        fusion = GoldenThreadFusion()
+        sources = list(DataSource)
+        symptoms = ["fever", "diarrhea", "cough"]
+
+        for p in range(60):
+            base = datetime(2025, 1, 1) + timedelta(hours=int(rng.integers(0, 500)))
+            signals = [
+                DataSignal(
+                    source=sources[int(rng.integers(len(sources)))],
+                    location="Dadaab",
+                    symptom=symptoms[int(rng.integers(len(symptoms)))],
+                    diagnosis=None,
+                    timestamp=base + timedelta(hours=float(rng.uniform(0, 48))),
+                    latitude=float(rng.normal(0.05, 0.05)),
+                    longitude=float(rng.normal(40.3, 0.05)),
+                    severity=int(rng.integers(1, 10)),
+                    metadata={}
+                )
+                for _ in range(int(rng.integers(1, 5)))
+            ]
+            fusion.fuse_signals(signals, patient_id=f"PAT_{p:03d}")
+
+        history = fusion.fusion_history
+        total = len(history)
+        counts = {}
+        for record in history:
+            counts[record.verification_status.name] = counts.get(record.verification_status.name, 0) + 1
+
+        stats = fusion.get_verification_statistics()
+        self.assertEqual(stats['total_fusions'], total)
+        self.assertEqual(stats['status_distribution'], {s: c / total for s, c in counts.items()})
+        self.assertAlmostEqual(stats['average_verification_score'], sum(r.verification_score for r in history) / total)
+        self.assertAlmostEqual(stats['average_spatial_delta_km'], sum(r.spatial_delta_km for r in history) / total)
+        self.assertAlmostEqual(stats['average_temporal_delta_hours'], sum(r.temporal_delta_hours for r in history) / total)
+
+    def test_empty_statistics(self):
+        self.assertEqual(GoldenThreadFusion().get_verification_statistics(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
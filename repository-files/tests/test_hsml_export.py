@@ -0,0 +1,183 @@
+"""
+HSML HDX Export Testing Suite
+Tests the streamed HDX JSON document and the row-group columnar exports
+(CSV, JSONL, Arrow IPC) read from on-disk sink segments
+"""
+
+import unittest
+import sys
+import os
+import csv
+import json
+import importlib.util
+import tempfile
+import tracemalloc
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.hsml_export import (
+    COLUMN_GROUPS, HDX_DATASET, MANIFEST_NAME, export_hdx_columnar, export_hdx_json
+)
+from core.hsml_logging import HSMLEventType, HSMLLogger
+from core.hsml_sinks import RotatingJSONLSink, serialize_event
+
+
+def record(i: int) -> dict:
+    return {
+        "event_id": f"evt{i:06d}",
+        "event_type": "consent_validation",
+        "priority": "medium",
+        "timestamp": "2025-01-01T00:00:00",
+        "actor": "consent_manager",
+        "resource": f"patient_{i}",
+        "action": "validate_consent",
+        "context": {"patient_id": str(i), "note": "comma, \"quote\"\nnewline"},
+        "reasoning_chain": ["Check consent token", "Check expiration"],
+        "outcome": "success",
+        "hash": "ab" * 32
+    }
+
+
+def payloads(n: int):
+    for i in range(n):
+        yield serialize_event(record(i))[0]
+
+
+class TestHDXJson(unittest.TestCase):
+    """Streamed document matches the HDX structure"""
+
+    def test_document_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "hdx.json")
+            result = export_hdx_json(payloads(250), path)
+            with open(path) as f:
+                doc = json.load(f)
+
+        self.assertEqual(result["events"], 250)
+        self.assertEqual(doc["dataset"], HDX_DATASET)
+        resource = doc["resources"][0]
+        self.assertEqual(resource["name"], "health_events")
+        self.assertEqual(resource["data"], [record(i) for i in range(250)])
+
+    def test_empty_export_is_valid(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "hdx.json")
+            export_hdx_json(iter(()), path)
+            with open(path) as f:
+                self.assertEqual(json.load(f)["resources"][0]["data"], [])
+
+
+class TestHDXColumnar(unittest.TestCase):
+    """Row groups, column groups and manifest"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.out = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_csv_groups_align_on_event_id(self):
+        result = export_hdx_columnar(payloads(1000), self.out, fmt="csv", row_group_size=300)
+        self.assertEqual(result["events"], 1000)
+        self.assertEqual(result["row_groups"], 4)
+
+        with open(os.path.join(self.out, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["rows"], 1000)
+        self.assertEqual([r["path"] for r in manifest["resources"]],
+                         [f"{g}.csv" for g in COLUMN_GROUPS])
+
+        groups = {}
+        for group, columns in COLUMN_GROUPS.items():
+            with open(os.path.join(self.out, f"{group}.csv"), newline="") as f:
+                rows = list(csv.reader(f))
+            self.assertEqual(rows[0], list(columns))
+            groups[group] = rows[1:]
+
+        self.assertEqual(len(groups["payload"]), 1000)
+        for group in COLUMN_GROUPS:
+            self.assertEqual([row[0] for row in groups[group]], [f"evt{i:06d}" for i in range(1000)])
+        self.assertEqual(json.loads(groups["payload"][7][1]), record(7)["context"])
+
+    def test_jsonl_keeps_nested_values(self):
+        export_hdx_columnar(payloads(10), self.out, fmt="jsonl", row_group_size=4)
+        with open(os.path.join(self.out, "payload.jsonl")) as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual(rows[3], {"event_id": "evt000003", "context": record(3)["context"],
+                                   "reasoning_chain": record(3)["reasoning_chain"]})
+
+    def test_rejects_unknown_format(self):
+        with self.assertRaises(ValueError):
+            export_hdx_columnar(payloads(1), self.out, fmt="parquet")
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow not installed")
+    def test_arrow_row_groups_are_record_batches(self):
+        import pyarrow as pa
+
+        export_hdx_columnar(payloads(100), self.out, fmt="arrow", row_group_size=32)
+        reader = pa.ipc.open_file(os.path.join(self.out, "identity.arrow"))
+        self.assertEqual(reader.num_record_batches, 4)
+        self.assertEqual(reader.read_all().num_rows, 100)
+
+    def test_memory_does_not_grow_with_events(self):
+        def peak(n):
+            tracemalloc.start()
+            export_hdx_columnar(payloads(n), self.out, fmt="csv", row_group_size=256)
+            _, top = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return top
+
+        small, large = peak(1000), peak(8000)
+        self.assertLess(large, small * 1.5)
+
+
+class TestLoggerExport(unittest.TestCase):
+    """HSMLLogger.export_to_hdx streams from its on-disk segments"""
+
+    def test_export_from_segments(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            hsml = HSMLLogger(sinks=[RotatingJSONLSink(os.path.join(tmp, "log"), max_bytes=4096)],
+                              recent_events=10)
+            for i in range(300):
+                hsml.log_event(
+                    event_type=HSMLEventType.OUTBREAK_DETECTION,
+                    actor="ecf_engine",
+                    resource=f"zone_{i}",
+                    action="detect_outbreak",
+                    context={"patient_id": str(i), "location": "Dadaab"}
+                )
+
+            result = hsml.export_to_hdx(os.path.join(tmp, "hdx.json"))
+            self.assertEqual(result["events"], 300)
+            self.assertGreater(result["events_per_second"], 0)
+            with open(os.path.join(tmp, "hdx.json")) as f:
+                self.assertEqual(len(json.load(f)["resources"][0]["data"]), 300)
+
+            result = hsml.export_to_hdx(os.path.join(tmp, "columnar"), format="jsonl", row_group_size=64)
+            self.assertEqual((result["events"], result["row_groups"]), (300, 5))
+            hsml.close()
+
+    def test_export_from_default_ring_warns(self):
+        """The default in-memory ring only holds recent events; exporting it says so"""
+        with tempfile.TemporaryDirectory() as tmp:
+            hsml = HSMLLogger(recent_events=50)
+            for i in range(120):
+                hsml.log_event(
+                    event_type=HSMLEventType.OUTBREAK_DETECTION,
+                    actor="ecf_engine",
+                    resource=f"zone_{i}",
+                    action="detect_outbreak",
+                    context={"patient_id": str(i)}
+                )
+
+            with self.assertLogs("core.hsml_logging", level="WARNING") as logs:
+                result = hsml.export_to_hdx(os.path.join(tmp, "hdx.json"))
+            self.assertEqual(result["events"], 50)
+            self.assertIn("evicted 70 older events", logs.output[0])
+            hsml.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
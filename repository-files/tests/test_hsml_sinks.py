@@ -0,0 +1,203 @@
+"""
+HSML Sinks Testing Suite
+Tests single-pass event serialization, the rotating JSONL / length-prefixed
+binary / ring sinks, the bounded async writer and HSMLLogger on top of them
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+import threading
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.hsml_logging import HSMLEventType, HSMLLogger, HSMLPriority
+from core.hsml_sinks import (
+    AsyncSinkWriter, BinarySink, RingSink, RotatingJSONLSink, serialize_event
+)
+
+
+def record(i: int) -> dict:
+    return {
+        "event_id": f"evt{i:05d}",
+        "outcome": "success",
+        "context": {"patient_id": str(i), "location": "Dadaab"},
+        "reasoning_chain": ["step one", f"step {i}"]
+    }
+
+
+class TestSerialization(unittest.TestCase):
+    """One serialization gives the payload and the body size"""
+
+    def test_round_trip_and_body_size(self):
+        rec = record(7)
+        payload, body = serialize_event(rec)
+        self.assertEqual(json.loads(payload), rec)
+        compact = dict(separators=(",", ":"))
+        self.assertEqual(body, len(json.dumps(rec["context"], **compact)) +
+                         len(json.dumps(rec["reasoning_chain"], **compact)))
+
+    def test_empty_parts_count_zero(self):
+        payload, body = serialize_event({"event_id": "x", "context": {}, "reasoning_chain": None})
+        self.assertEqual(body, 0)
+        self.assertEqual(json.loads(payload)["reasoning_chain"], None)
+
+
+class TestFileSinks(unittest.TestCase):
+    """Segments rotate, are retained up to a limit and read back in order"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def payloads(self, n):
+        return [serialize_event(record(i))[0] for i in range(n)]
+
+    def test_jsonl_rotation_and_read_back(self):
+        sink = RotatingJSONLSink(self.tmp.name, max_bytes=2000)
+        payloads = self.payloads(200)
+        for start in range(0, 200, 32):
+            sink.write_batch(payloads[start:start + 32])
+        sink.flush()
+        self.assertGreater(len(sink.segments()), 5)
+        for path in sink.segments()[:-1]:
+            self.assertLessEqual(os.path.getsize(path), 2000)
+        self.assertEqual(list(sink.iter_payloads()), payloads)
+        sink.close()
+
+        # Reopening appends to the newest segment
+        reopened = RotatingJSONLSink(self.tmp.name, max_bytes=2000)
+        reopened.write_batch(self.payloads(1))
+        reopened.flush()
+        self.assertEqual(len(list(reopened.iter_payloads())), 201)
+        reopened.close()
+
+    def test_retention_bounds_disk(self):
+        sink = RotatingJSONLSink(self.tmp.name, max_bytes=1000, max_segments=3)
+        sink.write_batch(self.payloads(500))
+        sink.flush()
+        self.assertEqual(len(sink.segments()), 3)
+        kept = [json.loads(p)["event_id"] for p in sink.iter_payloads()]
+        self.assertEqual(kept[-1], "evt00499")
+        self.assertEqual(kept, sorted(kept))
+        sink.close()
+
+    def test_binary_round_trip_ignores_torn_tail(self):
+        sink = BinarySink(self.tmp.name, prefix="audit")
+        payloads = self.payloads(50) + [b'{"text":"line\\nbreak"}']
+        sink.write_batch(payloads)
+        sink.close()
+        with open(sink.segments()[-1], "ab") as f:
+            f.write(b"\x10\x00\x00\x00{\"trunc")
+        reader = BinarySink(self.tmp.name, prefix="audit")
+        self.assertEqual(list(reader.iter_payloads()), payloads)
+        reader.close()
+
+    def test_ring_keeps_most_recent(self):
+        ring = RingSink(capacity=10)
+        ring.write_batch(self.payloads(25))
+        ids = [r["event_id"] for r in ring.iter_records()]
+        self.assertEqual(ids, [f"evt{i:05d}" for i in range(15, 25)])
+        self.assertEqual(ring.evicted, 15)
+
+
+class TestAsyncSinkWriter(unittest.TestCase):
+    """Bounded queue, background serialization, drop accounting"""
+
+    def test_writes_everything_on_flush(self):
+        ring = RingSink(capacity=1000)
+        sizes = []
+        writer = AsyncSinkWriter([ring], on_written=lambda item, payload, body: sizes.append(body))
+        for i in range(500):
+            writer.submit(record(i))
+        writer.flush()
+        self.assertEqual(len(ring), 500)
+        self.assertEqual(writer.written, 500)
+        self.assertEqual(len(sizes), 500)
+        writer.close()
+
+    def test_failing_callback_does_not_stall_flush(self):
+        """A raising on_written is counted; the writer keeps running"""
+        def on_written(item, payload, body):
+            if item["event_id"].endswith("7"):
+                raise RuntimeError("callback down")
+
+        ring = RingSink(capacity=1000)
+        writer = AsyncSinkWriter([ring], batch_size=8, on_written=on_written)
+        for i in range(100):
+            writer.submit(record(i))
+        writer.flush()
+        self.assertEqual(len(ring), 100)
+        self.assertEqual(writer.errors, 10)
+        self.assertTrue(writer._thread.is_alive())
+        writer.close()
+
+    def test_non_blocking_submit_drops_when_full(self):
+        gate = threading.Event()
+
+        class SlowSink(RingSink):
+            def write_batch(self, payloads):
+                gate.wait()
+                super().write_batch(payloads)
+
+        sink = SlowSink(capacity=100)
+        writer = AsyncSinkWriter([sink], queue_size=4, batch_size=1)
+        accepted = sum(writer.submit(record(i), block=False) for i in range(20))
+        self.assertLess(accepted, 20)
+        self.assertEqual(writer.dropped, 20 - accepted)
+        gate.set()
+        writer.close()
+        self.assertEqual(len(sink), accepted)
+
+
+class TestHSMLLoggerSinks(unittest.TestCase):
+    """Logger memory stays bounded and events reach the sinks"""
+
+    def log(self, hsml, i, event_type=HSMLEventType.CONSENT_VALIDATION):
+        return hsml.log_event(
+            event_type=event_type,
+            actor="consent_manager",
+            resource=f"patient_{i}",
+            action="validate_consent",
+            context={"patient_id": str(i), "consent_token": "VALID_TOKEN", "scope": "diagnosis"},
+            reasoning_chain=["Check consent token", "Validate scope", "Check expiration"]
+        )
+
+    def test_memory_bounded_and_logged_to_disk(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            sink = RotatingJSONLSink(tmp)
+            hsml = HSMLLogger(sinks=[sink], recent_events=50, queue_size=64)
+            for i in range(2000):
+                self.log(hsml, i)
+            hsml.flush()
+
+            self.assertEqual(len(hsml.events), 50)
+            records = list(sink.iter_records())
+            self.assertEqual(len(records), 2000)
+            self.assertEqual(records[0]["context"], {"patient_id": "0"})
+            self.assertEqual(records[0]["reasoning_chain"], ["Check consent token", "Check expiration"])
+
+            stats = hsml.get_statistics()
+            self.assertEqual(stats["written_events"], 2000)
+            self.assertGreater(stats["storage_saved_bytes"], 0)
+            self.assertTrue(0 < stats["compression_ratio"] < 1)
+            hsml.close()
+
+    def test_critical_events_are_never_dropped(self):
+        hsml = HSMLLogger(queue_size=1, block_when_full=False)
+        for i in range(200):
+            self.assertIsNotNone(self.log(hsml, i, HSMLEventType.GOLDEN_THREAD_FUSION))
+        hsml.flush()
+        self.assertEqual(hsml.stats["dropped_events"], 0)
+        self.assertEqual(hsml.get_statistics()["written_events"], 200)
+        self.assertEqual(hsml.events[0].priority, HSMLPriority.CRITICAL)
+        hsml.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Metrics Histogram Testing Suite
+Tests the log-linear latency histograms (bucketing, quantiles, per-thread
+shards) and their use in MetricsTracker and the Prometheus export
+"""
+
+import unittest
+import sys
+import os
+import random
+import threading
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from governance_kernel.latency_histogram import LogLinearHistogram
+from governance_kernel.metrics import MetricsTracker
+
+
+class TestLogLinearHistogram(unittest.TestCase):
+    """Bucket layout and quantile accuracy"""
+
+    def test_native_bucket_boundaries(self):
+        hist = LogLinearHistogram(schema=0)
+        for value in (1.0, 1.5, 2.0, 3.0, 1000.0):
+            hist.record(value)
+        buckets = {index: count for index, _, count in hist.snapshot().buckets()}
+        # schema 0: bucket i covers (2^(i-1), 2^i]
+        self.assertEqual(buckets, {0: 1, 1: 2, 2: 1, 10: 1})
+
+    def test_quantiles_within_bucket_error(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(3, 1) for _ in range(20000)]
+        hist = LogLinearHistogram(schema=3)
+        for v in values:
+            hist.record(v)
+
+        ordered = sorted(values)
+        width = 2 ** (2 ** -3)
+        for q in (0.5, 0.9, 0.95, 0.99):
+            exact = ordered[int(len(ordered) * q)]
+            self.assertLessEqual(abs(hist.quantile(q) / exact - 1), width - 1)
+
+        snapshot = hist.snapshot()
+        self.assertEqual(snapshot.count, 20000)
+        self.assertAlmostEqual(snapshot.mean(), sum(values) / len(values))
+        self.assertEqual(snapshot.quantile(1.0), max(values))
+
+    def test_memory_is_fixed(self):
+        hist = LogLinearHistogram()
+        size = len(hist.snapshot().counts)
+        for i in range(10000):
+            hist.record(i * 0.37)
+        self.assertEqual(len(hist.snapshot().counts), size)
+
+    def test_zero_and_out_of_range(self):
+        hist = LogLinearHistogram(lowest=1.0, highest=100.0)
+        for value in (0.0, 0.001, 50.0, 1e9):
+            hist.record(value)
+        snapshot = hist.snapshot()
+        self.assertEqual(snapshot.zero_count, 1)
+        self.assertEqual(snapshot.count, 4)
+        self.assertEqual(snapshot.max, 1e9)
+        self.assertEqual(snapshot.counts[0], 1)
+        self.assertEqual(snapshot.counts[-1], 1)
+
+    def test_empty(self):
+        hist = LogLinearHistogram()
+        self.assertEqual(hist.quantile(0.95), 0.0)
+        self.assertEqual(hist.mean(), 0.0)
+
+    def test_thread_shards_merge(self):
+        hist = LogLinearHistogram()
+        barrier = threading.Barrier(8)
+
+        def work():
+            barrier.wait()
+            for i in range(5000):
+                hist.record(1.0 + i % 100)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(hist), 40000)
+        # Finished threads are folded into one retired shard
+        self.assertEqual(hist._shards, [])
+        hist.record(5.0)
+        self.assertEqual(len(hist), 40001)
+
+    def test_thread_churn_without_reads(self):
+        hist = LogLinearHistogram()
+        for _ in range(50):
+            t = threading.Thread(target=hist.record, args=(2.0,))
+            t.start()
+            t.join()
+        # Never read: each new thread folded the previous ones away
+        self.assertLessEqual(len(hist._shards), 1)
+        self.assertEqual(len(hist), 50)
+
+
+class TestMetricsTrackerLatency(unittest.TestCase):
+    """MetricsTracker latency summary and Prometheus buckets"""
+
+    def test_summary_and_prometheus(self):
+        tracker = MetricsTracker()
+        for i in range(1, 1001):
+            tracker.record_latency(float(i), "api")
+        tracker.record_latency(120.5, "bridge")
+
+        summary = tracker.get_summary()["latency"]
+        self.assertAlmostEqual(summary["avg_api_latency_ms"], 500.5)
+        self.assertLessEqual(abs(summary["p95_api_latency_ms"] / 950 - 1), 0.091)
+        self.assertEqual(summary["p95_bridge_latency_ms"], 120.5)
+
+        lines = tracker.export_prometheus_metrics().splitlines()
+        self.assertIn("# TYPE iluminara_latency_ms histogram", lines)
+        api = [l for l in lines if l.startswith('iluminara_latency_ms_bucket{type="api"')]
+        counts = [int(l.rsplit(" ", 1)[1]) for l in api]
+        self.assertEqual(counts, sorted(counts))
+        self.assertEqual(api[-1], 'iluminara_latency_ms_bucket{type="api",le="+Inf"} 1000')
+        self.assertIn('iluminara_latency_ms_count{type="api"} 1000', lines)
+        self.assertIn('iluminara_latency_ms_count{type="inference"} 0', lines)
+
+
+if __name__ == "__main__":
+    unittest.main()
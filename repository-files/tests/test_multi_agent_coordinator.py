@@ -0,0 +1,300 @@
+"""
+Multi-Agent Coordinator Testing Suite
+Tests execution classes (event loop, thread pool, worker processes),
+per-agent timeouts, real cancellation of process agents, request
+coalescing and the agent result cache
+"""
+
+import unittest
+import sys
+import os
+import asyncio
+import threading
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from core.agent_executors import ExecutionClass
+from core.agent_result_cache import SingleFlight, TTLResultCache, canonical_digest
+from core.multi_agent_coordinator import AgentStatus, AgentType, MultiAgentCoordinator
+from governance_kernel.metrics import MetricsTracker
+
+
+# Process agents must be importable by worker processes
+def cpu_forecast(disease, historical_data, horizon):
+    total = sum(i * i for i in range(200000))
+    return {"forecast": {"peak_cases": sum(historical_data["cases"]) * horizon},
+            "pid": os.getpid(), "checksum": total % 97, "confidence": 0.8}
+
+
+def spin_forever(disease, historical_data, horizon):
+    while True:
+        pass
+
+
+def failing_agent(disease, historical_data, horizon):
+    raise ValueError("model file missing")
+
+
+def blocking_agent(disease, historical_data, horizon):
+    time.sleep(0.3)
+    return {"thread": threading.current_thread().name, "risk_score": 0.6, "confidence": 0.7}
+
+
+async def io_agent(disease, historical_data, horizon):
+    await asyncio.sleep(0.3)
+    return {"alert_level": "HIGH", "confidence": 0.9}
+
+
+HISTORY = {"cases": [10, 15, 25, 40]}
+
+
+class TestExecutionClasses(unittest.TestCase):
+    """Agents run where they declare"""
+
+    def setUp(self):
+        # Result cache off: these tests are about where agents execute
+        self.coordinator = MultiAgentCoordinator("Dadaab", 200000, timeout_seconds=20, process_workers=2,
+                                                 result_cache_ttl_seconds=0, metrics=MetricsTracker())
+
+    def tearDown(self):
+        self.coordinator.shutdown()
+
+    def run_ensemble(self):
+        return asyncio.run(self.coordinator.execute_ensemble("cholera", HISTORY, forecast_horizon_days=14))
+
+    def test_process_thread_and_async_agents(self):
+        self.coordinator.register_agent(AgentType.EPIDEMIOLOGICAL, object(), ExecutionClass.PROCESS, cpu_forecast)
+        self.coordinator.register_agent(AgentType.SPATIOTEMPORAL, object(), ExecutionClass.THREAD, blocking_agent)
+        self.coordinator.register_agent(AgentType.EARLY_WARNING, object(), ExecutionClass.ASYNC, io_agent)
+
+        prediction = self.run_ensemble()
+        results = {r.agent_type: r for r in prediction.agent_results}
+        self.assertTrue(all(r.status == AgentStatus.COMPLETED for r in results.values()))
+        self.assertNotEqual(results[AgentType.EPIDEMIOLOGICAL].result["pid"], os.getpid())
+        self.assertEqual(results[AgentType.EPIDEMIOLOGICAL].result["forecast"]["peak_cases"], 90 * 14)
+        self.assertTrue(results[AgentType.SPATIOTEMPORAL].result["thread"].startswith("agent-thread"))
+
+        # Workers are reused across ensembles
+        second = self.run_ensemble()
+        self.assertEqual(second.agent_results[0].result["pid"], results[AgentType.EPIDEMIOLOGICAL].result["pid"])
+
+    def test_blocking_agents_do_not_serialize_ensemble(self):
+        for agent_type in (AgentType.EPIDEMIOLOGICAL, AgentType.SPATIOTEMPORAL, AgentType.EARLY_WARNING):
+            self.coordinator.register_agent(agent_type, object(), ExecutionClass.THREAD, blocking_agent)
+        start = time.perf_counter()
+        self.run_ensemble()
+        self.assertLess(time.perf_counter() - start, 0.8)
+
+    def test_process_agent_error_is_reported(self):
+        self.coordinator.register_agent(AgentType.EPIDEMIOLOGICAL, object(), ExecutionClass.PROCESS, failing_agent)
+        result = self.run_ensemble().agent_results[0]
+        self.assertEqual(result.status, AgentStatus.FAILED)
+        self.assertIn("ValueError: model file missing", result.error)
+
+    def test_pool_agents_need_a_runner(self):
+        with self.assertRaises(ValueError):
+            self.coordinator.register_agent(AgentType.EPIDEMIOLOGICAL, object(), ExecutionClass.PROCESS)
+
+    def test_builtin_agents_still_work(self):
+        self.coordinator.register_agent(AgentType.EARLY_WARNING, object())
+        prediction = self.run_ensemble()
+        self.assertEqual(prediction.agent_results[0].status, AgentStatus.COMPLETED)
+        self.assertEqual(prediction.agent_results[0].result["alert_level"], "HIGH")
+
+
+class TestProcessCancellation(unittest.TestCase):
+    """Timeouts and cancellation stop process agents for real"""
+
+    def setUp(self):
+        self.coordinator = MultiAgentCoordinator("Dadaab", 200000, process_workers=1, metrics=MetricsTracker())
+
+    def tearDown(self):
+        self.coordinator.shutdown()
+
+    def test_timeout_terminates_worker(self):
+        self.coordinator.register_agent(AgentType.EPIDEMIOLOGICAL, object(), ExecutionClass.PROCESS,
+                                        spin_forever, timeout_seconds=0.5)
+        self.coordinator.warm_up()
+        start = time.perf_counter()
+        prediction = asyncio.run(self.coordinator.execute_ensemble("cholera", HISTORY))
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertEqual(prediction.agent_results[0].status, AgentStatus.TIMEOUT)
+
+        pool = self.coordinator._process_pool
+        self.assertEqual(pool.terminated, 1)
+        self.assertEqual(pool._idle, [])
+
+        # A replacement worker serves the next call
+        self.coordinator.register_agent(AgentType.EPIDEMIOLOGICAL, object(), ExecutionClass.PROCESS, cpu_forecast)
+        prediction = asyncio.run(self.coordinator.execute_ensemble("cholera", HISTORY))
+        self.assertEqual(prediction.agent_results[0].status, AgentStatus.COMPLETED)
+
+    def test_cancelled_ensemble_terminates_worker(self):
+        self.coordinator.register_agent(AgentType.EPIDEMIOLOGICAL, object(), ExecutionClass.PROCESS, spin_forever)
+
+        async def cancel_midway():
+            task = asyncio.create_task(self.coordinator.execute_ensemble("cholera", HISTORY))
+            await asyncio.sleep(1.0)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_midway())
+        self.assertEqual(self.coordinator._process_pool.terminated, 1)
+
+
+class CountingAgent:
+    """ASYNC runner counting its executions"""
+
+    def __init__(self, delay=0.2, fail=False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def __call__(self, disease, historical_data, horizon):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("upstream feed down")
+        return {"risk_score": 0.9, "confidence": 0.8, "disease": disease}
+
+
+class TestResultReuse(unittest.TestCase):
+    """Single-flight coalescing and TTL result cache"""
+
+    def setUp(self):
+        self.metrics = MetricsTracker()
+        self.coordinator = MultiAgentCoordinator("Dadaab", 200000, metrics=self.metrics)
+
+    def tearDown(self):
+        self.coordinator.shutdown()
+
+    def storm(self, callers, query=HISTORY, disease="cholera"):
+        async def run():
+            return await asyncio.gather(*[
+                self.coordinator.execute_ensemble(disease, query) for _ in range(callers)
+            ])
+        return asyncio.run(run())
+
+    def test_concurrent_identical_queries_share_one_run(self):
+        agent = CountingAgent()
+        self.coordinator.register_agent(AgentType.EARLY_WARNING, object(), runner=agent)
+
+        predictions = self.storm(10)
+        self.assertEqual(agent.calls, 1)
+        self.assertTrue(all(p.agent_results[0].status == AgentStatus.COMPLETED for p in predictions))
+
+        # Later identical query: served from the cache
+        self.storm(1)
+        self.assertEqual(agent.calls, 1)
+        self.assertEqual(self.metrics.caches["agent_results"], {"hit": 1, "coalesced": 9, "miss": 1})
+        self.assertAlmostEqual(self.metrics.cache_hit_rate("agent_results"), 10 / 11)
+        self.assertIn('iluminara_cache_lookups_total{cache="agent_results",outcome="coalesced"} 9',
+                      self.metrics.export_prometheus_metrics().splitlines())
+
+        # Different query: executed
+        self.storm(1, disease="measles")
+        self.assertEqual(agent.calls, 2)
+
+    def test_digest_is_canonical(self):
+        a = canonical_digest({"x": 1, "cases": np.array([1, 2, 3]), "tags": {"b", "a"}})
+        b = canonical_digest({"tags": {"a", "b"}, "cases": [1, 2, 3], "x": 1})
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, canonical_digest({"x": 1, "cases": [1, 2, 4], "tags": ["a", "b"]}))
+
+        agent = CountingAgent(delay=0)
+        self.coordinator.register_agent(AgentType.EARLY_WARNING, object(), runner=agent)
+        self.storm(1, query={"cases": np.arange(5000)})
+        self.storm(1, query={"cases": np.arange(5000)})
+        self.assertEqual(agent.calls, 1)
+        # Arrays differing only in the middle are different queries
+        changed = np.arange(5000)
+        changed[2500] = -1
+        self.storm(1, query={"cases": changed})
+        self.assertEqual(agent.calls, 2)
+
+    def test_dict_keys_keep_their_type(self):
+        self.assertNotEqual(canonical_digest({1: 5}), canonical_digest({"1": 5}))
+        self.assertNotEqual(canonical_digest({1: 5}), canonical_digest({True: 5}))
+        self.assertEqual(canonical_digest({1: 5, "a": [{2: 3}]}), canonical_digest({"a": [{2: 3}], 1: 5}))
+
+    def test_mixed_and_tuple_keys_still_execute(self):
+        agent = CountingAgent(delay=0)
+        self.coordinator.register_agent(AgentType.EARLY_WARNING, object(), runner=agent)
+
+        async def run(query):
+            return await self.coordinator.execute_ensemble("cholera", query, 7)
+
+        mixed = asyncio.run(run({"cases": [10, 15], 1: 2}))
+        self.assertEqual(mixed.agent_results[0].status, AgentStatus.COMPLETED)
+        asyncio.run(run({"cases": [10, 15], 1: 2}))
+        self.assertEqual(agent.calls, 1)  # mixed keys are cacheable
+
+        tupled = asyncio.run(run({("a", "b"): 1}))
+        self.assertEqual(tupled.agent_results[0].status, AgentStatus.COMPLETED)
+        asyncio.run(run({("a", "b"): 1}))
+        self.assertEqual(agent.calls, 3)  # tuple keys are not
+
+    def test_uncacheable_queries_always_execute(self):
+        agent = CountingAgent(delay=0)
+        self.coordinator.register_agent(AgentType.EARLY_WARNING, object(), runner=agent)
+        query = {"feed": object()}
+        self.storm(1, query=query)
+        self.storm(1, query=query)
+        self.assertEqual(agent.calls, 2)
+
+    def test_opt_out_still_coalesces(self):
+        agent = CountingAgent()
+        self.coordinator.register_agent(AgentType.EARLY_WARNING, object(), runner=agent, cacheable=False)
+        self.storm(5)
+        self.assertEqual(agent.calls, 1)
+        self.storm(1)
+        self.assertEqual(agent.calls, 2)
+
+    def test_failures_are_not_cached(self):
+        agent = CountingAgent(delay=0, fail=True)
+        self.coordinator.register_agent(AgentType.EARLY_WARNING, object(), runner=agent)
+        self.storm(1)
+        prediction = self.storm(1)[0]
+        self.assertEqual(agent.calls, 2)
+        self.assertEqual(prediction.agent_results[0].status, AgentStatus.FAILED)
+
+    def test_ttl_expiry_and_bound(self):
+        now = [0.0]
+        cache = TTLResultCache(ttl_seconds=10, max_entries=2, clock=lambda: now[0])
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        now[0] = 10.0
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(len(cache), 1)
+
+    def test_cancelled_waiter_does_not_cancel_shared_run(self):
+        flights = SingleFlight()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.2)
+            return "done"
+
+        async def run():
+            first = asyncio.ensure_future(flights.do("k", work))
+            second = asyncio.ensure_future(flights.do("k", work))
+            await asyncio.sleep(0.05)
+            first.cancel()
+            return await second
+
+        self.assertEqual(asyncio.run(run()), ("done", True))
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(flights), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+Neural Memory Testing Suite
+Tests batch ID encoding, mini-batch training, batched recall and the
+memory-mapped weight file format used by the holographic store
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from neural_memory.memory_training import INPUT_BITS, encode_ids, forward, train_minibatch
+from neural_memory.weight_store import (
+    FORMAT_VERSION, MAGIC, WeightFileError, is_weight_file, load_weights, save_weights
+)
+
+
+def init_weights(rng, hidden_dim=64, embedding_dim=8):
+    return {
+        'W1': (rng.normal(size=(INPUT_BITS, hidden_dim)) * 0.01).astype(np.float32),
+        'b1': np.zeros(hidden_dim, dtype=np.float32),
+        'W2': (rng.normal(size=(hidden_dim, hidden_dim)) * 0.01).astype(np.float32),
+        'b2': np.zeros(hidden_dim, dtype=np.float32),
+        'W3': (rng.normal(size=(hidden_dim, embedding_dim)) * 0.01).astype(np.float32),
+        'b3': np.zeros(embedding_dim, dtype=np.float32)
+    }
+
+
+class TestEncoding(unittest.TestCase):
+    """Patient IDs map to stable 256-bit inputs"""
+
+    def test_shape_and_bits(self):
+        x = encode_ids(["PAT_1", "PAT_2", "PAT_1"])
+        self.assertEqual(x.shape, (3, INPUT_BITS))
+        self.assertEqual(x.dtype, np.float32)
+        self.assertTrue(np.isin(x, (0.0, 1.0)).all())
+        np.testing.assert_array_equal(x[0], x[2])
+        self.assertFalse(np.array_equal(x[0], x[1]))
+
+    def test_batch_matches_single(self):
+        ids = [f"PAT_{i}" for i in range(20)]
+        batch = encode_ids(ids)
+        for i, pid in enumerate(ids):
+            np.testing.assert_array_equal(batch[i], encode_ids([pid])[0])
+
+
+class TestTraining(unittest.TestCase):
+    """Mini-batch training stores records and recall reads them back"""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(3)
+        self.weights = init_weights(self.rng)
+        self.inputs = encode_ids([f"PAT_{i}" for i in range(100)])
+        self.targets = self.rng.uniform(0, 1, (100, 8)).astype(np.float32)
+
+    def test_batched_forward_matches_rows(self):
+        batch = forward(self.weights, self.inputs)
+        for i in range(0, 100, 17):
+            np.testing.assert_allclose(batch[i], forward(self.weights, self.inputs[i]), rtol=1e-5, atol=1e-6)
+
+    def test_loss_decreases_and_records_recall(self):
+        before = float(np.mean((forward(self.weights, self.inputs) - self.targets) ** 2))
+        result = train_minibatch(self.weights, self.inputs, self.targets, batch_size=32, seed=0)
+
+        self.assertLess(result["loss"], before / 10)
+        self.assertEqual(result["epochs"], len(result["losses"]))
+        recalled = forward(self.weights, self.inputs)
+        self.assertLess(float(np.abs(recalled - self.targets).max()), 0.25)
+
+    def test_stops_when_loss_plateaus(self):
+        result = train_minibatch(self.weights, self.inputs, self.targets, max_epochs=5000, seed=0)
+        self.assertTrue(result["converged"])
+        self.assertLess(result["epochs"], 5000)
+
+    def test_empty_batch(self):
+        before = {k: v.copy() for k, v in self.weights.items()}
+        result = train_minibatch(self.weights, self.inputs[:0], self.targets[:0])
+        self.assertEqual(result["epochs"], 0)
+        for k, v in before.items():
+            np.testing.assert_array_equal(self.weights[k], v)
+
+
+class TestWeightStore(unittest.TestCase):
+    """Weight files round-trip, map read-only and reject damaged files"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "network.akw")
+        self.weights = init_weights(np.random.default_rng(9), hidden_dim=33, embedding_dim=5)
+        self.info = {"embedding_dim": 5, "hidden_dim": 33, "metadata_store": {"PAT_1": {"location": "Dadaab"}}}
+        save_weights(self.path, self.weights, self.info)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        self.assertTrue(is_weight_file(self.path))
+        weights, info = load_weights(self.path)
+        self.assertEqual(info, self.info)
+        self.assertEqual(list(weights), list(self.weights))
+        for name, array in self.weights.items():
+            np.testing.assert_array_equal(weights[name], array)
+            self.assertEqual(weights[name].dtype, np.float32)
+
+    def test_mapped_layers_are_read_only_and_aligned(self):
+        weights, _ = load_weights(self.path)
+        for array in weights.values():
+            self.assertFalse(array.flags.writeable)
+            self.assertTrue(array.flags.c_contiguous)
+        with self.assertRaises(ValueError):
+            weights["W1"][0, 0] = 1.0
+
+        copies, _ = load_weights(self.path, mmap=False)
+        copies["W1"][0, 0] = 1.0
+
+    def test_save_replaces_atomically(self):
+        self.weights["b3"][:] = 7.0
+        save_weights(self.path, self.weights, self.info)
+        self.assertEqual(os.listdir(self.tmp.name), ["network.akw"])
+        weights, _ = load_weights(self.path)
+        np.testing.assert_array_equal(weights["b3"], 7.0)
+
+    def test_checksum_detects_corruption(self):
+        with open(self.path, "r+b") as f:
+            f.seek(-3, os.SEEK_END)
+            f.write(b"\xff")
+        with self.assertRaises(WeightFileError):
+            load_weights(self.path)
+        load_weights(self.path, verify=False)
+
+    def test_rejects_other_formats(self):
+        with open(self.path, "r+b") as f:
+            f.seek(len(MAGIC))
+            f.write(np.uint32(FORMAT_VERSION + 1).tobytes())
+        with self.assertRaises(WeightFileError):
+            load_weights(self.path)
+
+        other = os.path.join(self.tmp.name, "network.pkl")
+        with open(other, "wb") as f:
+            f.write(b"\x80\x04not a weight file")
+        self.assertFalse(is_weight_file(other))
+        with self.assertRaises(WeightFileError):
+            load_weights(other)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Profiling Spans Testing Suite
+Tests the profiling switch, decorated methods and block spans feeding
+MetricsTracker histograms, and collapsed-stack sampling
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from governance_kernel import profiling
+from governance_kernel.dspm_engine import DSPMEngine
+from governance_kernel.metrics import MetricsTracker
+
+
+class Worker:
+    @profiling.profiled()
+    def work(self, n):
+        return sum(range(n))
+
+    @profiling.profiled("worker.named")
+    def named(self):
+        return "ok"
+
+
+@profiling.profiled()
+def free_function(x):
+    return x + 1
+
+
+def busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+class TestProfilingSwitch(unittest.TestCase):
+    """Disabled spans are free; enabled spans reach the tracker"""
+
+    def tearDown(self):
+        profiling.disable()
+
+    def test_disabled_method_is_the_plain_function(self):
+        plain = Worker.__dict__["work"]
+        self.assertFalse(profiling.is_enabled())
+        self.assertEqual(plain.__name__, "work")
+        self.assertNotIsInstance(plain, profiling._Instrumented)
+        self.assertEqual(Worker().work(10), 45)
+
+        plain_function = globals()["free_function"]
+        self.assertFalse(hasattr(plain_function, "__wrapped__"))
+
+        profiling.enable(MetricsTracker())
+        self.assertIsNot(Worker.__dict__["work"], plain)
+        self.assertIs(globals()["free_function"].__wrapped__, plain_function)
+        profiling.disable()
+        self.assertIs(Worker.__dict__["work"], plain)
+        self.assertIs(globals()["free_function"], plain_function)
+
+    def test_enabled_spans_record_histograms(self):
+        tracker = MetricsTracker()
+        profiling.enable(tracker)
+        for _ in range(20):
+            Worker().work(1000)
+        Worker().named()
+        self.assertEqual(free_function(1), 2)
+        with profiling.span("block"):
+            time.sleep(0.002)
+
+        self.assertEqual(len(tracker.spans["Worker.work"]), 20)
+        self.assertEqual(len(tracker.spans["worker.named"]), 1)
+        self.assertEqual(len(tracker.spans["free_function"]), 1)
+        self.assertGreaterEqual(tracker.spans["block"].snapshot().max, 2.0)
+
+        summary = tracker.get_summary()["spans"]
+        self.assertEqual(summary["Worker.work"]["count"], 20)
+        self.assertIn('iluminara_span_duration_ms_count{span="block"} 1',
+                      tracker.export_prometheus_metrics().splitlines())
+
+        profiling.disable()
+        Worker().work(10)
+        free_function(1)
+        with profiling.span("block"):
+            pass
+        self.assertEqual(len(tracker.spans["Worker.work"]), 20)
+        self.assertEqual(len(tracker.spans["block"]), 1)
+
+    def test_exceptions_are_timed_and_propagate(self):
+        class Failing:
+            @profiling.profiled()
+            def fail(self):
+                raise ValueError("boom")
+
+        tracker = MetricsTracker()
+        profiling.enable(tracker)
+        with self.assertRaises(ValueError):
+            Failing().fail()
+        self.assertEqual(len(tracker.spans["TestProfilingSwitch.test_exceptions_are_timed_and_propagate.<locals>.Failing.fail"]), 1)
+
+    def test_hot_path_instrumented(self):
+        tracker = MetricsTracker()
+        profiling.enable(tracker)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "notes.txt"
+            path.write_text("contact: jane@example.org\n")
+            DSPMEngine(scan_paths=[tmp]).scan_file(path)
+        self.assertEqual(len(tracker.spans["DSPMEngine.scan_file"]), 1)
+
+
+class TestStackSampling(unittest.TestCase):
+    """Sampling mode produces collapsed stacks"""
+
+    def tearDown(self):
+        profiling.disable()
+
+    def test_collapsed_stacks(self):
+        stop = threading.Event()
+        worker = threading.Thread(target=busy_loop, args=(stop,), name="busy")
+        worker.start()
+        profiling.enable(MetricsTracker(), sample_interval=0.001)
+        time.sleep(0.1)
+        profiling.disable()
+        stop.set()
+        worker.join()
+
+        sampler = profiling.sampler()
+        self.assertGreater(sampler.samples, 0)
+        stacks = sampler.collapsed()
+        busy = [s for s in stacks if s.startswith("thread:busy;")]
+        self.assertTrue(busy)
+        self.assertTrue(any(s.endswith("test_profiling.py:busy_loop") for s in busy))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "profile.folded")
+            self.assertEqual(profiling.dump_collapsed(path), len(stacks))
+            with open(path) as f:
+                for line in f:
+                    stack, count = line.rsplit(" ", 1)
+                    self.assertEqual(stacks[stack], int(count))
+
+
+if __name__ == "__main__":
+    unittest.main()
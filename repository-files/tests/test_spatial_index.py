@@ -0,0 +1,146 @@
+"""
+Spatial Index Testing Suite
+Tests the grid and STR-tree backends against brute force and their use by
+the Omniverse Twin entity queries
+"""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from civilization_os.spatial_index import SPATIAL_BACKENDS, create_spatial_index
+from civilization_os.omniverse_twin import InfrastructureType, OmniverseTwin
+
+
+class TestSpatialIndexBackends(unittest.TestCase):
+    """Every backend must match a brute-force scan, including after updates"""
+
+    def setUp(self):
+        self.rng = np.random.default_rng(5)
+        n = 2000
+        self.points = {
+            f"e{i}": (x, y)
+            for i, (x, y) in enumerate(zip(self.rng.uniform(0, 10, n), self.rng.normal(5, 2, n)))
+        }
+
+    def mutate(self, index):
+        """Interleave moves, removals and inserts past the repack threshold"""
+        keys = list(self.points)
+        for i in self.rng.choice(len(keys), 300, replace=False):
+            key = keys[i]
+            if i % 2:
+                index.remove(key)
+                del self.points[key]
+            else:
+                self.points[key] = tuple(self.rng.uniform(-2, 12, 2))
+                index.move(key, *self.points[key])
+        for i in range(100):
+            self.points[f"new{i}"] = tuple(self.rng.uniform(0, 10, 2))
+            index.insert(f"new{i}", *self.points[f"new{i}"])
+
+    def assert_matches_brute_force(self, index):
+        keys = list(self.points)
+        coords = np.array([self.points[k] for k in keys])
+        for _ in range(100):
+            x, y = self.rng.uniform(-1, 11, 2)
+            r = self.rng.uniform(0, 2.5)
+            dist = np.hypot(coords[:, 0] - x, coords[:, 1] - y)
+
+            expected = {keys[i] for i in np.nonzero(dist <= r)[0]}
+            self.assertEqual(set(index.query_radius(x, y, r)), expected)
+
+            inside = ((coords[:, 0] >= x) & (coords[:, 0] <= x + r)
+                      & (coords[:, 1] >= y - r) & (coords[:, 1] <= y))
+            self.assertEqual(set(index.query_bbox(x, y - r, x + r, y)), {keys[i] for i in np.nonzero(inside)[0]})
+
+            k = int(self.rng.integers(1, 12))
+            nearest = index.nearest(x, y, k)
+            np.testing.assert_allclose([d for _, d in nearest], np.sort(dist)[:k])
+
+    def test_bulk_loaded(self):
+        for backend in SPATIAL_BACKENDS:
+            with self.subTest(backend=backend):
+                index = create_spatial_index(backend)
+                index.bulk_load(self.points, *zip(*self.points.values()))
+                self.assert_matches_brute_force(index)
+
+    def test_incremental_updates(self):
+        for backend in SPATIAL_BACKENDS:
+            with self.subTest(backend=backend):
+                self.setUp()
+                index = create_spatial_index(backend, min_rebuild=64)
+                for key, (x, y) in self.points.items():
+                    index.insert(key, x, y)
+                self.mutate(index)
+                self.assertEqual(len(index), len(self.points))
+                self.assert_matches_brute_force(index)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            create_spatial_index("quadtree")
+
+
+class TestOmniverseTwinQueries(unittest.TestCase):
+    """Twin entity queries keep the original distance and bounds semantics"""
+
+    def setUp(self):
+        self.twin = OmniverseTwin(
+            city_name="Test City",
+            population=10000,
+            geographic_bounds={"lat": (0.0, 0.1), "lng": (40.2, 40.4)}
+        )
+        rng = np.random.default_rng(2)
+        types = [InfrastructureType.HEALTH_FACILITY, InfrastructureType.WATER_SYSTEM]
+        for i in range(300):
+            self.twin.register_entity(
+                entity_id=f"E{i}",
+                entity_type=types[i % 2],
+                location=(rng.uniform(0.0, 0.1), rng.uniform(40.2, 40.4), 0.0),
+                capacity=10
+            )
+
+    def brute_force_radius(self, center, radius_km, entity_type=None):
+        return {
+            e.entity_id for e in self.twin.entities.values()
+            if (entity_type is None or e.entity_type == entity_type)
+            and self.twin._calculate_distance(center, e.location[:2]) <= radius_km
+        }
+
+    def test_radius_by_type(self):
+        for entity_type in (None, InfrastructureType.HEALTH_FACILITY):
+            found = self.twin._find_entities_in_radius((0.05, 40.3), 5.0, entity_type)
+            self.assertEqual({e.entity_id for e in found}, self.brute_force_radius((0.05, 40.3), 5.0, entity_type))
+
+    def test_bounds(self):
+        bounds = {"lat": (0.02, 0.06), "lng": (40.25, 40.3)}
+        found = {e.entity_id for e in self.twin._find_entities_in_bounds(bounds)}
+        expected = {
+            e.entity_id for e in self.twin.entities.values()
+            if 0.02 <= e.location[0] <= 0.06 and 40.25 <= e.location[1] <= 40.3
+        }
+        self.assertEqual(found, expected)
+
+    def test_move_remove_and_retype(self):
+        self.twin.move_entity("E0", (0.0501, 40.3001, 0.0))
+        self.twin.remove_entity("E2")
+        self.twin.register_entity("E4", InfrastructureType.WATER_SYSTEM, (0.05, 40.3, 0.0), 10)
+
+        nearest, distance = self.twin._find_nearest_entities((0.05, 40.3), k=1)[0]
+        self.assertEqual(nearest.entity_id, "E4")
+        self.assertAlmostEqual(distance, 0.0)
+
+        health = self.brute_force_radius((0.05, 40.3), 50.0, InfrastructureType.HEALTH_FACILITY)
+        self.assertIn("E0", health)
+        self.assertNotIn("E2", health)
+        self.assertNotIn("E4", health)
+        found = self.twin._find_entities_in_radius((0.05, 40.3), 50.0, InfrastructureType.HEALTH_FACILITY)
+        self.assertEqual({e.entity_id for e in found}, health)
+
+
+if __name__ == '__main__':
+    unittest.main()
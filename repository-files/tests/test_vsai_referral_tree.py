@@ -0,0 +1,208 @@
+"""
+VSAI Referral Tree Testing Suite
+Tests the columnar node table, status bitmaps, memoized chain verification
+and batched generation growth used by ViralSymbioticAPIInfusion.propagate_api
+"""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from edge_node.vsai.referral_tree import (
+    MAX_CHAIN_LENGTH, NODE_TYPES, NodeBitmap, NodeTable, generate_referral_hash, grow_generation
+)
+
+
+class LinearPredictor:
+    """Deterministic stand-in for the virality regressor: K grows with trust"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def predict(self, feats):
+        self.calls += 1
+        return feats[:, 3]
+
+
+def seeded_table(count=50, key=1234):
+    table = NodeTable(capacity=8, key=key)
+    code = table.location_code("Dadaab")
+    table.append(np.full(count, -1), NODE_TYPES.index('SMARTPHONE'), np.linspace(0.8, 1.0, count), code,
+                 data_balance=100.0)
+    return table
+
+
+class TestNodeTable(unittest.TestCase):
+    """IDs, parent pointers and NodeVector snapshots"""
+
+    def test_ids_round_trip_and_are_unique(self):
+        table = seeded_table(5000)
+        ids = table.ids(np.arange(len(table)))
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertTrue(all(len(i) == 8 for i in ids))
+        for index in (0, 1, 4999):
+            self.assertEqual(table.index_of(ids[index]), index)
+        self.assertIsNone(table.index_of("+254700000000"))
+        self.assertIsNone(table.index_of("zzzzzzzz"))
+        self.assertNotIn("+254700000000", table)
+        self.assertNotEqual(table.ids([0]), NodeTable(key=4321).ids([0]))
+
+    def test_chain_follows_parent_pointers(self):
+        table = seeded_table(2)
+        a = table.append([0], 1, [0.7], 0)[0]
+        b = table.append([a], 1, [0.6], 0)[0]
+        c = table.append([b], 1, [0.5], 0)[0]
+
+        self.assertEqual(list(table.column('depth')), [0, 0, 1, 2, 3])
+        self.assertEqual(table.ancestors(c), [0, a, b])
+        chain = table.referral_chain(c)
+        self.assertEqual(len(chain), 3)
+        self.assertEqual(chain[-1], generate_referral_hash(
+            table.node_id(b), table.node_id(c), timestamp=float(table.column('created_at')[c])
+        ))
+        self.assertEqual(chain[:2], table.referral_chain(b))
+        self.assertEqual(table.referral_chain(0), [])
+
+    def test_mapping_snapshot(self):
+        table = seeded_table(3)
+        node_id = table.node_id(1)
+        node = table[node_id]
+        self.assertEqual(node.id, node_id)
+        self.assertEqual(node.type, 'SMARTPHONE')
+        self.assertEqual(node.location, 'Dadaab')
+        self.assertAlmostEqual(node.trust_score, 0.9, places=6)
+        self.assertEqual(table.get("nope"), None)
+        self.assertEqual(list(table), table.ids(np.arange(3)))
+
+
+class TestNodeBitmap(unittest.TestCase):
+    """Packed status bits agree with a boolean array"""
+
+    def test_matches_boolean_mask(self):
+        rng = np.random.default_rng(2)
+        bitmap = NodeBitmap(capacity=4)
+        expected = np.zeros(0, dtype=bool)
+        for size in (3, 17, 1000, 5003):
+            bitmap.resize(size)
+            expected = np.concatenate([expected, np.zeros(size - len(expected), dtype=bool)])
+            on = rng.integers(0, size, size // 2)
+            off = rng.integers(0, size, size // 5)
+            bitmap.set(on)
+            bitmap.set(off, False)
+            expected[on] = True
+            expected[off] = False
+            np.testing.assert_array_equal(bitmap.to_mask(), expected)
+            np.testing.assert_array_equal(bitmap.indices(), np.flatnonzero(expected))
+            self.assertEqual(bitmap.count(), expected.sum())
+        probe = rng.integers(0, 5003, 100)
+        np.testing.assert_array_equal(bitmap[probe], expected[probe])
+        self.assertEqual(bitmap.nbytes, (5003 + 7) // 8)
+
+    def test_and(self):
+        a, b = NodeBitmap(), NodeBitmap()
+        a.resize(20)
+        b.resize(20)
+        a.set([1, 2, 3, 19])
+        b.set([2, 3, 4, 19])
+        self.assertEqual(list((a & b).indices()), [2, 3, 19])
+
+
+class TestChainVerification(unittest.TestCase):
+    """Memoized verification over parent pointers"""
+
+    def setUp(self):
+        self.table = seeded_table(20)
+        rng = np.random.default_rng(4)
+        for _ in range(4):
+            grow_generation(self.table, np.arange(len(self.table)), LinearPredictor(), 3, 0.5, rng)
+
+    def test_grown_tree_is_valid_and_memoized(self):
+        self.assertTrue(self.table.verify_chains().all())
+        self.assertEqual(self.table._chain_checked.count(), len(self.table))
+
+    def test_detects_tampered_links(self):
+        table = self.table
+        parent = table.column('parent')
+        child = int(np.flatnonzero(table.column('depth') == 1)[0])
+        descendants = np.flatnonzero(parent == child)
+        self.assertTrue(len(descendants))
+
+        # Point a node at a later node (a would-be cycle) and re-verify
+        parent[child] = len(table) - 1
+        table.reset_verification()
+        valid = table.verify_chains()
+        self.assertFalse(valid[child])
+        self.assertFalse(valid[descendants].any())
+        self.assertEqual(int((~valid).sum()), self._subtree_size(child))
+
+        # Spreaders with broken chains do not invite
+        before = len(table)
+        grow_generation(table, descendants, LinearPredictor(), 3, 0.5, np.random.default_rng(0))
+        self.assertEqual(len(table), before)
+
+    def _subtree_size(self, root):
+        parent = self.table.column('parent')
+        members = {root}
+        for i in range(root + 1, len(self.table)):
+            if parent[i] in members:
+                members.add(i)
+        return len(members)
+
+
+class TestGrowGeneration(unittest.TestCase):
+    """A generation is one model call and consistent bookkeeping"""
+
+    def test_children_and_referral_counts(self):
+        table = seeded_table(200)
+        predictor = LinearPredictor()
+        rng = np.random.default_rng(0)
+        children = grow_generation(table, np.arange(200), predictor, 5, 0.5, rng)
+
+        self.assertEqual(predictor.calls, 1)
+        parents = table.column('parent')[children]
+        counts = np.bincount(parents, minlength=200)
+        np.testing.assert_array_equal(counts, table.column('total_referrals')[:200])
+        np.testing.assert_allclose(table.column('airtime')[:200], counts * 0.5)
+        # trust in [0.8, 1.0] -> K in [4, 5)
+        self.assertTrue(set(np.unique(counts)) <= {4, 5})
+        self.assertTrue((table.column('trust')[children] < table.column('trust')[parents]).all())
+        self.assertTrue((table.column('depth')[children] == 1).all())
+        self.assertTrue(np.isin(table.column('type')[children], [0, 1]).all())
+
+    def test_chain_length_is_capped(self):
+        table = seeded_table(1, key=7)
+        rng = np.random.default_rng(1)
+        for _ in range(MAX_CHAIN_LENGTH + 3):
+            # Keep the deepest node a strong spreader so every step extends the chain
+            deepest = int(np.argmax(table.column('depth')))
+            table.column('trust')[deepest] = 1.0
+            grow_generation(table, [deepest], LinearPredictor(), 3, 0.5, rng)
+        self.assertEqual(int(table.column('depth').max()), MAX_CHAIN_LENGTH)
+
+    def test_empty_frontier(self):
+        table = seeded_table(3)
+        predictor = LinearPredictor()
+        children = grow_generation(table, [], predictor, 5, 0.5, np.random.default_rng(0))
+        self.assertEqual(len(children), 0)
+        self.assertEqual(predictor.calls, 0)
+
+
+class TestViralEngineExports(unittest.TestCase):
+    """Names moved to referral_tree stay importable from viral_engine"""
+
+    def test_reexports(self):
+        from edge_node.vsai import referral_tree, viral_engine
+
+        for name in viral_engine.__all__:
+            self.assertTrue(hasattr(viral_engine, name), name)
+        self.assertIs(viral_engine.generate_referral_hash, referral_tree.generate_referral_hash)
+        self.assertIs(viral_engine.NodeVector, referral_tree.NodeVector)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+VSAI SIR Simulation Testing Suite
+Tests batched SIR integration against single-system odeint runs and the
+trajectory cache used by ViralSymbioticAPIInfusion.simulate_infusion
+"""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+from scipy.integrate import odeint
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from edge_node.vsai.sir_simulation import SIRSimulationService, sir_fingerprint, solve_sir_batch
+
+N = 14_000_000
+I0 = 5000
+
+
+def reference(beta, gamma, days=60):
+    """Previous single-system path"""
+    def derivatives(y, t):
+        S, I, R = y
+        return -beta * S * I / N, beta * S * I / N - gamma * I, gamma * I
+    t = np.linspace(0, days, days)
+    return odeint(derivatives, (N - I0, I0, 0), t).T
+
+
+class TestBatchedSolver(unittest.TestCase):
+    """Stacked systems match independent solves"""
+
+    def test_matches_single_runs(self):
+        gammas = np.array([1 / 3, 1 / 5, 1 / 9, 0.5])
+        betas = np.array([1.2, 1.8, 2.5, 0.8]) * gammas
+        t, S, I, R = solve_sir_batch(N, I0, 0, 60, betas, gammas)
+        self.assertEqual(S.shape, (4, 60))
+        for j in range(4):
+            S_ref, I_ref, R_ref = reference(betas[j], gammas[j])
+            np.testing.assert_allclose(S[j], S_ref, rtol=1e-6, atol=1.0)
+            np.testing.assert_allclose(I[j], I_ref, rtol=1e-6, atol=1.0)
+            np.testing.assert_allclose(R[j], R_ref, rtol=1e-6, atol=1.0)
+        np.testing.assert_allclose(S + I + R, N, rtol=1e-9)
+
+
+class TestSimulationService(unittest.TestCase):
+    """Fingerprint cache and grid sweeps"""
+
+    def test_fingerprint(self):
+        a = sir_fingerprint(N, I0, 0, 60, 0.5, 0.2)
+        self.assertEqual(a, sir_fingerprint(float(N), I0, 0.0, 60, 0.5, 0.2))
+        self.assertNotEqual(a, sir_fingerprint(N, I0, 0, 60, 0.5, 0.2 + 1e-12))
+        self.assertNotEqual(a, sir_fingerprint(N, I0, 0, 61, 0.5, 0.2))
+
+    def test_repeated_requests_hit_cache(self):
+        service = SIRSimulationService()
+        first = service.simulate(N, I0, 0, 60, 0.5, 0.2)
+        second = service.simulate(N, I0, 0, 60, 0.5, 0.2)
+        self.assertIs(first, second)
+        self.assertEqual((service.hits, service.misses, service.solver_calls), (1, 1, 1))
+        with self.assertRaises(ValueError):
+            first[2][0] = 0.0
+
+    def test_sweep_solves_missing_pairs_once(self):
+        service = SIRSimulationService()
+        service.simulate(N, I0, 0, 60, 0.4, 0.2)
+        betas, gammas = [0.2, 0.4, 0.6], [0.2, 0.25]
+        grid = service.sweep(N, I0, 0, 60, betas, gammas)
+
+        self.assertEqual(grid["I"].shape, (3, 2, 60))
+        self.assertEqual(service.solver_calls, 2)
+        self.assertEqual(service.hits, 1)
+        np.testing.assert_allclose(grid["R"][2, 1], reference(0.6, 0.25)[2], rtol=1e-6, atol=1.0)
+
+        service.sweep(N, I0, 0, 60, betas, gammas)
+        self.assertEqual(service.solver_calls, 2)
+
+    def test_duplicates_and_eviction(self):
+        service = SIRSimulationService(max_entries=2)
+        results = service.simulate_many(N, I0, 0, 30, [0.3, 0.3, 0.5], [0.2, 0.2, 0.2])
+        self.assertIs(results[0], results[1])
+        self.assertEqual(service.solver_calls, 1)
+
+        service.simulate(N, I0, 0, 30, 0.7, 0.2)
+        service.simulate(N, I0, 0, 30, 0.3, 0.2)
+        self.assertEqual(service.solver_calls, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
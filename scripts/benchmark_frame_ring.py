@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Frame Ring Benchmark
+Measures ultrasound operator throughput and per-frame allocations with the
+shared-memory frame ring against the copying array path, optionally with
+frames written by a separate sensor process.
+
+Usage:
+    python scripts/benchmark_frame_ring.py --height 480 --width 640 --frames 500 --producer-process
+"""
+
+import argparse
+import logging
+import multiprocessing as mp
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from kinetic_sensory.frame_ring import FrameRing
+from kinetic_sensory.holoscan_pipeline import HoloscanPipeline
+
+
+def legacy_process(frame: np.ndarray) -> np.ndarray:
+    """Previous operator chain: astype + divide, then a copy for the overlay"""
+    formatted = frame.astype(np.float32) / 255.0
+    segmentation = np.random.rand(*frame.shape[:2])
+    overlay = formatted.copy()
+    overlay[segmentation > 0.5] = [1.0, 0.0, 0.0]
+    return overlay
+
+
+def measure(step, frames: int, warmup: int = 20):
+    """Frames/s, peak transient bytes per frame and net allocated blocks per frame"""
+    for _ in range(warmup):
+        step()
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        step()
+    fps = frames / (time.perf_counter() - start)
+
+    tracemalloc.start()
+    peaks = []
+    blocks = sys.getallocatedblocks()
+    for _ in range(frames):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        step()
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    net_blocks = (sys.getallocatedblocks() - blocks) / frames
+    tracemalloc.stop()
+    return fps, float(np.median(peaks)), net_blocks
+
+
+def producer(spec, frames: int, seed: int):
+    """Sensor process: writes frames straight into ring slots"""
+    ring = FrameRing.attach(spec)
+    rng = np.random.default_rng(seed)
+    source = rng.integers(0, 256, size=(4,) + ring.fields["raw"][0], dtype=np.uint8)
+    sent = 0
+    while sent < frames:
+        slot = ring.acquire()
+        if slot < 0:
+            time.sleep(0)
+            continue
+        np.copyto(ring.view(slot, "raw"), source[sent % 4])
+        ring.publish(time.time())
+        sent += 1
+    ring.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frame ring benchmark")
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--channels", type=int, default=3)
+    parser.add_argument("--slots", type=int, default=8)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--producer-process", action="store_true",
+                        help="also time frames handed over from a separate process")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    shape = (args.height, args.width, args.channels)
+    frame_bytes = int(np.prod(shape))
+    rng = np.random.default_rng(args.seed)
+    frame = rng.integers(0, 256, size=shape, dtype=np.uint8)
+    print(f"Frame {shape} ({frame_bytes / 1e6:.2f} MB raw), {args.frames} frames")
+
+    fps, peak, blocks = measure(lambda: legacy_process(frame), args.frames)
+    print(f"Copying operators:  {fps:8.1f} frames/s  "
+          f"{peak / 1e6:7.2f} MB transient/frame  {blocks:6.2f} net blocks/frame")
+
+    pipeline = HoloscanPipeline()
+    ring = pipeline.create_frame_ring(shape, slots=args.slots)
+
+    def ring_step():
+        # Sensor copies the frame into a slot; operators then run in place
+        slot = ring.write("raw", frame)
+        pipeline.process_ultrasound_slot(slot)
+        ring.release()
+
+    def slot_step():
+        # Frame already resident in shared memory (written by the sensor)
+        pipeline.process_ultrasound_slot(3 % args.slots)
+
+    fps, peak, blocks = measure(ring_step, args.frames)
+    print(f"Ring (ingest+ops):  {fps:8.1f} frames/s  "
+          f"{peak / 1e6:7.2f} MB transient/frame  {blocks:6.2f} net blocks/frame ({peak:.0f} B)")
+    fps, peak, blocks = measure(slot_step, args.frames)
+    print(f"Ring (ops only):    {fps:8.1f} frames/s  "
+          f"{peak / 1e6:7.2f} MB transient/frame  {blocks:6.2f} net blocks/frame ({peak:.0f} B)")
+
+    if args.producer_process:
+        proc = mp.Process(target=producer, args=(ring.spec, args.frames + 1, args.seed))
+        proc.start()
+        done, start = -1, None
+        while done < args.frames:
+            slot = ring.next_ready()
+            if slot < 0:
+                time.sleep(0)
+                continue
+            if start is None:
+                start = time.perf_counter()  # clock starts at the first frame
+            pipeline.process_ultrasound_slot(slot)
+            ring.release()
+            done += 1
+        elapsed = time.perf_counter() - start
+        proc.join()
+        print(f"Cross-process:      {args.frames / elapsed:8.1f} frames/s (sensor process writing into slots)")
+
+    pipeline.close()
+
+
+if __name__ == "__main__":
+    main()
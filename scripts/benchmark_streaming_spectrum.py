@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Streaming Spectrum Benchmark
+CPU time per second of audio for continuous acoustic monitoring at several
+call cadences. The old path re-ran a full FFT over the monitoring buffer
+(the last second of audio) on every call. The streaming STFT only
+transforms the windows each chunk completes.
+
+Usage:
+    python scripts/benchmark_streaming_spectrum.py --seconds 60 --sample-rate 16000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from kinetic_sensory.holoscan_pipeline import HoloscanPipeline
+from kinetic_sensory.streaming_spectrum import StreamingSpectrum
+
+
+def legacy_monitor(audio: np.ndarray, chunk: int, buffer_len: int) -> None:
+    """Full FFT of the rolling monitoring buffer on every call"""
+    for end in range(chunk, len(audio) + 1, chunk):
+        window = audio[max(0, end - buffer_len):end]
+        spectrum = np.fft.fft(window)
+        np.fft.fftfreq(len(window))
+        np.max(np.abs(spectrum))
+
+
+def streaming_monitor(audio: np.ndarray, chunk: int, sample_rate: float) -> StreamingSpectrum:
+    analyzer = StreamingSpectrum(sample_rate=sample_rate)
+    for start in range(0, len(audio), chunk):
+        analyzer.push(audio[start:start + chunk])
+    return analyzer
+
+
+def cpu_ms_per_audio_second(fn, seconds: float) -> float:
+    start = time.process_time()
+    fn()
+    return (time.process_time() - start) * 1000.0 / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming spectrum benchmark")
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--sample-rate", type=float, default=16000.0)
+    parser.add_argument("--seed", type=int, default=2)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    rate = int(args.sample_rate)
+    audio = np.random.default_rng(args.seed).normal(size=int(args.seconds * rate))
+    print(f"{args.seconds:.0f} s of audio at {rate} Hz (window 1024, hop 512)")
+    print(f"{'chunk':>12s} {'calls/s':>8s} {'full FFT':>14s} {'streaming':>14s}")
+
+    for chunk_ms in (10, 50, 250, 1000):
+        chunk = rate * chunk_ms // 1000
+        legacy = cpu_ms_per_audio_second(lambda: legacy_monitor(audio, chunk, rate), args.seconds)
+        streaming = cpu_ms_per_audio_second(lambda: streaming_monitor(audio, chunk, rate), args.seconds)
+        print(f"{chunk_ms:9d} ms {1000 // chunk_ms:8d} {legacy:10.2f} ms/s {streaming:10.2f} ms/s")
+
+    # End to end through the pipeline entry point
+    pipeline = HoloscanPipeline()
+    chunk = rate // 50
+    start = time.process_time()
+    for i in range(0, len(audio), chunk):
+        pipeline.process_acoustic_monitoring("acoustic_01", audio[i:i + chunk], sample_rate=rate)
+    per_second = (time.process_time() - start) * 1000.0 / args.seconds
+    print(f"\nprocess_acoustic_monitoring, 20 ms chunks: {per_second:.2f} ms CPU per second of audio")
+
+
+if __name__ == "__main__":
+    main()
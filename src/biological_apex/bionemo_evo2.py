@@ -13,6 +13,12 @@ import numpy as np
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from biological_apex.inference_batching import (
+    InferenceBatcher,
+    ModelBackend,
+    PATHOGEN_CHARACTERIZATION,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,7 +34,8 @@ class BioNeMoEvo2Engine:
         self,
         model_path: str = "bionemo-evo2-9t",
         device: str = "cuda",
-        precision: str = "fp8"
+        precision: str = "fp8",
+        batcher: Optional[InferenceBatcher] = None
     ):
         """
         Initialize BioNeMo Evo 2 engine.
@@ -37,11 +44,14 @@ class BioNeMoEvo2Engine:
             model_path: Path to BioNeMo Evo 2 model weights
             device: Compute device (cuda/cpu)
             precision: Inference precision (fp8/fp16/fp32)
+            batcher: Shared inference batcher; characterization requests go
+                through it instead of one model call per sequence
         """
         self.model_path = model_path
         self.device = device
         self.precision = precision
         self.model = None
+        self.batcher = batcher
         
         logger.info(f"Initializing BioNeMo Evo 2 on {device} with {precision} precision")
         
@@ -87,18 +97,62 @@ class BioNeMoEvo2Engine:
         Returns:
             Dictionary containing pathogen characteristics
         """
-        if self.model is None:
-            self.load_model()
+        logger.debug(f"Characterizing {sequence_type} sequence of length {len(sequence)}")
+        
+        if self.batcher is not None:
+            # Zero-shot inference, batched with concurrent callers
+            characteristics = self.batcher.infer(
+                PATHOGEN_CHARACTERIZATION, sequence, sequence_type=sequence_type
+            )
+        else:
+            if self.model is None:
+                self.load_model()
+            # Zero-shot inference
+            characteristics = self.model.predict(
+                sequence=sequence,
+                task="pathogen_characterization",
+                sequence_type=sequence_type
+            )
+        
+        return self._format_characteristics(characteristics)
+    
+    def characterize_pathogens(
+        self,
+        sequences: List[str],
+        sequence_type: str = "dna"
+    ) -> List[Dict]:
+        """
+        Characterize many sequences in batched model calls.
+        
+        Args:
+            sequences: Nucleotide or protein sequences
+            sequence_type: Type of sequence (dna/rna/protein)
             
-        logger.info(f"Characterizing {sequence_type} sequence of length {len(sequence)}")
+        Returns:
+            One characteristics dictionary per sequence, in input order
+        """
+        if not sequences:
+            return []
         
-        # Zero-shot inference
-        characteristics = self.model.predict(
-            sequence=sequence,
-            task="pathogen_characterization",
-            sequence_type=sequence_type
-        )
+        logger.info(f"Characterizing {len(sequences)} {sequence_type} sequences")
         
+        if self.batcher is not None:
+            # Shared queue: batched with concurrent callers' requests
+            results = self.batcher.infer_many(
+                PATHOGEN_CHARACTERIZATION, sequences, sequence_type=sequence_type
+            )
+        else:
+            if self.model is None:
+                self.load_model()
+            # The caller's list is already a batch: one direct backend call
+            results = ModelBackend(self.model).infer(
+                PATHOGEN_CHARACTERIZATION, sequences, sequence_type=sequence_type
+            )
+        
+        return [self._format_characteristics(c) for c in results]
+    
+    def _format_characteristics(self, characteristics: Dict) -> Dict:
+        """Map raw model output to the characterization schema."""
         return {
             "pathogen_type": characteristics.get("type"),
             "virulence_factors": characteristics.get("virulence"),
@@ -326,14 +380,13 @@ class PathogenSurveillance:
         """
         logger.info(f"Analyzing wastewater sample {sample_id}")
         
-        # Characterize each sequence
-        pathogens = []
-        for seq in sequences:
-            if len(seq) > 100:  # Filter short reads
-                characteristics = self.engine.characterize_pathogen(seq)
-                
-                if characteristics["confidence"] > 0.8:
-                    pathogens.append(characteristics)
+        # Characterize reads in batched model calls
+        reads = [seq for seq in sequences if len(seq) > 100]  # Filter short reads
+        pathogens = [
+            characteristics
+            for characteristics in self.engine.characterize_pathogens(reads)
+            if characteristics["confidence"] > 0.8
+        ]
         
         # Identify novel pathogens
         novel_pathogens = [
@@ -0,0 +1,228 @@
+"""
+Batched Inference Queue
+Stack 1: Biological Apex - Request batching for Evo 2 model backends
+
+A foundation-model forward pass costs about the same for one sequence as for
+a few dozen (kernel launch, host/device transfer and TensorRT scheduling
+dominate), so per-read calls leave the accelerator idle. Callers submit
+single requests; a collector thread gathers whatever arrives within a short
+window or until the batch is full, runs one backend call per task and
+option set, and hands each caller its own result.
+
+The backend is anything with `infer(task, inputs, **options) -> outputs`
+(one output per input, same order). `MockEvo2Backend` is a deterministic CPU stand-in
+with a fixed per-call cost, for tests and benchmarks without BioNeMo.
+"""
+
+import hashlib
+import logging
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from governance_kernel.micro_batching import BatchSlot, MicroBatcher
+except ImportError:
+    # The collector lives in the governance kernel: import it from repository-files
+    sys.path.append(os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "repository-files"
+    ))
+    from governance_kernel.micro_batching import BatchSlot, MicroBatcher
+
+logger = logging.getLogger(__name__)
+
+PATHOGEN_CHARACTERIZATION = "pathogen_characterization"
+STRUCTURE_PREDICTION = "structure_prediction"
+DOCKING = "docking"
+
+PATHOGEN_TYPES = [
+    "coronavirus", "influenza_a", "vibrio_cholerae", "salmonella_enterica",
+    "mycobacterium_tuberculosis", "poliovirus", "norovirus", "unknown"
+]
+
+
+class InferenceBatcher(MicroBatcher):
+    """
+    Size- and time-bounded batching front end for a model backend.
+
+    Requests are grouped by task and by their keyword options (e.g.
+    `sequence_type`): one backend call per group, so requests with different
+    options never share a call.
+    """
+
+    def __init__(
+        self,
+        backend: Any,
+        max_batch: int = 32,
+        window_ms: float = 5.0
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            backend: Object with `infer(task, inputs, **options) -> outputs`
+            max_batch: Maximum requests per collected batch
+            window_ms: How long the collector waits for more requests
+        """
+        super().__init__(max_batch, window_ms, thread_name="evo2-inference-batcher")
+        self.backend = backend
+        self.backend_calls = 0
+
+    def submit(self, task: str, payload: Any, **options: Hashable) -> BatchSlot:
+        """Queue one request; call `.wait()` on the returned slot for its result"""
+        return super().submit(payload, key=(task, tuple(sorted(options.items()))))
+
+    def infer(self, task: str, payload: Any, **options: Hashable) -> Any:
+        """Run one request, batched with concurrent callers"""
+        return self.submit(task, payload, **options).wait()
+
+    def infer_many(self, task: str, payloads: Iterable[Any], **options: Hashable) -> List[Any]:
+        """Queue a caller-side list at once and collect results in order"""
+        slots = [self.submit(task, p, **options) for p in payloads]
+        return [slot.wait() for slot in slots]
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.requests / self.backend_calls if self.backend_calls else 0.0
+
+    def process(self, batch: List[BatchSlot]):
+        # One backend call per (task, options), results demultiplexed in order
+        groups: Dict[Tuple, List[BatchSlot]] = defaultdict(list)
+        for slot in batch:
+            groups[slot.key].append(slot)
+        for (task, options), slots in groups.items():
+            try:
+                outputs = self.backend.infer(task, [s.payload for s in slots], **dict(options))
+                if len(outputs) != len(slots):
+                    raise RuntimeError(f"Backend returned {len(outputs)} results for {len(slots)} {task} requests")
+                for slot, output in zip(slots, outputs):
+                    slot.result = output
+            except Exception as e:
+                logger.error(f"Batched {task} inference failed: {e}")
+                for slot in slots:
+                    slot.error = e
+            self.backend_calls += 1
+
+
+def encode_sequences(sequences: Sequence[str], max_len: Optional[int] = None) -> np.ndarray:
+    """Pack sequences into a zero-padded (n, max_len) uint8 matrix"""
+    lengths = np.fromiter((len(s) for s in sequences), dtype=np.int64, count=len(sequences))
+    width = int(lengths.max()) if len(lengths) else 0
+    if max_len is not None:
+        width = min(width, max_len)
+    out = np.zeros((len(sequences), width), dtype=np.uint8)
+    for i, seq in enumerate(sequences):
+        row = np.frombuffer(seq.encode("ascii", "replace")[:width], dtype=np.uint8)
+        out[i, :len(row)] = row
+    return out
+
+
+class MockEvo2Backend:
+    """
+    Deterministic CPU stand-in for the Evo 2 / AlphaFold / DiffDock backends.
+
+    Each `infer` call pays a fixed dispatch cost (standing in for kernel
+    launch and host/device transfer) plus vectorized per-sequence work over
+    the whole batch, like a real batched forward pass.
+
+    Args:
+        call_overhead_ms: Fixed cost per backend call
+        max_len: Sequence positions read per request
+    """
+
+    def __init__(self, call_overhead_ms: float = 5.0, max_len: int = 4096):
+        self.call_overhead = call_overhead_ms / 1000.0
+        self.max_len = max_len
+        self.calls = 0
+        self.items = 0
+
+    def infer(self, task: str, inputs: List[Any], **options: Any) -> List[Dict]:
+        self.calls += 1
+        self.items += len(inputs)
+        if self.call_overhead:
+            time.sleep(self.call_overhead)
+
+        if task == PATHOGEN_CHARACTERIZATION:
+            return self._characterize(inputs)
+        if task == STRUCTURE_PREDICTION:
+            return self._structures(inputs)
+        if task == DOCKING:
+            return self._docking(inputs)
+        raise ValueError(f"Unknown task: {task}")
+
+    def _features(self, sequences: Sequence[str]) -> np.ndarray:
+        """(n, 4) composition features in [0, 1]: GC, purine, entropy proxy, hash"""
+        codes = encode_sequences(sequences, self.max_len)
+        valid = codes > 0
+        length = np.maximum(valid.sum(axis=1), 1)
+        gc = ((codes == ord("G")) | (codes == ord("C"))).sum(axis=1) / length
+        purine = ((codes == ord("A")) | (codes == ord("G"))).sum(axis=1) / length
+        # Rolling dinucleotide hash: a cheap sequence signature
+        pairs = codes[:, :-1].astype(np.uint32) * 31 + codes[:, 1:]
+        signature = (pairs * valid[:, 1:]).sum(axis=1) % 9973 / 9973.0
+        distinct = (np.diff(np.sort(codes, axis=1), axis=1) > 0).sum(axis=1) / 20.0
+        return np.column_stack([gc, purine, np.minimum(distinct, 1.0), signature])
+
+    def _characterize(self, sequences: List[str]) -> List[Dict]:
+        features = self._features(sequences)
+        type_idx = (features[:, 3] * len(PATHOGEN_TYPES)).astype(int) % len(PATHOGEN_TYPES)
+        confidence = 0.5 + 0.5 * np.abs(np.sin(9.0 * features[:, 3] + 4.0 * features[:, 0]))
+        virulence = features[:, 1] > 0.5
+        resistance = features[:, 0] > 0.55
+        return [
+            {
+                "type": PATHOGEN_TYPES[type_idx[i]],
+                "virulence": ["toxin_gene_cluster"] if virulence[i] else [],
+                "resistance": ["beta_lactamase"] if resistance[i] else [],
+                "transmission": "fecal_oral" if features[i, 0] < 0.5 else "respiratory",
+                "hosts": ["human"],
+                "confidence": float(confidence[i])
+            }
+            for i in range(len(sequences))
+        ]
+
+    def _structures(self, sequences: List[str]) -> List[Dict]:
+        features = self._features(sequences)
+        plddt = 70.0 + 25.0 * features[:, 3]
+        ptm = 0.6 + 0.3 * features[:, 2]
+        return [{"plddt_score": float(plddt[i]), "ptm_score": float(ptm[i])} for i in range(len(sequences))]
+
+    def _docking(self, pairs: List[Any]) -> List[Dict]:
+        sequences = [p[0] if isinstance(p, (tuple, list)) else p for p in pairs]
+        features = self._features(sequences)
+        target = np.array([
+            int(hashlib.blake2b(str(p[1]).encode(), digest_size=2).hexdigest(), 16) / 65535.0
+            if isinstance(p, (tuple, list)) else 0.5
+            for p in pairs
+        ])
+        score = -5.0 - 10.0 * np.abs(np.cos(3.0 * features[:, 3] + target))
+        confidence = 0.7 + 0.25 * features[:, 2]
+        return [{"docking_score": float(score[i]), "confidence": float(confidence[i])} for i in range(len(pairs))]
+
+
+class ModelBackend:
+    """
+    Adapter from a loaded BioNeMo model to the batcher's `infer` interface.
+
+    Uses the model's batched entry point when it has one (`predict_batch`),
+    otherwise falls back to one `predict` per input. `sequence_type` is
+    per call; `default_sequence_type` applies when a request has none.
+    """
+
+    def __init__(self, model: Any, default_sequence_type: str = "dna"):
+        self.model = model
+        self.default_sequence_type = default_sequence_type
+
+    def infer(self, task: str, inputs: List[Any], sequence_type: Optional[str] = None) -> List[Dict]:
+        sequence_type = sequence_type or self.default_sequence_type
+        if hasattr(self.model, "predict_batch"):
+            return list(self.model.predict_batch(sequences=inputs, task=task, sequence_type=sequence_type))
+        return [
+            self.model.predict(sequence=item, task=task, sequence_type=sequence_type)
+            for item in inputs
+        ]
@@ -0,0 +1,529 @@
+"""
+CPU Vehicle Routing
+Stack 2: Kinetic & Sensory - Local-search VRP for hosts without cuOpt
+
+Pickup-and-delivery routing on the CPU, used as the fallback when the cuOpt
+GPU solver is not installed:
+- Cost matrices built with broadcasted numpy
+- Vectorized nearest-neighbour route seeding (capacity and time-window aware)
+- Time-boxed improvement with 2-opt (segment reversal) and or-opt
+  (relocation of 1-3 task chains within and between routes)
+
+Each task is served as pickup -> delivery, so the solver works on a link
+matrix `D[from, to]`: rows are exit points (vehicle start positions, then
+task delivery points), columns are entry points (task pickup points, then a
+zero-cost END column). The pickup -> delivery service leg is a constant of the
+task, so only inter-task links differ between solutions. Every candidate move
+is scored as a whole array of deltas per step rather than one Python
+evaluation per move.
+"""
+
+import time
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EPS = 1e-9
+
+
+def pairwise_distances(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Euclidean distance matrix between point sets of shape (n, 2) and (m, 2)"""
+    a = np.asarray(a, dtype=float).reshape(-1, 2)
+    b = np.asarray(b, dtype=float).reshape(-1, 2)
+    return np.hypot(a[:, None, 0] - b[None, :, 0], a[:, None, 1] - b[None, :, 1])
+
+
+@dataclass
+class RoutingProblem:
+    """Array form of a fleet and its delivery tasks"""
+    vehicle_ids: List[str]
+    task_ids: List[str]
+    vehicle_positions: np.ndarray   # (V, 2)
+    capacities: np.ndarray          # (V,)
+    speeds_kmh: np.ndarray          # (V,)
+    pickups: np.ndarray             # (T, 2)
+    deliveries: np.ndarray          # (T, 2)
+    demands: np.ndarray             # (T,)
+    earliest_h: np.ndarray          # (T,) hours after start, -inf if unconstrained
+    latest_h: np.ndarray            # (T,) hours after start, +inf if unconstrained
+
+    @property
+    def n_vehicles(self) -> int:
+        return len(self.vehicle_ids)
+
+    @property
+    def n_tasks(self) -> int:
+        return len(self.task_ids)
+
+    @property
+    def has_time_windows(self) -> bool:
+        return bool(np.isfinite(self.latest_h).any() or np.isfinite(self.earliest_h).any())
+
+    @classmethod
+    def from_fleet(
+        cls,
+        vehicles: Sequence[Any],
+        tasks: Sequence[Any],
+        start_time: Optional[datetime] = None
+    ) -> 'RoutingProblem':
+        """
+        Build from `Vehicle` / `DeliveryTask` objects.
+
+        Unavailable vehicles are left out. Time windows are converted to
+        hours relative to `start_time` (default: now).
+        """
+        vehicles = [v for v in vehicles if getattr(v, "available", True)]
+        start_time = start_time or datetime.now()
+
+        earliest = np.full(len(tasks), -np.inf)
+        latest = np.full(len(tasks), np.inf)
+        for i, task in enumerate(tasks):
+            if task.time_window:
+                earliest[i] = (task.time_window[0] - start_time).total_seconds() / 3600.0
+                latest[i] = (task.time_window[1] - start_time).total_seconds() / 3600.0
+
+        return cls(
+            vehicle_ids=[v.vehicle_id for v in vehicles],
+            task_ids=[t.task_id for t in tasks],
+            vehicle_positions=np.array([v.current_location for v in vehicles], dtype=float).reshape(-1, 2),
+            capacities=np.array([v.capacity_kg for v in vehicles], dtype=float),
+            speeds_kmh=np.array([v.speed_kmh for v in vehicles], dtype=float),
+            pickups=np.array([t.pickup_location for t in tasks], dtype=float).reshape(-1, 2),
+            deliveries=np.array([t.delivery_location for t in tasks], dtype=float).reshape(-1, 2),
+            demands=np.array([t.weight_kg for t in tasks], dtype=float),
+            earliest_h=earliest,
+            latest_h=latest
+        )
+
+    def link_costs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build the link matrix and service legs.
+
+        Returns:
+            D: (V + T, T + 1) exit -> entry distances, last column is END (0)
+            service: (T,) pickup -> delivery distance per task
+        """
+        V, T = self.n_vehicles, self.n_tasks
+        D = np.zeros((V + T, T + 1))
+        D[:, :T] = pairwise_distances(np.vstack([self.vehicle_positions, self.deliveries]), self.pickups)
+        service = np.hypot(*(self.deliveries - self.pickups).T) if T else np.zeros(0)
+        return D, service
+
+
+@dataclass
+class RoutingSolution:
+    """Task sequence per vehicle plus summary figures"""
+    routes: List[List[int]]
+    unassigned: List[int]
+    total_distance: float
+    total_time: float
+    solve_time_ms: float
+    iterations: int = 0
+
+    def to_route_dicts(self, problem: RoutingProblem, D: np.ndarray, service: np.ndarray) -> List[Dict]:
+        """Routes in the cuOpt agent's result format (non-empty routes only)"""
+        result = []
+        for v, route in enumerate(self.routes):
+            if not route:
+                continue
+            distance, duration = route_metrics(problem, D, service, v, route)
+            result.append({
+                "vehicle_id": problem.vehicle_ids[v],
+                "tasks": [problem.task_ids[t] for t in route],
+                "distance_km": distance,
+                "duration_hours": duration,
+                "load_kg": float(problem.demands[route].sum())
+            })
+        return result
+
+
+def route_metrics(
+    problem: RoutingProblem,
+    D: np.ndarray,
+    service: np.ndarray,
+    v: int,
+    route: Sequence[int]
+) -> Tuple[float, float]:
+    """Distance (km) and duration (hours, including waiting) of one route"""
+    if not route:
+        return 0.0, 0.0
+    V = problem.n_vehicles
+    r = np.asarray(route)
+    links = D[np.concatenate([[v], V + r[:-1]]), r]
+    distance = float(links.sum() + service[r].sum())
+
+    speed = problem.speeds_kmh[v]
+    if not problem.has_time_windows:
+        return distance, distance / speed
+
+    clock = 0.0
+    for leg, t in zip(links, route):
+        clock = max(clock + leg / speed, problem.earliest_h[t]) + service[t] / speed
+    return distance, clock
+
+
+def route_feasible(
+    problem: RoutingProblem,
+    D: np.ndarray,
+    service: np.ndarray,
+    v: int,
+    route: Sequence[int]
+) -> bool:
+    """Capacity and time-window check for one route"""
+    if not route:
+        return True
+    if problem.demands[list(route)].sum() > problem.capacities[v] + EPS:
+        return False
+    if not problem.has_time_windows:
+        return True
+
+    V = problem.n_vehicles
+    speed = problem.speeds_kmh[v]
+    clock = 0.0
+    node = v
+    for t in route:
+        clock = max(clock + D[node, t] / speed, problem.earliest_h[t]) + service[t] / speed
+        if clock > problem.latest_h[t] + EPS:
+            return False
+        node = V + t
+    return True
+
+
+class CPURoutingSolver:
+    """
+    Nearest-neighbour seeding followed by time-boxed 2-opt / or-opt.
+    """
+
+    def __init__(
+        self,
+        time_limit_ms: float = 1000.0,
+        max_segment: int = 3,
+        candidate_moves: int = 8
+    ):
+        """
+        Initialize the solver.
+
+        Args:
+            time_limit_ms: Wall-clock budget for the whole solve
+            max_segment: Longest task chain moved by or-opt
+            candidate_moves: Best-delta moves re-checked against time
+                windows before a step gives up
+        """
+        self.time_limit_ms = time_limit_ms
+        self.max_segment = max_segment
+        self.candidate_moves = candidate_moves
+
+    # --- PUBLIC API ---
+
+    def solve(
+        self,
+        problem: RoutingProblem,
+        D: Optional[np.ndarray] = None,
+        service: Optional[np.ndarray] = None,
+        initial_routes: Optional[List[List[int]]] = None
+    ) -> RoutingSolution:
+        """
+        Solve (or, with `initial_routes`, repair and improve) a routing problem.
+
+        Args:
+            problem: Fleet and tasks
+            D, service: Precomputed `problem.link_costs()` (computed if omitted)
+            initial_routes: Warm-start task sequence per vehicle; any task not
+                present is inserted at its cheapest feasible position
+
+        Returns:
+            RoutingSolution
+        """
+        start = time.perf_counter()
+        deadline = start + self.time_limit_ms / 1000.0
+        if D is None or service is None:
+            D, service = problem.link_costs()
+
+        if initial_routes is None:
+            routes, unassigned = self.seed_routes(problem, D, service)
+        else:
+            routes = [list(r) for r in initial_routes]
+            routed = np.zeros(problem.n_tasks, dtype=bool)
+            for r in routes:
+                routed[r] = True
+            unassigned = [int(t) for t in np.nonzero(~routed)[0]]
+
+        unassigned = self.insert_unassigned(problem, D, service, routes, unassigned)
+        iterations = self.improve(problem, D, service, routes, deadline)
+
+        total_distance = 0.0
+        total_time = 0.0
+        for v, route in enumerate(routes):
+            distance, duration = route_metrics(problem, D, service, v, route)
+            total_distance += distance
+            total_time = max(total_time, duration)
+
+        return RoutingSolution(
+            routes=routes,
+            unassigned=unassigned,
+            total_distance=total_distance,
+            total_time=total_time,
+            solve_time_ms=(time.perf_counter() - start) * 1000.0,
+            iterations=iterations
+        )
+
+    # --- CONSTRUCTION ---
+
+    def seed_routes(
+        self,
+        problem: RoutingProblem,
+        D: np.ndarray,
+        service: np.ndarray
+    ) -> Tuple[List[List[int]], List[int]]:
+        """
+        Vectorized nearest-neighbour construction, one vehicle at a time.
+
+        From the current exit point, the next task is the nearest pickup among
+        unassigned tasks that still fit the vehicle's remaining capacity (and
+        can be delivered inside their time window).
+        """
+        V, T = problem.n_vehicles, problem.n_tasks
+        open_tasks = np.ones(T, dtype=bool)
+        routes: List[List[int]] = [[] for _ in range(V)]
+        time_windows = problem.has_time_windows
+
+        for v in range(V):
+            if not open_tasks.any():
+                break
+            node, load, clock = v, 0.0, 0.0
+            speed = problem.speeds_kmh[v]
+            while True:
+                candidates = open_tasks & (problem.demands <= problem.capacities[v] - load + EPS)
+                if time_windows:
+                    begin = np.maximum(clock + D[node, :T] / speed, problem.earliest_h)
+                    finish = begin + service / speed
+                    candidates &= finish <= problem.latest_h + EPS
+                if not candidates.any():
+                    break
+                t = int(np.argmin(np.where(candidates, D[node, :T], np.inf)))
+
+                routes[v].append(t)
+                open_tasks[t] = False
+                load += problem.demands[t]
+                clock = (finish[t] if time_windows else clock + (D[node, t] + service[t]) / speed)
+                node = V + t
+
+        return routes, [int(t) for t in np.nonzero(open_tasks)[0]]
+
+    def insert_unassigned(
+        self,
+        problem: RoutingProblem,
+        D: np.ndarray,
+        service: np.ndarray,
+        routes: List[List[int]],
+        unassigned: List[int]
+    ) -> List[int]:
+        """Cheapest feasible insertion of leftover tasks; returns those still unplaced"""
+        remaining = []
+        links = None
+        for t in unassigned:
+            links = links or self._links(problem, routes)
+            if self._relocate(problem, D, service, routes, [t], source=None, links=links):
+                links = None
+            else:
+                remaining.append(t)
+        return remaining
+
+    # --- IMPROVEMENT ---
+
+    def improve(
+        self,
+        problem: RoutingProblem,
+        D: np.ndarray,
+        service: np.ndarray,
+        routes: List[List[int]],
+        deadline: float,
+        only_routes: Optional[Sequence[int]] = None
+    ) -> int:
+        """
+        Alternate 2-opt and or-opt passes until no move improves or time runs out.
+
+        Args:
+            only_routes: Restrict move sources to these vehicles (repair mode)
+
+        Returns:
+            Number of applied moves
+        """
+        applied = 0
+        vehicles = list(range(problem.n_vehicles)) if only_routes is None else list(only_routes)
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = False
+            for v in vehicles:
+                while time.perf_counter() < deadline and self._two_opt(problem, D, service, routes, v):
+                    applied += 1
+                    improved = True
+
+            links = None
+            for v in vehicles:
+                i = 0
+                while i < len(routes[v]) and time.perf_counter() < deadline:
+                    moved = False
+                    for k in range(1, self.max_segment + 1):
+                        if i + k > len(routes[v]):
+                            break
+                        links = links or self._links(problem, routes)
+                        segment = routes[v][i:i + k]
+                        if self._relocate(problem, D, service, routes, segment, source=(v, i), links=links):
+                            applied += 1
+                            improved = moved = True
+                            links = None
+                            break
+                    if not moved:
+                        i += 1
+        return applied
+
+    def _two_opt(
+        self,
+        problem: RoutingProblem,
+        D: np.ndarray,
+        service: np.ndarray,
+        routes: List[List[int]],
+        v: int
+    ) -> bool:
+        """Apply the best improving segment reversal in route `v`"""
+        route = routes[v]
+        L = len(route)
+        if L < 2:
+            return False
+
+        V, T = problem.n_vehicles, problem.n_tasks
+        r = np.asarray(route)
+        exits = V + r
+        prev = np.concatenate([[v], exits[:-1]])      # exit point before position i
+        nxt = np.concatenate([r[1:], [T]])             # entry point after position j
+
+        forward = np.concatenate([[0.0], np.cumsum(D[exits[:-1], r[1:]])])
+        backward = np.concatenate([[0.0], np.cumsum(D[exits[1:], r[:-1]])])
+
+        # delta[i, j] for reversing positions i..j (i < j)
+        old = (D[prev, r][:, None]
+               + (forward[None, :] - forward[:, None])
+               + D[exits, nxt][None, :])
+        new = (D[prev[:, None], r[None, :]]
+               + (backward[None, :] - backward[:, None])
+               + D[exits[:, None], nxt[None, :]])
+        delta = new - old
+        delta[np.tril_indices(L)] = np.inf
+
+        for flat in self._best_moves(delta):
+            i, j = divmod(int(flat), L)
+            candidate = route[:i] + route[i:j + 1][::-1] + route[j + 1:]
+            if route_feasible(problem, D, service, v, candidate):
+                routes[v] = candidate
+                return True
+        return False
+
+    def _relocate(
+        self,
+        problem: RoutingProblem,
+        D: np.ndarray,
+        service: np.ndarray,
+        routes: List[List[int]],
+        segment: List[int],
+        source: Optional[Tuple[int, int]],
+        links: Optional[Tuple[np.ndarray, ...]] = None
+    ) -> bool:
+        """
+        Move `segment` to its best position across all routes (or-opt).
+
+        With `source=None` the segment is unrouted and is inserted at its
+        cheapest feasible position regardless of gain. `links` is the
+        `_links` snapshot of `routes`; it must be rebuilt after any move.
+        """
+        V, T = problem.n_vehicles, problem.n_tasks
+        first, last = segment[0], segment[-1]
+        demand = problem.demands[segment].sum()
+        link_from, link_to, link_vehicle, link_pos, loads = links or self._links(problem, routes)
+
+        insertion = D[link_from, first] + D[V + last, link_to] - D[link_from, link_to]
+        over_capacity = loads[link_vehicle] + demand > problem.capacities[link_vehicle] + EPS
+
+        if source is None:
+            gain = 0.0
+            delta = np.where(over_capacity, np.inf, insertion)
+        else:
+            sv, i = source
+            k = len(segment)
+            route = routes[sv]
+            prev_node = sv if i == 0 else V + route[i - 1]
+            next_node = route[i + k] if i + k < len(route) else T
+            gain = D[prev_node, first] + D[V + last, next_node] - D[prev_node, next_node]
+
+            own = link_vehicle == sv
+            # Links touching or inside the segment are not real alternatives
+            adjacent = own & (link_pos >= i) & (link_pos <= i + k)
+            over_capacity &= ~own
+            delta = np.where(over_capacity | adjacent, np.inf, insertion - gain)
+
+        for best in self._best_moves(delta, improving=source is not None):
+            tv, pos = int(link_vehicle[best]), int(link_pos[best])
+            candidate_routes = {}
+            if source is not None:
+                sv, i = source
+                stripped = routes[sv][:i] + routes[sv][i + len(segment):]
+                if tv == sv and pos > i:
+                    pos -= len(segment)
+                candidate_routes[sv] = stripped
+            target = candidate_routes.get(tv, routes[tv])
+            candidate_routes[tv] = target[:pos] + list(segment) + target[pos:]
+
+            if all(route_feasible(problem, D, service, v, r) for v, r in candidate_routes.items()):
+                for v, r in candidate_routes.items():
+                    routes[v] = r
+                return True
+        return False
+
+    def _links(self, problem: RoutingProblem, routes: List[List[int]]) -> Tuple[np.ndarray, ...]:
+        """
+        Every link (exit -> entry) in the solution is an insertion slot.
+
+        Returns:
+            (from node, to node, vehicle, position in route, load per vehicle)
+        """
+        V, T = problem.n_vehicles, problem.n_tasks
+        lengths = np.array([len(r) + 1 for r in routes])
+        flat = np.fromiter((t for r in routes for t in r), dtype=np.int64, count=int(lengths.sum()) - len(routes))
+
+        link_vehicle = np.repeat(np.arange(len(routes)), lengths)
+        link_pos = np.arange(len(link_vehicle)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        is_first = link_pos == 0
+        is_last = link_pos == lengths[link_vehicle] - 1
+
+        link_from = np.empty(len(link_vehicle), dtype=np.int64)
+        link_from[is_first] = link_vehicle[is_first]
+        link_from[~is_first] = V + flat
+        link_to = np.empty(len(link_vehicle), dtype=np.int64)
+        link_to[is_last] = T
+        link_to[~is_last] = flat
+
+        loads = np.bincount(
+            np.repeat(np.arange(len(routes)), lengths - 1),
+            weights=problem.demands[flat],
+            minlength=len(routes)
+        )
+        return link_from, link_to, link_vehicle, link_pos, loads
+
+    def _best_moves(self, delta: np.ndarray, improving: bool = True):
+        """Indices of the lowest deltas (improving ones only, unless disabled)"""
+        flat = delta.ravel()
+        limit = -EPS if improving else np.inf
+        if flat.size <= self.candidate_moves:
+            order = np.argsort(flat)
+        else:
+            order = np.argpartition(flat, self.candidate_moves)[:self.candidate_moves]
+            order = order[np.argsort(flat[order])]
+        for idx in order:
+            if flat[idx] >= limit:
+                break
+            yield idx
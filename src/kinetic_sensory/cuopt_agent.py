@@ -14,6 +14,9 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime
 
+from kinetic_sensory.cpu_routing import CPURoutingSolver, RoutingProblem, pairwise_distances
+from kinetic_sensory.incremental_routing import IncrementalRouter, RerouteResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,8 +66,12 @@ class CuOptAgenticSolver:
         self.num_vehicles = num_vehicles
         self.device = device
         self.vehicles: List[Vehicle] = []
+        self.vehicles_by_id: Dict[str, Vehicle] = {}
+        self.vehicle_routes: Dict[str, List[str]] = {}
         self.tasks: List[DeliveryTask] = []
         self.nemo_agent = None
+        self.cpu_solver = CPURoutingSolver()
+        self.router = IncrementalRouter(self.cpu_solver)
         
         logger.info(f"Initializing cuOpt agentic solver with {num_vehicles} vehicles")
         
@@ -76,17 +83,26 @@ class CuOptAgenticSolver:
             vehicles: List of vehicles
         """
         self.vehicles = vehicles
+        self.vehicles_by_id = {v.vehicle_id: v for v in vehicles}
+        self.vehicle_routes = {}
+        self.router.reset()
         logger.info(f"Initialized fleet with {len(vehicles)} vehicles")
     
     def add_delivery_task(self, task: DeliveryTask):
         """
         Add delivery task to queue.
         
+        If a routing plan is live, the task is inserted into it
+        incrementally instead of waiting for the next full solve.
+        
         Args:
             task: Delivery task
         """
         self.tasks.append(task)
         logger.info(f"Added task {task.task_id}")
+        
+        if self.router.is_loaded:
+            self._apply_reroute(self.router.add_task(task))
     
     def parse_natural_language_command(
         self,
@@ -135,17 +151,11 @@ class CuOptAgenticSolver:
         """
         logger.info("Solving VRP with cuOpt")
         
-        # Build cost matrix
-        cost_matrix = self._build_cost_matrix()
-        
         # Build constraint matrix
         constraint_matrix = self._build_constraint_matrix(constraints)
         
         # Solve on GPU using cuOpt
-        solution = self._solve_on_gpu(
-            cost_matrix=cost_matrix,
-            constraints=constraint_matrix
-        )
+        solution = self._solve_on_gpu(constraints=constraint_matrix)
         
         # Extract routes
         routes = self._extract_routes(solution)
@@ -167,6 +177,11 @@ class CuOptAgenticSolver:
         """
         Re-route entire fleet in real-time.
         
+        With a live plan from the CPU solver, a closure is applied
+        incrementally: only links crossing the area are re-costed and only
+        the routes using them are repaired, warm-started from the current
+        solution. Otherwise the VRP is re-solved from scratch.
+        
         Args:
             reason: Reason for re-routing (flood/conflict/etc)
             affected_area: (lat, lon, radius_km) of affected area
@@ -176,6 +191,24 @@ class CuOptAgenticSolver:
         """
         logger.warning(f"Re-routing fleet due to: {reason}")
         
+        if affected_area and self.router.is_loaded:
+            result = self.router.close_area(
+                center=(affected_area[0], affected_area[1]),
+                radius=affected_area[2]
+            )
+            self._apply_reroute(result)
+            
+            return {
+                "reason": reason,
+                "affected_area": affected_area,
+                "new_routes": self.router.route_dicts(),
+                "affected_vehicles": result.affected_vehicles,
+                "dropped_tasks": result.dropped_tasks,
+                "unassigned_tasks": result.unassigned_tasks,
+                "total_distance_km": result.total_distance,
+                "reroute_time_ms": result.reroute_time_ms
+            }
+        
         # Add avoidance constraint
         constraints = {}
         if affected_area:
@@ -194,7 +227,7 @@ class CuOptAgenticSolver:
             "reason": reason,
             "affected_area": affected_area,
             "new_routes": solution["routes"],
-            "reroute_time_ms": solution["solve_time"]
+            "reroute_time_ms": solution["solve_time_ms"]
         }
     
     def optimize_medical_delivery(
@@ -268,18 +301,15 @@ class CuOptAgenticSolver:
     
     def _build_cost_matrix(self) -> np.ndarray:
         """Build cost matrix for VRP."""
-        n_locations = len(self.tasks) * 2 + 1  # pickup + delivery + depot
-        cost_matrix = np.zeros((n_locations, n_locations))
-        
-        # Calculate distances between all locations
-        for i in range(n_locations):
-            for j in range(n_locations):
-                if i != j:
-                    loc_i = self._get_location(i)
-                    loc_j = self._get_location(j)
-                    cost_matrix[i, j] = self._calculate_distance(loc_i, loc_j)
-        
-        return cost_matrix
+        # Location order matches _get_location: depot, pickups, deliveries
+        locations = np.vstack([
+            [(0.0, 0.0)],
+            np.array([t.pickup_location for t in self.tasks], dtype=float).reshape(-1, 2),
+            np.array([t.delivery_location for t in self.tasks], dtype=float).reshape(-1, 2)
+        ])
+        
+        # Calculate distances between all locations in one broadcast
+        return pairwise_distances(locations, locations)
     
     def _build_constraint_matrix(
         self,
@@ -311,12 +341,13 @@ class CuOptAgenticSolver:
         
         return constraint_matrix
     
-    def _solve_on_gpu(
-        self,
-        cost_matrix: np.ndarray,
-        constraints: Dict
-    ) -> Dict[str, Any]:
-        """Solve VRP on GPU using cuOpt."""
+    def _solve_on_gpu(self, constraints: Dict) -> Dict[str, Any]:
+        """
+        Solve VRP on GPU using cuOpt.
+        
+        The dense cost matrix is only built once cuOpt is importable; the
+        CPU fallback computes its own link costs.
+        """
         try:
             from cuopt import VRPSolver
             
@@ -324,7 +355,7 @@ class CuOptAgenticSolver:
             solver = VRPSolver(device=self.device)
             
             # Set problem
-            solver.set_cost_matrix(cost_matrix)
+            solver.set_cost_matrix(self._build_cost_matrix())
             solver.set_constraints(constraints)
             
             # Solve
@@ -341,57 +372,32 @@ class CuOptAgenticSolver:
             
         except ImportError:
             logger.warning("cuOpt not available, using fallback solver")
-            return self._fallback_solver(cost_matrix, constraints)
+            return self._fallback_solver(constraints)
     
-    def _fallback_solver(
-        self,
-        cost_matrix: np.ndarray,
-        constraints: Dict
-    ) -> Dict[str, Any]:
-        """Fallback VRP solver (simple greedy)."""
-        # Simple greedy nearest neighbor
-        routes = []
-        unassigned_tasks = list(range(len(self.tasks)))
-        
-        for vehicle in self.vehicles:
-            if not unassigned_tasks:
-                break
-            
-            route = {
-                "vehicle_id": vehicle.vehicle_id,
-                "tasks": [],
-                "distance_km": 0.0
-            }
-            
-            current_location = vehicle.current_location
-            current_capacity = 0.0
-            
-            while unassigned_tasks and current_capacity < vehicle.capacity_kg:
-                # Find nearest task
-                nearest_task_idx = min(
-                    unassigned_tasks,
-                    key=lambda i: self._calculate_distance(
-                        current_location,
-                        self.tasks[i].pickup_location
-                    )
-                )
-                
-                task = self.tasks[nearest_task_idx]
-                
-                # Check capacity
-                if current_capacity + task.weight_kg <= vehicle.capacity_kg:
-                    route["tasks"].append(task.task_id)
-                    current_capacity += task.weight_kg
-                    current_location = task.delivery_location
-                    unassigned_tasks.remove(nearest_task_idx)
-            
-            routes.append(route)
+    def _fallback_solver(self, constraints: Dict) -> Dict[str, Any]:
+        """
+        Fallback VRP solver on CPU.
+        
+        Nearest-neighbour seeding plus time-boxed 2-opt / or-opt local search
+        under capacity and time-window constraints (see cpu_routing).
+        """
+        start_time = datetime.now()
+        problem = RoutingProblem.from_fleet(self.vehicles, self.tasks, start_time=start_time)
+        D, service = problem.link_costs()
+        solution = self.cpu_solver.solve(problem, D, service)
+        
+        # Keep the plan in memory for incremental re-routing
+        self.router.load(problem, D, service, solution.routes, solution.unassigned, start_time=start_time)
+        
+        if solution.unassigned:
+            logger.warning(f"{len(solution.unassigned)} tasks could not be assigned within fleet constraints")
         
         return {
-            "routes": routes,
-            "total_distance": sum(r["distance_km"] for r in routes),
-            "total_time": 0.0,
-            "solve_time": 10.0
+            "routes": solution.to_route_dicts(problem, D, service),
+            "total_distance": solution.total_distance,
+            "total_time": solution.total_time,
+            "solve_time": solution.solve_time_ms,
+            "unassigned_tasks": [problem.task_ids[t] for t in solution.unassigned]
         }
     
     def _extract_routes(self, solution: Dict) -> List[Dict]:
@@ -402,9 +408,22 @@ class CuOptAgenticSolver:
         """Update vehicle routes."""
         for route in routes:
             vehicle_id = route["vehicle_id"]
-            vehicle = next(v for v in self.vehicles if v.vehicle_id == vehicle_id)
+            if vehicle_id not in self.vehicles_by_id:
+                logger.warning(f"Route for unknown vehicle {vehicle_id}")
+                continue
+            self.vehicle_routes[vehicle_id] = route["tasks"]
             logger.info(f"Updated route for {vehicle_id}")
     
+    def _apply_reroute(self, result: RerouteResult):
+        """Update vehicle routes touched by an incremental reroute."""
+        self._update_vehicle_routes(result.changed_routes)
+        
+        # Vehicles left without tasks
+        routed = {route["vehicle_id"] for route in result.changed_routes}
+        for vehicle_id in result.affected_vehicles:
+            if vehicle_id not in routed:
+                self.vehicle_routes.pop(vehicle_id, None)
+    
     def _get_location(self, index: int) -> Tuple[float, float]:
         """Get location by index."""
         if index == 0:
@@ -0,0 +1,224 @@
+"""
+Shared-Memory Frame Ring
+Stack 2: Kinetic & Sensory - Zero-copy frame slots for Holoscan operators
+
+A fixed ring of preallocated frame slots in one `multiprocessing.shared_memory`
+block:
+- Each slot holds a set of typed fields (e.g. raw uint8 frame, float32
+  working image, segmentation mask), exposed as numpy views into the block
+- Operators read and write those views in place and hand each other slot
+  indices instead of arrays, so steady-state processing allocates nothing
+- A sensor process can attach to the same block by name and write frames
+  directly into it
+
+Slots are handed over single-producer / single-consumer: the producer
+`acquire()`s the next free slot, fills it and `publish()`es it; the consumer
+takes it with `next_ready()` and gives it back with `release()`. A consumer
+holding several slots may release them in any order with `release(slot)`;
+a slot becomes writable again only once every older slot is released too,
+so a held slot is never overwritten. The counters live in the shared block
+so both sides may be separate processes.
+"""
+
+import logging
+from multiprocessing import shared_memory
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ALIGN = 64
+
+# Header counters
+WRITE_SEQ, READ_SEQ, DROPPED = 0, 1, 2
+N_COUNTERS = 8
+
+
+def _aligned(offset: int) -> int:
+    return (offset + ALIGN - 1) // ALIGN * ALIGN
+
+
+class FrameRing:
+    """
+    Ring of typed frame slots in shared memory.
+
+    Args:
+        slots: Number of frame slots
+        fields: Field name -> (per-slot shape, dtype)
+        name: Shared memory block name (generated when creating)
+        create: Create the block (owner) or attach to an existing one
+    """
+
+    def __init__(
+        self,
+        slots: int,
+        fields: Dict[str, Tuple[Tuple[int, ...], str]],
+        name: Optional[str] = None,
+        create: bool = True
+    ):
+        if slots < 1:
+            raise ValueError("slots must be >= 1")
+        self.slots = int(slots)
+        self.fields = {k: (tuple(shape), np.dtype(dtype).str) for k, (shape, dtype) in fields.items()}
+        self.owner = create
+
+        # Layout: counters, per-slot sequence and timestamp, then one block per field
+        offset = 0
+        layout = {}
+        layout["counters"] = (offset, (N_COUNTERS,), np.int64)
+        offset = _aligned(offset + N_COUNTERS * 8)
+        layout["sequence"] = (offset, (self.slots,), np.int64)
+        offset = _aligned(offset + self.slots * 8)
+        layout["timestamp"] = (offset, (self.slots,), np.float64)
+        offset = _aligned(offset + self.slots * 8)
+        layout["released"] = (offset, (self.slots,), np.bool_)
+        offset = _aligned(offset + self.slots)
+        for field, (shape, dtype) in self.fields.items():
+            layout[field] = (offset, (self.slots,) + shape, np.dtype(dtype))
+            offset = _aligned(offset + self.slots * int(np.prod(shape, dtype=np.int64)) * np.dtype(dtype).itemsize)
+        self.nbytes = max(offset, 1)
+
+        self.shm = shared_memory.SharedMemory(name=name, create=create, size=self.nbytes if create else 0)
+        self.name = self.shm.name
+
+        self._arrays = {
+            key: np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=off)
+            for key, (off, shape, dtype) in layout.items()
+        }
+        self.counters = self._arrays.pop("counters")
+        self.sequence = self._arrays.pop("sequence")
+        self.timestamp = self._arrays.pop("timestamp")
+        self._released = self._arrays.pop("released")
+        if create:
+            self.counters[:] = 0
+            self.sequence[:] = -1
+            self.timestamp[:] = 0.0
+            self._released[:] = False
+
+        # Per-slot views built once, so the hot path never creates array objects
+        self._slot_views = [
+            {field: array[slot, ...] for field, array in self._arrays.items()}
+            for slot in range(self.slots)
+        ]
+
+        logger.debug(f"FrameRing {self.name}: {self.slots} slots, {self.nbytes} bytes")
+
+    @classmethod
+    def attach(cls, spec: Dict) -> 'FrameRing':
+        """Attach to a ring created elsewhere from its `spec`"""
+        return cls(spec["slots"], spec["fields"], name=spec["name"], create=False)
+
+    @property
+    def spec(self) -> Dict:
+        """Picklable description for `attach` in another process"""
+        return {"name": self.name, "slots": self.slots, "fields": dict(self.fields)}
+
+    def field(self, name: str) -> np.ndarray:
+        """All slots of one field, shape (slots, *shape)"""
+        return self._arrays[name]
+
+    def view(self, slot: int, field: str) -> np.ndarray:
+        """Preallocated view of one field in one slot"""
+        return self._slot_views[slot][field]
+
+    def slot_views(self, slot: int) -> Dict[str, np.ndarray]:
+        """Field -> view for one slot"""
+        return self._slot_views[slot]
+
+    # Producer side
+
+    def acquire(self) -> int:
+        """Next free slot to fill, or -1 when every slot is still in flight"""
+        write = int(self.counters[WRITE_SEQ])
+        if write - int(self.counters[READ_SEQ]) >= self.slots:
+            return -1
+        return write % self.slots
+
+    def publish(self, timestamp: float = 0.0) -> int:
+        """Hand the acquired slot to the consumer; returns its sequence number"""
+        write = int(self.counters[WRITE_SEQ])
+        slot = write % self.slots
+        self.sequence[slot] = write
+        self.timestamp[slot] = timestamp
+        self.counters[WRITE_SEQ] = write + 1
+        return write
+
+    def write(self, field: str, frame, timestamp: float = 0.0) -> int:
+        """
+        Copy one frame into the next free slot and publish it.
+
+        Accepts arrays or any buffer (e.g. `bytes` off the wire). Returns the
+        slot index, or -1 (frame counted as dropped) when the ring is full.
+        """
+        slot = self.acquire()
+        if slot < 0:
+            self.counters[DROPPED] += 1
+            return -1
+        target = self._slot_views[slot][field]
+        if isinstance(frame, np.ndarray):
+            np.copyto(target, frame.reshape(target.shape), casting="unsafe")
+        else:
+            target.reshape(-1).view(np.uint8)[:] = np.frombuffer(frame, dtype=np.uint8)
+        self.publish(timestamp)
+        return slot
+
+    # Consumer side
+
+    def next_ready(self) -> int:
+        """Oldest published slot not yet released, or -1 when empty"""
+        read = int(self.counters[READ_SEQ])
+        if read >= int(self.counters[WRITE_SEQ]):
+            return -1
+        return read % self.slots
+
+    def release(self, slot: Optional[int] = None):
+        """
+        Return a slot to the producer (default: the oldest ready slot).
+
+        Raises:
+            ValueError: If `slot` is not published or already released
+        """
+        read = int(self.counters[READ_SEQ])
+        write = int(self.counters[WRITE_SEQ])
+        if slot is None:
+            slot = read % self.slots
+        seq = int(self.sequence[slot])
+        if not read <= seq < write or self._released[slot]:
+            raise ValueError(f"Slot {slot} is not held")
+        self._released[slot] = True
+
+        # Hand back the released prefix, oldest first
+        while read < write and self._released[read % self.slots]:
+            self._released[read % self.slots] = False
+            read += 1
+        self.counters[READ_SEQ] = read
+
+    def pending(self) -> int:
+        """Published slots not yet handed back to the producer"""
+        return int(self.counters[WRITE_SEQ] - self.counters[READ_SEQ])
+
+    @property
+    def dropped(self) -> int:
+        return int(self.counters[DROPPED])
+
+    # Lifetime
+
+    def close(self):
+        """Drop this process's mapping; the owner also frees the block"""
+        self._slot_views = []
+        self._arrays = {}
+        self.counters = self.sequence = self.timestamp = self._released = None
+        self.shm.close()
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> 'FrameRing':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
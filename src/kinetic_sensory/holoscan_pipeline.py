@@ -9,10 +9,13 @@ This module implements the NVIDIA Holoscan SDK for:
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Union
 import logging
 from dataclasses import dataclass
 
+from kinetic_sensory.frame_ring import FrameRing
+from kinetic_sensory.streaming_spectrum import StreamingSpectrum
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +37,9 @@ class HoloscanPipeline:
     Implements Dynamic Flow Control for edge medical instrumentation.
     """
     
+    # Peak tone amplitude (full scale 1.0) reported as a loud noise
+    LOUD_NOISE_AMPLITUDE = 0.125
+    
     def __init__(
         self,
         max_bandwidth_mbps: float = 100.0,
@@ -54,8 +60,64 @@ class HoloscanPipeline:
         self.active_streams: List[SensorStream] = []
         self.current_bandwidth = 0.0
         self.current_temperature = 25.0
+        self.frame_ring: Optional[FrameRing] = None
+        self._rng = np.random.default_rng()
+        self._overlay_where: List[np.ndarray] = []
+        self._overlay_color = np.array([1.0, 0.0, 0.0], dtype=np.float32)  # Red overlay
+        self.acoustic_analyzers: Dict[str, StreamingSpectrum] = {}
         
         logger.info(f"Initializing Holoscan pipeline on {device}")
+    
+    def create_frame_ring(
+        self,
+        frame_shape: Tuple[int, ...],
+        slots: int = 8,
+        name: Optional[str] = None
+    ) -> FrameRing:
+        """
+        Allocate the shared-memory frame ring used by the ultrasound operators.
+        
+        Each slot holds the raw uint8 frame and the float32 image,
+        segmentation and overlay buffers the operators write in place.
+        A sensor process can attach with `FrameRing.attach(ring.spec)` and
+        write frames straight into the "raw" field.
+        
+        Args:
+            frame_shape: Frame shape, (H, W) or (H, W, C)
+            slots: Number of frames in flight
+            name: Shared memory block name (generated if None)
+            
+        Returns:
+            The ring, also kept as `self.frame_ring`
+        """
+        frame_shape = tuple(frame_shape)
+        pixels = frame_shape[:2]
+        ring = FrameRing(slots, {
+            "raw": (frame_shape, "u1"),
+            "image": (frame_shape, "f4"),
+            "segmentation": (pixels, "f4"),
+            "mask": (pixels, "?"),
+            "overlay": (frame_shape, "f4")
+        }, name=name)
+        
+        if self.frame_ring is not None:
+            self.frame_ring.close()
+        self.frame_ring = ring
+        # Mask views broadcast over the channel axis, built once per slot
+        self._overlay_where = [
+            ring.view(slot, "mask")[..., None] if len(frame_shape) == 3 else ring.view(slot, "mask")
+            for slot in range(slots)
+        ]
+        
+        logger.info(f"Frame ring {ring.name}: {slots} slots of {frame_shape}, {ring.nbytes} bytes")
+        return ring
+    
+    def close(self):
+        """Close and unlink the frame ring's shared memory block"""
+        if self.frame_ring is not None:
+            self.frame_ring.close()
+            self.frame_ring = None
+            self._overlay_where = []
         
     def register_sensor_stream(
         self,
@@ -152,20 +214,51 @@ class HoloscanPipeline:
     def process_ultrasound_stream(
         self,
         stream_id: str,
-        frame_data: np.ndarray
+        frame_data: Union[np.ndarray, int]
     ) -> Dict[str, Any]:
         """
         Process high-fidelity ultrasound video stream.
         
+        With a frame ring, pass the index of a slot whose "raw" field already
+        holds the frame (or an array, which is copied into the next free slot
+        once). The returned segmentation and overlay are then views into the
+        slot and stay valid until the slot is reused. Slots filled from an
+        array are released once processed; a slot passed by index stays
+        with the caller, who releases it.
+        
+        Raises:
+            RuntimeError: If an array arrives while every slot is held
+        
         Args:
             stream_id: Ultrasound stream identifier
-            frame_data: Raw ultrasound frame data
+            frame_data: Raw ultrasound frame data, or a frame ring slot index
             
         Returns:
             Dictionary containing processed ultrasound data
         """
         logger.debug(f"Processing ultrasound frame from {stream_id}")
         
+        if self.frame_ring is not None:
+            ring = self.frame_ring
+            slot = frame_data
+            if isinstance(frame_data, np.ndarray):
+                slot = ring.write("raw", frame_data)
+                if slot < 0:
+                    raise RuntimeError("Frame ring full: every slot is still held")
+                self.process_ultrasound_slot(slot)
+                ring.release(slot)
+            else:
+                self.process_ultrasound_slot(slot)
+            views = ring.slot_views(slot)
+            return {
+                "stream_id": stream_id,
+                "slot": slot,
+                "frame_number": int(ring.sequence[slot]),
+                "segmentation": views["segmentation"],
+                "overlay": views["overlay"],
+                "processing_time_ms": self._get_processing_time()
+            }
+        
         # Apply Holoscan operators
         # 1. Format conversion
         formatted = self._format_converter(frame_data)
@@ -184,33 +277,77 @@ class HoloscanPipeline:
             "processing_time_ms": self._get_processing_time()
         }
     
+    def process_ultrasound_slot(self, slot: int) -> int:
+        """
+        Run the ultrasound operators in place on one frame ring slot.
+        
+        Every operator writes into the slot's preallocated buffers, so this
+        path allocates no frame-sized memory.
+        
+        Args:
+            slot: Frame ring slot whose "raw" field holds the frame
+            
+        Returns:
+            The slot index, for the next operator
+        """
+        views = self.frame_ring.slot_views(slot)
+        self._format_converter(views["raw"], out=views["image"])
+        self._run_inference(views["image"], model="ultrasound_seg", out=views["segmentation"])
+        self._create_overlay(
+            views["image"],
+            views["segmentation"],
+            out=views["overlay"],
+            mask=views["mask"],
+            where=self._overlay_where[slot]
+        )
+        return slot
+    
     def process_acoustic_monitoring(
         self,
         stream_id: str,
-        audio_data: np.ndarray
+        audio_data: np.ndarray,
+        sample_rate: float = 16000.0
     ) -> Dict[str, Any]:
         """
         Process environmental acoustic monitoring stream.
         
+        Audio is analysed as a continuous stream: each call feeds only the new
+        samples to the stream's overlap-save STFT, which carries partial
+        windows over to the next call. The cost per second of audio is the
+        same whether audio arrives in 10 ms or 10 s chunks.
+        
         Args:
             stream_id: Acoustic stream identifier
-            audio_data: Raw audio data
+            audio_data: New audio samples since the last call
+            sample_rate: Samples per second (fixed when the stream is first seen)
             
         Returns:
-            Dictionary containing acoustic analysis
+            Dictionary containing acoustic analysis. "spectrum" is the per-bin
+            peak amplitude (window-normalized, in sample units) over the
+            windows completed by this call.
         """
         logger.debug(f"Processing acoustic data from {stream_id}")
         
-        # Spectral analysis
-        spectrum = np.fft.fft(audio_data)
-        frequencies = np.fft.fftfreq(len(audio_data))
+        analyzer = self.acoustic_analyzers.get(stream_id)
+        if analyzer is None:
+            analyzer = StreamingSpectrum(sample_rate=sample_rate)
+            self.acoustic_analyzers[stream_id] = analyzer
+        
+        # Spectral analysis of the windows these samples complete
+        frames = analyzer.push(audio_data)
+        
+        # Amplitude spectrum: independent of window length, unlike raw magnitudes
+        spectrum = analyzer.peak_spectrum * analyzer.amplitude_scale
         
         # Detect anomalies (e.g., gunshots, explosions)
-        anomalies = self._detect_acoustic_anomalies(spectrum)
+        anomalies = self._detect_acoustic_anomalies(spectrum) if frames else []
         
         return {
             "stream_id": stream_id,
             "spectrum": spectrum,
+            "frequencies": analyzer.frequencies,
+            "frames_analyzed": frames,
+            "band_energies": analyzer.band_energies(),
             "anomalies_detected": len(anomalies),
             "anomaly_types": [a["type"] for a in anomalies],
             "alert_level": "high" if anomalies else "normal"
@@ -222,27 +359,52 @@ class HoloscanPipeline:
         # In production, read from actual thermal sensors
         return self.current_temperature + np.random.normal(0, 2)
     
-    def _format_converter(self, data: np.ndarray) -> np.ndarray:
+    def _format_converter(
+        self,
+        data: np.ndarray,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """Convert data format for processing."""
         # Holoscan format conversion operator
-        return data.astype(np.float32) / 255.0
+        if out is None:
+            out = np.empty(data.shape, dtype=np.float32)
+        # Cast, then scale in place (a mixed-type ufunc would allocate a cast buffer)
+        np.copyto(out, data, casting="unsafe")
+        return np.multiply(out, np.float32(1.0 / 255.0), out=out)
     
-    def _run_inference(self, data: np.ndarray, model: str) -> np.ndarray:
+    def _run_inference(
+        self,
+        data: np.ndarray,
+        model: str,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """Run inference using Holoscan inference operator."""
-        # Simulate inference
+        # Simulate inference: one score per pixel
         # In production, use TensorRT for acceleration
-        return np.random.rand(*data.shape)
+        if out is None:
+            out = np.empty(data.shape[:2], dtype=np.float32)
+        return self._rng.random(dtype=np.float32, out=out)
     
     def _create_overlay(
         self,
         image: np.ndarray,
-        segmentation: np.ndarray
+        segmentation: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        mask: Optional[np.ndarray] = None,
+        where: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """Create visualization overlay."""
         # Holoscan visualization operator
-        overlay = image.copy()
-        overlay[segmentation > 0.5] = [1.0, 0.0, 0.0]  # Red overlay
-        return overlay
+        if out is None:
+            out = image.copy()
+        else:
+            np.copyto(out, image)
+        mask = np.greater(segmentation, 0.5, out=mask)
+        if where is None:
+            where = mask[..., None] if out.ndim == 3 else mask
+        color = self._overlay_color if out.ndim == 3 else self._overlay_color[0]
+        np.copyto(out, color, where=where)
+        return out
     
     def _get_frame_number(self, stream_id: str) -> int:
         """Get current frame number for stream."""
@@ -256,11 +418,12 @@ class HoloscanPipeline:
         self,
         spectrum: np.ndarray
     ) -> List[Dict]:
-        """Detect acoustic anomalies."""
+        """Detect acoustic anomalies in an amplitude spectrum."""
         anomalies = []
         
-        # Simple threshold-based detection
-        if np.max(np.abs(spectrum)) > 1000:
+        # Simple threshold-based detection: the former raw-magnitude threshold
+        # of 1000 for one-second 16 kHz chunks, i.e. 1000 * 2 / 16000
+        if np.max(np.abs(spectrum)) > self.LOUD_NOISE_AMPLITUDE:
             anomalies.append({
                 "type": "loud_noise",
                 "confidence": 0.9,
@@ -0,0 +1,184 @@
+"""
+Streaming Spectral Analysis
+Stack 2: Kinetic & Sensory - Overlap-save STFT for continuous acoustic monitoring
+
+Short-time Fourier analysis of an unbounded audio stream:
+- Fixed window/hop STFT; samples that do not yet fill a window are carried
+  over to the next call, so every sample is transformed exactly
+  window/hop times whatever the call cadence
+- Window function, frequency axis and band-summing matrix precomputed once
+- Frames are strided views of one preallocated sample buffer and go through
+  `numpy.fft.rfft` in a single batched call into preallocated outputs
+- Band energies are folded into a running sum and an exponential moving
+  average frame by frame, so features never need the history again
+"""
+
+import inspect
+import logging
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+logger = logging.getLogger(__name__)
+
+# Environmental monitoring bands (Hz); clipped to the Nyquist frequency
+ACOUSTIC_BANDS = {
+    "low": (20.0, 250.0),       # engines, explosions (low-frequency energy)
+    "mid": (250.0, 2000.0),     # voices, vehicles
+    "high": (2000.0, 8000.0),   # gunshot transients, glass, alarms
+}
+
+# numpy >= 2.0 can write the FFT straight into a preallocated array
+_RFFT_OUT = "out" in inspect.signature(np.fft.rfft).parameters
+
+
+def periodic_window(name: str, size: int) -> np.ndarray:
+    """Periodic (DFT-even) analysis window"""
+    n = np.arange(size)
+    if name == "hann":
+        return 0.5 - 0.5 * np.cos(2.0 * np.pi * n / size)
+    if name == "hamming":
+        return 0.54 - 0.46 * np.cos(2.0 * np.pi * n / size)
+    if name in ("rect", "boxcar"):
+        return np.ones(size)
+    raise ValueError(f"Unknown window: {name}")
+
+
+class StreamingSpectrum:
+    """
+    Incremental STFT and band-energy tracker for one audio stream.
+
+    Args:
+        sample_rate: Samples per second
+        window_size: FFT window length (samples)
+        hop_size: Samples between frame starts (window_size - overlap)
+        bands: Band name -> (low Hz, high Hz)
+        window: Window function name (hann/hamming/rect)
+        smoothing: EMA weight of the newest frame in `band_energy_ema`
+        max_frames: Frames transformed per batch (bounds the buffers)
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 16000.0,
+        window_size: int = 1024,
+        hop_size: int = 512,
+        bands: Optional[Dict[str, Tuple[float, float]]] = None,
+        window: str = "hann",
+        smoothing: float = 0.1,
+        max_frames: int = 64
+    ):
+        if not 0 < hop_size <= window_size:
+            raise ValueError("hop_size must be in (0, window_size]")
+        self.sample_rate = float(sample_rate)
+        self.window_size = int(window_size)
+        self.hop_size = int(hop_size)
+        self.smoothing = float(smoothing)
+        self.max_frames = int(max_frames)
+
+        self.window = periodic_window(window, self.window_size)
+        # Magnitude -> amplitude of a sinusoid centred on a bin (single-sided)
+        self.amplitude_scale = 2.0 / self.window.sum()
+        self.frequencies = np.fft.rfftfreq(self.window_size, 1.0 / self.sample_rate)
+        n_bins = len(self.frequencies)
+
+        bands = ACOUSTIC_BANDS if bands is None else bands
+        nyquist = self.sample_rate / 2.0
+        self.band_names = [name for name, (low, _) in bands.items() if low < nyquist]
+        self._band_matrix = np.zeros((n_bins, len(self.band_names)))
+        for j, name in enumerate(self.band_names):
+            low, high = bands[name]
+            self._band_matrix[(self.frequencies >= low) & (self.frequencies < high), j] = 1.0
+
+        # Sample buffer: carried tail + room for max_frames new hops
+        self._capacity = self.window_size + self.hop_size * (self.max_frames - 1)
+        self._buffer = np.zeros(self._capacity)
+        self._filled = 0
+
+        # Per-batch outputs
+        self._frames = np.empty((self.max_frames, self.window_size))
+        self._spectrum = np.empty((self.max_frames, n_bins), dtype=np.complex128)
+        self._magnitude = np.empty((self.max_frames, n_bins))
+        self._band_frames = np.empty((self.max_frames, len(self.band_names)))
+        self._decay = (1.0 - self.smoothing) ** np.arange(self.max_frames - 1, -1, -1)
+
+        # Running features
+        self.frames_processed = 0
+        self.samples_seen = 0
+        self.peak_spectrum = np.zeros(n_bins)       # per-bin max magnitude over the last push
+        self.band_energy = np.zeros(len(self.band_names))
+        self.band_energy_ema = np.zeros(len(self.band_names))
+        self.band_energy_sum = np.zeros(len(self.band_names))
+
+    @property
+    def n_bins(self) -> int:
+        return len(self.frequencies)
+
+    def push(self, samples: np.ndarray) -> int:
+        """
+        Feed new samples and transform every window they complete.
+
+        Returns:
+            Number of frames produced by this call
+        """
+        samples = np.asarray(samples, dtype=float).reshape(-1)
+        self.samples_seen += len(samples)
+        self.peak_spectrum.fill(0.0)
+        produced = 0
+        start = 0
+        while start < len(samples):
+            take = min(len(samples) - start, self._capacity - self._filled)
+            self._buffer[self._filled:self._filled + take] = samples[start:start + take]
+            self._filled += take
+            start += take
+            produced += self._drain()
+        return produced
+
+    def reset(self):
+        """Forget buffered samples and running features"""
+        self._filled = 0
+        self.frames_processed = 0
+        self.samples_seen = 0
+        for array in (self.peak_spectrum, self.band_energy, self.band_energy_ema, self.band_energy_sum):
+            array.fill(0.0)
+
+    def band_energies(self) -> Dict[str, float]:
+        """Smoothed energy per band"""
+        return {name: float(v) for name, v in zip(self.band_names, self.band_energy_ema)}
+
+    def _drain(self) -> int:
+        """Transform all complete windows in the buffer and keep the remainder"""
+        if self._filled < self.window_size:
+            return 0
+        n = 1 + (self._filled - self.window_size) // self.hop_size
+
+        # Overlapping frames as a strided view of the buffer (no copy)
+        step = self._buffer.strides[0]
+        frames = as_strided(self._buffer, shape=(n, self.window_size), strides=(self.hop_size * step, step))
+        windowed = np.multiply(frames, self.window, out=self._frames[:n])
+        spectrum = self._spectrum[:n]
+        if _RFFT_OUT:
+            np.fft.rfft(windowed, axis=1, out=spectrum)
+        else:
+            spectrum[...] = np.fft.rfft(windowed, axis=1)
+
+        magnitude = np.abs(spectrum, out=self._magnitude[:n])
+        np.maximum(self.peak_spectrum, magnitude.max(axis=0), out=self.peak_spectrum)
+        np.square(magnitude, out=magnitude)
+        bands = np.matmul(magnitude, self._band_matrix, out=self._band_frames[:n])
+
+        # Fold the batch into the running features, frame order preserved
+        alpha = self.smoothing
+        self.band_energy_ema *= (1.0 - alpha) ** n
+        self.band_energy_ema += alpha * (self._decay[-n:] @ bands)
+        self.band_energy_sum += bands.sum(axis=0)
+        self.band_energy[:] = bands[-1]
+        self.frames_processed += n
+
+        # Keep the samples the next window still needs
+        consumed = n * self.hop_size
+        remaining = self._filled - consumed
+        self._buffer[:remaining] = self._buffer[consumed:self._filled]
+        self._filled = remaining
+        return n
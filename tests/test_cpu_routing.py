@@ -0,0 +1,181 @@
+"""
+CPU Routing Solver Testing Suite
+Tests the 2-opt / or-opt fallback solver and the cuOpt agent's CPU result format
+"""
+
+import unittest
+import sys
+import os
+from datetime import datetime, timedelta
+from unittest import mock
+
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from kinetic_sensory.cpu_routing import CPURoutingSolver, RoutingProblem, route_feasible, route_metrics
+from kinetic_sensory.cuopt_agent import CuOptAgenticSolver, DeliveryTask, Vehicle
+
+START = datetime(2025, 1, 1, 8, 0)
+
+
+def make_fleet(n_tasks, n_vehicles, seed, time_windows=True, capacity=None):
+    """Random fleet and tasks on a 100 km square"""
+    rng = np.random.default_rng(seed)
+    capacity = capacity or max(4.0, 1.5 * n_tasks / n_vehicles)
+    vehicles = [
+        Vehicle(f"truck_{i}", "truck", capacity, tuple(rng.uniform(0, 100, 2)), speed_kmh=40.0)
+        for i in range(n_vehicles)
+    ]
+    tasks = []
+    for i in range(n_tasks):
+        window = None
+        if time_windows and i % 4 == 0:
+            opens = START + timedelta(hours=float(rng.uniform(0, 6)))
+            window = (opens, opens + timedelta(hours=8))
+        tasks.append(DeliveryTask(
+            f"task_{i}",
+            tuple(rng.uniform(0, 100, 2)),
+            tuple(rng.uniform(0, 100, 2)),
+            weight_kg=1.0,
+            priority=1,
+            time_window=window
+        ))
+    return vehicles, tasks
+
+
+class TestCPURoutingSolver(unittest.TestCase):
+    """Test assignment, constraints and local search moves"""
+
+    def setUp(self):
+        self.solver = CPURoutingSolver(time_limit_ms=200.0)
+
+    def solve(self, n_tasks, n_vehicles, seed, **kwargs):
+        vehicles, tasks = make_fleet(n_tasks, n_vehicles, seed, **kwargs)
+        problem = RoutingProblem.from_fleet(vehicles, tasks, start_time=START)
+        D, service = problem.link_costs()
+        return problem, D, service, self.solver.solve(problem, D, service)
+
+    def test_every_task_assigned_exactly_once(self):
+        """Each task is routed once or reported unassigned, never both"""
+        for seed in range(5):
+            problem, D, service, solution = self.solve(40, 4, seed)
+            seen = [t for route in solution.routes for t in route] + list(solution.unassigned)
+            self.assertEqual(sorted(seen), list(range(problem.n_tasks)))
+
+    def test_capacity_and_time_windows_respected(self):
+        """Every returned route fits its vehicle and meets each window"""
+        for seed in range(5):
+            problem, D, service, solution = self.solve(40, 4, seed)
+            for v, route in enumerate(solution.routes):
+                self.assertLessEqual(problem.demands[route].sum(), problem.capacities[v] + 1e-9)
+                self.assertTrue(route_feasible(problem, D, service, v, route))
+
+                # Independent clock walk over the route
+                clock = 0.0
+                node = problem.vehicle_positions[v]
+                speed = problem.speeds_kmh[v]
+                for t in route:
+                    clock += np.hypot(*(problem.pickups[t] - node)) / speed
+                    clock = max(clock, problem.earliest_h[t])
+                    clock += np.hypot(*(problem.deliveries[t] - problem.pickups[t])) / speed
+                    self.assertLessEqual(clock, problem.latest_h[t] + 1e-6)
+                    node = problem.deliveries[t]
+
+    def test_tight_capacity_leaves_tasks_unassigned(self):
+        """Tasks beyond total fleet capacity are reported, not overloaded"""
+        problem, D, service, solution = self.solve(20, 2, 7, time_windows=False, capacity=5.0)
+
+        self.assertEqual(len(solution.unassigned), 10)
+        for v, route in enumerate(solution.routes):
+            self.assertLessEqual(len(route), 5)
+
+    def test_two_opt_never_increases_route_cost(self):
+        """A 2-opt step only ever shortens the route it changes"""
+        rng = np.random.default_rng(11)
+        for seed in range(10):
+            vehicles, tasks = make_fleet(30, 3, seed, time_windows=False, capacity=100.0)
+            problem = RoutingProblem.from_fleet(vehicles, tasks, start_time=START)
+            D, service = problem.link_costs()
+            routes = [list(map(int, chunk)) for chunk in np.array_split(rng.permutation(30), 3)]
+
+            for v in range(problem.n_vehicles):
+                before, _ = route_metrics(problem, D, service, v, routes[v])
+                tasks_before = sorted(routes[v])
+                while self.solver._two_opt(problem, D, service, routes, v):
+                    after, _ = route_metrics(problem, D, service, v, routes[v])
+                    self.assertLess(after, before + 1e-9)
+                    before = after
+                self.assertEqual(sorted(routes[v]), tasks_before)
+
+    def test_two_opt_keeps_time_windows(self):
+        """Reversals that would break a window are rejected"""
+        for seed in range(5):
+            problem, D, service, solution = self.solve(30, 3, seed)
+            routes = [list(r) for r in solution.routes]
+            for v in range(problem.n_vehicles):
+                while self.solver._two_opt(problem, D, service, routes, v):
+                    self.assertTrue(route_feasible(problem, D, service, v, routes[v]))
+
+
+class TestFallbackSolverSchema(unittest.TestCase):
+    """Test the agent's CPU fallback result matches the cuOpt result format"""
+
+    def setUp(self):
+        self.agent = CuOptAgenticSolver(num_vehicles=3, device="cpu")
+        self.agent.cpu_solver.time_limit_ms = 200.0
+        vehicles, tasks = make_fleet(25, 3, 3, time_windows=False)
+        self.agent.initialize_fleet(vehicles)
+        for task in tasks:
+            self.agent.add_delivery_task(task)
+
+    def test_result_schema(self):
+        """Top-level and per-route keys and types"""
+        result = self.agent._fallback_solver({})
+
+        self.assertEqual(
+            set(result),
+            {"routes", "total_distance", "total_time", "solve_time", "unassigned_tasks"}
+        )
+        self.assertIsInstance(result["total_distance"], float)
+        self.assertIsInstance(result["total_time"], float)
+        self.assertIsInstance(result["solve_time"], float)
+        self.assertIsInstance(result["unassigned_tasks"], list)
+
+        vehicle_ids = {v.vehicle_id for v in self.agent.vehicles}
+        for route in result["routes"]:
+            self.assertEqual(
+                set(route),
+                {"vehicle_id", "tasks", "distance_km", "duration_hours", "load_kg"}
+            )
+            self.assertIn(route["vehicle_id"], vehicle_ids)
+            self.assertTrue(route["tasks"])
+            self.assertTrue(all(isinstance(t, str) for t in route["tasks"]))
+            self.assertGreaterEqual(route["distance_km"], 0.0)
+            self.assertGreaterEqual(route["duration_hours"], 0.0)
+            self.assertEqual(route["load_kg"], float(len(route["tasks"])))
+
+    def test_result_covers_every_task(self):
+        """Routed plus unassigned task ids are exactly the queued tasks"""
+        result = self.agent._fallback_solver({})
+
+        routed = [t for route in result["routes"] for t in route["tasks"]]
+        self.assertEqual(
+            sorted(routed + result["unassigned_tasks"]),
+            sorted(t.task_id for t in self.agent.tasks)
+        )
+        self.assertAlmostEqual(
+            result["total_distance"],
+            sum(route["distance_km"] for route in result["routes"])
+        )
+
+    def test_fallback_skips_dense_cost_matrix(self):
+        """Without cuOpt, solve_vrp never builds the O(n^2) location matrix"""
+        with mock.patch.object(self.agent, "_build_cost_matrix", side_effect=AssertionError("built")):
+            result = self.agent.solve_vrp()
+        self.assertEqual(result["tasks_assigned"], sum(len(r["tasks"]) for r in result["routes"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Evo 2 Engine Testing Suite
+Tests seeded candidate sampling: reproducibility, residue distribution and lengths
+"""
+
+import unittest
+import sys
+import os
+from collections import Counter
+
+# Add BioNeMo genomics directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'ml_health', 'bionemo_genomics')))
+
+from evo2_engine import AMINO_ACIDS, Evo2FoundationEngine
+
+
+class TestCandidateSampling(unittest.TestCase):
+    """Test the batched sequence sampler"""
+
+    def test_seeded_sampling_is_reproducible(self):
+        first = Evo2FoundationEngine(seed=42)._sample_sequences(200)
+        second = Evo2FoundationEngine(seed=42)._sample_sequences(200)
+        other = Evo2FoundationEngine(seed=43)._sample_sequences(200)
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other)
+
+    def test_seeded_candidates_are_reproducible(self):
+        first = Evo2FoundationEngine(seed=5)._generate_candidates("ATCG", {}, num_candidates=20)
+        second = Evo2FoundationEngine(seed=5)._generate_candidates("ATCG", {}, num_candidates=20)
+        self.assertEqual(first, second)
+
+    def test_residues_are_uniform(self):
+        """Chi-square over the 20 residues stays below the p = 0.001 critical value"""
+        residues = Evo2FoundationEngine(seed=1)._draw_residues(200000)
+
+        self.assertEqual(len(residues), 200000)
+        counts = Counter(residues)
+        self.assertEqual(set(counts), set(AMINO_ACIDS))
+        expected = len(residues) / len(AMINO_ACIDS)
+        chi2 = sum((counts[r] - expected) ** 2 / expected for r in AMINO_ACIDS)
+        self.assertLess(chi2, 43.82)  # 19 degrees of freedom
+
+    def test_lengths_cover_the_half_open_range(self):
+        sequences = Evo2FoundationEngine(seed=3)._sample_sequences(2000, length_range=(5, 9))
+
+        self.assertEqual(len(sequences), 2000)
+        self.assertEqual(len(set(sequences)), 2000)
+        self.assertEqual({len(s) for s in sequences}, {5, 6, 7, 8})
+        self.assertTrue(all(set(s) <= set(AMINO_ACIDS) for s in sequences))
+
+    def test_exhausting_a_short_range(self):
+        """Every distinct sequence of the range can be drawn"""
+        sequences = Evo2FoundationEngine(seed=0)._sample_sequences(20, length_range=(1, 2), max_rounds=200)
+        self.assertEqual(sorted(sequences), sorted(AMINO_ACIDS))
+
+    def test_impossible_count_raises(self):
+        """Asking for more distinct sequences than the range holds is an error"""
+        engine = Evo2FoundationEngine(seed=0)
+        with self.assertRaises(ValueError):
+            engine._sample_sequences(100, length_range=(1, 2))
+        with self.assertRaises(ValueError):
+            engine._sample_sequences(1, length_range=(4, 4))
+
+    def test_short_batch_is_logged(self):
+        """Running out of redraw rounds is reported instead of passing silently"""
+        engine = Evo2FoundationEngine(seed=0)
+        with self.assertLogs("evo2_engine", level="WARNING") as logs:
+            sequences = engine._sample_sequences(400, length_range=(2, 3), max_rounds=1)
+
+        self.assertLess(len(sequences), 400)
+        self.assertIn(f"Sampled {len(sequences)} of 400", logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
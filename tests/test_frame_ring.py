@@ -0,0 +1,159 @@
+"""
+Frame Ring Testing Suite
+Tests the shared-memory frame ring slot handover, within and across processes
+"""
+
+import unittest
+import sys
+import os
+import multiprocessing
+
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from kinetic_sensory.frame_ring import FrameRing
+
+FIELDS = {"raw": ((4, 3), "u1"), "score": ((), "f4")}
+
+
+def produce(spec, count):
+    """Sensor process: attach by name and publish `count` frames"""
+    ring = FrameRing.attach(spec)
+    try:
+        written = 0
+        while written < count:
+            slot = ring.acquire()
+            if slot < 0:
+                continue
+            ring.view(slot, "raw")[:] = written
+            ring.publish(timestamp=float(written))
+            written += 1
+    finally:
+        ring.close()
+
+
+class TestFrameRing(unittest.TestCase):
+    """Test acquire/release, wraparound and attaching from another process"""
+
+    def setUp(self):
+        self.ring = FrameRing(4, FIELDS)
+
+    def tearDown(self):
+        self.ring.close()
+
+    def test_acquire_publish_release(self):
+        """A published slot is ready for the consumer until released"""
+        ring = self.ring
+        self.assertEqual(ring.next_ready(), -1)
+
+        slot = ring.acquire()
+        self.assertEqual(slot, 0)
+        ring.view(slot, "raw")[:] = 7
+        self.assertEqual(ring.publish(timestamp=1.5), 0)
+
+        self.assertEqual(ring.pending(), 1)
+        self.assertEqual(ring.next_ready(), 0)
+        self.assertEqual(ring.sequence[0], 0)
+        self.assertEqual(ring.timestamp[0], 1.5)
+        self.assertTrue((ring.view(0, "raw") == 7).all())
+
+        ring.release()
+        self.assertEqual(ring.pending(), 0)
+        self.assertEqual(ring.next_ready(), -1)
+
+    def test_full_ring_refuses_and_counts_drops(self):
+        """No slot is handed out while every slot is in flight"""
+        ring = self.ring
+        for i in range(4):
+            self.assertEqual(ring.write("raw", np.full((4, 3), i, dtype=np.uint8)), i)
+
+        self.assertEqual(ring.acquire(), -1)
+        self.assertEqual(ring.write("raw", np.zeros((4, 3), dtype=np.uint8)), -1)
+        self.assertEqual(ring.dropped, 1)
+
+        ring.release()
+        self.assertEqual(ring.acquire(), 0)
+
+    def test_out_of_order_release(self):
+        """A slot released early is handed back only after older slots"""
+        ring = self.ring
+        for i in range(3):
+            ring.write("raw", np.full((4, 3), i, dtype=np.uint8))
+
+        ring.release(1)
+        self.assertEqual(ring.pending(), 3)
+        self.assertEqual(ring.next_ready(), 0)
+        ring.release(0)
+        self.assertEqual(ring.pending(), 1)
+        self.assertEqual(ring.next_ready(), 2)
+
+        # Slot 1 is free again, slot 2 is still held
+        self.assertEqual(ring.write("raw", np.zeros((4, 3), dtype=np.uint8)), 3)
+        self.assertEqual(ring.write("raw", np.zeros((4, 3), dtype=np.uint8)), 0)
+        self.assertEqual(ring.write("raw", np.zeros((4, 3), dtype=np.uint8)), 1)
+        self.assertEqual(ring.acquire(), -1)
+        self.assertTrue((ring.view(2, "raw") == 2).all())
+
+    def test_release_requires_a_held_slot(self):
+        ring = self.ring
+        with self.assertRaises(ValueError):
+            ring.release()
+        slot = ring.write("raw", np.zeros((4, 3), dtype=np.uint8))
+        ring.write("raw", np.zeros((4, 3), dtype=np.uint8))
+        ring.release(slot + 1)
+        with self.assertRaises(ValueError):
+            ring.release(slot + 1)
+        with self.assertRaises(ValueError):
+            ring.release(3)
+
+    def test_wraparound(self):
+        """Slots are reused in order with increasing sequence numbers"""
+        ring = self.ring
+        for seq in range(11):
+            slot = ring.write("raw", bytes([seq % 256]) * 12, timestamp=float(seq))
+            self.assertEqual(slot, seq % 4)
+            self.assertEqual(ring.next_ready(), slot)
+            self.assertEqual(ring.sequence[slot], seq)
+            self.assertTrue((ring.view(slot, "raw") == seq).all())
+            ring.release()
+
+        self.assertEqual(ring.pending(), 0)
+        self.assertEqual(ring.dropped, 0)
+        # Every slot holds the last frame written to it
+        self.assertEqual(sorted(ring.sequence.tolist()), [7, 8, 9, 10])
+
+    def test_views_are_preallocated(self):
+        """Slot views alias the shared block and are reused across calls"""
+        ring = self.ring
+        self.assertIs(ring.view(2, "raw"), ring.slot_views(2)["raw"])
+        ring.field("score")[3] = 0.25
+        self.assertEqual(float(ring.view(3, "score")), 0.25)
+
+    def test_attach_from_second_process(self):
+        """A separate process writes frames the owner reads in order"""
+        count = 25
+        ctx = multiprocessing.get_context("spawn")
+        producer = ctx.Process(target=produce, args=(self.ring.spec, count))
+        producer.start()
+
+        received = []
+        while len(received) < count:
+            slot = self.ring.next_ready()
+            if slot < 0:
+                self.assertTrue(producer.is_alive() or self.ring.pending(), "producer exited early")
+                continue
+            frame = self.ring.view(slot, "raw")
+            self.assertTrue((frame == frame.flat[0]).all())
+            received.append((int(self.ring.sequence[slot]), int(frame.flat[0]), self.ring.timestamp[slot]))
+            self.ring.release()
+
+        producer.join(30)
+        self.assertEqual(producer.exitcode, 0)
+        self.assertEqual(received, [(i, i, float(i)) for i in range(count)])
+        self.assertEqual(self.ring.dropped, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Holoscan Pipeline Testing Suite
+Tests streaming acoustic monitoring and frame ring ultrasound processing on the Holoscan pipeline
+"""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from kinetic_sensory.holoscan_pipeline import HoloscanPipeline
+
+
+def tone(amplitude, seconds=1.0, frequency=440.0, sample_rate=16000.0):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    return amplitude * np.sin(2 * np.pi * frequency * t)
+
+
+class TestAcousticMonitoring(unittest.TestCase):
+    """Test anomaly detection on the streaming spectrum"""
+
+    def setUp(self):
+        self.pipeline = HoloscanPipeline()
+
+    def test_loud_tone_raises_alert(self):
+        result = self.pipeline.process_acoustic_monitoring("mic", tone(0.9))
+        self.assertEqual(result["alert_level"], "high")
+        self.assertEqual(result["anomaly_types"], ["loud_noise"])
+        # Amplitude spectrum: the peak is close to the tone amplitude
+        self.assertAlmostEqual(float(result["spectrum"].max()), 0.9, delta=0.9 * 0.2)
+
+    def test_quiet_tone_is_normal(self):
+        result = self.pipeline.process_acoustic_monitoring("mic", tone(0.05))
+        self.assertEqual(result["alert_level"], "normal")
+
+    def test_alert_does_not_depend_on_chunk_size(self):
+        audio = tone(0.9)
+        levels = {
+            self.pipeline.process_acoustic_monitoring("chunked", chunk)["alert_level"]
+            for chunk in np.split(audio, 10)
+        }
+        self.assertEqual(levels, {"high"})
+
+    def test_returned_spectrum_is_a_snapshot(self):
+        first = self.pipeline.process_acoustic_monitoring("mic", tone(0.9))["spectrum"]
+        peak = first.max()
+        self.pipeline.process_acoustic_monitoring("mic", tone(0.01))
+        self.assertEqual(first.max(), peak)
+
+
+
+class TestUltrasoundFrameRing(unittest.TestCase):
+    """Test ultrasound frames staged through the shared-memory ring"""
+
+    def setUp(self):
+        self.pipeline = HoloscanPipeline()
+        self.ring = self.pipeline.create_frame_ring((8, 8, 3), slots=4)
+
+    def tearDown(self):
+        self.pipeline.close()
+
+    def test_array_frames_release_their_slots(self):
+        """Frames passed as arrays never leave slots in flight"""
+        rng = np.random.default_rng(0)
+        for i in range(10):
+            frame = rng.integers(0, 256, (8, 8, 3), dtype=np.uint8)
+            result = self.pipeline.process_ultrasound_stream("probe", frame)
+            self.assertEqual(result["slot"], i % 4)
+            self.assertEqual(result["frame_number"], i)
+            self.assertEqual(self.ring.pending(), 0)
+        self.assertEqual(self.ring.dropped, 0)
+
+    def test_slot_frames_stay_with_the_caller(self):
+        """A slot passed by index is processed but not released"""
+        slot = self.ring.write("raw", np.zeros((8, 8, 3), dtype=np.uint8))
+        result = self.pipeline.process_ultrasound_stream("probe", slot)
+        self.assertEqual(result["slot"], slot)
+        self.assertEqual(self.ring.pending(), 1)
+
+    def test_array_frames_never_free_a_held_slot(self):
+        """The array path releases only the slot it filled"""
+        held = self.ring.write("raw", np.full((8, 8, 3), 7, dtype=np.uint8))
+        held_views = self.pipeline.process_ultrasound_stream("probe", held)
+        overlay = held_views["overlay"].copy()
+
+        for _ in range(3):
+            result = self.pipeline.process_ultrasound_stream("probe", np.zeros((8, 8, 3), dtype=np.uint8))
+            self.assertNotEqual(result["slot"], held)
+        self.assertEqual(self.ring.next_ready(), held)
+
+        # Every other slot waits behind the held one: the ring is full
+        with self.assertRaises(RuntimeError):
+            self.pipeline.process_ultrasound_stream("probe", np.zeros((8, 8, 3), dtype=np.uint8))
+        np.testing.assert_array_equal(held_views["overlay"], overlay)
+        self.assertTrue((self.ring.view(held, "raw") == 7).all())
+
+        self.ring.release(held)
+        self.assertEqual(self.ring.pending(), 0)
+
+    def test_close_unlinks_shared_memory(self):
+        from multiprocessing import shared_memory
+
+        name = self.ring.name
+        self.pipeline.close()
+        self.assertIsNone(self.pipeline.frame_ring)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+        self.pipeline.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+"""
+Incremental Routing Testing Suite
+Tests closure re-costing against a brute-force pairwise check and plan feasibility after reroutes
+"""
+
+import unittest
+import sys
+import os
+import math
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from kinetic_sensory.cpu_routing import CPURoutingSolver, RoutingProblem, route_feasible
+from kinetic_sensory.cuopt_agent import DeliveryTask, Vehicle
+from kinetic_sensory.incremental_routing import IncrementalRouter, closure_detours, segments_cross
+
+START = datetime(2025, 1, 1, 8, 0)
+
+
+def brute_detour(p, q, center, radius):
+    """Extra length to drive p -> q around the disc (0 if the segment misses it)"""
+    ax, ay = p[0] - center[0], p[1] - center[1]
+    bx, by = q[0] - center[0], q[1] - center[1]
+    da, db = math.hypot(ax, ay), math.hypot(bx, by)
+    if da <= radius or db <= radius:
+        return 0.0
+
+    # Closest point of the segment to the centre
+    dx, dy = bx - ax, by - ay
+    length = math.hypot(dx, dy)
+    s = min(max(-(ax * dx + ay * dy) / (length * length), 0.0), 1.0) if length else 0.0
+    if math.hypot(ax + s * dx, ay + s * dy) >= radius:
+        return 0.0
+
+    theta = math.acos(max(-1.0, min(1.0, (ax * bx + ay * by) / (da * db))))
+    arc = theta - math.acos(radius / da) - math.acos(radius / db)
+    tangents = math.sqrt(da * da - radius * radius) + math.sqrt(db * db - radius * radius)
+    return tangents + radius * max(arc, 0.0) - length
+
+
+def make_fleet(n_tasks, n_vehicles, seed, time_windows=True):
+    rng = np.random.default_rng(seed)
+    vehicles = [
+        Vehicle(f"truck_{i}", "truck", 20.0, tuple(rng.uniform(0, 100, 2)), speed_kmh=40.0)
+        for i in range(n_vehicles)
+    ]
+    tasks = []
+    for i in range(n_tasks):
+        window = None
+        if time_windows and i % 4 == 0:
+            opens = START + timedelta(hours=float(rng.uniform(0, 6)))
+            window = (opens, opens + timedelta(hours=8))
+        tasks.append(DeliveryTask(
+            f"task_{i}",
+            tuple(rng.uniform(0, 100, 2)),
+            tuple(rng.uniform(0, 100, 2)),
+            weight_kg=1.0,
+            priority=1,
+            time_window=window
+        ))
+    return vehicles, tasks
+
+
+class TestClosureGeometry(unittest.TestCase):
+    """Test the vectorized crossing and detour code against a per-pair loop"""
+
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.exits = rng.uniform(0, 100, (60, 2))
+        self.entries = rng.uniform(0, 100, (80, 2))
+        self.areas = [(tuple(rng.uniform(20, 80, 2)), float(rng.uniform(2, 15))) for _ in range(8)]
+
+    def brute_pairs(self, center, radius):
+        expected = {}
+        for i, p in enumerate(self.exits):
+            for j, q in enumerate(self.entries):
+                extra = brute_detour(p, q, center, radius)
+                if extra > 0:
+                    expected[(i, j)] = extra
+        return expected
+
+    def test_closure_detours_matches_brute_force(self):
+        """Same crossing pairs and detour lengths, for any bin count"""
+        for center, radius in self.areas:
+            expected = self.brute_pairs(center, radius)
+            for n_bins in (1, 4, 16):
+                rows, cols, extra = closure_detours(self.exits, self.entries, center, radius, n_bins=n_bins)
+                found = dict(zip(zip(rows.tolist(), cols.tolist()), extra.tolist()))
+
+                self.assertEqual(len(found), len(rows), "pair reported twice")
+                self.assertEqual(set(found), set(expected))
+                for pair, value in expected.items():
+                    self.assertAlmostEqual(found[pair], value, places=9)
+
+    def test_segments_cross_matches_brute_force(self):
+        """Paired crossing test agrees with the closest-point check"""
+        starts, ends = self.exits, self.entries[:len(self.exits)]
+        for center, radius in self.areas:
+            crossed = segments_cross(starts, ends, center, radius)
+            expected = [brute_detour(p, q, center, radius) > 0 for p, q in zip(starts, ends)]
+            self.assertEqual(crossed.tolist(), expected)
+
+    def test_endpoints_inside_disc_are_ignored(self):
+        """Segments starting or ending inside the closure are never re-costed"""
+        center, radius = (50.0, 50.0), 10.0
+        exits = np.array([[50.0, 52.0], [0.0, 50.0]])
+        entries = np.array([[100.0, 50.0], [48.0, 50.0]])
+
+        rows, cols, extra = closure_detours(exits, entries, center, radius)
+
+        self.assertEqual(list(zip(rows.tolist(), cols.tolist())), [(1, 0)])
+        self.assertAlmostEqual(extra[0], brute_detour(exits[1], entries[0], center, radius))
+
+
+class TestIncrementalRouter(unittest.TestCase):
+    """Test that reroutes keep the live plan consistent and feasible"""
+
+    def setUp(self):
+        vehicles, tasks = make_fleet(60, 5, 9)
+        self.problem = RoutingProblem.from_fleet(vehicles, tasks, start_time=START)
+        D, service = self.problem.link_costs()
+        self.original_D, self.original_service = D.copy(), service.copy()
+
+        solver = CPURoutingSolver(time_limit_ms=200.0)
+        solution = solver.solve(self.problem, D, service)
+        self.router = IncrementalRouter(solver, repair_time_limit_ms=50.0)
+        self.router.load(self.problem, D, service, solution.routes, solution.unassigned, start_time=START)
+        self.areas = [((30.0, 40.0), 8.0), ((70.0, 60.0), 6.0), ((50.0, 50.0), 5.0)]
+
+    def assert_plan_feasible(self):
+        router = self.router
+        problem = router.problem
+        routed = [t for route in router.routes for t in route]
+
+        self.assertEqual(len(routed), len(set(routed)), "task routed twice")
+        self.assertEqual(
+            sorted(routed + router.unassigned),
+            [t for t in range(problem.n_tasks) if not router.closed[t]]
+        )
+        for v, route in enumerate(router.routes):
+            self.assertTrue(route_feasible(problem, router.D, router.service, v, route))
+            self.assertTrue(np.isfinite(router._route_entry(v)[0]))
+
+    def test_feasible_after_closures(self):
+        """Closed tasks are dropped and every route stays feasible"""
+        for center, radius in self.areas:
+            result = self.router.close_area(center, radius)
+            self.assert_plan_feasible()
+
+            for task_id in result.dropped_tasks:
+                t = self.router.task_index(task_id)
+                self.assertTrue(self.router.closed[t])
+                inside = min(np.hypot(*(self.problem.pickups[t] - center)),
+                             np.hypot(*(self.problem.deliveries[t] - center)))
+                self.assertLessEqual(inside, radius)
+
+    def test_feasible_after_added_tasks(self):
+        """Tasks added after closures are inserted or reported, never overlapping"""
+        for center, radius in self.areas:
+            self.router.close_area(center, radius)
+
+        rng = np.random.default_rng(21)
+        for i in range(10):
+            task = DeliveryTask(
+                f"urgent_{i}",
+                tuple(rng.uniform(0, 100, 2)),
+                tuple(rng.uniform(0, 100, 2)),
+                weight_kg=1.0,
+                priority=5,
+                time_window=(START, START + timedelta(hours=12))
+            )
+            result = self.router.add_task(task)
+            self.assert_plan_feasible()
+
+            t = self.router.task_index(task.task_id)
+            if result.dropped_tasks:
+                self.assertEqual(result.dropped_tasks, [task.task_id])
+                self.assertTrue(self.router.closed[t])
+
+    def test_link_costs_match_from_scratch(self):
+        """Incrementally re-costed links equal a fresh matrix plus per-pair detours"""
+        for center, radius in self.areas:
+            self.router.close_area(center, radius)
+
+        problem, V = self.problem, self.problem.n_vehicles
+        exits = np.vstack([problem.vehicle_positions, problem.deliveries])
+        expected_D = self.original_D.copy()
+        expected_service = self.original_service.copy()
+        for center, radius in self.areas:
+            for i, p in enumerate(exits):
+                for j, q in enumerate(problem.pickups):
+                    expected_D[i, j] += brute_detour(p, q, center, radius)
+            for t in range(problem.n_tasks):
+                expected_service[t] += brute_detour(problem.pickups[t], problem.deliveries[t], center, radius)
+
+        open_tasks = ~self.router.closed
+        self.assertTrue(np.isinf(self.router.D[:, :problem.n_tasks][:, ~open_tasks]).all())
+        np.testing.assert_allclose(
+            self.router.D[:V + problem.n_tasks, :problem.n_tasks][:, open_tasks],
+            expected_D[:, :problem.n_tasks][:, open_tasks]
+        )
+        np.testing.assert_allclose(self.router.service[open_tasks], expected_service[open_tasks])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Inference Batching Testing Suite
+Tests request batching, result demultiplexing and per-request options for Evo 2
+"""
+
+import unittest
+import sys
+import os
+import threading
+
+# Add src directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from biological_apex.bionemo_evo2 import BioNeMoEvo2Engine
+from biological_apex.inference_batching import (
+    DOCKING,
+    PATHOGEN_CHARACTERIZATION,
+    InferenceBatcher,
+    MockEvo2Backend,
+    ModelBackend,
+)
+
+
+class RecordingModel:
+    """Batched model echoing each input with the sequence type it was run as"""
+
+    def __init__(self):
+        self.calls = []
+
+    def predict_batch(self, sequences, task, sequence_type):
+        self.calls.append((task, sequence_type, len(sequences)))
+        return [{"type": f"{sequence_type}:{s}", "confidence": 1.0} for s in sequences]
+
+
+class TestInferenceBatcher(unittest.TestCase):
+    """Test the shared Evo 2 inference queue"""
+
+    def setUp(self):
+        self.backend = MockEvo2Backend(call_overhead_ms=0)
+        self.batcher = InferenceBatcher(self.backend, max_batch=64, window_ms=20.0)
+
+    def tearDown(self):
+        self.batcher.stop()
+
+    def test_concurrent_callers_get_their_own_results(self):
+        reads = [("ACGT" * (i + 1)) + "GG" * (i % 7) for i in range(48)]
+        expected = MockEvo2Backend(call_overhead_ms=0).infer(PATHOGEN_CHARACTERIZATION, reads)
+        results = [None] * len(reads)
+
+        def caller(i):
+            task = PATHOGEN_CHARACTERIZATION if i % 3 else DOCKING
+            payload = reads[i] if i % 3 else (reads[i], "target")
+            results[i] = (task, self.batcher.infer(task, payload))
+
+        threads = [threading.Thread(target=caller, args=(i,)) for i in range(len(reads))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for i, (task, result) in enumerate(results):
+            if task == PATHOGEN_CHARACTERIZATION:
+                self.assertEqual(result, expected[i])
+            else:
+                self.assertIn("docking_score", result)
+        self.assertLess(self.backend.calls, len(reads))
+        self.assertEqual(self.batcher.requests, len(reads))
+
+    def test_infer_many_preserves_order(self):
+        reads = ["A" * n + "C" * (50 - n) for n in range(50)]
+        self.assertEqual(
+            self.batcher.infer_many(PATHOGEN_CHARACTERIZATION, reads),
+            MockEvo2Backend(call_overhead_ms=0).infer(PATHOGEN_CHARACTERIZATION, reads)
+        )
+        self.assertEqual(self.backend.calls, 1)
+
+    def test_options_split_backend_calls(self):
+        model = RecordingModel()
+        batcher = InferenceBatcher(ModelBackend(model), window_ms=20.0)
+        slots = [
+            batcher.submit(PATHOGEN_CHARACTERIZATION, f"seq{i}", sequence_type=kind)
+            for i, kind in enumerate(["dna", "rna", "dna", "protein"])
+        ]
+        results = [slot.wait(timeout=5) for slot in slots]
+        batcher.stop()
+
+        self.assertEqual([r["type"] for r in results], ["dna:seq0", "rna:seq1", "dna:seq2", "protein:seq3"])
+        self.assertEqual(sorted(model.calls), [
+            (PATHOGEN_CHARACTERIZATION, "dna", 2),
+            (PATHOGEN_CHARACTERIZATION, "protein", 1),
+            (PATHOGEN_CHARACTERIZATION, "rna", 1),
+        ])
+
+    def test_backend_errors_reach_callers(self):
+        with self.assertRaises(ValueError):
+            self.batcher.infer("unknown_task", "ACGT")
+        # The collector survives and serves the next request
+        self.assertIn("type", self.batcher.infer(PATHOGEN_CHARACTERIZATION, "ACGT"))
+
+
+class TestEngineSequenceType(unittest.TestCase):
+    """Test that every call runs with its own sequence type"""
+
+    def test_sequence_type_is_not_frozen_by_first_call(self):
+        engine = BioNeMoEvo2Engine()
+        engine.model = RecordingModel()
+
+        dna = engine.characterize_pathogens(["ACGT"], sequence_type="dna")
+        rna = engine.characterize_pathogens(["ACGU"], sequence_type="rna")
+        self.assertEqual(dna[0]["pathogen_type"], "dna:ACGT")
+        self.assertEqual(rna[0]["pathogen_type"], "rna:ACGU")
+        self.assertIsNone(engine.batcher)
+
+    def test_shared_batcher_keeps_sequence_type(self):
+        model = RecordingModel()
+        batcher = InferenceBatcher(ModelBackend(model), window_ms=1.0)
+        engine = BioNeMoEvo2Engine(batcher=batcher)
+        engine.characterize_pathogens(["ACGT"], sequence_type="dna")
+        result = engine.characterize_pathogen("MKV", sequence_type="protein")
+        batcher.stop()
+        self.assertEqual(result["pathogen_type"], "protein:MKV")
+
+
+if __name__ == '__main__':
+    unittest.main()